@@ -183,12 +183,15 @@ async def async_set_default_conversation_agent(
 
     Strategy:
     1) Ensure our conversation agent is registered.
-    2) Update the preferred Assist pipeline to use this entry as conversation_engine.
+    2) Update the preferred Assist pipeline to use this agent as conversation_engine.
        This survives restarts/updates because it writes pipeline storage.
     """
     try:
-        # The agent_id for custom integrations is the config entry ID
-        agent_id = entry.entry_id
+        # The conversation entity id, or the config entry id on Home
+        # Assistant versions without conversation entities.
+        from .conversation import async_get_agent_id
+
+        agent_id = async_get_agent_id(hass, entry)
 
         # Verify our agent is registered in conversation integration.
         from homeassistant.components.conversation import (
@@ -198,7 +201,7 @@ async def async_set_default_conversation_agent(
         agent_info = async_get_agent_info(hass, agent_id)
         if agent_info is None:
             _LOGGER.warning(
-                "Styx conversation agent not found (entry_id=%s). "
+                "Styx conversation agent not found (agent_id=%s). "
                 "Registration may not have completed yet.",
                 agent_id,
             )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+import re
 
 import aiohttp
 
@@ -18,6 +19,17 @@ class CopilotApiError(Exception):
     pass
 
 
+def extract_http_status(err: Exception) -> int | None:
+    """HTTP status of an error raised for a Core error response, else None."""
+    match = re.match(r"^HTTP\s+(\d+)\s+for\s+", str(err))
+    if not match:
+        return None
+    try:
+        return int(match.group(1))
+    except (TypeError, ValueError):
+        return None
+
+
 class CopilotApiClient:
     def __init__(self, session: aiohttp.ClientSession, base_url: str, token: str | None):
         self._session = session
@@ -137,4 +149,5 @@ __all__ = [
     "CopilotStatus",
     "CopilotApiError",
     "CopilotApiClient",
+    "extract_http_status",
 ]
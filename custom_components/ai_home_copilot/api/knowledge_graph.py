@@ -9,8 +9,10 @@ API endpoints (Core Add-on):
 - GET /api/v1/kg/nodes - List nodes
 - GET /api/v1/kg/nodes/<id> - Get specific node
 - POST /api/v1/kg/nodes - Create node
+- POST /api/v1/kg/nodes/bulk - Upsert many nodes (optional)
 - GET /api/v1/kg/edges - List edges
 - POST /api/v1/kg/edges - Create edge
+- POST /api/v1/kg/edges/bulk - Upsert many edges (optional)
 - POST /api/v1/kg/query - Query graph
 - POST /api/v1/kg/import/patterns - Import from Habitus
 """
@@ -21,14 +23,28 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import aiohttp
 
 from ..const import HEADER_AUTH
 
+if TYPE_CHECKING:
+    from .knowledge_graph_mirror import KnowledgeGraphMirror
+
 _LOGGER = logging.getLogger(__name__)
 
+# Items per bulk upsert request.
+BULK_CHUNK_SIZE = 200
+# Concurrent single-item requests when Core has no bulk endpoint.
+FALLBACK_CONCURRENCY = 8
+# Statuses meaning "this Core has no bulk endpoint".
+_BULK_UNSUPPORTED_STATUSES = {404, 405, 501}
+# Page size of the list endpoints (Core caps it at 500).
+_LIST_LIMIT = 500
+# Pages per node/edge type read by a mirror reconcile (10 000 items).
+_RECONCILE_MAX_PAGES = 20
+
 
 class NodeType(Enum):
     """Types of nodes in the Knowledge Graph."""
@@ -201,18 +217,68 @@ class KGQueryResult:
         )
 
 
+@dataclass
+class KGChunkResult:
+    """Outcome of one chunk of a bulk upsert."""
+    index: int
+    size: int
+    failed_ids: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed_ids and self.error is None
+
+
+@dataclass
+class KGBulkResult:
+    """Outcome of a bulk upsert, with per-chunk partial failures."""
+    chunks: list[KGChunkResult] = field(default_factory=list)
+    bulk_endpoint: bool = True
+
+    @property
+    def total(self) -> int:
+        return sum(c.size for c in self.chunks)
+
+    @property
+    def failed_ids(self) -> list[str]:
+        return [i for c in self.chunks for i in c.failed_ids]
+
+    @property
+    def succeeded(self) -> int:
+        return self.total - len(self.failed_ids)
+
+    @property
+    def ok(self) -> bool:
+        return all(c.ok for c in self.chunks)
+
+
 class KnowledgeGraphError(Exception):
-    """Knowledge Graph API error."""
-    pass
+    """Knowledge Graph API error; ``status`` is set for HTTP error responses."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
 
 
 class KnowledgeGraphClient:
     """Async client for Knowledge Graph API."""
 
-    def __init__(self, session: aiohttp.ClientSession, base_url: str, token: str | None):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str,
+        token: str | None,
+        mirror: KnowledgeGraphMirror | None = None,
+    ):
         self._session = session
         self._base_url = base_url.rstrip("/")
         self._token = token
+        # Optional local copy: successful writes are applied to it and the
+        # find_* queries are answered from it while it is usable.
+        self.mirror = mirror
+        # "nodes"/"edges" -> False once Core answered the bulk route with 404/405/501.
+        self._bulk_supported: dict[str, bool] = {}
 
     def _headers(self) -> dict[str, str]:
         headers: dict[str, str] = {}
@@ -230,7 +296,9 @@ class KnowledgeGraphClient:
             ) as resp:
                 if resp.status >= 400:
                     body = await resp.text()
-                    raise KnowledgeGraphError(f"HTTP {resp.status} for {url}: {body[:200]}")
+                    raise KnowledgeGraphError(
+                        f"HTTP {resp.status} for {url}: {body[:200]}", status=resp.status
+                    )
                 return await resp.json()
         except asyncio.TimeoutError as e:
             raise KnowledgeGraphError(f"Timeout calling {url}") from e
@@ -248,7 +316,9 @@ class KnowledgeGraphClient:
             ) as resp:
                 if resp.status >= 400:
                     body = await resp.text()
-                    raise KnowledgeGraphError(f"HTTP {resp.status} for {url}: {body[:200]}")
+                    raise KnowledgeGraphError(
+                        f"HTTP {resp.status} for {url}: {body[:200]}", status=resp.status
+                    )
                 if resp.status == 204:
                     return {}
                 ctype = resp.headers.get("Content-Type", "")
@@ -275,9 +345,12 @@ class KnowledgeGraphClient:
         self,
         node_type: NodeType | None = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> list[KGNode]:
         """List nodes with optional type filter."""
         params = {"limit": str(min(limit, 500))}
+        if offset:
+            params["offset"] = str(offset)
         if node_type:
             params["type"] = node_type.value
         data = await self._get(f"/api/v1/kg/nodes?{self._encode_params(params)}")
@@ -299,6 +372,8 @@ class KnowledgeGraphClient:
         data = await self._post("/api/v1/kg/nodes", node.to_dict())
         if not data.get("ok"):
             raise KnowledgeGraphError(data.get("error", "Unknown error"))
+        if self.mirror is not None:
+            self.mirror.apply_nodes([node])
         return KGNode.from_dict(data.get("node", {}))
 
     async def add_entity_node(
@@ -330,9 +405,12 @@ class KnowledgeGraphClient:
         target: str | None = None,
         edge_type: EdgeType | None = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> list[KGEdge]:
         """List edges with optional filters."""
         params = {"limit": str(min(limit, 500))}
+        if offset:
+            params["offset"] = str(offset)
         if source:
             params["source"] = source
         if target:
@@ -349,6 +427,8 @@ class KnowledgeGraphClient:
         data = await self._post("/api/v1/kg/edges", edge.to_dict())
         if not data.get("ok"):
             raise KnowledgeGraphError(data.get("error", "Unknown error"))
+        if self.mirror is not None:
+            self.mirror.apply_edges([edge])
         return KGEdge.from_dict(data.get("edge", {}))
 
     async def add_relationship(
@@ -371,6 +451,143 @@ class KnowledgeGraphClient:
         )
         return await self.create_edge(edge)
 
+    # ==================== Bulk Operations ====================
+
+    async def upsert_nodes(
+        self,
+        nodes: list[KGNode],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> KGBulkResult:
+        """Upsert many nodes, one request per chunk.
+
+        Falls back to bounded-concurrency create_node calls when Core has
+        no bulk endpoint. Failures are reported per chunk, never raised.
+        """
+        return await self._bulk_upsert("nodes", nodes, self.create_node, chunk_size)
+
+    async def upsert_edges(
+        self,
+        edges: list[KGEdge],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> KGBulkResult:
+        """Upsert many edges, one request per chunk (see upsert_nodes)."""
+        return await self._bulk_upsert("edges", edges, self.create_edge, chunk_size)
+
+    async def _bulk_upsert(self, kind: str, items: list, create_one, chunk_size: int) -> KGBulkResult:
+        result = KGBulkResult()
+        chunk_size = max(1, chunk_size)
+        for index, start in enumerate(range(0, len(items), chunk_size)):
+            chunk = items[start:start + chunk_size]
+            result.chunks.append(await self._upsert_chunk(kind, index, chunk, create_one))
+        result.bulk_endpoint = self._bulk_supported.get(kind, True)
+        return result
+
+    async def _upsert_chunk(self, kind: str, index: int, chunk: list, create_one) -> KGChunkResult:
+        if self._bulk_supported.get(kind, True):
+            try:
+                data = await self._post(f"/api/v1/kg/{kind}/bulk", {kind: [i.to_dict() for i in chunk]})
+            except KnowledgeGraphError as err:
+                if err.status not in _BULK_UNSUPPORTED_STATUSES:
+                    return KGChunkResult(index, len(chunk), [i.id for i in chunk], str(err))
+                _LOGGER.info("Knowledge Graph bulk %s endpoint unavailable, using single requests", kind)
+                self._bulk_supported[kind] = False
+            else:
+                self._bulk_supported[kind] = True
+                if not data.get("ok"):
+                    return KGChunkResult(
+                        index, len(chunk), [i.id for i in chunk], data.get("error", "Unknown error")
+                    )
+                failed = [str(e.get("id")) for e in data.get("errors", []) if isinstance(e, dict)]
+                self._mirror_bulk(kind, chunk, failed)
+                return KGChunkResult(index, len(chunk), failed)
+
+        semaphore = asyncio.Semaphore(FALLBACK_CONCURRENCY)
+
+        async def _one(item) -> None:
+            async with semaphore:
+                await create_one(item)
+
+        outcomes = await asyncio.gather(*(_one(i) for i in chunk), return_exceptions=True)
+        failed: list[str] = []
+        existing: list = []
+        error: str | None = None
+        for item, outcome in zip(chunk, outcomes):
+            if not isinstance(outcome, BaseException):
+                continue
+            if "already exists" in str(outcome).lower():
+                existing.append(item)
+            else:
+                failed.append(item.id)
+                error = str(outcome)
+        # create_one mirrors what it created; Core already had the rest.
+        self._mirror_bulk(kind, existing, [])
+        return KGChunkResult(index, len(chunk), failed, error)
+
+    def _mirror_bulk(self, kind: str, chunk: list, failed: list[str]) -> None:
+        if self.mirror is None:
+            return
+        rejected = set(failed)
+        accepted = [i for i in chunk if i.id not in rejected]
+        if kind == "nodes":
+            self.mirror.apply_nodes(accepted)
+        else:
+            self.mirror.apply_edges(accepted)
+
+    async def _list_all(self, fetch, key) -> tuple[list, bool]:
+        """Page through a list endpoint; returns (items, complete).
+
+        Incomplete when the page budget runs out or Core ignores ``offset``
+        (a full page brings nothing new).
+        """
+        items: dict[Any, Any] = {}
+        offset = 0
+        for _ in range(_RECONCILE_MAX_PAGES):
+            page = await fetch(offset)
+            known = len(items)
+            for item in page:
+                items[key(item)] = item
+            if len(page) < _LIST_LIMIT:
+                return list(items.values()), True
+            if len(items) == known:
+                break
+            offset += len(page)
+        return list(items.values()), False
+
+    async def async_reconcile_mirror(self) -> bool:
+        """Replace the mirror with a fresh snapshot of Core's graph.
+
+        Pages through every node and edge type; if a type cannot be read
+        completely the snapshot is marked incomplete and queries stay remote.
+        """
+        if self.mirror is None:
+            return False
+        try:
+            nodes: list[KGNode] = []
+            edges: list[KGEdge] = []
+            complete = True
+            for node_type in NodeType:
+                items, done = await self._list_all(
+                    lambda offset, t=node_type: self.list_nodes(t, limit=_LIST_LIMIT, offset=offset),
+                    lambda node: node.id,
+                )
+                complete &= done
+                nodes.extend(items)
+            for edge_type in EdgeType:
+                items, done = await self._list_all(
+                    lambda offset, t=edge_type: self.list_edges(edge_type=t, limit=_LIST_LIMIT, offset=offset),
+                    lambda edge: (edge.source, edge.target, edge.type),
+                )
+                complete &= done
+                edges.extend(items)
+        except (KnowledgeGraphError, KeyError, ValueError) as err:
+            self.mirror.record_reconcile_error()
+            _LOGGER.debug("Knowledge Graph mirror reconcile failed: %s", err)
+            return False
+        self.mirror.replace(nodes, edges, complete=complete)
+        if not complete:
+            _LOGGER.info("Knowledge Graph could not be listed completely; mirror not used for queries")
+        return True
+
     # ==================== Query Operations ====================
 
     async def query(self, query: KGQuery) -> KGQueryResult:
@@ -387,6 +604,10 @@ class KnowledgeGraphClient:
         min_confidence: float = 0.3,
     ) -> KGQueryResult:
         """Find entities related to a given entity."""
+        if self.mirror is not None:
+            local = self.mirror.find_related(entity_id, max_results, min_confidence)
+            if local is not None:
+                return local
         query = KGQuery(
             query_type="structural",
             entity_id=entity_id,
@@ -401,6 +622,10 @@ class KnowledgeGraphClient:
         max_results: int = 10,
     ) -> KGQueryResult:
         """Find patterns and entities related to a mood."""
+        if self.mirror is not None:
+            local = self.mirror.find_by_mood(mood, max_results)
+            if local is not None:
+                return local
         query = KGQuery(
             query_type="contextual",
             mood=mood,
@@ -414,6 +639,10 @@ class KnowledgeGraphClient:
         max_results: int = 20,
     ) -> KGQueryResult:
         """Find entities and patterns for a zone."""
+        if self.mirror is not None:
+            local = self.mirror.find_by_zone(zone_id, max_results)
+            if local is not None:
+                return local
         query = KGQuery(
             query_type="structural",
             zone_id=zone_id,
@@ -442,6 +671,9 @@ class KnowledgeGraphClient:
         if zone_id:
             payload["zone_id"] = zone_id
         data = await self._post("/api/v1/kg/import/patterns", payload)
+        # Core created pattern/mood nodes the mirror does not know about.
+        if self.mirror is not None:
+            self.mirror.invalidate()
         return data
 
     # ==================== Helpers ====================
@@ -461,6 +693,8 @@ __all__ = [
     "KGStats",
     "KGQuery",
     "KGQueryResult",
+    "KGChunkResult",
+    "KGBulkResult",
     "KnowledgeGraphError",
     "KnowledgeGraphClient",
 ]
\ No newline at end of file
@@ -0,0 +1,222 @@
+"""In-memory mirror of the Core Knowledge Graph for read queries.
+
+The mirror answers ``find_related``, ``find_by_zone`` and ``find_by_mood``
+locally from an adjacency list plus label and zone indexes. It is fed by
+the client's own successful writes and replaced wholesale by periodic
+reconciliation against Core (``KnowledgeGraphClient.async_reconcile_mirror``).
+
+Until the first reconciliation, after ``invalidate()``, when the last
+snapshot was truncated, or once it is older than ``stale_after_s``, the
+mirror reports a miss and the client asks Core instead.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Iterable, Optional
+
+from .knowledge_graph import EdgeType, KGEdge, KGNode, KGQueryResult
+
+# Nodes with more neighbours than this (e.g. a capability shared by every
+# light) are not expanded for second-hop neighbours in find_related.
+MIRROR_MAX_FANOUT = 200
+
+_ZONE_PREFIXES = ("zone.", "area.")
+
+
+class KnowledgeGraphMirror:
+    """Adjacency-list copy of the Knowledge Graph with label/zone indexes."""
+
+    def __init__(self, stale_after_s: float = 7200.0) -> None:
+        self.stale_after_s = stale_after_s
+        self._nodes: dict[str, KGNode] = {}
+        self._out: dict[str, dict[str, KGEdge]] = {}
+        self._in: dict[str, dict[str, KGEdge]] = {}
+        self._by_label: dict[str, set[str]] = {}
+        self._by_zone: dict[str, set[str]] = {}
+        self._ready = False
+        self._complete = False
+        self._reconciled_at: Optional[float] = None
+        self._stats: dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "writes_since_reconcile": 0,
+            "reconciles": 0,
+            "reconcile_errors": 0,
+            "invalidations": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def apply_nodes(self, nodes: Iterable[KGNode]) -> None:
+        """Record nodes Core accepted."""
+        for node in nodes:
+            old = self._nodes.get(node.id)
+            if old is not None:
+                self._unindex_label(old)
+            self._nodes[node.id] = node
+            self._by_label.setdefault(node.label.casefold(), set()).add(node.id)
+            self._stats["writes_since_reconcile"] += 1
+
+    def apply_edges(self, edges: Iterable[KGEdge]) -> None:
+        """Record edges Core accepted."""
+        for edge in edges:
+            self._out.setdefault(edge.source, {})[edge.id] = edge
+            self._in.setdefault(edge.target, {})[edge.id] = edge
+            if edge.type == EdgeType.BELONGS_TO and edge.target.startswith(_ZONE_PREFIXES):
+                self._by_zone.setdefault(edge.target, set()).add(edge.source)
+            self._stats["writes_since_reconcile"] += 1
+
+    def replace(self, nodes: list[KGNode], edges: list[KGEdge], complete: bool = True) -> None:
+        """Swap in a fresh snapshot from Core."""
+        self._nodes = {}
+        self._out = {}
+        self._in = {}
+        self._by_label = {}
+        self._by_zone = {}
+        self.apply_nodes(nodes)
+        self.apply_edges(edges)
+        self._ready = True
+        self._complete = complete
+        self._reconciled_at = time.monotonic()
+        self._stats["writes_since_reconcile"] = 0
+        self._stats["reconciles"] += 1
+
+    def record_reconcile_error(self) -> None:
+        self._stats["reconcile_errors"] += 1
+
+    def invalidate(self) -> None:
+        """Stop answering locally until the next reconciliation."""
+        self._ready = False
+        self._stats["invalidations"] += 1
+
+    def _unindex_label(self, node: KGNode) -> None:
+        ids = self._by_label.get(node.label.casefold())
+        if ids is not None:
+            ids.discard(node.id)
+            if not ids:
+                del self._by_label[node.label.casefold()]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @property
+    def usable(self) -> bool:
+        if not (self._ready and self._complete and self._reconciled_at is not None):
+            return False
+        return time.monotonic() - self._reconciled_at <= self.stale_after_s
+
+    def _lookup(self) -> bool:
+        if self.usable:
+            self._stats["hits"] += 1
+            return True
+        self._stats["misses"] += 1
+        return False
+
+    def _adjacent(self, node_id: str, min_confidence: float) -> list[tuple[str, KGEdge]]:
+        """Neighbours in both directions.
+
+        Registry facts carry no confidence (0.0) and always count; edges with
+        an explicit confidence below ``min_confidence`` are skipped.
+        """
+        result = []
+        for edge in self._out.get(node_id, {}).values():
+            if not edge.confidence or edge.confidence >= min_confidence:
+                result.append((edge.target, edge))
+        for edge in self._in.get(node_id, {}).values():
+            if not edge.confidence or edge.confidence >= min_confidence:
+                result.append((edge.source, edge))
+        return result
+
+    def find_related(
+        self, entity_id: str, max_results: int = 10, min_confidence: float = 0.3
+    ) -> KGQueryResult | None:
+        """Direct neighbours and nodes sharing a neighbour, closest first."""
+        if not self._lookup():
+            return None
+        scores: dict[str, float] = {}
+        seen_edges: dict[str, KGEdge] = {}
+        for neighbour, edge in self._adjacent(entity_id, min_confidence):
+            scores[neighbour] = scores.get(neighbour, 0.0) + 1.0
+            seen_edges[edge.id] = edge
+            second_hop = self._adjacent(neighbour, min_confidence)
+            if len(second_hop) > MIRROR_MAX_FANOUT:
+                continue
+            for other, other_edge in second_hop:
+                if other != entity_id:
+                    scores[other] = scores.get(other, 0.0) + 0.5
+                    seen_edges[other_edge.id] = other_edge
+
+        ranked = [n for n in sorted(scores, key=lambda n: (-scores[n], n)) if n in self._nodes]
+        ranked = ranked[:max_results]
+        keep = set(ranked) | {entity_id}
+        edges = [e for e in seen_edges.values() if e.source in keep and e.target in keep]
+        confidence = max((e.confidence for e in edges if e.confidence), default=1.0 if ranked else 0.0)
+        return KGQueryResult(
+            nodes=[self._nodes[n] for n in ranked],
+            edges=edges,
+            confidence=confidence,
+            sources=["mirror"],
+        )
+
+    def find_by_zone(self, zone_id: str, max_results: int = 20) -> KGQueryResult | None:
+        """Members of a zone (or area) via BELONGS_TO edges."""
+        if not self._lookup():
+            return None
+        key = zone_id if zone_id.startswith(_ZONE_PREFIXES) else f"zone.{zone_id}"
+        members = sorted(m for m in self._by_zone.get(key, ()) if m in self._nodes)[:max_results]
+        edges = [
+            e for e in self._in.get(key, {}).values()
+            if e.type == EdgeType.BELONGS_TO and e.source in members
+        ]
+        return KGQueryResult(
+            nodes=[self._nodes[m] for m in members],
+            edges=edges,
+            confidence=1.0 if members else 0.0,
+            sources=["mirror"],
+        )
+
+    def find_by_mood(self, mood: str, max_results: int = 10) -> KGQueryResult | None:
+        """Nodes related to a mood; ``nodes[i]`` pairs with ``edges[i]``."""
+        if not self._lookup():
+            return None
+        mood_id = mood if mood.startswith("mood.") else f"mood.{mood}"
+        edges = sorted(
+            (
+                e for e in self._in.get(mood_id, {}).values()
+                if e.type == EdgeType.RELATES_TO_MOOD and e.source in self._nodes
+            ),
+            key=lambda e: (-e.confidence, -e.weight, e.source),
+        )[:max_results]
+        return KGQueryResult(
+            nodes=[self._nodes[e.source] for e in edges],
+            edges=edges,
+            confidence=max((e.confidence for e in edges), default=0.0),
+            sources=["mirror"],
+        )
+
+    def find_by_label(self, label: str) -> list[KGNode]:
+        """Exact (case-insensitive) label lookup."""
+        return [self._nodes[n] for n in sorted(self._by_label.get(label.casefold(), ()))]
+
+    def get_stats(self) -> dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else None,
+            "nodes": len(self._nodes),
+            "edges": sum(len(e) for e in self._out.values()),
+            "ready": self._ready,
+            "complete": self._complete,
+            "usable": self.usable,
+            "age_s": (
+                round(time.monotonic() - self._reconciled_at, 1)
+                if self._reconciled_at is not None else None
+            ),
+        }
+
+
+__all__ = ["KnowledgeGraphMirror"]
@@ -3,6 +3,11 @@
 Generates an interactive HTML/JS visualization from Core graph state.
 Privacy-first: all data stays local; no external dependencies.
 
+The published panel is a static shell; graph data comes from an
+integration JSON feed (``BRAIN_GRAPH_FEED_URL``) that revalidates against
+Core with ETag/If-None-Match and answers the panel's own If-None-Match
+with 304 while the graph is unchanged.
+
 Version 0.8 (2026-02-16):
 - Interactive D3.js visualization with zoom/pan
 - Filter by Node Kind, Zone, or text search
@@ -14,17 +19,24 @@ Version 0.8 (2026-02-16):
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
+import hashlib
 import html
 import json
 import math
 from pathlib import Path
-from typing import Any
+import time
+from typing import Any, Mapping
 
+from aiohttp import web
 from homeassistant.components import persistent_notification
+from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
 
+from .const import DOMAIN
 from .privacy import sanitize_text
 
 
@@ -80,6 +92,25 @@ def _normalize_scores(nodes: list[dict[str, Any]]) -> list[float]:
     return [(v - lo) / (hi - lo) for v in raw]
 
 
+PANEL_WIDTH = 1200
+PANEL_HEIGHT = 900
+DEFAULT_MAX_NODES = 200
+DEFAULT_MAX_EDGES = 400
+# Upper bounds for limitNodes/limitEdges on the JSON feed.
+FEED_MAX_NODES = 2000
+FEED_MAX_EDGES = 4000
+# Feed answers from cache without asking Core within this window.
+FEED_MIN_REFRESH_S = 5.0
+# How often an open panel revalidates the feed.
+FEED_POLL_INTERVAL_S = 30
+# Cached snapshots (one per limitNodes/limitEdges pair); least recently used go first.
+FEED_MAX_SNAPSHOTS = 8
+
+BRAIN_GRAPH_FEED_URL = "/api/ai_home_copilot/brain_graph/state"
+CORE_GRAPH_STATE_PATH = "/api/v1/graph/state"
+PANEL_PATH = Path("/config/www/ai_home_copilot/brain_graph_panel.html")
+
+
 # Color palette for node kinds
 KIND_COLORS = {
     "entity": "#4aa3df",
@@ -106,27 +137,31 @@ def _get_kind_color(kind: str | None) -> str:
     return KIND_COLORS.get(kind.lower(), KIND_COLORS["default"])
 
 
-def _render_interactive_html(
-    *,
+def _build_graph_payload(
     nodes: list[dict[str, Any]],
     edges: list[dict[str, Any]],
-    title: str,
-) -> str:
-    """Generate interactive HTML with JavaScript for zoom/pan/filter."""
-    
-    width = 1200
-    height = 900
+    *,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    max_edges: int = DEFAULT_MAX_EDGES,
+) -> dict[str, Any]:
+    """Sanitize Core graph state and lay it out for the panel.
+
+    The result is what the panel script consumes, inline or from the feed.
+    """
+    width = PANEL_WIDTH
+    height = PANEL_HEIGHT
     cx = width / 2
     cy = height / 2
     radius = min(width, height) * 0.38
 
+    nodes = nodes[:max_nodes]
     scores = _normalize_scores(nodes)
 
     viz_nodes: list[NodeViz] = []
     id_to_idx: dict[str, int] = {}
 
     # Process nodes
-    for i, n in enumerate(nodes[:200]):
+    for i, n in enumerate(nodes):
         if not isinstance(n, dict):
             continue
         
@@ -140,7 +175,7 @@ def _render_interactive_html(
         label = sanitize_text(raw_label, max_chars=60) or nid
 
         # Circular layout
-        a = (2 * math.pi * i) / max(1, min(len(nodes), 200))
+        a = (2 * math.pi * i) / max(1, len(nodes))
         x = cx + radius * math.cos(a)
         y = cy + radius * math.sin(a)
 
@@ -168,7 +203,7 @@ def _render_interactive_html(
 
     # Process edges
     edge_data: list[dict[str, Any]] = []
-    for e in edges[:400]:
+    for e in edges[:max_edges]:
         if not isinstance(e, dict):
             continue
         frm = sanitize_text(e.get("from"), max_chars=80)
@@ -185,40 +220,62 @@ def _render_interactive_html(
             "weight": _safe_float(e.get("weight"), 0.5),
         })
 
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    # Prepare node data for JavaScript - sanitize all fields before JSON dump
-    nodes_json = json.dumps([
-        {
-            "id": html.escape(sanitize_text(n.node_id, max_chars=80)),
-            "label": html.escape(sanitize_text(n.label, max_chars=60)),
-            "kind": html.escape(sanitize_text(n.kind, max_chars=30)),
-            "domain": html.escape(sanitize_text(n.domain, max_chars=30)) if n.domain else None,
-            "zone": html.escape(sanitize_text(n.zone, max_chars=30)) if n.zone else None,
-            "score": round(n.score, 3),
-            "x": round(n.x, 1),
-            "y": round(n.y, 1),
-            "color": _get_kind_color(n.kind),
-        }
-        for n in viz_nodes
-    ], ensure_ascii=False)
-    
-    edges_json = json.dumps([
-        {
-            "from": html.escape(sanitize_text(e.get("from"), max_chars=80)),
-            "to": html.escape(sanitize_text(e.get("to"), max_chars=80)),
-            "type": html.escape(sanitize_text(e.get("type"), max_chars=30)) if e.get("type") else None,
-            "weight": round(float(e.get("weight", 0)), 3) if e.get("weight") is not None else None,
-        }
-        for e in edge_data
-    ], ensure_ascii=False)
-    
-    # Collect unique kinds/zones for filters
-    kinds = sorted(set(n.kind for n in viz_nodes if n.kind))
-    zones = sorted(set(n.zone for n in viz_nodes if n.zone))
-    
-    kinds_json = json.dumps(kinds)
-    zones_json = json.dumps(zones)
+    # Sanitize all fields for the panel script
+    return {
+        "nodes": [
+            {
+                "id": html.escape(sanitize_text(n.node_id, max_chars=80)),
+                "label": html.escape(sanitize_text(n.label, max_chars=60)),
+                "kind": html.escape(sanitize_text(n.kind, max_chars=30)),
+                "domain": html.escape(sanitize_text(n.domain, max_chars=30)) if n.domain else None,
+                "zone": html.escape(sanitize_text(n.zone, max_chars=30)) if n.zone else None,
+                "score": round(n.score, 3),
+                "x": round(n.x, 1),
+                "y": round(n.y, 1),
+                "color": _get_kind_color(n.kind),
+            }
+            for n in viz_nodes
+        ],
+        "edges": [
+            {
+                "from": html.escape(sanitize_text(e.get("from"), max_chars=80)),
+                "to": html.escape(sanitize_text(e.get("to"), max_chars=80)),
+                "type": html.escape(sanitize_text(e.get("type"), max_chars=30)) if e.get("type") else None,
+                "weight": round(float(e.get("weight", 0)), 3) if e.get("weight") is not None else None,
+            }
+            for e in edge_data
+        ],
+        # Collect unique kinds/zones for filters
+        "kinds": sorted(set(n.kind for n in viz_nodes if n.kind)),
+        "zones": sorted(set(n.zone for n in viz_nodes if n.zone)),
+        "edge_count": len(edges),
+    }
+
+
+def _render_interactive_html(
+    *,
+    nodes: list[dict[str, Any]],
+    edges: list[dict[str, Any]],
+    title: str,
+    feed_url: str | None = None,
+) -> str:
+    """Generate interactive HTML with JavaScript for zoom/pan/filter.
+
+    With ``feed_url`` the page is a static shell: graph data starts empty
+    and is loaded (and revalidated via ETag) from the JSON feed.
+    """
+    width = PANEL_WIDTH
+    height = PANEL_HEIGHT
+    payload = _build_graph_payload(nodes, edges)
+    now = "—" if feed_url else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    nodes_json = json.dumps(payload["nodes"], ensure_ascii=False)
+    edges_json = json.dumps(payload["edges"], ensure_ascii=False)
+    kinds_json = json.dumps(payload["kinds"])
+    zones_json = json.dumps(payload["zones"])
+    feed_url_json = json.dumps(feed_url)
+    node_count = len(payload["nodes"])
+    edge_count = payload["edge_count"]
 
     return f'''<!DOCTYPE html>
 <html lang="en">
@@ -528,11 +585,11 @@ def _render_interactive_html(
                 <h3>📊 Stats</h3>
                 <div class="stats">
                     <div class="stat">
-                        <div class="stat-value" id="node-count">{len(viz_nodes)}</div>
+                        <div class="stat-value" id="node-count">{node_count}</div>
                         <div class="stat-label">Nodes</div>
                     </div>
                     <div class="stat">
-                        <div class="stat-value" id="edge-count">{len(edges)}</div>
+                        <div class="stat-value" id="edge-count">{edge_count}</div>
                         <div class="stat-label">Edges</div>
                     </div>
                 </div>
@@ -573,7 +630,7 @@ def _render_interactive_html(
         <div class="main">
             <header>
                 <h1>🧠 Brain Graph</h1>
-                <div class="meta">Generated: {now} · Interactive View</div>
+                <div class="meta">Generated: <span id="generated">{now}</span> · Interactive View</div>
             </header>
             
             <div class="graph-container">
@@ -613,6 +670,8 @@ def _render_interactive_html(
         const edges = {edges_json};
         const kinds = {kinds_json};
         const zones = {zones_json};
+        const feedUrl = {feed_url_json};
+        let feedEtag = null;
         
         // State
         let selectedNode = null;
@@ -631,6 +690,7 @@ def _render_interactive_html(
         // Initialize filters
         function initFilters() {{
             const kindSelect = document.getElementById('filter-kind');
+            kindSelect.length = 1;
             kinds.forEach(k => {{
                 const opt = document.createElement('option');
                 opt.value = k;
@@ -639,6 +699,7 @@ def _render_interactive_html(
             }});
             
             const zoneSelect = document.getElementById('filter-zone');
+            zoneSelect.length = 1;
             zones.forEach(z => {{
                 const opt = document.createElement('option');
                 opt.value = z;
@@ -648,6 +709,7 @@ def _render_interactive_html(
             
             // Build legend
             const legend = document.getElementById('legend');
+            legend.innerHTML = '';
             const colorMap = {{
                 entity: '#4aa3df',
                 device: '#6b8e23',
@@ -878,32 +940,238 @@ def _render_interactive_html(
         document.getElementById('filter-zone').addEventListener('change', renderGraph);
         document.getElementById('filter-search').addEventListener('input', renderGraph);
         
-        // Refresh (reload page)
+        // Feed: HA session token (same-origin iframe) for the JSON endpoint
+        function haToken() {{
+            try {{
+                const ha = window.parent.document.querySelector('home-assistant');
+                const token = ha && ha.hass && ha.hass.auth && ha.hass.auth.data.access_token;
+                if (token) return token;
+            }} catch (err) {{}}
+            try {{
+                const stored = JSON.parse(localStorage.getItem('hassTokens') || 'null');
+                return stored && stored.access_token;
+            }} catch (err) {{
+                return null;
+            }}
+        }}
+        
+        function replaceAll(target, items) {{
+            target.splice(0, target.length, ...items);
+        }}
+        
+        // Load graph data; 304 means unchanged, nothing to re-render
+        async function loadFeed() {{
+            const headers = {{}};
+            const token = haToken();
+            if (token) headers['Authorization'] = 'Bearer ' + token;
+            if (feedEtag) headers['If-None-Match'] = feedEtag;
+            let resp;
+            try {{
+                resp = await fetch(feedUrl, {{ headers: headers, cache: 'no-cache' }});
+            }} catch (err) {{
+                document.getElementById('generated').textContent = 'feed unavailable';
+                return;
+            }}
+            if (resp.status === 304) return;
+            if (!resp.ok) {{
+                document.getElementById('generated').textContent = 'feed error (HTTP ' + resp.status + ')';
+                return;
+            }}
+            feedEtag = resp.headers.get('ETag');
+            const data = await resp.json();
+            replaceAll(nodes, data.nodes || []);
+            replaceAll(edges, data.edges || []);
+            replaceAll(kinds, data.kinds || []);
+            replaceAll(zones, data.zones || []);
+            document.getElementById('node-count').textContent = nodes.length;
+            document.getElementById('edge-count').textContent = data.edge_count || edges.length;
+            document.getElementById('generated').textContent = data.generated || '—';
+            initFilters();
+            renderGraph();
+        }}
+        
+        // Refresh: revalidate the feed, or reload an inline page
         function refreshGraph() {{
-            location.reload();
+            if (feedUrl) {{
+                loadFeed();
+            }} else {{
+                location.reload();
+            }}
         }}
         
         // Initialize
         initFilters();
         renderGraph();
+        if (feedUrl) {{
+            loadFeed();
+            setInterval(loadFeed, {FEED_POLL_INTERVAL_S * 1000});
+        }}
     </script>
 </body>
 </html>'''
 
 
-def _write_text(path: Path, content: str) -> None:
+def _write_text_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` unless the file already holds it. Returns True if written."""
+    encoded = content.encode("utf-8")
+    try:
+        if hashlib.blake2b(path.read_bytes()).digest() == hashlib.blake2b(encoded).digest():
+            return False
+    except OSError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(encoded)
+    return True
+
+
+def _graph_lists(data: Any) -> tuple[list[Any], list[Any]]:
+    nodes = data.get("nodes") if isinstance(data, dict) else None
+    edges = data.get("edges") if isinstance(data, dict) else None
+    return (nodes if isinstance(nodes, list) else [], edges if isinstance(edges, list) else [])
+
+
+def _parse_limit(raw: Any, default: int, maximum: int) -> int:
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(value, maximum))
+
+
+@dataclass
+class BrainGraphSnapshot:
+    """Cached graph state for one (max_nodes, max_edges) pair."""
+    nodes: list[Any] = field(default_factory=list)
+    edges: list[Any] = field(default_factory=list)
+    payload: dict[str, Any] | None = None
+    etag: str | None = None
+    core_etag: str | None = None
+    checked_at: float = 0.0
+
+
+class BrainGraphFeed:
+    """Panel graph feed: Core graph state cached and revalidated by ETag.
+
+    ``etag`` is a hash of the built payload, so it only changes when the
+    rendered graph does, whether or not Core itself sends ETags.
+    """
+
+    def __init__(self, api) -> None:
+        self.api = api
+        self._snapshots: OrderedDict[tuple[int, int], BrainGraphSnapshot] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "not_modified": 0,
+            "core_fetches": 0,
+            "core_not_modified": 0,
+            "rebuilds": 0,
+        }
+
+    async def async_snapshot(
+        self,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        max_edges: int = DEFAULT_MAX_EDGES,
+    ) -> BrainGraphSnapshot:
+        """Return current graph state, asking Core at most every FEED_MIN_REFRESH_S."""
+        async with self._lock:
+            key = (max_nodes, max_edges)
+            snap = self._snapshots.get(key)
+            if snap is None:
+                snap = self._snapshots[key] = BrainGraphSnapshot()
+                while len(self._snapshots) > FEED_MAX_SNAPSHOTS:
+                    self._snapshots.popitem(last=False)
+            else:
+                self._snapshots.move_to_end(key)
+            now = time.monotonic()
+            if snap.payload is not None and now - snap.checked_at < FEED_MIN_REFRESH_S:
+                return snap
+
+            data, core_etag = await self.api.async_get_conditional(
+                CORE_GRAPH_STATE_PATH,
+                etag=snap.core_etag if snap.payload is not None else None,
+                params={"limitNodes": max_nodes, "limitEdges": max_edges},
+            )
+            self.stats["core_fetches"] += 1
+            snap.checked_at = now
+            if data is None:
+                self.stats["core_not_modified"] += 1
+                return snap
+
+            nodes, edges = _graph_lists(data)
+            payload = _build_graph_payload(nodes, edges, max_nodes=max_nodes, max_edges=max_edges)
+            raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            etag = f'"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"'
+            if etag != snap.etag:
+                payload["generated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                snap.payload = payload
+                snap.etag = etag
+                snap.nodes = nodes
+                snap.edges = edges
+                self.stats["rebuilds"] += 1
+            snap.core_etag = core_etag
+            return snap
+
+    async def async_respond(
+        self, query: Mapping[str, str], if_none_match: str | None
+    ) -> tuple[int, dict[str, Any] | None, dict[str, str]]:
+        """Answer a feed request: (status, JSON body or None, headers)."""
+        self.stats["requests"] += 1
+        max_nodes = _parse_limit(query.get("limitNodes"), DEFAULT_MAX_NODES, FEED_MAX_NODES)
+        max_edges = _parse_limit(query.get("limitEdges"), DEFAULT_MAX_EDGES, FEED_MAX_EDGES)
+        try:
+            snap = await self.async_snapshot(max_nodes, max_edges)
+        except Exception as err:  # noqa: BLE001
+            return 502, {"error": sanitize_text(err, max_chars=240)}, {}
+
+        headers = {"ETag": snap.etag or "", "Cache-Control": "no-cache"}
+        if if_none_match and if_none_match == snap.etag:
+            self.stats["not_modified"] += 1
+            return 304, None, headers
+        return 200, snap.payload, headers
+
+
+class BrainGraphFeedView(HomeAssistantView):
+    """GET the panel graph feed (supports limitNodes/limitEdges, If-None-Match)."""
+
+    url = BRAIN_GRAPH_FEED_URL
+    name = "api:ai_home_copilot:brain_graph_state"
+    requires_auth = True
+
+    def __init__(self, feed: BrainGraphFeed) -> None:
+        self._feed = feed
+
+    async def get(self, request: web.Request) -> web.Response:
+        status, body, headers = await self._feed.async_respond(
+            request.query, request.headers.get("If-None-Match")
+        )
+        if body is None:
+            return web.Response(status=status, headers=headers)
+        return web.json_response(body, status=status, headers=headers)
+
+
+def async_get_brain_graph_feed(hass: HomeAssistant, coordinator) -> BrainGraphFeed:
+    """Return the shared graph feed, registering its view on first use."""
+    glob = hass.data.setdefault(DOMAIN, {}).setdefault("_global", {})
+    feed: BrainGraphFeed | None = glob.get("brain_graph_feed")
+    if feed is None:
+        feed = BrainGraphFeed(coordinator.api)
+        hass.http.register_view(BrainGraphFeedView(feed))
+        glob["brain_graph_feed"] = feed
+    else:
+        feed.api = coordinator.api
+    return feed
 
 
 async def async_publish_brain_graph_panel(hass: HomeAssistant, coordinator) -> Path | None:
-    """Fetch graph state and publish an interactive HTML panel.
+    """Publish the interactive panel shell backed by the JSON graph feed.
 
-    Returns the written path on success, else None.
+    Returns the panel path on success, else None. The shell is only
+    rewritten when its content changes.
     """
-    url = "/api/v1/graph/state?limitNodes=200&limitEdges=400"
+    feed = async_get_brain_graph_feed(hass, coordinator)
     try:
-        data = await coordinator.api.async_get(url)
+        await feed.async_snapshot()
     except Exception as err:  # noqa: BLE001
         persistent_notification.async_create(
             hass,
@@ -913,21 +1181,15 @@ async def async_publish_brain_graph_panel(hass: HomeAssistant, coordinator) -> P
         )
         return None
 
-    nodes = data.get("nodes") if isinstance(data, dict) else None
-    edges = data.get("edges") if isinstance(data, dict) else None
-    if not isinstance(nodes, list):
-        nodes = []
-    if not isinstance(edges, list):
-        edges = []
-
     html = _render_interactive_html(
-        nodes=nodes,
-        edges=edges,
+        nodes=[],
+        edges=[],
         title="PilotSuite Brain Graph",
+        feed_url=f"{BRAIN_GRAPH_FEED_URL}?limitNodes={DEFAULT_MAX_NODES}&limitEdges={DEFAULT_MAX_EDGES}",
     )
 
-    panel_path = Path("/config/www/ai_home_copilot/brain_graph_panel.html")
-    await hass.async_add_executor_job(_write_text, panel_path, html)
+    panel_path = PANEL_PATH
+    await hass.async_add_executor_job(_write_text_if_changed, panel_path, html)
 
     url_local = "/local/ai_home_copilot/brain_graph_panel.html"
     msg = "\n".join([
@@ -937,6 +1199,7 @@ async def async_publish_brain_graph_panel(hass: HomeAssistant, coordinator) -> P
         "• Zoom/Pan (mouse wheel + drag)",
         "• Filter by Node Kind, Zone, or Search",
         "• Click nodes for details",
+        "• Live data, refreshed only when the graph changes",
         "",
         "Lovelace iframe card:",
         "```yaml",
@@ -953,4 +1216,4 @@ async def async_publish_brain_graph_panel(hass: HomeAssistant, coordinator) -> P
         notification_id="ai_home_copilot_brain_graph_panel",
     )
 
-    return panel_path
\ No newline at end of file
+    return panel_path
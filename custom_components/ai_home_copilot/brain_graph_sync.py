@@ -5,23 +5,31 @@ Synchronizes Home Assistant entities/state with the Core Brain Graph module
 via the /api/v1/graph endpoints. This creates a real-time knowledge graph
 of HA entities, their relationships, and state transitions.
 
+Uploads are batched and diff-based: node/edge upserts are staged, deduped by
+id and sent in bounded chunks to /api/v1/graph/state. A content hash of what
+Core last accepted is kept per node and edge, so a resync only sends what
+changed since the last successful upload. Those hashes are dropped (so
+everything goes out again) when Core looks restarted or emptied, and on
+every ``GRAPH_FULL_UPLOAD_EVERY``-th resync to repair nodes Core pruned.
+
 Privacy-first: only essential entity metadata and anonymized state patterns.
 
 Security: entity_id sanitization prevents injection in node IDs.
 """
+import hashlib
 import logging
 import json
 import re
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any
 import asyncio
 
 import aiohttp
 from homeassistant.core import HomeAssistant, Event
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers.event import async_call_later
 from homeassistant.const import (
-    EVENT_STATE_CHANGED,
     EVENT_CALL_SERVICE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
@@ -29,10 +37,44 @@ from homeassistant.const import (
 
 from .const import DOMAIN
 from .core.error_helpers import log_error_with_context
-from .core.performance import get_entity_cache, DomainFilter
+from .core.http_pool import CoreSessionView, async_get_core_session
+from .core.performance import get_entity_cache, DomainFilter, ExpiringKeyIndex
+from .core.state_router import async_get_state_router
 
 _LOGGER = logging.getLogger(__name__)
 
+# Default domains for smart home graph (extended coverage); live state
+# changes are only routed to the sync for these.
+SYNC_DOMAINS = (
+    "light", "switch", "climate", "media_player", "cover",
+    "sensor", "binary_sensor", "person", "device_tracker",
+    "humidifier", "fan", "vacuum", "lock", "alarm_control_panel",
+)
+
+# Max nodes + edges per POST /api/v1/graph/state.
+GRAPH_UPLOAD_MAX_ITEMS = 1000
+# Live updates (state changes, service calls) are coalesced for this long.
+GRAPH_LIVE_FLUSH_DELAY_S = 1.0
+# Bound for the per-node/edge hash maps (state nodes are keyed by value);
+# evicting an entry only means it is re-sent once.
+GRAPH_MAX_TRACKED_HASHES = 20000
+# Every Nth periodic resync re-sends everything (1 h at the 5 min default),
+# so nodes Core pruned or decayed come back without an HA restart.
+GRAPH_FULL_UPLOAD_EVERY = 12
+# Dedupe window for processed state_changed/call_service events.
+PROCESSED_EVENT_TTL_S = 60
+PROCESSED_EVENT_MAX_KEYS = 5000
+
+
+def _content_hash(item: Dict[str, Any]) -> str:
+    """Stable hash of a node/edge payload."""
+    raw = json.dumps(item, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _edge_key(edge_data: Dict[str, Any]) -> str:
+    return f"{edge_data.get('source_id')}|{edge_data.get('edge_type')}|{edge_data.get('target_id')}"
+
 
 def sanitize_entity_id(entity_id: str) -> str:
     """Sanitize entity_id for use in node IDs.
@@ -106,7 +148,7 @@ class BrainGraphSync:
         self.hass = hass
         self.core_url = core_url.rstrip('/')
         self.access_token = access_token
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[CoreSessionView] = None
         self._running = False
         
         # Registries for relationships
@@ -114,12 +156,33 @@ class BrainGraphSync:
         self._device_reg: Optional[device_registry.DeviceRegistry] = None
         self._entity_reg: Optional[entity_registry.EntityRegistry] = None
         
-        # Track processed events to avoid cycles
-        self._processed_events: Set[str] = set()
-        self._max_processed_events = 1000
+        # Track processed events to avoid cycles (oldest-first, TTL-bounded)
+        self._processed_events = ExpiringKeyIndex(
+            ttl_seconds=PROCESSED_EVENT_TTL_S, max_size=PROCESSED_EVENT_MAX_KEYS
+        )
 
         # Track event listeners for proper cleanup
         self._listeners: List[callable] = []
+
+        # Batched, diff-based upload state: id -> content hash Core accepted,
+        # and staged upserts (id -> (hash, payload)) waiting for the next flush.
+        self._node_hashes: Dict[str, str] = {}
+        self._edge_hashes: Dict[str, str] = {}
+        self._pending_nodes: Dict[str, tuple[str, Dict[str, Any]]] = {}
+        self._pending_edges: Dict[str, tuple[str, Dict[str, Any]]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._unsub_flush = None
+        self._resyncs = 0
+        # (version, uptime) from the last graph/stats read, to spot Core restarts.
+        self._core_identity: tuple[Any, Any] = (None, None)
+        self._upload_stats: Dict[str, int] = {
+            "requests": 0,
+            "failed_requests": 0,
+            "nodes_sent": 0,
+            "edges_sent": 0,
+            "skipped_unchanged": 0,
+            "hash_resets": 0,
+        }
         
     async def async_start(self) -> bool:
         """Start the Brain Graph sync service."""
@@ -127,9 +190,11 @@ class BrainGraphSync:
             if self._running:
                 return True
                 
-            self._session = aiohttp.ClientSession(
+            self._session = async_get_core_session(
+                self.hass,
+                "brain_graph_sync",
                 timeout=aiohttp.ClientTimeout(total=10),
-                headers={"Authorization": f"Bearer {self.access_token}"}
+                headers={"Authorization": f"Bearer {self.access_token}"},
             )
             
             # Initialize registries
@@ -147,7 +212,9 @@ class BrainGraphSync:
             await self._sync_initial_graph()
             
             # Start listening to HA events (store unsubscribe callbacks for cleanup)
-            listener1 = self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._handle_state_changed)
+            listener1 = async_get_state_router(self.hass).async_subscribe(
+                "brain_graph_sync", self._handle_state_changed, domains=SYNC_DOMAINS
+            )
             listener2 = self.hass.bus.async_listen(EVENT_CALL_SERVICE, self._handle_service_call)
             self._listeners = [listener1, listener2]
 
@@ -177,6 +244,11 @@ class BrainGraphSync:
                 listener()
         self._listeners = []
 
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        await self._flush_graph_updates()
+
         if self._session:
             await self._session.close()
             self._session = None
@@ -189,6 +261,7 @@ class BrainGraphSync:
             async with self._session.get(f"{self.core_url}/api/v1/graph/stats") as resp:
                 if resp.status == 200:
                     stats = await resp.json()
+                    self._core_reset_reason(stats)
                     _LOGGER.info("Connected to Brain Graph (nodes: %s, edges: %s)", 
                                stats.get('nodes', 0), stats.get('edges', 0))
                     return True
@@ -218,8 +291,15 @@ class BrainGraphSync:
             
             # Sync current entity states
             await self._sync_entity_states()
-            
-            _LOGGER.info("Initial Brain Graph sync completed")
+
+            requests_before = self._upload_stats["requests"]
+            await self._flush_graph_updates()
+
+            _LOGGER.info(
+                "Brain Graph sync completed (%d requests, %d unchanged skipped)",
+                self._upload_stats["requests"] - requests_before,
+                self._upload_stats["skipped_unchanged"],
+            )
             
         except Exception as err:
             log_error_with_context(
@@ -227,6 +307,44 @@ class BrainGraphSync:
                 {"num_areas": len(self._area_reg.areas), "num_entities": len(self._entity_reg.entities)}
             )
     
+    async def async_resync(self) -> None:
+        """Full resync; only what changed since the last successful upload is sent.
+
+        Everything is sent when Core lost its graph (restart, empty stats)
+        and on every ``GRAPH_FULL_UPLOAD_EVERY``-th call.
+        """
+        if not self._running:
+            return
+        self._resyncs += 1
+        stats = await self.get_graph_stats()
+        reason = self._core_reset_reason(stats) if stats else None
+        if reason is None and self._resyncs % GRAPH_FULL_UPLOAD_EVERY == 0:
+            reason = "periodic full upload"
+        if reason is not None:
+            _LOGGER.info("Brain Graph resync re-sends all nodes and edges (%s)", reason)
+            self._node_hashes.clear()
+            self._edge_hashes.clear()
+            self._upload_stats["hash_resets"] += 1
+        await self._sync_initial_graph()
+
+    def _core_reset_reason(self, stats: Dict[str, Any]) -> Optional[str]:
+        """Why Core may no longer have what we uploaded, if it looks that way."""
+        version = stats.get("version")
+        uptime = stats.get("uptime_seconds", stats.get("uptime"))
+        last_version, last_uptime = self._core_identity
+        self._core_identity = (version, uptime)
+        if stats.get("nodes") == 0 and self._node_hashes:
+            return "Core graph is empty"
+        if last_version is not None and version != last_version:
+            return "Core version changed"
+        if (
+            isinstance(uptime, (int, float))
+            and isinstance(last_uptime, (int, float))
+            and uptime < last_uptime
+        ):
+            return "Core restarted"
+        return None
+
     async def _sync_areas(self):
         """Sync HA areas as zone nodes in Brain Graph."""
         areas = self._area_reg.areas
@@ -242,7 +360,7 @@ class BrainGraphSync:
                 }
             }
             
-            await self._send_node_update(node_data)
+            self._queue_node(node_data)
     
     async def _sync_devices(self):
         """Sync HA devices as device nodes with area relationships."""
@@ -262,7 +380,7 @@ class BrainGraphSync:
                 }
             }
             
-            await self._send_node_update(node_data)
+            self._queue_node(node_data)
             
             # Create area relationship if device has area
             if device.area_id:
@@ -275,7 +393,7 @@ class BrainGraphSync:
                     }
                 }
                 
-                await self._send_edge_update(edge_data)
+                self._queue_edge(edge_data)
     
     async def _sync_entities(self):
         """Sync HA entities as entity nodes with device/area relationships."""
@@ -302,7 +420,7 @@ class BrainGraphSync:
                 }
             }
             
-            await self._send_node_update(node_data)
+            self._queue_node(node_data)
             
             # Create device relationship if entity has device
             if entity.device_id:
@@ -315,7 +433,7 @@ class BrainGraphSync:
                     }
                 }
                 
-                await self._send_edge_update(edge_data)
+                self._queue_edge(edge_data)
             
             # Create area relationship if entity has area (direct or via device)
             area_id = entity.area_id
@@ -334,7 +452,7 @@ class BrainGraphSync:
                     }
                 }
                 
-                await self._send_edge_update(edge_data)
+                self._queue_edge(edge_data)
     
     async def _sync_entity_states(self, domains: Optional[List[str]] = None):
         """Sync current entity states as state nodes with domain filtering.
@@ -342,13 +460,8 @@ class BrainGraphSync:
         Args:
             domains: Optional list of domains to sync. If None, uses optimized default set.
         """
-        # Default domains for smart home graph (extended coverage)
         if domains is None:
-            domains = [
-                "light", "switch", "climate", "media_player", "cover",
-                "sensor", "binary_sensor", "person", "device_tracker",
-                "humidifier", "fan", "vacuum", "lock", "alarm_control_panel"
-            ]
+            domains = list(SYNC_DOMAINS)
         
         # Use domain filter for performance optimization
         states = DomainFilter.get_entities_by_domain(self.hass, set(domains))
@@ -382,7 +495,7 @@ class BrainGraphSync:
                 }
             }
             
-            await self._send_node_update(node_data)
+            self._queue_node(node_data)
             
             # Create relationship from entity to current state
             edge_data = {
@@ -395,7 +508,7 @@ class BrainGraphSync:
                 }
             }
             
-            await self._send_edge_update(edge_data)
+            self._queue_edge(edge_data)
             
         except Exception as err:
             log_error_with_context(
@@ -410,20 +523,15 @@ class BrainGraphSync:
             return
 
         event_id = f"state_changed_{event.time_fired.timestamp()}_{event.data.get('entity_id', '')}"
-        if event_id in self._processed_events:
+        if not self._processed_events.add(event_id):
             return
 
-        # Add to processed events (with size limit, prune atomically)
-        self._processed_events.add(event_id)
-        if len(self._processed_events) > self._max_processed_events:
-            # Atomic reset: keep only recent entries
-            self._processed_events = set()
-
         entity_id = event.data.get("entity_id")
         new_state = event.data.get("new_state")
 
         if entity_id and new_state:
             await self._sync_entity_state(entity_id, new_state)
+            self._schedule_flush()
     
     async def _handle_service_call(self, event: Event):
         """Handle HA service call events."""
@@ -431,12 +539,8 @@ class BrainGraphSync:
             return
             
         event_id = f"service_call_{event.time_fired.timestamp()}_{event.data.get('domain', '')}_{event.data.get('service', '')}"
-        if event_id in self._processed_events:
+        if not self._processed_events.add(event_id):
             return
-            
-        self._processed_events.add(event_id)
-        if len(self._processed_events) > self._max_processed_events:
-            self._processed_events = set()
 
         domain = event.data.get("domain")
         service = event.data.get("service")
@@ -455,7 +559,7 @@ class BrainGraphSync:
                 }
             }
             
-            await self._send_node_update(node_data)
+            self._queue_node(node_data)
             
             # Link to affected entities
             target_entities = service_data.get("entity_id", [])
@@ -475,43 +579,133 @@ class BrainGraphSync:
                     }
                 }
                 
-                await self._send_edge_update(edge_data)
+                self._queue_edge(edge_data)
+
+            self._schedule_flush()
     
-    async def _send_node_update(self, node_data: Dict[str, Any]):
-        """Send a node update to Core Brain Graph."""
-        if not self._session or not self._running:
+    # ------------------------------------------------------------------
+    # Batched, diff-based upload
+    # ------------------------------------------------------------------
+
+    def _queue_node(self, node_data: Dict[str, Any]) -> None:
+        """Stage a node upsert unless Core already has this exact content."""
+        node_id = node_data.get("node_id")
+        if not node_id:
             return
-        try:
-            async with self._session.post(
-                f"{self.core_url}/api/v1/graph/state",
-                json={"nodes": [node_data]}
-            ) as resp:
-                if resp.status != 200:
-                    _LOGGER.debug("Brain Graph node update failed: status %s", resp.status)
-        except Exception as err:
-            log_error_with_context(
-                _LOGGER, err, "Brain Graph node update",
-                {"node_type": node_data.get("type"), "node_id": node_data.get("id", "unknown")},
-                level=logging.DEBUG
-            )
-    
-    async def _send_edge_update(self, edge_data: Dict[str, Any]):
-        """Send an edge update to Core Brain Graph."""
-        if not self._session or not self._running:
+        digest = _content_hash(node_data)
+        if self._node_hashes.get(node_id) == digest:
+            self._pending_nodes.pop(node_id, None)
+            self._upload_stats["skipped_unchanged"] += 1
+            return
+        self._pending_nodes[node_id] = (digest, node_data)
+
+    def _queue_edge(self, edge_data: Dict[str, Any]) -> None:
+        """Stage an edge upsert unless Core already has this exact content."""
+        key = _edge_key(edge_data)
+        digest = _content_hash(edge_data)
+        if self._edge_hashes.get(key) == digest:
+            self._pending_edges.pop(key, None)
+            self._upload_stats["skipped_unchanged"] += 1
             return
+        self._pending_edges[key] = (digest, edge_data)
+
+    def _schedule_flush(self) -> None:
+        """Coalesce live updates into one upload shortly after the first one."""
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, GRAPH_LIVE_FLUSH_DELAY_S, self._async_flush_timer
+            )
+
+    async def _async_flush_timer(self, _now) -> None:
+        self._unsub_flush = None
+        await self._flush_graph_updates()
+
+    @staticmethod
+    def _remember(hashes: Dict[str, str], key: str, digest: str) -> None:
+        hashes.pop(key, None)
+        hashes[key] = digest
+        if len(hashes) > GRAPH_MAX_TRACKED_HASHES:
+            del hashes[next(iter(hashes))]
+
+    async def _flush_graph_updates(self) -> bool:
+        """Upload staged upserts in bounded chunks (nodes before edges).
+
+        Hashes are only recorded for chunks Core accepted; a failed chunk is
+        dropped and goes out again with the next resync. Returns False if any
+        chunk failed.
+        """
+        async with self._flush_lock:
+            if not self._session:
+                return False
+            items = [("node", key, entry) for key, entry in self._pending_nodes.items()]
+            items += [("edge", key, entry) for key, entry in self._pending_edges.items()]
+            self._pending_nodes = {}
+            self._pending_edges = {}
+
+            ok = True
+            for start in range(0, len(items), GRAPH_UPLOAD_MAX_ITEMS):
+                chunk = items[start:start + GRAPH_UPLOAD_MAX_ITEMS]
+                nodes = [data for kind, _, (_, data) in chunk if kind == "node"]
+                edges = [data for kind, _, (_, data) in chunk if kind == "edge"]
+                payload: Dict[str, Any] = {}
+                if nodes:
+                    payload["nodes"] = nodes
+                if edges:
+                    payload["edges"] = edges
+
+                if not await self._post_graph_state(payload):
+                    ok = False
+                    continue
+                self._upload_stats["nodes_sent"] += len(nodes)
+                self._upload_stats["edges_sent"] += len(edges)
+                for kind, key, (digest, _) in chunk:
+                    self._remember(
+                        self._node_hashes if kind == "node" else self._edge_hashes, key, digest
+                    )
+            return ok
+
+    async def _post_graph_state(self, payload: Dict[str, Any]) -> bool:
+        """POST one chunk to Core Brain Graph; True if accepted."""
+        self._upload_stats["requests"] += 1
         try:
             async with self._session.post(
                 f"{self.core_url}/api/v1/graph/state",
-                json={"edges": [edge_data]}
+                json=payload
             ) as resp:
-                if resp.status != 200:
-                    _LOGGER.debug("Brain Graph edge update failed: status %s", resp.status)
+                if resp.status == 200:
+                    return True
+                _LOGGER.debug("Brain Graph batch upload failed: status %s", resp.status)
         except Exception as err:
             log_error_with_context(
-                _LOGGER, err, "Brain Graph edge update",
-                {"edge_type": edge_data.get("type"), "from": edge_data.get("from"), "to": edge_data.get("to")},
+                _LOGGER, err, "Brain Graph batch upload",
+                {"nodes": len(payload.get("nodes", [])), "edges": len(payload.get("edges", []))},
                 level=logging.DEBUG
             )
+        self._upload_stats["failed_requests"] += 1
+        return False
+
+    async def async_upsert(
+        self,
+        nodes: Optional[List[Dict[str, Any]]] = None,
+        edges: Optional[List[Dict[str, Any]]] = None,
+    ) -> bool:
+        """Queue external node/edge upserts and upload what changed right away."""
+        for node_data in nodes or ():
+            self._queue_node(node_data)
+        for edge_data in edges or ():
+            self._queue_edge(edge_data)
+        return await self._flush_graph_updates()
+
+    def get_upload_stats(self) -> Dict[str, Any]:
+        """Counters for the batched graph upload (diagnostics)."""
+        return {
+            **self._upload_stats,
+            "tracked_nodes": len(self._node_hashes),
+            "tracked_edges": len(self._edge_hashes),
+            "pending_nodes": len(self._pending_nodes),
+            "pending_edges": len(self._pending_edges),
+            "dedupe": self._processed_events.get_stats(),
+        }
     
     async def get_graph_stats(self) -> Optional[Dict[str, Any]]:
         """Get Brain Graph statistics."""
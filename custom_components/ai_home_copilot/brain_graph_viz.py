@@ -1,6 +1,8 @@
 """Brain graph visualization (minimal, local-only).
 
 Generates a simple HTML/SVG file from the core graph state endpoint.
+Graph state comes from the shared panel feed (ETag-revalidated); the file
+is only re-rendered and rewritten when the graph changed.
 
 Privacy-first: node labels/ids are sanitized and clamped; no meta dumps.
 """
@@ -16,8 +18,13 @@ from typing import Any
 from homeassistant.components import persistent_notification
 from homeassistant.core import HomeAssistant
 
+from .brain_graph_panel import async_get_brain_graph_feed
+from .const import DOMAIN
 from .privacy import sanitize_text
 
+VIZ_MAX_NODES = 120
+VIZ_MAX_EDGES = 240
+
 
 @dataclass
 class _NodeViz:
@@ -188,12 +195,12 @@ def _write_text(path: Path, content: str) -> None:
 async def async_publish_brain_graph_viz(hass: HomeAssistant, coordinator) -> Path | None:
     """Fetch graph state and publish a local HTML viz.
 
-    Returns the written path on success, else None.
+    Returns the file path on success, else None.
     """
 
-    url = "/api/v1/graph/state?limitNodes=120&limitEdges=240"
+    feed = async_get_brain_graph_feed(hass, coordinator)
     try:
-        data = await coordinator.api.async_get(url)
+        snap = await feed.async_snapshot(VIZ_MAX_NODES, VIZ_MAX_EDGES)
     except Exception as err:  # noqa: BLE001
         persistent_notification.async_create(
             hass,
@@ -203,24 +210,20 @@ async def async_publish_brain_graph_viz(hass: HomeAssistant, coordinator) -> Pat
         )
         return None
 
-    nodes = data.get("nodes") if isinstance(data, dict) else None
-    edges = data.get("edges") if isinstance(data, dict) else None
-    if not isinstance(nodes, list):
-        nodes = []
-    if not isinstance(edges, list):
-        edges = []
-
-    html = _render_html(
-        nodes=nodes,
-        edges=edges,
-        title="PilotSuite brain graph (preview)",
-    )
-
     latest_path = Path("/config/www/ai_home_copilot/brain_graph_latest.html")
+    glob = hass.data.setdefault(DOMAIN, {}).setdefault("_global", {})
+    # Graph unchanged since the last publish: keep the existing file.
+    if snap.etag is None or glob.get("brain_graph_viz_etag") != snap.etag:
+        html = _render_html(
+            nodes=snap.nodes,
+            edges=snap.edges,
+            title="PilotSuite brain graph (preview)",
+        )
 
-    # No archive by default (avoid clutter). If you want history later,
-    # we can add an opt-in archive option.
-    await hass.async_add_executor_job(_write_text, latest_path, html)
+        # No archive by default (avoid clutter). If you want history later,
+        # we can add an opt-in archive option.
+        await hass.async_add_executor_job(_write_text, latest_path, html)
+        glob["brain_graph_viz_etag"] = snap.etag
 
     url_local = "/local/ai_home_copilot/brain_graph_latest.html"
     msg = "\n".join(
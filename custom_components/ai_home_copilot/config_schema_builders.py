@@ -40,6 +40,15 @@ from .const import (
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED,
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE,
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS,
+    CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+    CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+    CONF_EVENTS_FORWARDER_MIN_BATCH,
+    CONF_EVENTS_FORWARDER_TARGET_RTT_MS,
+    CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS,
+    CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT,
+    CONF_EVENTS_FORWARDER_PRIORITY_RULES,
+    CONF_EVENTS_FORWARDER_PRIORITY_MAX_BATCH,
+    CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
     CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES,
     CONF_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS,
     CONF_EVENTS_FORWARDER_ADDITIONAL_ENTITIES,
@@ -89,6 +98,15 @@ from .const import (
     DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED,
     DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE,
     DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+    DEFAULT_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+    DEFAULT_EVENTS_FORWARDER_MIN_BATCH,
+    DEFAULT_EVENTS_FORWARDER_TARGET_RTT_MS,
+    DEFAULT_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS,
+    DEFAULT_EVENTS_FORWARDER_MAX_IN_FLIGHT,
+    DEFAULT_EVENTS_FORWARDER_PRIORITY_RULES,
+    DEFAULT_EVENTS_FORWARDER_PRIORITY_MAX_BATCH,
+    DEFAULT_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
     DEFAULT_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES,
     DEFAULT_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS,
     DEFAULT_EVENTS_FORWARDER_ADDITIONAL_ENTITIES,
@@ -326,6 +344,42 @@ def build_forwarder_schema(data: dict) -> dict:
             CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS,
             default=data.get(CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS, DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS),
         ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+            default=data.get(CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD, DEFAULT_EVENTS_FORWARDER_COMPRESSED_UPLOAD),
+        ): bool,
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+            default=data.get(CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING, DEFAULT_EVENTS_FORWARDER_ADAPTIVE_BATCHING),
+        ): bool,
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_MIN_BATCH,
+            default=data.get(CONF_EVENTS_FORWARDER_MIN_BATCH, DEFAULT_EVENTS_FORWARDER_MIN_BATCH),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=5000)),
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_TARGET_RTT_MS,
+            default=data.get(CONF_EVENTS_FORWARDER_TARGET_RTT_MS, DEFAULT_EVENTS_FORWARDER_TARGET_RTT_MS),
+        ): vol.All(vol.Coerce(int), vol.Range(min=50, max=10000)),
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS,
+            default=data.get(CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS, DEFAULT_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60000)),
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT,
+            default=data.get(CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT, DEFAULT_EVENTS_FORWARDER_MAX_IN_FLIGHT),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_PRIORITY_RULES,
+            default=data.get(CONF_EVENTS_FORWARDER_PRIORITY_RULES, DEFAULT_EVENTS_FORWARDER_PRIORITY_RULES),
+        ): str,
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_PRIORITY_MAX_BATCH,
+            default=data.get(CONF_EVENTS_FORWARDER_PRIORITY_MAX_BATCH, DEFAULT_EVENTS_FORWARDER_PRIORITY_MAX_BATCH),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+        vol.Optional(
+            CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
+            default=data.get(CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS, DEFAULT_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10000)),
         vol.Optional(
             CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES,
             default=data.get(CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES, DEFAULT_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES),
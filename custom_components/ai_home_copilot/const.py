@@ -54,6 +54,25 @@ CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS = (
     "events_forwarder_persistent_queue_flush_interval_seconds"
 )
 
+# Core API v1: compact (columnar + compressed) event uploads, if Core supports it.
+CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD = "events_forwarder_compressed_upload"
+
+# Core API v1: adaptive (AIMD) batch size / flush delay within operator bounds.
+# Upper bounds are events_forwarder_max_batch / events_forwarder_flush_interval_seconds.
+CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING = "events_forwarder_adaptive_batching"
+CONF_EVENTS_FORWARDER_MIN_BATCH = "events_forwarder_min_batch"
+CONF_EVENTS_FORWARDER_TARGET_RTT_MS = "events_forwarder_target_rtt_ms"
+CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS = "events_forwarder_min_flush_delay_ms"
+
+# Core API v1: pipelined uploads (concurrent batches carrying a batch_seq).
+CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT = "events_forwarder_max_in_flight"
+
+# Core API v1: priority lane for latency-critical events (own batch size + flush trigger).
+# Rules match an event's domain, device_class or event type.
+CONF_EVENTS_FORWARDER_PRIORITY_RULES = "events_forwarder_priority_rules"
+CONF_EVENTS_FORWARDER_PRIORITY_MAX_BATCH = "events_forwarder_priority_max_batch"
+CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS = "events_forwarder_priority_flush_interval_ms"
+
 # Core API v1: events forwarder entity allowlist
 CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES = "events_forwarder_include_habitus_zones"
 CONF_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS = "events_forwarder_include_media_players"
@@ -120,6 +139,15 @@ DEFAULT_EVENTS_FORWARDER_IDEMPOTENCY_TTL_SECONDS = 300
 DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED = False
 DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE = 500
 DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS = 5
+DEFAULT_EVENTS_FORWARDER_COMPRESSED_UPLOAD = False
+DEFAULT_EVENTS_FORWARDER_ADAPTIVE_BATCHING = False
+DEFAULT_EVENTS_FORWARDER_MIN_BATCH = 10
+DEFAULT_EVENTS_FORWARDER_TARGET_RTT_MS = 500
+DEFAULT_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS = 250
+DEFAULT_EVENTS_FORWARDER_MAX_IN_FLIGHT = 4
+DEFAULT_EVENTS_FORWARDER_PRIORITY_RULES = "person,device_tracker,motion,occupancy,presence,call_service"
+DEFAULT_EVENTS_FORWARDER_PRIORITY_MAX_BATCH = 10
+DEFAULT_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS = 200
 
 DEFAULT_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES = True
 DEFAULT_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS = True
@@ -435,6 +463,15 @@ DEFAULTS_MAP: dict[str, object] = {
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED: DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED,
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE: DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE,
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS: DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS,
+    CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD: DEFAULT_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+    CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING: DEFAULT_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+    CONF_EVENTS_FORWARDER_MIN_BATCH: DEFAULT_EVENTS_FORWARDER_MIN_BATCH,
+    CONF_EVENTS_FORWARDER_TARGET_RTT_MS: DEFAULT_EVENTS_FORWARDER_TARGET_RTT_MS,
+    CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS: DEFAULT_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS,
+    CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT: DEFAULT_EVENTS_FORWARDER_MAX_IN_FLIGHT,
+    CONF_EVENTS_FORWARDER_PRIORITY_RULES: DEFAULT_EVENTS_FORWARDER_PRIORITY_RULES,
+    CONF_EVENTS_FORWARDER_PRIORITY_MAX_BATCH: DEFAULT_EVENTS_FORWARDER_PRIORITY_MAX_BATCH,
+    CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS: DEFAULT_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
     CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES: DEFAULT_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES,
     CONF_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS: DEFAULT_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS,
     CONF_EVENTS_FORWARDER_ADDITIONAL_ENTITIES: DEFAULT_EVENTS_FORWARDER_ADDITIONAL_ENTITIES,
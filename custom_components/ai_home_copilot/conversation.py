@@ -4,12 +4,32 @@ Proxies user utterances to the PilotSuite Core Add-on via the
 OpenAI-compatible /v1/chat/completions endpoint and returns the
 assistant reply as a ConversationResult.
 
+The agent is a ``ConversationEntity`` with ``supports_streaming`` set, set
+up through the ``conversation`` platform; Home Assistant versions without
+conversation entities get it registered with ``async_set_agent`` instead.
+With the entity the agent id is its ``conversation.*`` entity id rather
+than the config entry id; Assist pipelines still pointing at the entry id
+are moved over when the entity is added.
+
+The reply is streamed (``stream: true``). On Home Assistant versions with a
+streaming chat log (2025.3+) the deltas are fed into it as they arrive, so
+the assist pipeline can start on the first words; otherwise the deltas are
+assembled into the final result. Cores without streaming support get one
+blocking request as before, and its reply goes into the chat log as well.
+
+Repeated questions are answered from the entry's
+``ConversationResponseCache`` (see conversation_cache.py) while the
+context and the entities they mention are unchanged.
+
 Follows the HA 2024.x+ conversation agent pattern.
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import partial
 import logging
+import time
 
 from homeassistant.components.conversation import (
     AbstractConversationAgent,
@@ -19,21 +39,72 @@ from homeassistant.components.conversation import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import intent
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
-from .coordinator import CopilotApiError
+from .conversation_cache import async_get_response_cache
+from .api import CopilotApiError, extract_http_status
 from .conversation_ids import normalize_conversation_id
+from .entity import build_main_device_identifiers
+
+try:
+    from homeassistant.components.conversation import ConversationEntity
+except ImportError:  # Home Assistant without conversation entities
+    ConversationEntity = None
 
 _LOGGER = logging.getLogger(__name__)
 
+# Core answered the stream request with "not supported": use a blocking request.
+_STREAM_UNSUPPORTED_STATUSES = {400, 404, 405, 415, 501}
+
+
+async def _once(text: str) -> AsyncIterator[str]:
+    yield text
+
+
+async def _feed_chat_log(chat_log, agent_id: str, deltas: AsyncIterator[str]) -> None:
+    """Stream text deltas into HA's chat log as one assistant turn.
 
-class StyxConversationAgent(AbstractConversationAgent):
+    The turn is opened together with the first delta, so a stream that
+    fails before producing any text leaves no empty assistant message.
+    """
+
+    async def _ha_deltas():
+        opened = False
+        async for text in deltas:
+            if opened:
+                yield {"content": text}
+            else:
+                opened = True
+                yield {"role": "assistant", "content": text}
+
+    async for _content in chat_log.async_add_delta_content_stream(agent_id, _ha_deltas()):
+        pass
+
+
+class StyxConversationEntity(ConversationEntity or object, AbstractConversationAgent):
     """Conversation agent that proxies to PilotSuite Core."""
 
+    _attr_has_entity_name = True
+    _attr_name = None
+    _attr_supports_streaming = True
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the agent."""
         self.hass = hass
         self.entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_conversation"
+        self._attr_device_info = DeviceInfo(
+            identifiers=build_main_device_identifiers(entry.data | entry.options),
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Move Assist pipelines from the legacy agent id to this entity."""
+        await super().async_added_to_hass()
+        try:
+            await async_migrate_assist_pipelines(self.hass, self.entry, self.entity_id)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Failed to migrate Assist pipelines to %s", self.entity_id)
 
     @property
     def supported_languages(self) -> list[str]:
@@ -43,10 +114,40 @@ class StyxConversationAgent(AbstractConversationAgent):
     async def async_process(
         self, user_input: ConversationInput
     ) -> ConversationResult:
-        """Process a user utterance via PilotSuite Core."""
+        """Process a user utterance via PilotSuite Core.
+
+        Entry point on Home Assistant versions that do not hand the agent a
+        chat log themselves; opens one when the API exists.
+        """
+        conversation_id = normalize_conversation_id(user_input.conversation_id)
+        try:
+            from homeassistant.components.conversation import async_get_chat_log
+            from homeassistant.helpers import chat_session
+        except ImportError:
+            return await self._async_respond(user_input, conversation_id, None)
+
+        with (
+            chat_session.async_get_chat_session(self.hass, conversation_id) as session,
+            async_get_chat_log(self.hass, session, user_input) as chat_log,
+        ):
+            return await self._async_respond(user_input, conversation_id, chat_log)
+
+    async def _async_handle_message(
+        self, user_input: ConversationInput, chat_log
+    ) -> ConversationResult:
+        """Process a user utterance into the chat log HA opened for it."""
+        return await self._async_respond(
+            user_input, normalize_conversation_id(chat_log.conversation_id), chat_log
+        )
+
+    async def _async_respond(
+        self,
+        user_input: ConversationInput,
+        conversation_id: str,
+        chat_log,
+    ) -> ConversationResult:
         entry_data = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id, {})
         coordinator = entry_data.get("coordinator")
-        conversation_id = normalize_conversation_id(user_input.conversation_id)
         language = user_input.language or self.hass.config.language or "de"
 
         if coordinator is None:
@@ -54,8 +155,14 @@ class StyxConversationAgent(AbstractConversationAgent):
                 language, "PilotSuite coordinator not available.", conversation_id
             )
 
+        feed = (
+            partial(_feed_chat_log, chat_log, user_input.agent_id)
+            if chat_log is not None else None
+        )
+
         # Build context-rich system prompt
         messages: list[dict[str, str]] = []
+        system_prompt = ""
         try:
             from .conversation_context import async_build_system_prompt
             system_prompt = await async_build_system_prompt(
@@ -66,12 +173,24 @@ class StyxConversationAgent(AbstractConversationAgent):
         except Exception:
             _LOGGER.debug("Could not build conversation context, proceeding without")
 
+        # Same question, same context, nothing it mentions changed: reuse the reply.
+        cache = async_get_response_cache(self.hass, self.entry)
+        cache_key = (
+            cache.key_for(user_input.text, language, system_prompt or "")
+            if cache is not None else None
+        )
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                if feed is not None:
+                    await feed(_once(cached))
+                return self._speech_result(language, cached, conversation_id)
+
         messages.append({"role": "user", "content": user_input.text})
 
         try:
-            result = await coordinator.api.async_chat_completions(
-                messages=messages,
-                conversation_id=conversation_id,
+            reply, complete = await self._async_stream_reply(
+                coordinator.api, feed, messages, conversation_id
             )
         except CopilotApiError as err:
             _LOGGER.error("PilotSuite API error: %s", err)
@@ -89,9 +208,74 @@ class StyxConversationAgent(AbstractConversationAgent):
                 language, "Could not reach PilotSuite Core.", conversation_id
             )
 
-        reply = result.get("content", "")
+        # A reply cut off mid-stream is shown once but never reused.
+        if cache_key is not None and reply and complete:
+            cache.store(cache_key, user_input.text, reply)
+
+        return self._speech_result(
+            language, reply or "No response from PilotSuite.", conversation_id
+        )
+
+    async def _async_stream_reply(
+        self,
+        api,
+        feed: Callable[[AsyncIterator[str]], Awaitable[None]] | None,
+        messages: list[dict[str, str]],
+        conversation_id: str,
+    ) -> tuple[str, bool]:
+        """Stream the reply from Core; fall back to one blocking request.
+
+        Returns the reply text and whether it is complete (False when the
+        stream broke off after some text).
+        """
+        parts: list[str] = []
+        started = time.monotonic()
+
+        async def _deltas():
+            async for text in api.async_chat_completions_stream(
+                messages=messages, conversation_id=conversation_id
+            ):
+                if not parts:
+                    _LOGGER.debug(
+                        "PilotSuite first token after %.2fs", time.monotonic() - started
+                    )
+                parts.append(text)
+                yield text
+
+        deltas = _deltas()
+        try:
+            if feed is not None:
+                await feed(deltas)
+            # Collect whatever the chat log did not consume (or everything).
+            async for _text in deltas:
+                pass
+        except CopilotApiError as err:
+            if parts:
+                _LOGGER.warning("PilotSuite reply stream broke off: %s", err)
+                return "".join(parts), False
+            if extract_http_status(err) not in _STREAM_UNSUPPORTED_STATUSES:
+                raise
+            _LOGGER.debug("Core does not stream chat completions (%s); retrying without", err)
+            result = await api.async_chat_completions(
+                messages=messages,
+                conversation_id=conversation_id,
+            )
+            reply = result.get("content", "")
+            if feed is not None and reply:
+                await feed(_once(reply))
+            return reply, True
+
+        return "".join(parts), True
+
+    @staticmethod
+    def _speech_result(
+        language: str,
+        speech: str,
+        conversation_id: str,
+    ) -> ConversationResult:
+        """Build a ConversationResult carrying ``speech``."""
         response = intent.IntentResponse(language=language)
-        response.async_set_speech(reply or "No response from PilotSuite.")
+        response.async_set_speech(speech)
         return ConversationResult(
             response=response,
             conversation_id=conversation_id,
@@ -112,13 +296,62 @@ class StyxConversationAgent(AbstractConversationAgent):
         )
 
 
+def async_get_agent_id(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the Assist agent id of ``entry``'s conversation agent.
+
+    The conversation entity id where entities exist, otherwise (or before
+    the entity is registered) the config entry id.
+    """
+    if ConversationEntity is None:
+        return entry.entry_id
+    from homeassistant.helpers import entity_registry as er
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "conversation", DOMAIN, f"{entry.entry_id}_conversation"
+    )
+    return entity_id or entry.entry_id
+
+
+async def async_migrate_assist_pipelines(
+    hass: HomeAssistant, entry: ConfigEntry, agent_id: str
+) -> int:
+    """Point pipelines that use the legacy agent id (the entry id) at ``agent_id``."""
+    if agent_id == entry.entry_id:
+        return 0
+    from homeassistant.components import assist_pipeline
+
+    migrated = 0
+    for pipeline in assist_pipeline.async_get_pipelines(hass):
+        if pipeline.conversation_engine != entry.entry_id:
+            continue
+        await assist_pipeline.async_update_pipeline(
+            hass, pipeline, conversation_engine=agent_id
+        )
+        migrated += 1
+    if migrated:
+        _LOGGER.info(
+            "Moved %d Assist pipeline(s) from agent %s to %s",
+            migrated, entry.entry_id, agent_id,
+        )
+    return migrated
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities
+) -> None:
+    """Set up the PilotSuite conversation entity."""
+    async_add_entities([StyxConversationEntity(hass, entry)])
+
+
 async def async_setup_conversation(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
-    """Register the PilotSuite conversation agent."""
+    """Register the agent on Home Assistant versions without conversation entities."""
+    if ConversationEntity is not None:
+        return
     from homeassistant.components.conversation import async_set_agent
 
-    agent = StyxConversationAgent(hass, entry)
+    agent = StyxConversationEntity(hass, entry)
     async_set_agent(hass, entry, agent)
     _LOGGER.info("PilotSuite conversation agent registered")
 
@@ -126,7 +359,9 @@ async def async_setup_conversation(
 async def async_unload_conversation(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
-    """Unregister the PilotSuite conversation agent."""
+    """Unregister the agent registered by ``async_setup_conversation``."""
+    if ConversationEntity is not None:
+        return
     from homeassistant.components.conversation import async_unset_agent
 
     async_unset_agent(hass, entry)
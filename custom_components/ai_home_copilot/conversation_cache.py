@@ -0,0 +1,260 @@
+"""Response cache for repeated conversation questions.
+
+Household members ask the same few questions ("ist jemand zuhause?", "wie
+warm ist es im Wohnzimmer?") over and over. ``ConversationResponseCache``
+remembers the reply per normalized utterance, language and a fingerprint
+of the system prompt, which already summarises the live context (mood,
+zones, persons, weather). A cached reply is dropped as soon as any entity
+it refers to changes state: the entities are the ones whose entity_id or
+friendly name appears in the question or the answer. Entries also expire
+after ``ttl_s`` and the cache is an LRU of at most ``max_entries``.
+
+Only self-contained questions are cached. Commands must reach Core every
+time because answering them has side effects, and that includes polite ones
+("kannst du das Licht anmachen?", "could you lock the door?") and
+imperatives with a question mark. Follow-ups ("Warum?", "Und im Bad?") depend
+on the previous turn and are not cached either.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import re
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .core.state_router import async_get_state_router
+
+RESPONSE_CACHE_TTL_S = 600.0
+RESPONSE_CACHE_MAX_ENTRIES = 128
+# Entities tracked per cached reply; answers naming more are not cached.
+RESPONSE_CACHE_MAX_REFS = 32
+# Friendly names shorter than this match too much text to be useful.
+_MIN_NAME_LEN = 3
+
+_QUESTION_WORDS = frozenset({
+    # de
+    "wer", "was", "wie", "wo", "wann", "warum", "welche", "welcher", "welches",
+    "wieviel", "wieviele", "ist", "sind", "gibt", "hat", "haben", "läuft", "laeuft",
+    # en
+    "who", "what", "whats", "how", "where", "when", "why", "which", "is", "are",
+    "does", "do", "did", "were", "any", "anyone",  # "was" is listed under de
+})
+# First words that make an utterance a request: modal openers of polite
+# commands and imperative verbs.
+_COMMAND_OPENERS = frozenset({
+    # de
+    "kannst", "könntest", "koenntest", "würdest", "wuerdest", "können", "koennen",
+    "könnten", "koennten", "würden", "wuerden", "mach", "mache", "schalte", "schalt",
+    "stell", "stelle", "setz", "setze", "öffne", "oeffne", "schließ", "schließe",
+    "schliess", "schliesse", "dimm", "dimme", "spiel", "spiele", "starte", "stopp",
+    "stoppe", "aktiviere", "deaktiviere", "sperre", "erinnere", "sag",
+    # en
+    "can", "could", "would", "will", "turn", "switch", "set", "open", "close", "start",
+    "stop", "play", "dim", "lock", "unlock", "activate", "deactivate", "remind", "tell",
+})
+_POLITE_WORDS = frozenset({"bitte", "please"})
+# Openers of turns that continue the previous one.
+_FOLLOW_UP_OPENERS = frozenset({"und", "aber", "also", "and", "but", "so"})
+_FOLLOW_UP_PREFIXES = ("was ist mit ", "wie ist es mit ", "what about ", "how about ")
+# Shorter utterances ("Warum?", "Wie lange?") lean on the previous turn.
+_MIN_QUESTION_WORDS = 3
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+_ENTITY_ID = re.compile(r"\b[a-z_]+\.[a-z0-9_]+\b")
+
+
+def normalize_utterance(text: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of ``text``."""
+    text = _NON_WORD.sub(" ", text.casefold().replace("'", ""))
+    return _SPACES.sub(" ", text).strip()
+
+
+def is_command(text: str) -> bool:
+    """Polite request or imperative, whatever the punctuation."""
+    words = normalize_utterance(text).split()
+    return bool(words) and (words[0] in _COMMAND_OPENERS or not _POLITE_WORDS.isdisjoint(words))
+
+
+def is_follow_up(text: str) -> bool:
+    """Turn that only makes sense after the previous one."""
+    normalized = normalize_utterance(text)
+    words = normalized.split()
+    return (
+        len(words) < _MIN_QUESTION_WORDS
+        or words[0] in _FOLLOW_UP_OPENERS
+        or normalized.startswith(_FOLLOW_UP_PREFIXES)
+    )
+
+
+def is_question(text: str) -> bool:
+    if is_command(text):
+        return False
+    if text.rstrip().endswith("?"):
+        return True
+    normalized = normalize_utterance(text)
+    return bool(normalized) and normalized.split(" ", 1)[0] in _QUESTION_WORDS
+
+
+class ConversationResponseCache:
+    """LRU of replies, invalidated by state changes of the entities they mention."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        ttl_s: float = RESPONSE_CACHE_TTL_S,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._hass = hass
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        # key -> (expires_at, reply, referenced entity ids)
+        self._entries: OrderedDict[str, tuple[float, str, frozenset[str]]] = OrderedDict()
+        self._by_entity: dict[str, set[str]] = {}
+        self._sub = None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "uncacheable": 0,
+            "invalidations": 0,
+            "evictions": 0,
+            "expired": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def key_for(self, text: str, language: str, context: str) -> str | None:
+        """Cache key, or None when the utterance must not be answered from cache."""
+        if not is_question(text) or is_follow_up(text):
+            self._stats["uncacheable"] += 1
+            return None
+        fingerprint = hashlib.sha1(context.encode("utf-8")).hexdigest()[:16]
+        return f"{language}|{fingerprint}|{normalize_utterance(text)}"
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        if entry[0] <= time.monotonic():
+            self._stats["expired"] += 1
+            self._stats["misses"] += 1
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry[1]
+
+    def store(self, key: str, text: str, reply: str) -> None:
+        if not reply:
+            return
+        refs = self._referenced_entities(f"{text}\n{reply}")
+        if refs is None:
+            self._stats["uncacheable"] += 1
+            return
+        self._drop(key)
+        self._entries[key] = (time.monotonic() + self.ttl_s, reply, refs)
+        for entity_id in refs:
+            self._by_entity.setdefault(entity_id, set()).add(key)
+        self._stats["stores"] += 1
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self._stats["evictions"] += 1
+        self._watch()
+
+    def _referenced_entities(self, text: str) -> frozenset[str] | None:
+        """Entities named in ``text`` (by id or friendly name); None if too many."""
+        haystack = text.casefold()
+        refs = {eid for eid in _ENTITY_ID.findall(haystack) if self._hass.states.get(eid) is not None}
+        for state in self._hass.states.async_all():
+            name = state.attributes.get("friendly_name")
+            if isinstance(name, str) and len(name) >= _MIN_NAME_LEN and name.casefold() in haystack:
+                refs.add(state.entity_id)
+        if len(refs) > RESPONSE_CACHE_MAX_REFS:
+            return None
+        return frozenset(refs)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for entity_id in entry[2]:
+            keys = self._by_entity.get(entity_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_entity[entity_id]
+
+    def _watch(self) -> None:
+        """Keep the state router subscription on exactly the referenced entities."""
+        entity_ids = set(self._by_entity)
+        if self._sub is None:
+            if entity_ids:
+                self._sub = async_get_state_router(self._hass).async_subscribe(
+                    "conversation_response_cache", self._on_state_changed, entity_ids=entity_ids
+                )
+        elif entity_ids:
+            self._sub.update(entity_ids)
+        else:
+            self._sub()
+            self._sub = None
+
+    def _on_state_changed(self, event) -> None:
+        keys = self._by_entity.get(event.data.get("entity_id"))
+        if not keys:
+            return
+        for key in list(keys):
+            self._drop(key)
+            self._stats["invalidations"] += 1
+        self._watch()
+
+    def invalidate_all(self) -> None:
+        self._entries.clear()
+        self._by_entity.clear()
+        self._watch()
+
+    def async_close(self) -> None:
+        self.invalidate_all()
+
+    def get_stats(self) -> dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else None,
+            "entries": len(self._entries),
+            "tracked_entities": len(self._by_entity),
+        }
+
+
+def async_get_response_cache(hass: HomeAssistant, entry: ConfigEntry) -> ConversationResponseCache | None:
+    """The entry's response cache (created on first use); None if the entry is not loaded."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not isinstance(entry_data, dict):
+        return None
+    cache = entry_data.get("response_cache")
+    if cache is None:
+        cache = ConversationResponseCache(hass)
+        entry_data["response_cache"] = cache
+    return cache
+
+
+__all__ = [
+    "ConversationResponseCache",
+    "async_get_response_cache",
+    "is_command",
+    "is_follow_up",
+    "is_question",
+    "normalize_utterance",
+]
@@ -5,13 +5,23 @@ conversation agent has full awareness of the home state.
 
 Max ~2000 characters to stay within LLM context budgets.
 
+Sections are cached per config entry (``PromptSectionCache``) so follow-up
+turns reuse what has not changed. Each section has a TTL and, where HA can
+tell us, an explicit trigger: person/weather state changes, changes of the
+zone temperature/humidity sensors and coordinator refreshes (mood). The
+zones section reads the packaged zones_config.json, so edits to it show up
+within the section TTL. Build times are recorded per section.
+
 Path: custom_components/ai_home_copilot/conversation_context.py
 """
 from __future__ import annotations
 
+import json
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -22,6 +32,22 @@ _LOGGER = logging.getLogger(__name__)
 
 _MAX_PROMPT_CHARS = 2000
 
+_ZONES_CONFIG_PATH = Path(__file__).resolve().parent / "data" / "zones_config.json"
+# (mtime_ns, zones) of the last zones_config.json read.
+_zones_config_cache: tuple[int, list[dict[str, Any]]] | None = None
+
+# Section order in the prompt and the longest a cached copy may be reused.
+# Sections with a trigger below keep the TTL as a safety net only.
+PROMPT_SECTION_TTL_S: dict[str, float] = {
+    "identity": 3600.0,
+    "mood": 60.0,  # + coordinator refresh
+    "zones": 900.0,  # + zone sensor state changes
+    "persons": 900.0,  # + person.* state changes
+    "weather": 900.0,  # + weather.* state changes
+    "suggestions": 60.0,
+    "analysis": 300.0,
+}
+
 
 async def async_build_system_prompt(
     hass: HomeAssistant,
@@ -40,47 +66,19 @@ async def async_build_system_prompt(
       6. Pending suggestions (top 3)
       7. Automation analysis summary
 
+    Unchanged sections come from the entry's ``PromptSectionCache``.
+
     Returns a prompt string, max ~2000 chars.
     """
+    cache = async_get_prompt_cache(hass, entry)
     parts: list[str] = []
-
-    # 1. Identity
-    assistant_name = _get_config(hass, entry, "assistant_name", "Styx")
-    home_name = _get_home_name(hass)
-    parts.append(
-        f"Du bist {assistant_name}, der lokale KI-Assistent fuer SmartHome \"{home_name}\". "
-        f"Antworte auf Deutsch, kurz und hilfreich."
-    )
-
-    # 2. Live Mood
-    mood_str = _build_mood_section(hass, entry)
-    if mood_str:
-        parts.append(mood_str)
-
-    # 3. Zones
-    zone_str = _build_zones_section(hass, entry)
-    if zone_str:
-        parts.append(zone_str)
-
-    # 4. Persons
-    person_str = _build_persons_section(hass)
-    if person_str:
-        parts.append(person_str)
-
-    # 5. Weather
-    weather_str = _build_weather_section(hass)
-    if weather_str:
-        parts.append(weather_str)
-
-    # 6. Suggestions
-    suggestions_str = _build_suggestions_section(hass, entry)
-    if suggestions_str:
-        parts.append(suggestions_str)
-
-    # 7. Automation analysis
-    analysis_str = _build_analysis_section(hass, entry)
-    if analysis_str:
-        parts.append(analysis_str)
+    for name in PROMPT_SECTION_TTL_S:
+        if cache is not None:
+            text = cache.get(name)
+        else:
+            text = _SECTION_BUILDERS[name](hass, entry)
+        if text:
+            parts.append(text)
 
     prompt = "\n".join(parts)
 
@@ -91,6 +89,16 @@ async def async_build_system_prompt(
     return prompt
 
 
+def _build_identity_section(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Build the identity + personality line."""
+    assistant_name = _get_config(hass, entry, "assistant_name", "Styx")
+    home_name = _get_home_name(hass)
+    return (
+        f"Du bist {assistant_name}, der lokale KI-Assistent fuer SmartHome \"{home_name}\". "
+        f"Antworte auf Deutsch, kurz und hilfreich."
+    )
+
+
 def _get_config(hass: HomeAssistant, entry: ConfigEntry, key: str, default: str) -> str:
     """Get a config value from entry options or data."""
     val = entry.options.get(key, entry.data.get(key, default))
@@ -146,19 +154,38 @@ def _build_mood_section(hass: HomeAssistant, entry: ConfigEntry) -> str:
     )
 
 
-def _build_zones_section(hass: HomeAssistant, entry: ConfigEntry) -> str:
-    """Build zone summary with current temperatures."""
-    import json
-    from pathlib import Path
-
-    # Load zone config
-    zones_path = Path(__file__).resolve().parent / "data" / "zones_config.json"
+def _load_zones_config() -> list[dict[str, Any]]:
+    """Zones from zones_config.json; re-read only when the file changes."""
+    global _zones_config_cache
     try:
-        raw = json.loads(zones_path.read_text(encoding="utf-8"))
+        mtime = _ZONES_CONFIG_PATH.stat().st_mtime_ns
+        if _zones_config_cache is not None and _zones_config_cache[0] == mtime:
+            return _zones_config_cache[1]
+        raw = json.loads(_ZONES_CONFIG_PATH.read_text(encoding="utf-8"))
         zones = raw.get("zones", [])
     except Exception:
-        return ""
+        return []
+    if not isinstance(zones, list):
+        zones = []
+    _zones_config_cache = (mtime, zones)
+    return zones
+
 
+def _zone_sensor_ids(zones: list[dict[str, Any]]) -> set[str]:
+    """Entity ids the zones section reads (first temperature/humidity per zone)."""
+    ids: set[str] = set()
+    for zone in zones[:12]:
+        entities = zone.get("entities", {})
+        for role in ("temperature", "humidity"):
+            eids = entities.get(role, [])
+            if eids:
+                ids.add(eids[0])
+    return ids
+
+
+def _build_zones_section(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Build zone summary with current temperatures."""
+    zones = _load_zones_config()
     if not zones:
         return ""
 
@@ -254,3 +281,139 @@ def _state_val(hass: HomeAssistant, entity_id: str) -> str:
     if state is None or state.state in ("unknown", "unavailable", ""):
         return ""
     return state.state
+
+
+_SECTION_BUILDERS: dict[str, Callable[[HomeAssistant, ConfigEntry], str]] = {
+    "identity": _build_identity_section,
+    "mood": _build_mood_section,
+    "zones": _build_zones_section,
+    "persons": lambda hass, entry: _build_persons_section(hass),
+    "weather": lambda hass, entry: _build_weather_section(hass),
+    "suggestions": _build_suggestions_section,
+    "analysis": _build_analysis_section,
+}
+
+
+class PromptSectionCache:
+    """Per-entry cache of built prompt sections with invalidation triggers."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self._hass = hass
+        self._entry = entry
+        # name -> (built_at monotonic, text)
+        self._sections: dict[str, tuple[float, str]] = {}
+        self._stats: dict[str, dict[str, float]] = {
+            name: {"hits": 0, "builds": 0, "invalidations": 0, "build_s_total": 0.0, "build_s_max": 0.0}
+            for name in PROMPT_SECTION_TTL_S
+        }
+        self._unsubs: list[Callable[[], None]] = []
+        self._zone_sub = None
+        self._closed = False
+        self._async_setup_triggers()
+
+    def _async_setup_triggers(self) -> None:
+        from .core.state_router import async_get_state_router
+
+        self._router = async_get_state_router(self._hass)
+        self._unsubs.append(
+            self._router.async_subscribe(
+                "prompt_cache_persons", lambda event: self.invalidate("persons"), domains=["person"]
+            )
+        )
+        self._unsubs.append(
+            self._router.async_subscribe(
+                "prompt_cache_weather", lambda event: self.invalidate("weather"), domains=["weather"]
+            )
+        )
+        entry_data = self._hass.data.get(DOMAIN, {}).get(self._entry.entry_id)
+        coordinator = entry_data.get("coordinator") if isinstance(entry_data, dict) else None
+        if coordinator is not None and hasattr(coordinator, "async_add_listener"):
+            self._unsubs.append(coordinator.async_add_listener(lambda: self.invalidate("mood")))
+
+    def _watch_zone_entities(self, entity_ids: set[str]) -> None:
+        """Keep the zone sensor subscription on exactly the ids the section read."""
+        if self._zone_sub is None:
+            if entity_ids:
+                self._zone_sub = self._router.async_subscribe(
+                    "prompt_cache_zones", lambda event: self.invalidate("zones"), entity_ids=entity_ids
+                )
+        elif entity_ids:
+            self._zone_sub.update(entity_ids)
+        else:
+            self._zone_sub()
+            self._zone_sub = None
+
+    def get(self, name: str) -> str:
+        """Cached text of ``name`` while fresh, otherwise rebuild it."""
+        stats = self._stats[name]
+        cached = self._sections.get(name)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < PROMPT_SECTION_TTL_S[name]:
+            stats["hits"] += 1
+            return cached[1]
+
+        t0 = time.perf_counter()
+        text = _SECTION_BUILDERS[name](self._hass, self._entry)
+        if name == "zones" and not self._closed:
+            self._watch_zone_entities(_zone_sensor_ids(_load_zones_config()))
+        elapsed = time.perf_counter() - t0
+        stats["builds"] += 1
+        stats["build_s_total"] += elapsed
+        if elapsed > stats["build_s_max"]:
+            stats["build_s_max"] = elapsed
+        self._sections[name] = (now, text)
+        return text
+
+    def invalidate(self, *names: str) -> None:
+        """Drop the named sections (all of them when none are given)."""
+        for name in names or tuple(self._sections):
+            if self._sections.pop(name, None) is not None:
+                self._stats[name]["invalidations"] += 1
+
+    def async_close(self) -> None:
+        self._closed = True
+        unsubs, self._unsubs = self._unsubs, []
+        if self._zone_sub is not None:
+            unsubs.append(self._zone_sub)
+            self._zone_sub = None
+        for unsub in unsubs:
+            try:
+                unsub()
+            except Exception:  # noqa: BLE001
+                pass
+        self._sections.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        sections: dict[str, Any] = {}
+        hits = builds = 0
+        for name, st in self._stats.items():
+            hits += st["hits"]
+            builds += st["builds"]
+            sections[name] = {
+                "hits": st["hits"],
+                "builds": st["builds"],
+                "invalidations": st["invalidations"],
+                "build_ms_total": round(st["build_s_total"] * 1000.0, 2),
+                "build_ms_avg": (
+                    round(st["build_s_total"] * 1000.0 / st["builds"], 3) if st["builds"] else 0.0
+                ),
+                "build_ms_max": round(st["build_s_max"] * 1000.0, 3),
+                "cached": name in self._sections,
+            }
+        lookups = hits + builds
+        return {
+            "hit_rate": round(hits / lookups, 3) if lookups else None,
+            "sections": sections,
+        }
+
+
+def async_get_prompt_cache(hass: HomeAssistant, entry: ConfigEntry) -> PromptSectionCache | None:
+    """The entry's prompt cache (created on first use); None if the entry is not loaded."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not isinstance(entry_data, dict):
+        return None
+    cache = entry_data.get("prompt_cache")
+    if cache is None:
+        cache = PromptSectionCache(hass, entry)
+        entry_data["prompt_cache"] = cache
+    return cache
@@ -2,16 +2,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import timedelta
 import json
 import logging
+import time
 from typing import Any
-import re
 
 import aiohttp
 
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -20,9 +20,19 @@ from .api import (
     CopilotApiClient as SharedCopilotApiClient,
     CopilotApiError,
     CopilotStatus,
+    extract_http_status,
 )
 from .connection_config import resolve_core_connection_from_mapping
 from .core_endpoint import build_base_url, build_candidate_hosts
+from .core.http_pool import async_get_core_session
+from .core.latency import (
+    OUTCOME_CANCELLED,
+    OUTCOME_CLIENT_ERROR,
+    OUTCOME_TIMEOUT,
+    EndpointLatencyTracker,
+    HostHealth,
+    status_outcome,
+)
 from .camera_entities import (
     CameraState,
     CameraMotionEvent,
@@ -34,16 +44,89 @@ from .camera_entities import (
 
 _LOGGER = logging.getLogger(__name__)
 CHAT_COMPLETIONS_TIMEOUT_S = 90.0
+# Streaming has no overall cap (long answers keep flowing); it is aborted
+# after this long without any data instead.
+CHAT_STREAM_IDLE_TIMEOUT_S = CHAT_COMPLETIONS_TIMEOUT_S
 
+# Entity GETs: concurrent identical requests share one in-flight call and
+# the response is reused for SHARED_GET_TTL_S.
+SHARED_GET_TTL_S = 5.0
+SHARED_GET_MAX_ENTRIES = 256
+# Shared GET misses arriving within this window (e.g. one platform poll of
+# all sensors) are fetched together in one hub snapshot call.
+HUB_SNAPSHOT_PATH = "/api/v1/hub/snapshot"
+HUB_SNAPSHOT_WINDOW_S = 0.02
+HUB_SNAPSHOT_MAX_PATHS = 32
+_SNAPSHOT_UNSUPPORTED_STATUSES = frozenset({404, 405, 501})
+
+# Hedged GETs (several base URLs only): when the primary host has not
+# answered within its own p95 latency, the same GET goes to the next
+# healthiest host and the first answer wins. At most HEDGE_MAX_RATIO of
+# GETs are hedged (token bucket, HEDGE_BURST deep).
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_DEFAULT_DELAY_S = 1.0
+HEDGE_MIN_DELAY_S = 0.05
+HEDGE_MAX_DELAY_S = 3.0
+HEDGE_MAX_RATIO = 0.1
+HEDGE_BURST = 5.0
+# Below this success score the active host stops being the primary.
+HEDGE_MIN_HOST_SCORE = 0.5
+
+# Hybrid mode: mood/neuron changes arrive in real time via webhook push; the
+# coordinator polls as a fallback. Every tick only refetches the endpoints
+# whose own refresh interval has elapsed (conditional GET, 304 when unchanged).
+# A failed endpoint keeps its last value and is retried on the next tick.
+COORDINATOR_TICK_S = 120
+ENDPOINT_REFRESH_S: dict[str, float] = {
+    # /health plus a revalidated /version: the availability check, every tick.
+    "status": COORDINATOR_TICK_S,
+    "mood": 240,
+    "neurons": 240,
+    "override_modes": 600,
+    "zone_automation": 900,
+    "light_module": 900,
+    "music_cloud": 1800,
+    "core_modules": 1800,
+    "brain_summary": 1800,
+    "rag_status": 1800,
+    "habitus_rules": 3600,
+    "capabilities": 3600,
+}
+# Ticks drift by a few seconds; without slack a 240 s endpoint would wait
+# for the third tick.
+ENDPOINT_DUE_SLACK_S = 5.0
+# Written when an endpoint fails before it ever answered.
+ENDPOINT_FALLBACKS: dict[str, Any] = {
+    "capabilities": {},
+    "mood": {"mood": "unknown", "confidence": 0.0},
+    "neurons": {"neurons": {}},
+    "core_modules": {},
+    "brain_summary": {},
+    "habitus_rules": {},
+    "rag_status": {},
+    "override_modes": {},
+    "music_cloud": {},
+    "light_module": {},
+    "zone_automation": {},
+}
 
-def _extract_http_status(err: CopilotApiError) -> int | None:
-    match = re.match(r"^HTTP\s+(\d+)\s+for\s+", str(err))
-    if not match:
-        return None
-    try:
-        return int(match.group(1))
-    except (TypeError, ValueError):
-        return None
+
+def _completion_delta(chunk: Any) -> str:
+    """Text carried by one chat completion chunk or response.
+
+    Handles OpenAI-style ``choices[0].delta`` (stream) / ``choices[0].message``
+    (non-stream) and Ollama-style ``message.content`` NDJSON lines.
+    """
+    if not isinstance(chunk, dict):
+        return ""
+    choices = chunk.get("choices")
+    if isinstance(choices, list) and choices and isinstance(choices[0], dict):
+        part = choices[0].get("delta") or choices[0].get("message") or {}
+    else:
+        part = chunk.get("message") or {}
+    content = part.get("content") if isinstance(part, dict) else None
+    return content if isinstance(content, str) else ""
 
 
 def _should_failover(err: CopilotApiError) -> bool:
@@ -53,7 +136,7 @@ def _should_failover(err: CopilotApiError) -> bool:
     if message.startswith("Unexpected content type ") or message.startswith("Invalid JSON from "):
         return True
 
-    status = _extract_http_status(err)
+    status = extract_http_status(err)
     if status is None:
         return False
 
@@ -79,6 +162,119 @@ class CopilotApiClient(SharedCopilotApiClient):
         if not self._base_urls:
             self._base_urls = [primary]
         self._active_base_url = self._base_urls[0]
+        # path -> (validators, last body) for async_get_revalidated.
+        self._revalidation_cache: dict[str, tuple[dict[str, str], dict]] = {}
+        self._revalidation_stats = {"requests": 0, "not_modified": 0}
+        self._latency = EndpointLatencyTracker()
+        # Hedged GETs: per-host health and a token bucket capping the hedge rate.
+        self.hedge_gets = True
+        self._hosts: dict[str, HostHealth] = {}
+        self._hedge_tokens = HEDGE_BURST
+        self._hedge_stats = {"requests": 0, "hedged": 0, "secondary_wins": 0, "throttled": 0}
+        # path -> in-flight request / (expires_at, body) for async_get_shared.
+        self._shared_inflight: dict[str, asyncio.Future] = {}
+        self._shared_cache: dict[str, tuple[float, dict]] = {}
+        self._shared_stats = {
+            "requests": 0,
+            "coalesced": 0,
+            "hits": 0,
+            "errors": 0,
+            "snapshots": 0,
+            "snapshot_paths": 0,
+            "direct": 0,
+        }
+        self._shared_tasks: set[asyncio.Future] = set()
+        # Hub snapshot multiplexing: None until Core answered once.
+        self._snapshot_supported: bool | None = None
+        self._snapshot_pending: dict[str, asyncio.Future] = {}
+        self._snapshot_flush: asyncio.Future | None = None
+        # Paths the snapshot endpoint could not serve; always fetched directly.
+        self._snapshot_skip: set[str] = set()
+
+    async def _request_once(
+        self,
+        method: str,
+        url: str,
+        *,
+        payload: dict | None,
+        params: dict | None,
+        data: bytes | None,
+        headers: dict[str, str],
+        timeout_s: float,
+        meta: dict[str, Any] | None,
+    ) -> dict:
+        """One HTTP call to one host; raises CopilotApiError on HTTP errors or bad bodies."""
+        async with self._session.request(
+            method,
+            url,
+            json=payload if data is None else None,
+            data=data,
+            params=params,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout_s),
+        ) as resp:
+            if meta is not None:
+                meta["status"] = resp.status
+            if resp.status >= 400:
+                body = await resp.text()
+                raise CopilotApiError(f"HTTP {resp.status} for {url}: {body[:200]}")
+
+            if meta is not None:
+                meta["etag"] = resp.headers.get("ETag")
+                meta["last_modified"] = resp.headers.get("Last-Modified")
+            ctype = (resp.headers.get("Content-Type", "") or "").lower()
+            if resp.status in (204, 304):
+                return {}
+            body = await resp.text()
+            if "json" not in ctype:
+                raise CopilotApiError(
+                    f"Unexpected content type '{ctype or 'unknown'}' for {url}: {body[:200]}"
+                )
+            try:
+                parsed = json.loads(body) if body else {}
+            except json.JSONDecodeError as json_err:
+                raise CopilotApiError(
+                    f"Invalid JSON from {url}: {body[:200]}"
+                ) from json_err
+            return parsed if isinstance(parsed, dict) else {"data": parsed}
+
+    async def _attempt(
+        self, method: str, base_url: str, normalized_path: str, **kwargs: Any
+    ) -> tuple[dict | None, CopilotApiError | None, str]:
+        """``_request_once`` against ``base_url``, scored into the host's health.
+
+        Returns ``(data, None, outcome)`` or ``(None, error, outcome)``.
+        """
+        url = f"{base_url}{normalized_path}"
+        meta = kwargs["meta"] if kwargs.get("meta") is not None else {}
+        kwargs["meta"] = meta
+        started = time.perf_counter()
+        try:
+            data = await self._request_once(method, url, **kwargs)
+        except asyncio.TimeoutError:
+            err, outcome = CopilotApiError(f"Timeout calling {url}"), OUTCOME_TIMEOUT
+        except aiohttp.ClientError as client_err:
+            err, outcome = CopilotApiError(f"Client error calling {url}: {client_err}"), OUTCOME_CLIENT_ERROR
+        except CopilotApiError as api_err:
+            status = meta.get("status")
+            err = api_err
+            outcome = status_outcome(status) if status and status >= 400 else OUTCOME_CLIENT_ERROR
+        else:
+            self._host_health(base_url).record(time.perf_counter() - started, True)
+            return data, None, status_outcome(meta.get("status", 200))
+        # 4xx other than 404/405/408/429 is about the request, not the host.
+        self._host_health(base_url).record(time.perf_counter() - started, not _should_failover(err))
+        return None, err, outcome
+
+    def _switch_active(self, base_url: str) -> None:
+        if base_url != self._active_base_url:
+            _LOGGER.warning(
+                "PilotSuite API failover: switched endpoint from %s to %s",
+                self._active_base_url,
+                base_url,
+            )
+        self._active_base_url = base_url
+        self._base_url = base_url
 
     async def _request_json(
         self,
@@ -87,79 +283,366 @@ class CopilotApiClient(SharedCopilotApiClient):
         *,
         payload: dict | None = None,
         params: dict | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
         timeout_s: float = 10.0,
+        meta: dict[str, Any] | None = None,
     ) -> dict:
         normalized_path = path if path.startswith("/") else f"/{path}"
-        last_err: CopilotApiError | None = None
+        request_headers = self._headers()
+        if headers:
+            request_headers.update(headers)
+        kwargs = dict(
+            payload=payload, params=params, data=data, headers=request_headers, timeout_s=timeout_s, meta=meta
+        )
 
-        for idx, base_url in enumerate(self._base_urls):
-            url = f"{base_url}{normalized_path}"
-            try:
-                async with self._session.request(
-                    method,
-                    url,
-                    json=payload,
-                    params=params,
-                    headers=self._headers(),
-                    timeout=aiohttp.ClientTimeout(total=timeout_s),
-                ) as resp:
-                    if resp.status >= 400:
-                        body = await resp.text()
-                        raise CopilotApiError(f"HTTP {resp.status} for {url}: {body[:200]}")
-
-                    ctype = (resp.headers.get("Content-Type", "") or "").lower()
-                    if resp.status == 204:
-                        data: dict = {}
-                    else:
-                        body = await resp.text()
-                        if "json" not in ctype:
-                            raise CopilotApiError(
-                                f"Unexpected content type '{ctype or 'unknown'}' for {url}: {body[:200]}"
-                            )
-                        try:
-                            parsed = json.loads(body) if body else {}
-                        except json.JSONDecodeError as json_err:
-                            raise CopilotApiError(
-                                f"Invalid JSON from {url}: {body[:200]}"
-                            ) from json_err
-                        data = parsed if isinstance(parsed, dict) else {"data": parsed}
-
-                    if base_url != self._active_base_url:
-                        _LOGGER.warning(
-                            "PilotSuite API failover: switched endpoint from %s to %s",
-                            self._active_base_url,
-                            base_url,
-                        )
-                    self._active_base_url = base_url
-                    self._base_url = base_url
-                    return data
-            except asyncio.TimeoutError as err:
-                last_err = CopilotApiError(f"Timeout calling {url}")
-                if idx < len(self._base_urls) - 1:
-                    continue
-                raise last_err from err
-            except aiohttp.ClientError as err:
-                last_err = CopilotApiError(f"Client error calling {url}: {err}")
-                if idx < len(self._base_urls) - 1:
-                    continue
-                raise last_err from err
-            except CopilotApiError as err:
+        started = time.perf_counter()
+        failovers = 0
+        outcome = OUTCOME_CLIENT_ERROR
+        try:
+            if method == "GET" and self.hedge_gets and len(self._base_urls) > 1:
+                result, err, outcome, failovers = await self._request_hedged(normalized_path, kwargs)
+                if err is not None:
+                    raise err
+                return result
+
+            last_err: CopilotApiError | None = None
+            for idx, base_url in enumerate(self._base_urls):
+                failovers = idx
+                result, err, outcome = await self._attempt(method, base_url, normalized_path, **kwargs)
+                if err is None:
+                    self._switch_active(base_url)
+                    return result
                 last_err = err
                 if idx < len(self._base_urls) - 1 and _should_failover(err):
                     continue
-                raise
+                raise err
 
-        raise last_err or CopilotApiError("No available Core API endpoint")
+            raise last_err or CopilotApiError("No available Core API endpoint")
+        except asyncio.CancelledError:
+            outcome = OUTCOME_CANCELLED
+            raise
+        finally:
+            self._latency.record(
+                method, normalized_path, time.perf_counter() - started, outcome, failovers
+            )
+
+    # ------------------------------------------------------------------
+    # Hedged GETs
+    # ------------------------------------------------------------------
+
+    def _host_health(self, base_url: str) -> HostHealth:
+        health = self._hosts.get(base_url)
+        if health is None:
+            health = self._hosts[base_url] = HostHealth()
+        return health
+
+    def _hedge_hosts(self) -> list[str]:
+        """Hosts in try order: primary, hedge target, then the rest as configured.
+
+        The primary is the active host unless it is unhealthy, then the
+        best-ranked one; the hedge target is the best other host.
+        """
+        def rank(url: str) -> tuple[float, float]:
+            health = self._host_health(url)
+            return (-health.score, health.histogram.percentile_ms(50) or 0.0)
+
+        primary = self._active_base_url
+        if self._host_health(primary).score < HEDGE_MIN_HOST_SCORE:
+            primary = min(self._base_urls, key=rank)
+        secondary = min((u for u in self._base_urls if u != primary), key=rank)
+        return [primary, secondary] + [u for u in self._base_urls if u not in (primary, secondary)]
+
+    def _hedge_delay(self, base_url: str) -> float:
+        """How long to wait for ``base_url`` before hedging: its p95 latency, clamped."""
+        hist = self._host_health(base_url).histogram
+        if hist.total < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY_S
+        p95_s = hist.percentile_ms(HEDGE_PERCENTILE) / 1000.0
+        return min(max(p95_s, HEDGE_MIN_DELAY_S), HEDGE_MAX_DELAY_S)
+
+    def _take_hedge_token(self) -> bool:
+        if self._hedge_tokens >= 1.0:
+            self._hedge_tokens -= 1.0
+            return True
+        self._hedge_stats["throttled"] += 1
+        return False
+
+    async def _request_hedged(
+        self, normalized_path: str, kwargs: dict[str, Any]
+    ) -> tuple[dict | None, CopilotApiError | None, str, int]:
+        """GET from the primary; if it is slower than its usual p95, race the hedge target.
+
+        The first successful answer wins and the other request is cancelled.
+        Only slowness is hedged: once every started host has failed outright
+        the remaining hosts are tried one after the other, as in the
+        sequential path. Returns ``(data, err, outcome, failovers)``.
+        """
+        self._hedge_stats["requests"] += 1
+        self._hedge_tokens = min(self._hedge_tokens + HEDGE_MAX_RATIO, HEDGE_BURST)
+        order = self._hedge_hosts()
+        primary, secondary = order[0], order[1]
+        meta = kwargs["meta"]
+        per_host_meta: dict[str, dict[str, Any]] = {url: {} for url in order}
+
+        def _start(base_url: str) -> asyncio.Task:
+            host_kwargs = {**kwargs, "meta": per_host_meta[base_url]}
+            task = asyncio.ensure_future(self._attempt("GET", base_url, normalized_path, **host_kwargs))
+            tasks[task] = base_url
+            started[base_url] = time.perf_counter()
+            return task
+
+        tasks: dict[asyncio.Task, str] = {}
+        started: dict[str, float] = {}
+        _start(primary)
+        try:
+            done, _ = await asyncio.wait(set(tasks), timeout=self._hedge_delay(primary))
+            if (
+                not done
+                and self._host_health(secondary).score >= HEDGE_MIN_HOST_SCORE
+                and self._take_hedge_token()
+            ):
+                self._hedge_stats["hedged"] += 1
+                _start(secondary)
+
+            primary_failed = False
+            last: tuple[str, CopilotApiError | None, str] = (primary, None, OUTCOME_CLIENT_ERROR)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Successes first, so a failure in the same batch starts no further host.
+                for task in sorted(done, key=lambda t: t.result()[1] is not None):
+                    base_url = tasks[task]
+                    data, err, outcome = task.result()
+                    if err is None:
+                        if meta is not None:
+                            meta.update(per_host_meta[base_url])
+                        if base_url != primary:
+                            self._hedge_stats["secondary_wins"] += 1
+                        # A hedge win only means the primary was slow; switch
+                        # hosts when it actually failed.
+                        if base_url == primary or primary_failed:
+                            self._switch_active(base_url)
+                        return data, None, outcome, order.index(base_url)
+                    last = (base_url, err, outcome)
+                    if base_url == primary:
+                        primary_failed = True
+                    if not pending and len(tasks) < len(order) and _should_failover(err):
+                        pending.add(_start(order[len(tasks)]))
+            if meta is not None:
+                meta.update(per_host_meta[last[0]])
+            return None, last[1], last[2], len(tasks) - 1
+        finally:
+            now = time.perf_counter()
+            for task, base_url in tasks.items():
+                if not task.done():
+                    task.cancel()
+                    # The loser took at least this long; keep its p95 honest.
+                    self._host_health(base_url).histogram.record(int((now - started[base_url]) * 1_000_000))
 
     async def async_get(self, path: str, params: dict | None = None) -> dict:
         return await self._request_json("GET", path, params=params, timeout_s=10.0)
 
+    async def async_get_conditional(
+        self, path: str, etag: str | None = None, params: dict | None = None
+    ) -> tuple[dict | None, str | None]:
+        """GET with If-None-Match; returns (None, etag) when Core answers 304."""
+        meta: dict[str, Any] = {}
+        headers = {"If-None-Match": etag} if etag else None
+        data = await self._request_json("GET", path, params=params, headers=headers, timeout_s=10.0, meta=meta)
+        if meta.get("status") == 304:
+            return None, etag
+        return data, meta.get("etag")
+
+    async def async_get_revalidated(self, path: str) -> dict:
+        """GET ``path`` conditionally, reusing the last body when Core answers 304.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` from the previous
+        response, so an unchanged resource costs an empty 304.
+        """
+        validators, cached = self._revalidation_cache.get(path, ({}, None))
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        meta: dict[str, Any] = {}
+        data = await self._request_json(
+            "GET", path, headers=headers or None, timeout_s=10.0, meta=meta
+        )
+        self._revalidation_stats["requests"] += 1
+        if meta.get("status") == 304 and cached is not None:
+            self._revalidation_stats["not_modified"] += 1
+            return cached
+        fresh = {k: meta[k] for k in ("etag", "last_modified") if meta.get(k)}
+        if fresh:
+            self._revalidation_cache[path] = (fresh, data)
+        else:
+            self._revalidation_cache.pop(path, None)
+        return data
+
+    def get_latency_stats(self) -> dict[str, Any]:
+        """Latency percentiles, outcomes and error budget per Core endpoint."""
+        return self._latency.get_stats()
+
+    def get_hedge_stats(self) -> dict[str, Any]:
+        return {
+            **self._hedge_stats,
+            "enabled": self.hedge_gets and len(self._base_urls) > 1,
+            "active": self._active_base_url,
+            "hosts": {url: health.summary() for url, health in self._hosts.items()},
+        }
+
+    def get_revalidation_stats(self) -> dict[str, int]:
+        return {**self._revalidation_stats, "cached_paths": len(self._revalidation_cache)}
+
+    async def async_get_shared(
+        self, path: str, *, ttl_s: float = SHARED_GET_TTL_S, timeout_s: float = 10.0
+    ) -> dict:
+        """GET ``path`` through a single-flight, short-TTL response cache.
+
+        Concurrent callers of one path share a single request, and its body
+        is served from memory for ``ttl_s`` afterwards. Misses for different
+        paths that arrive within ``HUB_SNAPSHOT_WINDOW_S`` are multiplexed
+        into one ``POST /api/v1/hub/snapshot``; a Core without that endpoint,
+        or a path it cannot serve, falls back to a plain GET per path.
+        Errors are not cached; every caller waiting on the failed request
+        gets them. The returned dict is shared and must not be mutated.
+        """
+        path = path if path.startswith("/") else f"/{path}"
+        hit = self._shared_cache.get(path)
+        if hit is not None and hit[0] > time.monotonic():
+            self._shared_stats["hits"] += 1
+            return hit[1]
+
+        request = self._shared_inflight.get(path)
+        if request is not None:
+            self._shared_stats["coalesced"] += 1
+        else:
+            self._shared_stats["requests"] += 1
+            request = asyncio.get_running_loop().create_future()
+            self._shared_inflight[path] = request
+            if self._snapshot_supported is False or path in self._snapshot_skip:
+                self._spawn_shared(self._async_resolve_shared({path: request}, ttl_s, timeout_s))
+            else:
+                self._snapshot_pending[path] = request
+                if self._snapshot_flush is None:
+                    self._snapshot_flush = self._spawn_shared(
+                        self._async_flush_snapshot(ttl_s, timeout_s)
+                    )
+        # A cancelled caller must not cancel the request others wait on.
+        return await asyncio.shield(request)
+
+    def _spawn_shared(self, coro) -> asyncio.Future:
+        task = asyncio.ensure_future(coro)
+        self._shared_tasks.add(task)
+        task.add_done_callback(self._shared_tasks.discard)
+        return task
+
+    async def _async_flush_snapshot(self, ttl_s: float, timeout_s: float) -> None:
+        await asyncio.sleep(HUB_SNAPSHOT_WINDOW_S)
+        pending = list(self._snapshot_pending.items())
+        self._snapshot_pending = {}
+        self._snapshot_flush = None
+        await asyncio.gather(*(
+            self._async_resolve_shared(
+                dict(pending[i:i + HUB_SNAPSHOT_MAX_PATHS]), ttl_s, timeout_s
+            )
+            for i in range(0, len(pending), HUB_SNAPSHOT_MAX_PATHS)
+        ))
+
+    async def _async_resolve_shared(
+        self, requests: dict[str, asyncio.Future], ttl_s: float, timeout_s: float
+    ) -> None:
+        results: dict[str, Any] = {}
+        try:
+            if len(requests) > 1 and self._snapshot_supported is not False:
+                results = await self._async_fetch_snapshot(list(requests), timeout_s)
+            direct = [p for p in requests if p not in results]
+            if direct:
+                self._shared_stats["direct"] += len(direct)
+                bodies = await asyncio.gather(
+                    *(self._request_json("GET", p, timeout_s=timeout_s) for p in direct),
+                    return_exceptions=True,
+                )
+                results.update(zip(direct, bodies))
+        except Exception as err:  # noqa: BLE001
+            for p in requests:
+                results.setdefault(p, err)
+        finally:
+            for p, request in requests.items():
+                self._settle_shared(p, request, results.get(p), ttl_s)
+
+    async def _async_fetch_snapshot(self, paths: list[str], timeout_s: float) -> dict[str, Any]:
+        """Fetch ``paths`` in one call; paths it cannot serve are left out."""
+        try:
+            data = await self._request_json(
+                "POST", HUB_SNAPSHOT_PATH, payload={"paths": paths}, timeout_s=timeout_s
+            )
+        except CopilotApiError as err:
+            if extract_http_status(err) in _SNAPSHOT_UNSUPPORTED_STATUSES:
+                _LOGGER.debug("Core has no hub snapshot endpoint; using per-path GETs")
+                self._snapshot_supported = False
+                return {}
+            raise
+        self._snapshot_supported = True
+        self._shared_stats["snapshots"] += 1
+
+        resources = data.get("resources")
+        resources = resources if isinstance(resources, dict) else {}
+        results: dict[str, Any] = {}
+        for p in paths:
+            entry = resources.get(p)
+            status = entry.get("status", 200) if isinstance(entry, dict) else None
+            if status is None or status in _SNAPSHOT_UNSUPPORTED_STATUSES:
+                self._snapshot_skip.add(p)
+                continue
+            if status >= 400:
+                detail = str(entry.get("error", ""))[:200]
+                results[p] = CopilotApiError(f"HTTP {status} for {HUB_SNAPSHOT_PATH}{p}: {detail}")
+                continue
+            body = entry.get("data")
+            results[p] = body if isinstance(body, dict) else {"data": body}
+            self._shared_stats["snapshot_paths"] += 1
+        return results
+
+    def _settle_shared(self, path: str, request: asyncio.Future, result: Any, ttl_s: float) -> None:
+        self._shared_inflight.pop(path, None)
+        if request.done():
+            return
+        if result is None:
+            request.cancel()
+        elif isinstance(result, BaseException):
+            self._shared_stats["errors"] += 1
+            request.set_exception(result)
+            request.exception()  # retrieved: callers may already be gone
+        else:
+            self._shared_cache.pop(path, None)
+            self._shared_cache[path] = (time.monotonic() + ttl_s, result)
+            while len(self._shared_cache) > SHARED_GET_MAX_ENTRIES:
+                del self._shared_cache[next(iter(self._shared_cache))]
+            request.set_result(result)
+
+    def get_shared_stats(self) -> dict[str, Any]:
+        return {
+            **self._shared_stats,
+            "cached_paths": len(self._shared_cache),
+            "in_flight": len(self._shared_inflight),
+            "snapshot_supported": self._snapshot_supported,
+            "snapshot_skipped_paths": len(self._snapshot_skip),
+        }
+
     async def async_post(self, path: str, payload: dict) -> dict:
         return await self._request_json("POST", path, payload=payload, timeout_s=10.0)
 
     async def async_put(self, path: str, payload: dict) -> dict:
         return await self._request_json("PUT", path, payload=payload, timeout_s=10.0)
 
+    async def async_post_bytes(self, path: str, body: bytes, headers: dict[str, str]) -> dict:
+        """POST a pre-encoded body (e.g. compressed event batches)."""
+        return await self._request_json("POST", path, data=body, headers=headers, timeout_s=10.0)
+
     async def async_get_status(self) -> CopilotStatus:
         health: dict | None = None
         version: dict | None = None
@@ -175,7 +658,7 @@ class CopilotApiClient(SharedCopilotApiClient):
             ok = None
 
         try:
-            version = await self.async_get("/version")
+            version = await self.async_get_revalidated("/version")
             if isinstance(version.get("version"), str):
                 ver = version["version"]
             elif isinstance(version.get("data"), dict) and isinstance(version["data"].get("version"), str):
@@ -188,7 +671,7 @@ class CopilotApiClient(SharedCopilotApiClient):
     async def async_get_mood(self) -> dict[str, Any]:
         """Get current mood from neural system."""
         try:
-            data = await self.async_get("/api/v1/neurons/mood")
+            data = await self.async_get_revalidated("/api/v1/neurons/mood")
             return data.get("data", data)
         except CopilotApiError as e:
             _LOGGER.debug("Mood API not available: %s", e)
@@ -197,7 +680,7 @@ class CopilotApiClient(SharedCopilotApiClient):
     async def async_get_neurons(self) -> dict[str, Any]:
         """Get all neuron states."""
         try:
-            data = await self.async_get("/api/v1/neurons")
+            data = await self.async_get_revalidated("/api/v1/neurons")
             return data.get("data", data)
         except CopilotApiError as e:
             _LOGGER.debug("Neurons API not available: %s", e)
@@ -224,6 +707,125 @@ class CopilotApiClient(SharedCopilotApiClient):
             content = choices[0].get("message", {}).get("content", "")
         return {"content": content, "conversation_id": conversation_id}
 
+    async def async_chat_completions_stream(
+        self, messages: list[dict[str, str]], conversation_id: str | None = None
+    ) -> AsyncIterator[str]:
+        """Stream a chat reply from /v1/chat/completions (``stream: true``).
+
+        Yields text deltas as Core produces them (SSE ``data:`` lines or NDJSON).
+        A Core that ignores ``stream`` and answers with one JSON body yields the
+        whole reply once. No endpoint failover: a started stream is not replayed.
+        """
+        payload: dict[str, Any] = {"model": "pilotsuite", "messages": messages, "stream": True}
+        if conversation_id:
+            payload["conversation_id"] = conversation_id
+
+        url = f"{self._active_base_url}/v1/chat/completions"
+        headers = self._headers()
+        headers["Accept"] = "text/event-stream"
+        try:
+            async with self._session.post(
+                url,
+                json=payload,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=CHAT_STREAM_IDLE_TIMEOUT_S),
+            ) as resp:
+                if resp.status >= 400:
+                    body = await resp.text()
+                    raise CopilotApiError(f"HTTP {resp.status} for {url}: {body[:200]}")
+
+                ctype = (resp.headers.get("Content-Type", "") or "").lower()
+                if "json" in ctype and "ndjson" not in ctype:
+                    body = await resp.text()
+                    try:
+                        content = _completion_delta(json.loads(body) if body else {})
+                    except json.JSONDecodeError as json_err:
+                        raise CopilotApiError(f"Invalid JSON from {url}: {body[:200]}") from json_err
+                    if content:
+                        yield content
+                    return
+
+                async for raw in resp.content:
+                    line = raw.decode("utf-8", "replace").strip()
+                    if not line or line.startswith(":"):
+                        continue
+                    if line.startswith("data:"):
+                        line = line[5:].strip()
+                    elif "text/event-stream" in ctype:
+                        continue  # event:/id:/retry: fields
+                    if line == "[DONE]":
+                        return
+                    try:
+                        chunk = json.loads(line)
+                    except json.JSONDecodeError:
+                        _LOGGER.debug("Skipping malformed chat stream line: %s", line[:200])
+                        continue
+                    if isinstance(chunk, dict) and chunk.get("error"):
+                        raise CopilotApiError(f"Stream error from {url}: {str(chunk['error'])[:200]}")
+                    content = _completion_delta(chunk)
+                    if content:
+                        yield content
+                    if isinstance(chunk, dict) and chunk.get("done") is True:
+                        return
+        except asyncio.TimeoutError as err:
+            raise CopilotApiError(f"Timeout calling {url}") from err
+        except aiohttp.ClientError as err:
+            raise CopilotApiError(f"Client error calling {url}: {err}") from err
+
+    async def async_stream_events(
+        self, path: str, *, last_event_id: str | None = None, idle_timeout_s: float = 45.0
+    ) -> AsyncIterator[tuple[str | None, str, str]]:
+        """Hold an SSE stream open and yield ``(id, event, data)`` per event.
+
+        Comment lines (Core keepalives) yield ``(None, "keepalive", "")``.
+        ``last_event_id`` is sent as ``Last-Event-ID`` so Core can replay
+        what was missed. The stream is aborted after ``idle_timeout_s``
+        without any data, keepalives included.
+        """
+        url = f"{self._active_base_url}{path}"
+        headers = self._headers()
+        headers["Accept"] = "text/event-stream"
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        try:
+            async with self._session.get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=idle_timeout_s),
+            ) as resp:
+                if resp.status >= 400:
+                    body = await resp.text()
+                    raise CopilotApiError(f"HTTP {resp.status} for {url}: {body[:200]}")
+                ctype = (resp.headers.get("Content-Type", "") or "").lower()
+                if "text/event-stream" not in ctype:
+                    raise CopilotApiError(f"Unexpected content type '{ctype or 'unknown'}' for {url}")
+
+                event_id: str | None = None
+                event = "message"
+                data: list[str] = []
+                async for raw in resp.content:
+                    line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                    if not line:
+                        if data:
+                            yield event_id, event, "\n".join(data)
+                        event, data = "message", []
+                        continue
+                    if line.startswith(":"):
+                        yield None, "keepalive", ""
+                        continue
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "data":
+                        data.append(value)
+                    elif field == "event":
+                        event = value or "message"
+                    elif field == "id":
+                        event_id = value or None
+        except asyncio.TimeoutError as err:
+            raise CopilotApiError(f"Timeout calling {url}") from err
+        except aiohttp.ClientError as err:
+            raise CopilotApiError(f"Client error calling {url}: {err}") from err
+
     async def async_evaluate_neurons(self, context: dict[str, Any]) -> dict[str, Any]:
         """Evaluate neural pipeline with HA states."""
         try:
@@ -254,7 +856,7 @@ class CopilotApiClient(SharedCopilotApiClient):
     async def async_get_core_modules(self) -> dict[str, str]:
         """Return Core module states from /api/v1/modules/."""
         try:
-            data = await self.async_get("/api/v1/modules/")
+            data = await self.async_get_revalidated("/api/v1/modules/")
             return data.get("modules", {})
         except CopilotApiError as e:
             _LOGGER.debug("Core modules API not available: %s", e)
@@ -270,7 +872,7 @@ class CopilotApiClient(SharedCopilotApiClient):
     async def async_get_brain_summary(self) -> dict:
         """Return Brain Graph summary from /api/v1/dashboard/brain-summary."""
         try:
-            return await self.async_get("/api/v1/dashboard/brain-summary")
+            return await self.async_get_revalidated("/api/v1/dashboard/brain-summary")
         except CopilotApiError as e:
             _LOGGER.debug("Brain summary not available: %s", e)
         return {}
@@ -278,7 +880,7 @@ class CopilotApiClient(SharedCopilotApiClient):
     async def async_get_habitus_rules_summary(self) -> dict:
         """Return Habitus rules summary from /api/v1/habitus/rules/summary."""
         try:
-            return await self.get_with_auth("habitus/rules/summary")
+            return await self.async_get_revalidated("/api/v1/habitus/rules/summary")
         except CopilotApiError as e:
             _LOGGER.debug("Habitus rules summary not available: %s", e)
         return {}
@@ -294,7 +896,7 @@ class CopilotApiClient(SharedCopilotApiClient):
     async def async_get_rag_status(self) -> dict[str, Any]:
         """Return RAG status from Core API (best effort)."""
         try:
-            data = await self.async_get("/api/v1/rag/status")
+            data = await self.async_get_revalidated("/api/v1/rag/status")
             if isinstance(data.get("rag"), dict):
                 return data.get("rag", {})
             return data
@@ -308,7 +910,7 @@ class CopilotDataUpdateCoordinator(DataUpdateCoordinator):
     
     def __init__(self, hass: HomeAssistant, config: dict):
         self._config = config
-        session = async_get_clientsession(hass)
+        session = async_get_core_session(hass, "coordinator")
 
         host, port, token = resolve_core_connection_from_mapping(config)
         self._config[CONF_HOST] = host
@@ -341,75 +943,25 @@ class CopilotDataUpdateCoordinator(DataUpdateCoordinator):
         self.camera_state: dict[str, CameraState] = {}
         self.camera_privacy: dict[str, CameraPrivacySettings] = {}
         
-        # Hybrid mode: 120s fallback polling (real-time via webhook push)
+        # Per-endpoint refresh schedule (monotonic due times).
+        self._endpoint_due: dict[str, float] = {}
+        self._poll_stats = {"ticks": 0, "fetched": 0, "skipped": 0, "failed": 0}
+        # Endpoints currently kept fresh by the Core push stream.
+        self._push_endpoints: frozenset[str] = frozenset()
+
         super().__init__(
             hass,
             logger=_LOGGER,
             name=f"{DOMAIN}_coordinator",
-            update_interval=timedelta(seconds=120),
+            update_interval=timedelta(seconds=COORDINATOR_TICK_S),
         )
     
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API with retry on transient failures.
-
-        All best-effort API calls run concurrently via asyncio.gather to
-        reduce total polling latency from ~13 sequential round-trips to ~1.
-        """
+        """Refresh the due Core endpoints with retry on transient failures."""
         last_err: Exception | None = None
         for attempt in range(3):
             try:
-                # Status is the critical gate — must succeed.
-                status = await self.api.async_get_status()
-
-                # Fire all best-effort fetches in parallel.
-                (
-                    capabilities,
-                    mood_data,
-                    neurons_data,
-                    core_modules,
-                    brain_summary,
-                    habitus_rules,
-                    rag_status,
-                    habit_data,
-                    override_modes,
-                    music_cloud,
-                    light_module,
-                    zone_automation,
-                ) = await asyncio.gather(
-                    self._safe_fetch(self.api.async_get, "/api/v1/capabilities", fallback={}),
-                    self._safe_fetch(self.api.async_get_mood, fallback={"mood": "unknown", "confidence": 0.0}),
-                    self._safe_fetch(self.api.async_get_neurons, fallback={"neurons": {}}),
-                    self._safe_fetch(self.api.async_get_core_modules, fallback={}),
-                    self._safe_fetch(self.api.async_get_brain_summary, fallback={}),
-                    self._safe_fetch(self.api.async_get_habitus_rules_summary, fallback={}),
-                    self._safe_fetch(self.api.async_get_rag_status, fallback={}),
-                    self._get_habit_learning_data(),
-                    self._get_override_modes(),
-                    self._get_music_cloud_status(),
-                    self._get_light_module_status(),
-                    self._get_zone_automation_status(),
-                )
-
-                return {
-                    "ok": bool(status.ok) if status.ok is not None else True,
-                    "version": status.version or "unknown",
-                    "capabilities": capabilities,
-                    "mood": mood_data,
-                    "neurons": neurons_data.get("neurons", {}),
-                    "dominant_mood": mood_data.get("mood", "unknown"),
-                    "mood_confidence": mood_data.get("confidence", 0.0),
-                    "habit_summary": habit_data.get("habit_summary", {}),
-                    "predictions": habit_data.get("predictions", []),
-                    "sequences": habit_data.get("sequences", []),
-                    "core_modules": core_modules,
-                    "brain_summary": brain_summary,
-                    "habitus_rules": habitus_rules,
-                    "rag_status": rag_status,
-                    "override_modes": override_modes,
-                    "music_cloud": music_cloud,
-                    "light_module": light_module,
-                    "zone_automation": zone_automation,
-                }
+                return await self._async_refresh_due_endpoints()
             except CopilotApiError as err:
                 last_err = err
                 if attempt < 2:
@@ -433,6 +985,128 @@ class CopilotDataUpdateCoordinator(DataUpdateCoordinator):
         _LOGGER.warning("PilotSuite API unreachable after 3 attempts: %s", last_err)
         raise UpdateFailed(f"API unavailable after retries: {last_err}") from last_err
 
+    def _endpoint_fetchers(self) -> dict[str, Callable[[], Awaitable[Any]]]:
+        """Fetch callables per endpoint; they raise when Core does not answer."""
+        get = self.api.async_get_revalidated
+        return {
+            "capabilities": lambda: get("/api/v1/capabilities"),
+            "mood": lambda: self._get_unwrapped("/api/v1/neurons/mood", "data"),
+            "neurons": lambda: self._get_unwrapped("/api/v1/neurons", "data"),
+            "core_modules": self._get_core_modules,
+            "brain_summary": lambda: get("/api/v1/dashboard/brain-summary"),
+            "habitus_rules": lambda: get("/api/v1/habitus/rules/summary"),
+            "rag_status": lambda: self._get_unwrapped("/api/v1/rag/status", "rag"),
+            "override_modes": lambda: get("/api/v1/modes"),
+            "music_cloud": self._get_music_cloud_status,
+            "light_module": self._get_light_module_status,
+            "zone_automation": self._get_zone_automation_status,
+        }
+
+    async def _get_unwrapped(self, path: str, field: str) -> Any:
+        """GET ``path``; the ``field`` envelope when present, else the whole body."""
+        data = await self.api.async_get_revalidated(path)
+        inner = data.get(field)
+        return inner if isinstance(inner, dict) else data
+
+    async def _get_core_modules(self) -> dict[str, Any]:
+        data = await self.api.async_get_revalidated("/api/v1/modules/")
+        return data.get("modules", {})
+
+    @staticmethod
+    async def _fetch_endpoint(key: str, fetch: Callable[[], Awaitable[Any]]) -> tuple[bool, Any]:
+        try:
+            return True, await fetch()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Core endpoint %s not available: %s", key, err)
+            return False, None
+
+    @staticmethod
+    def _endpoint_fields(key: str, value: Any) -> dict[str, Any]:
+        """Project one endpoint result onto the coordinator ``data`` keys."""
+        if key == "mood":
+            return {
+                "mood": value,
+                "dominant_mood": value.get("mood", "unknown"),
+                "mood_confidence": value.get("confidence", 0.0),
+            }
+        if key == "neurons":
+            return {"neurons": value.get("neurons", {})}
+        return {key: value}
+
+    def set_push_endpoints(self, keys) -> None:
+        """Stop polling ``keys`` while a push channel delivers them.
+
+        Endpoints that leave push coverage are refetched on the next tick.
+        """
+        keys = frozenset(keys)
+        self.mark_endpoints_due(*(self._push_endpoints - keys))
+        self._push_endpoints = keys
+
+    def mark_endpoints_due(self, *keys: str) -> None:
+        """Force the given endpoints (all when empty) into the next refresh."""
+        for key in keys or tuple(ENDPOINT_REFRESH_S):
+            self._endpoint_due.pop(key, None)
+
+    async def _async_refresh_due_endpoints(self) -> dict[str, Any]:
+        """Fetch the endpoints that are due and merge them into ``data``.
+
+        Endpoints that are not due keep their previous value, and so do
+        fields pushed via webhook in between. A failed endpoint keeps its
+        previous value too (its fallback if it never answered) and stays due,
+        so the next tick retries it.
+        """
+        now = time.monotonic()
+        due = [
+            key for key in ENDPOINT_REFRESH_S
+            if key not in self._push_endpoints
+            and self._endpoint_due.get(key, 0.0) <= now + ENDPOINT_DUE_SLACK_S
+        ]
+        data: dict[str, Any] = dict(self.data) if self.data else {}
+
+        if "status" in due:
+            status = await self.api.async_get_status()
+            data["ok"] = bool(status.ok) if status.ok is not None else True
+            data["version"] = status.version or "unknown"
+
+        fetchers = self._endpoint_fetchers()
+        keys = [key for key in due if key in fetchers]
+        *results, habit_data = await asyncio.gather(
+            *(self._fetch_endpoint(key, fetchers[key]) for key in keys),
+            self._get_habit_learning_data(),
+        )
+        for key, (ok, value) in zip(keys, results):
+            if not ok:
+                for field_name, fallback in self._endpoint_fields(key, ENDPOINT_FALLBACKS[key]).items():
+                    data.setdefault(field_name, fallback)
+                self._poll_stats["failed"] += 1
+                continue
+            data.update(self._endpoint_fields(key, value))
+            self._endpoint_due[key] = now + ENDPOINT_REFRESH_S[key]
+        if "status" in due:
+            self._endpoint_due["status"] = now + ENDPOINT_REFRESH_S["status"]
+
+        data["habit_summary"] = habit_data.get("habit_summary", {})
+        data["predictions"] = habit_data.get("predictions", [])
+        data["sequences"] = habit_data.get("sequences", [])
+
+        self._poll_stats["ticks"] += 1
+        self._poll_stats["fetched"] += len(due)
+        self._poll_stats["skipped"] += len(ENDPOINT_REFRESH_S) - len(due)
+        return data
+
+    def get_poll_stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        return {
+            **self._poll_stats,
+            "push_endpoints": sorted(self._push_endpoints),
+            "http": self.api.get_revalidation_stats(),
+            "shared_gets": self.api.get_shared_stats(),
+            "next_due_s": {
+                key: round(max(0.0, self._endpoint_due.get(key, now) - now), 1)
+                for key in ENDPOINT_REFRESH_S
+            },
+        }
+
     @staticmethod
     async def _safe_fetch(coro_func, *args, fallback=None):
         """Call an async function and return fallback on any error."""
@@ -441,65 +1115,45 @@ class CopilotDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception:  # noqa: BLE001
             return fallback
     
-    async def _get_override_modes(self) -> dict[str, Any]:
-        """Fetch override modes status from Core (best-effort)."""
-        try:
-            return await self.api.async_get("/api/v1/modes")
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.debug("Override modes not available: %s", err)
-            return {}
-
     async def _get_music_cloud_status(self) -> dict[str, Any]:
-        """Fetch Music Cloud status from Core (best-effort, parallel)."""
-        try:
-            result, config, groups = await asyncio.gather(
-                self.api.async_get("/api/v1/media/cloud/status"),
-                self.api.async_get("/api/v1/media/cloud/config"),
-                self.api.async_get("/api/v1/media/cloud/groups"),
-            )
-            return {
-                "status": result,
-                "config": config.get("config", {}) if isinstance(config, dict) else {},
-                "active_groups": groups.get("groups", []) if isinstance(groups, dict) else [],
-            }
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.debug("Music cloud status not available: %s", err)
-            return {}
+        """Fetch Music Cloud status from Core (parallel GETs)."""
+        result, config, groups = await asyncio.gather(
+            self.api.async_get_revalidated("/api/v1/media/cloud/status"),
+            self.api.async_get_revalidated("/api/v1/media/cloud/config"),
+            self.api.async_get_revalidated("/api/v1/media/cloud/groups"),
+        )
+        return {
+            "status": result,
+            "config": config.get("config", {}) if isinstance(config, dict) else {},
+            "active_groups": groups.get("groups", []) if isinstance(groups, dict) else [],
+        }
 
     async def _get_light_module_status(self) -> dict[str, Any]:
-        """Fetch Light Module status from Core (best-effort, parallel)."""
-        try:
-            status, config, presets = await asyncio.gather(
-                self.api.async_get("/api/v1/light-module/status"),
-                self.api.async_get("/api/v1/light-module/config"),
-                self.api.async_get("/api/v1/light-module/presets"),
-            )
-            return {
-                "enabled": status.get("ok", False),
-                "active_zones": len(status.get("zones", [])),
-                "zones": status.get("zones", []),
-                "config": config.get("config", {}),
-                "presets": presets.get("presets", {}),
-            }
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.debug("Light module status not available: %s", err)
-            return {}
+        """Fetch Light Module status from Core (parallel GETs)."""
+        status, config, presets = await asyncio.gather(
+            self.api.async_get_revalidated("/api/v1/light-module/status"),
+            self.api.async_get_revalidated("/api/v1/light-module/config"),
+            self.api.async_get_revalidated("/api/v1/light-module/presets"),
+        )
+        return {
+            "enabled": status.get("ok", False),
+            "active_zones": len(status.get("zones", [])),
+            "zones": status.get("zones", []),
+            "config": config.get("config", {}),
+            "presets": presets.get("presets", {}),
+        }
 
     async def _get_zone_automation_status(self) -> dict[str, Any]:
-        """Fetch Zone Automation status from Core (best-effort, parallel)."""
-        try:
-            status, configs = await asyncio.gather(
-                self.api.async_get("/api/v1/zone-automation/status"),
-                self.api.async_get("/api/v1/zone-automation/config"),
-            )
-            return {
-                "total_zones": status.get("count", 0),
-                "zones": status.get("zones", []),
-                "configs": configs.get("configs", []),
-            }
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.debug("Zone automation status not available: %s", err)
-            return {}
+        """Fetch Zone Automation status from Core (parallel GETs)."""
+        status, configs = await asyncio.gather(
+            self.api.async_get_revalidated("/api/v1/zone-automation/status"),
+            self.api.async_get_revalidated("/api/v1/zone-automation/config"),
+        )
+        return {
+            "total_zones": status.get("count", 0),
+            "zones": status.get("zones", []),
+            "configs": configs.get("configs", []),
+        }
 
     _EMPTY_HABIT_DATA: dict[str, Any] = {
         "habit_summary": {},
@@ -0,0 +1,132 @@
+"""AIMD controller for the events forwarder batch size and flush delay.
+
+Static ``max_batch``/``flush_interval`` either produce many tiny POSTs (short
+interval, quiet house) or let latency pile up behind a long interval (busy
+house, slow Core). The controller adapts both from what the forwarder observes:
+
+* batch size: additive increase while POSTs finish under the target round-trip
+  time and batches come back full, multiplicative decrease when a POST is slow
+  or fails.
+* flush delay: multiplicative decrease while a backlog is waiting (drain fast),
+  additive increase while batches go out under-filled (wait for more events).
+
+Both values always stay within the operator-set bounds.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+# Fraction of the batch range added per "good" round-trip.
+_BATCH_INCREASE_FRACTION = 0.1
+# Multiplicative decrease factors.
+_BATCH_DECREASE_SLOW = 0.7
+_BATCH_DECREASE_ERROR = 0.5
+_DELAY_DECREASE_BACKLOG = 0.5
+# Consecutive errors after which the batch drops straight to its minimum.
+_ERROR_STREAK_FLOOR = 3
+# Fraction of the delay range added when batches go out under-filled.
+_DELAY_INCREASE_FRACTION = 0.1
+# Smoothing for the round-trip estimate.
+_RTT_EWMA_ALPHA = 0.3
+
+
+class AimdBatchController:
+    """Adapt batch size and flush delay from RTT, error streak and queue depth."""
+
+    def __init__(
+        self,
+        min_batch: int,
+        max_batch: int,
+        min_delay: float,
+        max_delay: float,
+        target_rtt_ms: float,
+    ) -> None:
+        self.max_batch = max(1, int(max_batch))
+        self.min_batch = max(1, min(int(min_batch), self.max_batch))
+        self.max_delay = max(0.0, float(max_delay))
+        self.min_delay = max(0.0, min(float(min_delay), self.max_delay))
+        self.target_rtt_ms = max(1.0, float(target_rtt_ms))
+
+        # Start at the configured ceiling for batches (previous static behaviour)
+        # and the configured interval for the delay; adapt from there.
+        self._batch = float(self.max_batch)
+        self._delay = self.max_delay
+
+        self.rtt_ewma_ms: float | None = None
+        self.last_rtt_ms: float | None = None
+        self.last_decision = "init"
+        self.last_decision_ts: float | None = None
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def batch_size(self) -> int:
+        return max(self.min_batch, min(self.max_batch, int(round(self._batch))))
+
+    @property
+    def flush_delay(self) -> float:
+        return max(self.min_delay, min(self.max_delay, self._delay))
+
+    def on_success(self, rtt_seconds: float, sent: int, queue_depth: int) -> None:
+        """Feed back a delivered batch of ``sent`` items and the remaining queue."""
+        rtt_ms = max(0.0, rtt_seconds * 1000.0)
+        self.last_rtt_ms = rtt_ms
+        if self.rtt_ewma_ms is None:
+            self.rtt_ewma_ms = rtt_ms
+        else:
+            self.rtt_ewma_ms += _RTT_EWMA_ALPHA * (rtt_ms - self.rtt_ewma_ms)
+
+        batch_full = sent >= self.batch_size
+        if self.rtt_ewma_ms > self.target_rtt_ms:
+            self._batch = max(self.min_batch, self._batch * _BATCH_DECREASE_SLOW)
+            decision = "decrease_slow"
+            self.decreases += 1
+        elif batch_full or queue_depth > 0:
+            step = max(1.0, (self.max_batch - self.min_batch) * _BATCH_INCREASE_FRACTION)
+            self._batch = min(self.max_batch, self._batch + step)
+            decision = "increase"
+            self.increases += 1
+        else:
+            decision = "hold"
+
+        if queue_depth > 0:
+            self._delay = max(self.min_delay, self._delay * _DELAY_DECREASE_BACKLOG)
+        elif not batch_full:
+            step = max(0.01, (self.max_delay - self.min_delay) * _DELAY_INCREASE_FRACTION)
+            self._delay = min(self.max_delay, self._delay + step)
+
+        self._record(decision)
+
+    def on_error(self, error_streak: int) -> None:
+        """Halve the batch after a failed POST; a persistent streak goes to the floor."""
+        if error_streak >= _ERROR_STREAK_FLOOR:
+            self._batch = float(self.min_batch)
+        else:
+            self._batch = max(self.min_batch, self._batch * _BATCH_DECREASE_ERROR)
+        self.decreases += 1
+        self._record("decrease_error")
+
+    def _record(self, decision: str) -> None:
+        self.last_decision = decision
+        self.last_decision_ts = time.time()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Current decisions + bounds (for ``events_forwarder_adaptive``)."""
+        return {
+            "batch_size": self.batch_size,
+            "flush_delay_s": round(self.flush_delay, 3),
+            "rtt_ewma_ms": round(self.rtt_ewma_ms, 1) if self.rtt_ewma_ms is not None else None,
+            "last_rtt_ms": round(self.last_rtt_ms, 1) if self.last_rtt_ms is not None else None,
+            "target_rtt_ms": self.target_rtt_ms,
+            "last_decision": self.last_decision,
+            "last_decision_ts": self.last_decision_ts,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "bounds": {
+                "min_batch": self.min_batch,
+                "max_batch": self.max_batch,
+                "min_delay_s": self.min_delay,
+                "max_delay_s": self.max_delay,
+            },
+        }
@@ -0,0 +1,227 @@
+"""Queue lanes and bookkeeping for pipelined (concurrent) event batch uploads.
+
+The events forwarder used to hold one lock for the whole POST, so throughput
+was capped at one batch per round-trip, and every envelope waited in one FIFO.
+``BatchPipeline`` owns the queued envelopes, split into priority lanes, and lets
+up to ``max_in_flight`` batches be outstanding at once while keeping the
+guarantees the single-flight sender had:
+
+* every batch gets a monotonically increasing ``batch_seq`` that Core can use to
+  reorder or dedupe; a retried batch keeps its original sequence number,
+* failed batches are retried as whole batches, oldest sequence first, ahead of
+  anything still queued in their lane, so per-lane delivery order is preserved,
+* completions (and lanes) may finish out of order, but the acked count (used to
+  advance the persistent queue log watermark) only moves over a contiguous run
+  of delivered or dropped envelopes in enqueue order.
+
+The high lane may use one in-flight slot beyond ``max_in_flight`` so a window
+full of bulk batches never blocks it. Per-lane enqueue-to-delivery latency is
+sampled for p50/p99 reporting.
+
+The pipeline is pure bookkeeping; the forwarder owns the HTTP calls and tasks.
+"""
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any
+
+LANE_HIGH = "high"
+LANE_BULK = "bulk"
+LANES = (LANE_HIGH, LANE_BULK)  # dispatch order
+
+_LATENCY_SAMPLES = 1000
+
+# (ordinal, enqueued_at monotonic, envelope)
+_Entry = tuple[int, float, dict[str, Any]]
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+class BatchPipeline:
+    """Lane queues, sequence numbers, in-flight/retry batches and in-order acks."""
+
+    def __init__(self, max_in_flight: int = 1) -> None:
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.next_seq = 1
+
+        self._queues: dict[str, deque[_Entry]] = {lane: deque() for lane in LANES}
+        self._in_flight: dict[int, tuple[str, list[_Entry]]] = {}
+        self._retry: dict[int, tuple[str, list[_Entry]]] = {}
+
+        # Enqueue ordinals: everything <= _acked_ordinal is delivered or dropped;
+        # _done holds finished ordinals above that watermark.
+        self._next_ordinal = 1
+        self._acked_ordinal = 0
+        self._done: set[int] = set()
+
+        self._latency: dict[str, deque[float]] = {
+            lane: deque(maxlen=_LATENCY_SAMPLES) for lane in LANES
+        }
+
+        self.dispatched_total = 0
+        self.retried_total = 0
+        self.completed_total = 0
+        self.dropped_batches_total = 0
+        self.delivered_by_lane: dict[str, int] = {lane: 0 for lane in LANES}
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    @property
+    def retry_batches(self) -> int:
+        return len(self._retry)
+
+    def queued(self, lane: str | None = None) -> int:
+        if lane is not None:
+            return len(self._queues[lane])
+        return sum(len(q) for q in self._queues.values())
+
+    def retry_items(self, lane: str | None = None) -> int:
+        return sum(len(entries) for ln, entries in self._retry.values() if lane in (None, ln))
+
+    def pending(self) -> int:
+        """Envelopes waiting to be sent (queued + parked for retry)."""
+        return self.queued() + self.retry_items()
+
+    def has_capacity(self, lane: str = LANE_BULK, probing: bool = False) -> bool:
+        """Whether another batch of ``lane`` may be dispatched.
+
+        While probing after errors only one batch is in flight at a time.
+        """
+        if probing:
+            return not self._in_flight
+        limit = self.max_in_flight + (1 if lane == LANE_HIGH else 0)
+        return len(self._in_flight) < limit
+
+    def has_work(self, lane: str | None = None) -> bool:
+        lanes = LANES if lane is None else (lane,)
+        return any(self._queues[ln] or self._has_retry(ln) for ln in lanes)
+
+    def has_full_batch(self, lane: str, limit: int) -> bool:
+        return self._has_retry(lane) or len(self._queues[lane]) >= max(1, int(limit))
+
+    def unacked_items(self) -> list[dict[str, Any]]:
+        """All not-yet-delivered envelopes in enqueue order (for persistence)."""
+        entries: list[_Entry] = []
+        for _, batch in self._in_flight.values():
+            entries.extend(batch)
+        for _, batch in self._retry.values():
+            entries.extend(batch)
+        for q in self._queues.values():
+            entries.extend(q)
+        entries.sort(key=lambda e: e[0])
+        return [item for _, _, item in entries]
+
+    # ------------------------------------------------------------------
+    # Transitions
+    # ------------------------------------------------------------------
+
+    def push(self, item: dict[str, Any], lane: str = LANE_BULK, now: float | None = None) -> None:
+        """Queue an envelope on ``lane`` (enqueue order == persistent log order)."""
+        ts = time.monotonic() if now is None else now
+        self._queues[lane].append((self._next_ordinal, ts, item))
+        self._next_ordinal += 1
+
+    def next_batch(self, lane: str, limit: int) -> tuple[int, list[dict[str, Any]]] | None:
+        """Take the lane's oldest retry batch, else up to ``limit`` queued items."""
+        retry = [seq for seq, (ln, _) in self._retry.items() if ln == lane]
+        if retry:
+            seq = min(retry)
+            _, entries = self._retry.pop(seq)
+            self.retried_total += 1
+        elif self._queues[lane]:
+            q = self._queues[lane]
+            entries = [q.popleft() for _ in range(min(max(1, int(limit)), len(q)))]
+            seq = self.next_seq
+            self.next_seq += 1
+        else:
+            return None
+
+        self._in_flight[seq] = (lane, entries)
+        self.dispatched_total += 1
+        return seq, [item for _, _, item in entries]
+
+    def complete(self, seq: int, now: float | None = None) -> int:
+        """Mark a batch delivered; return how many envelopes became contiguously acked."""
+        batch = self._in_flight.pop(seq, None)
+        if batch is None:
+            return 0
+        lane, entries = batch
+        ts = time.monotonic() if now is None else now
+        samples = self._latency[lane]
+        for _, enqueued_at, _ in entries:
+            samples.append(max(0.0, ts - enqueued_at))
+        self.completed_total += 1
+        self.delivered_by_lane[lane] += len(entries)
+        return self._finish(entries)
+
+    def fail(self, seq: int) -> None:
+        """Park a failed batch for retry under the same sequence number."""
+        batch = self._in_flight.pop(seq, None)
+        if batch is not None:
+            self._retry[seq] = batch
+
+    def drop_oldest(self, count: int) -> tuple[int, int]:
+        """Drop at least ``count`` envelopes; return ``(dropped, acked_count)``.
+
+        Bulk goes before high. Within a lane, parked retry batches (the oldest
+        envelopes) are dropped whole, then the queue front.
+        """
+        dropped: list[_Entry] = []
+        for lane in reversed(LANES):
+            while len(dropped) < count and self._has_retry(lane):
+                seq = min(s for s, (ln, _) in self._retry.items() if ln == lane)
+                dropped.extend(self._retry.pop(seq)[1])
+                self.dropped_batches_total += 1
+            q = self._queues[lane]
+            while len(dropped) < count and q:
+                dropped.append(q.popleft())
+        return len(dropped), self._finish(dropped)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "next_seq": self.next_seq,
+            "retry_batches": self.retry_batches,
+            "dispatched_total": self.dispatched_total,
+            "completed_total": self.completed_total,
+            "retried_total": self.retried_total,
+            "dropped_batches_total": self.dropped_batches_total,
+            "lanes": {lane: self.lane_stats(lane) for lane in LANES},
+        }
+
+    def lane_stats(self, lane: str) -> dict[str, Any]:
+        samples = sorted(self._latency[lane])
+        return {
+            "queued": len(self._queues[lane]),
+            "retry_items": self.retry_items(lane),
+            "delivered_total": self.delivered_by_lane[lane],
+            "latency_p50_ms": round(_percentile(samples, 50) * 1000.0, 1) if samples else None,
+            "latency_p99_ms": round(_percentile(samples, 99) * 1000.0, 1) if samples else None,
+            "latency_samples": len(samples),
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _has_retry(self, lane: str) -> bool:
+        return any(ln == lane for ln, _ in self._retry.values())
+
+    def _finish(self, entries: list[_Entry]) -> int:
+        self._done.update(ordinal for ordinal, _, _ in entries)
+        start = self._acked_ordinal
+        while self._acked_ordinal + 1 in self._done:
+            self._acked_ordinal += 1
+            self._done.discard(self._acked_ordinal)
+        return self._acked_ordinal - start
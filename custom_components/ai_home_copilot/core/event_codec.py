@@ -0,0 +1,301 @@
+"""Compact wire format for ``POST /api/v1/events`` batches.
+
+Both forwarders send lists of verbose dict envelopes where keys and values like
+``"source": "home_assistant"``, the domain and zone ids repeat in every item.
+When Core advertises support (see ``negotiate_event_encoding``) the batch is
+sent column-wise instead:
+
+    {
+      "encoding": "columnar-v1",
+      "count": 3,
+      "strings": ["state_changed", "light.kitchen", ...],   # interned values
+      "columns": {
+        "type":               {"s": [0, 0, 0]},             # string-table indexes
+        "attributes.zone_ids": {"s": [[4], [4, 5], []]},
+        "attributes.old_state": {"s": [6, null, 7]},
+        "ts":                 {"r": ["2026-...", ...]},     # raw values
+        "attributes.service": {"s": [8], "m": [0, 2]}       # "m": rows missing the key
+      }
+    }
+
+Nested dicts are flattened to dotted paths (empty dicts stay leaf values);
+``.`` and ``\\`` inside a key are escaped with a backslash.
+A column is dictionary-encoded when all its values are strings (or lists of
+strings) and at least one repeats; otherwise it is sent raw. The JSON body is
+then compressed (zstd when the optional ``zstandard`` package is available and
+Core accepts it, otherwise gzip).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gzip
+import json
+from typing import Any
+
+try:  # optional, not an integration requirement
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - depends on environment
+    _zstd = None
+
+ENCODING_JSON = "json"
+ENCODING_COLUMNAR = "columnar-v1"
+
+CONTENT_ENCODING_GZIP = "gzip"
+CONTENT_ENCODING_ZSTD = "zstd"
+
+CONTENT_TYPE_COLUMNAR = "application/vnd.pilotsuite.events+json"
+
+_GZIP_LEVEL = 5
+_ZSTD_LEVEL = 3
+
+
+@dataclass(slots=True, frozen=True)
+class EventEncoding:
+    """Negotiated wire format for event uploads."""
+
+    batch: str = ENCODING_JSON
+    content_encoding: str | None = None
+
+    @property
+    def is_legacy(self) -> bool:
+        return self.batch == ENCODING_JSON and self.content_encoding is None
+
+
+LEGACY_ENCODING = EventEncoding()
+
+
+def negotiate_event_encoding(capabilities: dict[str, Any] | None) -> EventEncoding:
+    """Pick the best wire format from Core's ``/api/v1/capabilities`` payload.
+
+    Core opts in with either of::
+
+        {"events": {"encodings": ["columnar-v1"], "content_encodings": ["gzip", "zstd"]}}
+        {"event_encodings": [...], "event_content_encodings": [...]}
+
+    Anything else (older Core, fallback status payloads) keeps today's format.
+    """
+    if not isinstance(capabilities, dict):
+        return LEGACY_ENCODING
+
+    events = capabilities.get("events")
+    events = events if isinstance(events, dict) else {}
+    encodings = events.get("encodings", capabilities.get("event_encodings"))
+    content = events.get("content_encodings", capabilities.get("event_content_encodings"))
+
+    encodings = {e for e in encodings if isinstance(e, str)} if isinstance(encodings, list) else set()
+    content = {c for c in content if isinstance(c, str)} if isinstance(content, list) else set()
+
+    batch = ENCODING_COLUMNAR if ENCODING_COLUMNAR in encodings else ENCODING_JSON
+    content_encoding: str | None = None
+    if CONTENT_ENCODING_ZSTD in content and _zstd is not None:
+        content_encoding = CONTENT_ENCODING_ZSTD
+    elif CONTENT_ENCODING_GZIP in content:
+        content_encoding = CONTENT_ENCODING_GZIP
+
+    return EventEncoding(batch=batch, content_encoding=content_encoding)
+
+
+# ---------------------------------------------------------------------------
+# Columnar batch
+# ---------------------------------------------------------------------------
+
+
+def _escape_key(key: str) -> str:
+    return key.replace("\\", "\\\\").replace(".", "\\.")
+
+
+def _split_path(path: str) -> list[str]:
+    if "\\" not in path:
+        return path.split(".")
+    keys: list[str] = []
+    current: list[str] = []
+    chars = iter(path)
+    for ch in chars:
+        if ch == "\\":
+            current.append(next(chars, ""))
+        elif ch == ".":
+            keys.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    keys.append("".join(current))
+    return keys
+
+
+def _collect(
+    obj: dict[str, Any],
+    prefix: str,
+    row: int,
+    columns: dict[str, list[Any]],
+    missing: dict[str, list[int]],
+    paths: dict[str, dict[str, str]],
+) -> None:
+    """Append ``obj``'s leaves to their columns, padding rows that lacked them.
+
+    ``paths`` memoizes prefix -> key -> escaped column path for the batch.
+    """
+    known = paths.get(prefix)
+    if known is None:
+        known = paths[prefix] = {}
+    for key, value in obj.items():
+        path = known.get(key)
+        if path is None:
+            path = known[key] = prefix + (_escape_key(key) if "." in key or "\\" in key else key)
+        if type(value) is dict and value:
+            _collect(value, path + ".", row, columns, missing, paths)
+            continue
+        col = columns.get(path)
+        if col is None:
+            col = columns[path] = [None] * row
+            missing[path] = list(range(row))
+        elif len(col) != row:
+            missing[path].extend(range(len(col), row))
+            col.extend([None] * (row - len(col)))
+        col.append(value)
+
+
+def encode_columnar_batch(items: list[dict[str, Any]]) -> dict[str, Any]:
+    """Encode envelopes into a dictionary-encoded columnar batch.
+
+    One pass over the envelopes fills the columns; each column is then
+    interned in bulk, so the cost stays close to a plain ``json.dumps``.
+    """
+    columns: dict[str, list[Any]] = {}
+    missing: dict[str, list[int]] = {}
+    paths: dict[str, dict[str, str]] = {}
+    for row, item in enumerate(items):
+        _collect(item, "", row, columns, missing, paths)
+
+    count = len(items)
+    strings: list[str] = []
+    string_ids: dict[Any, Any] = {None: None}
+
+    out: dict[str, dict[str, Any]] = {}
+    for path, values in columns.items():
+        gap = count - len(values)
+        if gap:
+            missing[path].extend(range(len(values), count))
+            values.extend([None] * gap)
+
+        kinds = set(map(type, values))
+        kinds.discard(type(None))
+        encoded: list[Any] | None = None
+        if kinds == {str}:
+            distinct = set(values)
+            distinct.discard(None)
+            if count - values.count(None) > len(distinct):
+                for value in distinct:
+                    if value not in string_ids:
+                        string_ids[value] = len(strings)
+                        strings.append(value)
+                encoded = list(map(string_ids.__getitem__, values))
+        elif kinds == {list} or kinds == {str, list}:
+            if all(type(v) is str for value in values if type(value) is list for v in value):
+                encoded = []
+                for value in values:
+                    if type(value) is list:
+                        ids = []
+                        for v in value:
+                            idx = string_ids.get(v)
+                            if idx is None:
+                                idx = string_ids[v] = len(strings)
+                                strings.append(v)
+                            ids.append(idx)
+                        encoded.append(ids)
+                    elif value is None:
+                        encoded.append(None)
+                    else:
+                        idx = string_ids.get(value)
+                        if idx is None:
+                            idx = string_ids[value] = len(strings)
+                            strings.append(value)
+                        encoded.append(idx)
+
+        col: dict[str, Any] = {"s": encoded} if encoded is not None else {"r": values}
+        if missing[path]:
+            col["m"] = missing[path]
+        out[path] = col
+
+    return {
+        "encoding": ENCODING_COLUMNAR,
+        "count": count,
+        "strings": strings,
+        "columns": out,
+    }
+
+
+def decode_columnar_batch(batch: dict[str, Any]) -> list[dict[str, Any]]:
+    """Inverse of ``encode_columnar_batch`` (used by tests and local Core stubs)."""
+    count = int(batch.get("count") or 0)
+    strings: list[str] = batch.get("strings") or []
+    items: list[dict[str, Any]] = [{} for _ in range(count)]
+
+    for path, col in (batch.get("columns") or {}).items():
+        missing = set(col.get("m") or ())
+        interned = "s" in col
+        values = col["s"] if interned else col.get("r") or []
+        keys = _split_path(path)
+        for row_idx, value in enumerate(values):
+            if row_idx in missing:
+                continue
+            if interned and value is not None:
+                value = strings[value] if isinstance(value, int) else [strings[i] for i in value]
+            target = items[row_idx]
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+
+    return items
+
+
+# ---------------------------------------------------------------------------
+# Body encoding
+# ---------------------------------------------------------------------------
+
+
+def encode_events_body(
+    payload: dict[str, Any],
+    list_key: str,
+    encoding: EventEncoding,
+) -> tuple[bytes, dict[str, str]]:
+    """Serialize an events payload for the negotiated encoding.
+
+    ``list_key`` is the envelope list inside ``payload`` (``items`` for the
+    events forwarder, ``events`` for the N3 forwarder). Returns the request body
+    and the extra headers to send with it.
+    """
+    headers: dict[str, str] = {"Content-Type": "application/json"}
+    if encoding.batch == ENCODING_COLUMNAR:
+        body_obj = dict(payload)
+        body_obj[list_key] = encode_columnar_batch(payload.get(list_key) or [])
+        headers["Content-Type"] = CONTENT_TYPE_COLUMNAR
+    else:
+        body_obj = payload
+
+    body = json.dumps(body_obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    if encoding.content_encoding == CONTENT_ENCODING_ZSTD and _zstd is not None:
+        body = _zstd.ZstdCompressor(level=_ZSTD_LEVEL).compress(body)
+        headers["Content-Encoding"] = CONTENT_ENCODING_ZSTD
+    elif encoding.content_encoding == CONTENT_ENCODING_GZIP:
+        body = gzip.compress(body, compresslevel=_GZIP_LEVEL)
+        headers["Content-Encoding"] = CONTENT_ENCODING_GZIP
+
+    return body, headers
+
+
+def decode_events_body(body: bytes, headers: dict[str, str], list_key: str) -> dict[str, Any]:
+    """Inverse of ``encode_events_body`` (used by tests and local Core stubs)."""
+    content_encoding = (headers.get("Content-Encoding") or "").lower()
+    if content_encoding == CONTENT_ENCODING_GZIP:
+        body = gzip.decompress(body)
+    elif content_encoding == CONTENT_ENCODING_ZSTD:
+        if _zstd is None:
+            raise ValueError("zstd body but zstandard is not installed")
+        body = _zstd.ZstdDecompressor().decompress(body)
+
+    payload = json.loads(body.decode("utf-8"))
+    batch = payload.get(list_key) if isinstance(payload, dict) else None
+    if isinstance(batch, dict) and batch.get("encoding") == ENCODING_COLUMNAR:
+        payload[list_key] = decode_columnar_batch(batch)
+    return payload
@@ -0,0 +1,388 @@
+"""Segmented append-only event log for the events forwarder queue.
+
+The forwarder used to persist its whole queue through one HA ``Store`` on every
+dirty tick, so the save cost grew with the backlog. This log only appends the
+envelopes enqueued since the last tick and tracks delivery with a sequence
+watermark, so persistence cost follows new events instead of queue size.
+
+On-disk layout (one directory per config entry)::
+
+    seg-00000001.jsonl   # sealed segment, one {"s": seq, "e": envelope} per line
+    seg-00000002.jsonl   # active segment (appended to)
+    checkpoint.json      # acked watermark + per-segment seq ranges
+
+``append``/``ack``/``take_pending`` are cheap in-memory calls for the event
+loop; ``replay``/``write``/``reset`` do blocking file I/O and must run in the
+executor (``hass.async_add_executor_job``). The forwarder queue order is FIFO by
+sequence, so acknowledging ``n`` items always advances a contiguous prefix.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+import os
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = "checkpoint.json"
+SEGMENT_PREFIX = "seg-"
+SEGMENT_SUFFIX = ".jsonl"
+
+DEFAULT_SEGMENT_MAX_RECORDS = 1000
+
+
+def _segment_name(index: int) -> str:
+    return f"{SEGMENT_PREFIX}{index:08d}{SEGMENT_SUFFIX}"
+
+
+def _segment_index(name: str) -> int | None:
+    if not (name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)):
+        return None
+    try:
+        return int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class _Segment:
+    index: int
+    first_seq: int
+    last_seq: int
+    count: int = 0
+
+
+class SegmentedEventLog:
+    """Append-only, segment-rotated, checkpointed log of queued envelopes."""
+
+    def __init__(self, directory: str, segment_max_records: int = DEFAULT_SEGMENT_MAX_RECORDS) -> None:
+        self._dir = directory
+        self._segment_max_records = max(1, int(segment_max_records))
+
+        self._segments: list[_Segment] = []
+        self._next_index = 1
+        self._pending: list[tuple[int, dict[str, Any]]] = []
+
+        self._last_seq = 0  # last sequence number assigned
+        self._acked_seq = 0  # every seq <= this is delivered or dropped
+        self._checkpoint_acked_seq = 0
+
+        self.appended_total = 0
+        self.truncated_segments_total = 0
+        self.replayed_total = 0
+        self.corrupt_records_total = 0
+
+    # ------------------------------------------------------------------
+    # In-memory API (safe on the event loop)
+    # ------------------------------------------------------------------
+
+    def append(self, item: dict[str, Any]) -> int:
+        """Stage an envelope for the next write and return its sequence number."""
+        self._last_seq += 1
+        self._pending.append((self._last_seq, item))
+        return self._last_seq
+
+    def ack(self, count: int) -> None:
+        """Mark the oldest ``count`` un-acked records as delivered (or dropped)."""
+        if count <= 0:
+            return
+        self._acked_seq = min(self._acked_seq + count, self._last_seq)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending) or self._acked_seq != self._checkpoint_acked_seq
+
+    @property
+    def pending_len(self) -> int:
+        return self._last_seq - self._acked_seq
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "segments": len(self._segments),
+            "last_seq": self._last_seq,
+            "acked_seq": self._acked_seq,
+            "unwritten": len(self._pending),
+            "appended_total": self.appended_total,
+            "truncated_segments_total": self.truncated_segments_total,
+            "replayed_total": self.replayed_total,
+            "corrupt_records_total": self.corrupt_records_total,
+        }
+
+    # ------------------------------------------------------------------
+    # Blocking I/O (executor only)
+    # ------------------------------------------------------------------
+
+    def replay(self) -> list[dict[str, Any]]:
+        """Load checkpoint + segments and return un-acked envelopes in order.
+
+        Tolerates a torn final line (crash mid-append; it is cut off so the
+        next append starts on a fresh line) and segments that were written
+        after the last checkpoint.
+        """
+        os.makedirs(self._dir, exist_ok=True)
+
+        checkpoint = self._read_checkpoint()
+        acked = checkpoint.get("acked_seq")
+        self._acked_seq = acked if isinstance(acked, int) and acked > 0 else 0
+
+        names = sorted(
+            (idx, name)
+            for name in os.listdir(self._dir)
+            if (idx := _segment_index(name)) is not None
+        )
+
+        out: list[dict[str, Any]] = []
+        self._segments = []
+        seen_max = 0
+        for idx, name in names:
+            seg: _Segment | None = None
+            path = os.path.join(self._dir, name)
+            try:
+                self._cut_torn_tail(path)
+                with open(path, "rb") as fh:
+                    for line in fh:
+                        rec = self._parse_line(line)
+                        if rec is None:
+                            continue
+                        seq, item = rec
+                        if seq <= seen_max:
+                            # Duplicate after a retried append; keep the first copy.
+                            continue
+                        if seg is None:
+                            seg = _Segment(index=idx, first_seq=seq, last_seq=seq)
+                        seg.last_seq = seq
+                        seg.count += 1
+                        seen_max = seq
+                        if seq > self._acked_seq:
+                            out.append(item)
+            except OSError as err:
+                _LOGGER.warning("Event log: failed to read segment %s: %s", name, err)
+                continue
+
+            if seg is None:
+                seg = _Segment(index=idx, first_seq=seen_max + 1, last_seq=seen_max)
+            self._segments.append(seg)
+            self._next_index = max(self._next_index, idx + 1)
+
+        self._last_seq = max(self._acked_seq, seen_max)
+        self._checkpoint_acked_seq = self._acked_seq
+        self._pending = []
+        self.replayed_total = len(out)
+
+        # Drop segments that were fully acked before the crash.
+        self._truncate(self._acked_seq)
+        return out
+
+    def skip_unreplayed(self) -> None:
+        """Continue after a failed ``replay`` without reusing sequence numbers.
+
+        Numbering resumes after the highest sequence found on disk, and those
+        records count as acked so the forwarder's count-based ``ack`` lines up
+        with the new queue. New records go to a fresh segment.
+        """
+        checkpoint = self._read_checkpoint()
+        last = checkpoint.get("last_seq")
+        seen_max = last if isinstance(last, int) and last > 0 else 0
+        max_index = 0
+        try:
+            names = os.listdir(self._dir)
+        except OSError:
+            names = []
+        for name in names:
+            idx = _segment_index(name)
+            if idx is None:
+                continue
+            max_index = max(max_index, idx)
+            try:
+                with open(os.path.join(self._dir, name), "rb") as fh:
+                    for line in fh:
+                        rec = self._parse_line(line)
+                        if rec is not None and rec[0] > seen_max:
+                            seen_max = rec[0]
+            except OSError as err:
+                _LOGGER.debug("Event log: failed to scan segment %s: %s", name, err)
+
+        skipped = max(0, seen_max - self._acked_seq)
+        if skipped:
+            _LOGGER.warning("Event log: skipping %d records that could not be replayed", skipped)
+        self._last_seq = max(self._last_seq, seen_max)
+        self._acked_seq = self._last_seq
+        self._segments = []
+        self._next_index = max(self._next_index, max_index + 1)
+        self._pending = []
+
+    def take_pending(self) -> tuple[list[tuple[int, dict[str, Any]]], int]:
+        """Detach staged records + current watermark for an executor ``write``.
+
+        Call on the event loop so ``append``/``ack`` never race the writer.
+        """
+        pending, self._pending = self._pending, []
+        return pending, self._acked_seq
+
+    def restage(self, records: list[tuple[int, dict[str, Any]]]) -> None:
+        """Put records back in front after a failed ``write`` (event loop)."""
+        if records:
+            self._pending = records + self._pending
+
+    def write(self, records: list[tuple[int, dict[str, Any]]], acked_seq: int) -> None:
+        """Append ``records``, rotate segments, checkpoint, truncate acked segments.
+
+        ``records``/``acked_seq`` come from ``take_pending``. On ``OSError`` the
+        caller should ``restage`` the records; a replay drops any duplicates.
+        """
+        os.makedirs(self._dir, exist_ok=True)
+
+        if records:
+            self._append_records(records)
+
+        if records or acked_seq != self._checkpoint_acked_seq:
+            self._write_checkpoint(acked_seq)
+            self._truncate(acked_seq)
+
+    def reset(self, items: list[dict[str, Any]]) -> None:
+        """Replace the log contents with ``items`` (used for one-time migration)."""
+        os.makedirs(self._dir, exist_ok=True)
+        for seg in self._segments:
+            self._remove_segment(seg)
+        self._segments = []
+        self._pending = []
+        self._acked_seq = self._last_seq
+        for item in items:
+            self.append(item)
+        self.write(*self.take_pending())
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _cut_torn_tail(self, path: str) -> None:
+        """Truncate ``path`` after its last newline.
+
+        A crash mid-append leaves a partial last line; the next append opens
+        the segment in append mode and would glue its first record onto it.
+        """
+        with open(path, "rb+") as fh:
+            size = fh.seek(0, os.SEEK_END)
+            if not size:
+                return
+            fh.seek(size - 1)
+            if fh.read(1) == b"\n":
+                return
+            fh.seek(0)
+            data = fh.read()
+            keep = data.rfind(b"\n") + 1
+            fh.truncate(keep)
+            fh.flush()
+            os.fsync(fh.fileno())
+        self.corrupt_records_total += 1
+        _LOGGER.debug("Event log: cut %d torn bytes from %s", size - keep, os.path.basename(path))
+
+    def _parse_line(self, line: bytes) -> tuple[int, dict[str, Any]] | None:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            # Also catches UnicodeDecodeError from a torn multi-byte character.
+            rec = json.loads(line)
+        except ValueError:
+            self.corrupt_records_total += 1
+            return None
+        if not isinstance(rec, dict):
+            self.corrupt_records_total += 1
+            return None
+        seq = rec.get("s")
+        item = rec.get("e")
+        if not isinstance(seq, int) or not isinstance(item, dict):
+            self.corrupt_records_total += 1
+            return None
+        return seq, item
+
+    def _append_records(self, records: list[tuple[int, dict[str, Any]]]) -> None:
+        pos = 0
+        while pos < len(records):
+            seg = self._segments[-1] if self._segments else None
+            if seg is None or seg.count >= self._segment_max_records:
+                seg = _Segment(index=self._next_index, first_seq=records[pos][0], last_seq=records[pos][0] - 1)
+                self._segments.append(seg)
+                self._next_index += 1
+
+            room = self._segment_max_records - seg.count
+            chunk = records[pos:pos + room]
+            pos += len(chunk)
+
+            lines = "".join(
+                json.dumps({"s": seq, "e": item}, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for seq, item in chunk
+            )
+            path = os.path.join(self._dir, _segment_name(seg.index))
+            with open(path, "a", encoding="utf-8") as fh:
+                fh.write(lines)
+                fh.flush()
+                os.fsync(fh.fileno())
+
+            seg.count += len(chunk)
+            seg.last_seq = chunk[-1][0]
+            self.appended_total += len(chunk)
+
+    def _read_checkpoint(self) -> dict[str, Any]:
+        path = os.path.join(self._dir, CHECKPOINT_FILE)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                loaded = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Event log: unreadable checkpoint, replaying all segments: %s", err)
+            return {}
+        return loaded if isinstance(loaded, dict) else {}
+
+    def _write_checkpoint(self, acked_seq: int) -> None:
+        payload = {
+            "version": 1,
+            "acked_seq": acked_seq,
+            "last_seq": self._last_seq,
+            "segments": [
+                {
+                    "name": _segment_name(seg.index),
+                    "first_seq": seg.first_seq,
+                    "last_seq": seg.last_seq,
+                    "count": seg.count,
+                }
+                for seg in self._segments
+            ],
+        }
+        path = os.path.join(self._dir, CHECKPOINT_FILE)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, separators=(",", ":"))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+        self._checkpoint_acked_seq = acked_seq
+
+    def _truncate(self, acked_seq: int) -> None:
+        """Delete sealed segments whose records are all acked.
+
+        The active (last) segment is kept unless it is fully acked *and* full,
+        so appends keep going to one file between rotations.
+        """
+        keep: list[_Segment] = []
+        for i, seg in enumerate(self._segments):
+            is_active = i == len(self._segments) - 1
+            fully_acked = seg.last_seq <= acked_seq
+            if fully_acked and (not is_active or seg.count >= self._segment_max_records):
+                self._remove_segment(seg)
+                self.truncated_segments_total += 1
+                continue
+            keep.append(seg)
+        self._segments = keep
+
+    def _remove_segment(self, seg: _Segment) -> None:
+        try:
+            os.remove(os.path.join(self._dir, _segment_name(seg.index)))
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            _LOGGER.debug("Event log: failed to remove segment %s: %s", seg.index, err)
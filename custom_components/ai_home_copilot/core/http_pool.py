@@ -0,0 +1,252 @@
+"""Integration-wide HTTP connection pool for talking to PilotSuite Core.
+
+One ``aiohttp.ClientSession`` per Home Assistant instance, owned by the
+integration, with a tuned ``TCPConnector``: a global and a per-host
+connection limit (the global one doubles as the concurrency cap against
+Core), longer keepalive so polling and pushes reuse warm connections, and a
+DNS cache. Like Home Assistant's own sessions it uses HA's shared SSL
+context and sends HA's User-Agent. Clients ask for a ``CoreSessionView`` via
+``async_get_core_session(hass, caller)``; the view has the usual
+``get``/``post``/``request`` methods, applies the caller's default base URL,
+headers and timeout, and tags every request with the caller name so the
+pool can report connection reuse, pool wait time and DNS cache hits per
+caller. ``close()`` on a view is a no-op; the session itself is closed when
+Home Assistant shuts down.
+"""
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any, Mapping
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+
+from ..const import DOMAIN
+
+_GLOBAL_KEY = "_core_http_pool"
+
+# Connections open at once across all callers and hosts.
+CORE_POOL_LIMIT = 64
+# Connections to one Core host (add-on and fallback URLs count separately).
+CORE_POOL_LIMIT_PER_HOST = 16
+# Idle keepalive; above the 30 s default so 60 s pollers find warm sockets.
+CORE_POOL_KEEPALIVE_S = 75.0
+CORE_POOL_DNS_TTL_S = 300
+
+_CALLER_COUNTERS = (
+    "requests",
+    "errors",
+    "reused",
+    "connects",
+    "queued",
+    "dns_hits",
+    "dns_misses",
+)
+
+
+class CoreSessionPool:
+    """Owns the shared session and its per-caller connection metrics."""
+
+    def __init__(self) -> None:
+        self._session: aiohttp.ClientSession | None = None
+        self._callers: dict[str, dict[str, float]] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        # async_create_clientsession builds its own connector, so take its
+        # SSL context and User-Agent instead.
+        from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+        from homeassistant.util.ssl import get_default_context
+
+        connector = aiohttp.TCPConnector(
+            limit=CORE_POOL_LIMIT,
+            limit_per_host=CORE_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=CORE_POOL_KEEPALIVE_S,
+            use_dns_cache=True,
+            ttl_dns_cache=CORE_POOL_DNS_TTL_S,
+            ssl=get_default_context(),
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": SERVER_SOFTWARE},
+            trace_configs=[self._trace_config()],
+        )
+
+    async def async_close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def _caller(self, ctx: SimpleNamespace) -> dict[str, float]:
+        request_ctx = ctx.trace_request_ctx
+        name = request_ctx.get("caller", "other") if isinstance(request_ctx, Mapping) else "other"
+        stats = self._callers.get(name)
+        if stats is None:
+            stats = {key: 0 for key in _CALLER_COUNTERS}
+            stats.update(wait_s_total=0.0, wait_s_max=0.0, connect_s_total=0.0)
+            self._callers[name] = stats
+        return stats
+
+    async def _on_request_start(self, session, ctx, params) -> None:
+        self._caller(ctx)["requests"] += 1
+
+    async def _on_request_exception(self, session, ctx, params) -> None:
+        self._caller(ctx)["errors"] += 1
+
+    async def _on_queued_start(self, session, ctx, params) -> None:
+        ctx.queued_at = time.perf_counter()
+
+    async def _on_queued_end(self, session, ctx, params) -> None:
+        stats = self._caller(ctx)
+        waited = time.perf_counter() - ctx.queued_at
+        stats["queued"] += 1
+        stats["wait_s_total"] += waited
+        if waited > stats["wait_s_max"]:
+            stats["wait_s_max"] = waited
+
+    async def _on_create_start(self, session, ctx, params) -> None:
+        ctx.connect_at = time.perf_counter()
+
+    async def _on_create_end(self, session, ctx, params) -> None:
+        stats = self._caller(ctx)
+        stats["connects"] += 1
+        stats["connect_s_total"] += time.perf_counter() - ctx.connect_at
+
+    async def _on_reuse(self, session, ctx, params) -> None:
+        self._caller(ctx)["reused"] += 1
+
+    async def _on_dns_hit(self, session, ctx, params) -> None:
+        self._caller(ctx)["dns_hits"] += 1
+
+    async def _on_dns_miss(self, session, ctx, params) -> None:
+        self._caller(ctx)["dns_misses"] += 1
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_request_exception.append(self._on_request_exception)
+        trace.on_connection_queued_start.append(self._on_queued_start)
+        trace.on_connection_queued_end.append(self._on_queued_end)
+        trace.on_connection_create_start.append(self._on_create_start)
+        trace.on_connection_create_end.append(self._on_create_end)
+        trace.on_connection_reuseconn.append(self._on_reuse)
+        trace.on_dns_cache_hit.append(self._on_dns_hit)
+        trace.on_dns_cache_miss.append(self._on_dns_miss)
+        return trace
+
+    def get_stats(self) -> dict[str, Any]:
+        callers: dict[str, Any] = {}
+        for name, st in sorted(self._callers.items()):
+            acquired = st["reused"] + st["connects"]
+            callers[name] = {
+                **{key: st[key] for key in _CALLER_COUNTERS},
+                "reuse_rate": round(st["reused"] / acquired, 3) if acquired else None,
+                "wait_ms_total": round(st["wait_s_total"] * 1000.0, 2),
+                "wait_ms_max": round(st["wait_s_max"] * 1000.0, 3),
+                "connect_ms_avg": (
+                    round(st["connect_s_total"] * 1000.0 / st["connects"], 3) if st["connects"] else 0.0
+                ),
+            }
+        return {
+            "open": self._session is not None and not self._session.closed,
+            "limit": CORE_POOL_LIMIT,
+            "limit_per_host": CORE_POOL_LIMIT_PER_HOST,
+            "callers": callers,
+        }
+
+
+class CoreSessionView:
+    """A caller's handle on the shared session (base URL, headers, timeout)."""
+
+    def __init__(
+        self,
+        pool: CoreSessionPool,
+        caller: str,
+        *,
+        base_url: str | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+    ) -> None:
+        self._pool = pool
+        self.caller = caller
+        self._base_url = base_url.rstrip("/") if base_url else None
+        self._headers = dict(headers or {})
+        self._timeout = timeout
+
+    @property
+    def closed(self) -> bool:
+        return False
+
+    def request(self, method: str, url: str, **kwargs: Any):
+        if self._base_url and url.startswith("/"):
+            url = f"{self._base_url}{url}"
+        if self._headers:
+            kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        kwargs["trace_request_ctx"] = {"caller": self.caller}
+        return self._pool.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any):
+        return self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """The shared session outlives its callers."""
+
+
+def async_get_core_session_pool(hass: HomeAssistant) -> CoreSessionPool:
+    """Return the integration-wide pool (created on first use)."""
+    global_data = hass.data.setdefault(DOMAIN, {}).setdefault("_global", {})
+    pool = global_data.get(_GLOBAL_KEY)
+    if pool is None:
+        pool = CoreSessionPool()
+        global_data[_GLOBAL_KEY] = pool
+
+        async def _close(event) -> None:
+            await pool.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _close)
+    return pool
+
+
+def async_get_core_session(
+    hass: HomeAssistant,
+    caller: str,
+    *,
+    base_url: str | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: aiohttp.ClientTimeout | None = None,
+) -> CoreSessionView:
+    """A view on the shared Core session, tagged ``caller`` in the metrics."""
+    return CoreSessionView(
+        async_get_core_session_pool(hass), caller, base_url=base_url, headers=headers, timeout=timeout
+    )
+
+
+__all__ = [
+    "CoreSessionPool",
+    "CoreSessionView",
+    "async_get_core_session",
+    "async_get_core_session_pool",
+]
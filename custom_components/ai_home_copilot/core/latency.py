@@ -0,0 +1,263 @@
+"""Per-endpoint latency histograms and error budgets for Core API calls.
+
+``EndpointLatencyTracker.record`` is called once per ``_request_json`` call
+and stays on in production: a dict lookup for the endpoint plus a few
+integer operations to bucket the latency. Latencies go into a fixed-size
+log-linear (HDR-style) histogram per method and path template: 8 linear
+sub-buckets per power of two of microseconds, so percentiles are within
+12.5 % and memory per endpoint is constant. Path segments that look like
+ids (numbers, UUIDs, entity ids) are folded into ``{id}`` and the number of
+endpoints is capped.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any
+
+# 8 sub-buckets per power of two.
+_SUB_BITS = 3
+_SUB = 1 << _SUB_BITS
+# Bucket of 60 s (6e7 us) is the last one; anything slower lands there.
+_BUCKETS = (27 - _SUB_BITS) * _SUB
+
+LATENCY_MAX_ENDPOINTS = 128
+# Success objective for the error budget: errors are 5xx, timeouts and
+# transport failures (4xx are the caller's problem and do not count).
+ERROR_BUDGET_SLO = 0.99
+
+_OVERFLOW_KEY = ("*", "{other}")
+_ID_SEGMENT = re.compile(
+    r"^(?:\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{16,}|[a-z_]+\.[\w\-]+)$",
+    re.IGNORECASE,
+)
+
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_CLIENT_ERROR = "client_error"
+# The caller gave up (task cancelled); not held against Core.
+OUTCOME_CANCELLED = "cancelled"
+
+
+def path_template(path: str) -> str:
+    """``/api/v1/graph/nodes/light.kitchen`` -> ``/api/v1/graph/nodes/{id}``."""
+    return "/".join("{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/"))
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < 2 * _SUB:
+        return micros if micros > 0 else 0
+    shift = micros.bit_length() - _SUB_BITS - 1
+    idx = ((shift + 1) << _SUB_BITS) + (micros >> shift) - _SUB
+    return idx if idx < _BUCKETS else _BUCKETS - 1
+
+
+def _bucket_upper_us(idx: int) -> int:
+    if idx < 2 * _SUB:
+        return idx + 1
+    shift = (idx >> _SUB_BITS) - 1
+    return ((idx & (_SUB - 1)) + _SUB + 1) << shift
+
+
+class LatencyHistogram:
+    """Fixed-size log-linear histogram of latencies in microseconds."""
+
+    __slots__ = ("counts", "total", "sum_us", "max_us")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.total = 0
+        self.sum_us = 0
+        self.max_us = 0
+
+    def record(self, micros: int) -> None:
+        self.counts[_bucket_index(micros)] += 1
+        self.total += 1
+        self.sum_us += micros
+        if micros > self.max_us:
+            self.max_us = micros
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for idx, count in enumerate(other.counts):
+            if count:
+                self.counts[idx] += count
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile_ms(self, pct: float) -> float | None:
+        """Upper bound of the bucket holding the ``pct`` percentile."""
+        if not self.total:
+            return None
+        rank = max(1, int(self.total * pct / 100.0 + 0.999999))
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return round(min(_bucket_upper_us(idx), self.max_us) / 1000.0, 3)
+        return round(self.max_us / 1000.0, 3)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.total,
+            "mean_ms": round(self.sum_us / self.total / 1000.0, 3) if self.total else None,
+            "p50_ms": self.percentile_ms(50),
+            "p90_ms": self.percentile_ms(90),
+            "p99_ms": self.percentile_ms(99),
+            "max_ms": round(self.max_us / 1000.0, 3) if self.total else None,
+        }
+
+
+class _EndpointStats:
+    __slots__ = ("histogram", "outcomes", "failovers")
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        # "2xx".."5xx", timeout, client_error, cancelled
+        self.outcomes: dict[str, int] = {}
+        self.failovers = 0
+
+    @property
+    def errors(self) -> int:
+        o = self.outcomes
+        return o.get("5xx", 0) + o.get(OUTCOME_TIMEOUT, 0) + o.get(OUTCOME_CLIENT_ERROR, 0)
+
+
+def _budget(calls: int, errors: int) -> dict[str, Any]:
+    if not calls:
+        return {"error_rate": None, "budget_remaining": None}
+    rate = errors / calls
+    return {
+        "error_rate": round(rate, 4),
+        # 1.0 = no errors, 0.0 = budget used up, negative = SLO missed.
+        "budget_remaining": round(1.0 - rate / (1.0 - ERROR_BUDGET_SLO), 3),
+    }
+
+
+class EndpointLatencyTracker:
+    """Latency histogram and outcome counters per (method, path template)."""
+
+    def __init__(self) -> None:
+        self._endpoints: dict[tuple[str, str], _EndpointStats] = {}
+        # method -> raw path -> stats, so templating runs once per path.
+        self._by_raw: dict[str, dict[str, _EndpointStats]] = {}
+        self._raw_paths = 0
+
+    def _stats_for(self, method: str, path: str) -> _EndpointStats:
+        key = (method, path_template(path))
+        stats = self._endpoints.get(key)
+        if stats is None:
+            if len(self._endpoints) >= LATENCY_MAX_ENDPOINTS:
+                key = _OVERFLOW_KEY
+                stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats()
+        if self._raw_paths < LATENCY_MAX_ENDPOINTS * 8:
+            self._by_raw.setdefault(method, {})[path] = stats
+            self._raw_paths += 1
+        return stats
+
+    def record(self, method: str, path: str, elapsed_s: float, outcome: str, failovers: int = 0) -> None:
+        """Record one call; ``outcome`` is a status class ("2xx") or timeout/client_error."""
+        by_path = self._by_raw.get(method)
+        stats = by_path.get(path) if by_path is not None else None
+        if stats is None:
+            stats = self._stats_for(method, path)
+        # LatencyHistogram.record and _bucket_index inlined: this runs per call.
+        hist = stats.histogram
+        micros = int(elapsed_s * 1_000_000)
+        if micros < 2 * _SUB:
+            idx = micros if micros > 0 else 0
+        else:
+            shift = micros.bit_length() - _SUB_BITS - 1
+            idx = ((shift + 1) << _SUB_BITS) + (micros >> shift) - _SUB
+            if idx >= _BUCKETS:
+                idx = _BUCKETS - 1
+        hist.counts[idx] += 1
+        hist.total += 1
+        hist.sum_us += micros
+        if micros > hist.max_us:
+            hist.max_us = micros
+        outcomes = stats.outcomes
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        if failovers:
+            stats.failovers += failovers
+
+    def overall(self) -> dict[str, Any]:
+        merged = LatencyHistogram()
+        errors = failovers = 0
+        for stats in self._endpoints.values():
+            merged.merge(stats.histogram)
+            errors += stats.errors
+            failovers += stats.failovers
+        return {
+            **merged.summary(),
+            "errors": errors,
+            "failovers": failovers,
+            **_budget(merged.total, errors),
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        endpoints: dict[str, Any] = {}
+        for (method, template), stats in sorted(self._endpoints.items(), key=lambda kv: kv[0]):
+            endpoints[f"{method} {template}"] = {
+                **stats.histogram.summary(),
+                "outcomes": dict(stats.outcomes),
+                "failovers": stats.failovers,
+                **_budget(stats.histogram.total, stats.errors),
+            }
+        return {
+            "slo": ERROR_BUDGET_SLO,
+            "overall": self.overall(),
+            "endpoints": endpoints,
+        }
+
+
+class HostHealth:
+    """Latency histogram and an EWMA success score for one Core base URL."""
+
+    __slots__ = ("histogram", "score", "calls", "errors")
+
+    # Weight of the newest outcome in the success score.
+    ALPHA = 0.2
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.score = 1.0
+        self.calls = 0
+        self.errors = 0
+
+    def record(self, elapsed_s: float, ok: bool) -> None:
+        self.calls += 1
+        if ok:
+            self.histogram.record(int(elapsed_s * 1_000_000))
+        else:
+            self.errors += 1
+        self.score += self.ALPHA * ((1.0 if ok else 0.0) - self.score)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "score": round(self.score, 3),
+            "calls": self.calls,
+            "errors": self.errors,
+            "p50_ms": self.histogram.percentile_ms(50),
+            "p95_ms": self.histogram.percentile_ms(95),
+        }
+
+
+_STATUS_CLASSES = ("0xx", "1xx", "2xx", "3xx", "4xx", "5xx")
+
+
+def status_outcome(status: int) -> str:
+    return _STATUS_CLASSES[status // 100] if 0 <= status < 600 else "other"
+
+
+__all__ = [
+    "EndpointLatencyTracker",
+    "HostHealth",
+    "LatencyHistogram",
+    "ERROR_BUDGET_SLO",
+    "OUTCOME_CANCELLED",
+    "OUTCOME_CLIENT_ERROR",
+    "OUTCOME_TIMEOUT",
+    "path_template",
+    "status_outcome",
+]
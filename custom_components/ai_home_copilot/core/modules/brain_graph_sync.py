@@ -6,7 +6,8 @@ via the /api/v1/graph endpoints. Creates a real-time knowledge graph
 of HA entities, their relationships, and state transitions.
 
 Optimizations:
-- Batch API calls for efficiency
+- Batch API calls for efficiency (diffed by content hash in the service)
+- Periodic full resync; only changed nodes/edges are uploaded
 - Event deduplication with TTL-based cache
 - Integration with Knowledge Graph and Neurons
 - Proper error handling and recovery
@@ -21,6 +22,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 
 from homeassistant.core import HomeAssistant, Event
+from homeassistant.helpers.event import async_track_time_interval
 
 from ..module import CopilotModule, ModuleContext
 from ...brain_graph_sync import (
@@ -139,6 +141,15 @@ class BrainGraphSyncModule(CopilotModule):
             
             # Set up event listeners for neurons
             await self._setup_neuron_listeners()
+
+            # Periodic full resync; the service only uploads what changed.
+            self._listener_unsubs.append(
+                async_track_time_interval(
+                    self._hass,
+                    self._async_periodic_resync,
+                    timedelta(seconds=self._config.sync_interval),
+                )
+            )
             
             # Start batch processing task
             self._batch_task = self._hass.async_create_task(self._process_batch_queue())
@@ -191,6 +202,11 @@ class BrainGraphSyncModule(CopilotModule):
             _LOGGER.error("Brain Graph sync module unload failed: %s", err)
             return False
     
+    async def _async_periodic_resync(self, _now=None) -> None:
+        """Resync registries and states to the Brain Graph (diff-based)."""
+        if self._sync_service and self._running:
+            await self._sync_service.async_resync()
+
     async def _setup_neuron_listeners(self) -> None:
         """Set up listeners for neuron events."""
 
@@ -319,32 +335,17 @@ class BrainGraphSyncModule(CopilotModule):
         edges: List[Dict[str, Any]]
     ) -> None:
         """Send a batch of nodes and edges to Core."""
-        if not self._sync_service or not self._sync_service._session:
+        if not self._sync_service:
             return
-            
+
         try:
-            payload = {}
-            if nodes:
-                payload["nodes"] = nodes
-            if edges:
-                payload["edges"] = edges
-            
-            if payload:
-                async with self._sync_service._session.post(
-                    f"{self._sync_service.core_url}/api/v1/graph/state",
-                    json=payload
-                ) as resp:
-                    if resp.status != 200:
-                        _LOGGER.warning(
-                            "Brain Graph batch update failed: status %s", 
-                            resp.status
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Brain Graph batch sent: %d nodes, %d edges",
-                            len(nodes), len(edges)
-                        )
-                        
+            if not await self._sync_service.async_upsert(nodes, edges):
+                _LOGGER.warning("Brain Graph batch update failed")
+            else:
+                _LOGGER.debug(
+                    "Brain Graph batch sent: %d nodes, %d edges",
+                    len(nodes), len(edges)
+                )
         except Exception as err:
             _LOGGER.error("Failed to send batch to Brain Graph: %s", err)
     
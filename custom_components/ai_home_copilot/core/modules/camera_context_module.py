@@ -19,11 +19,11 @@ from typing import Any, TypedDict
 
 from homeassistant.core import HomeAssistant, Event, callback
 from homeassistant.helpers import entity_registry
-from homeassistant.const import EVENT_STATE_CHANGED
 
 from ...const import DOMAIN
 from ...module_connector import SIGNAL_ACTIVITY_UPDATED
 from .module import CopilotModule
+from ..state_router import async_get_state_router
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -153,7 +153,11 @@ class CameraContextModule(CopilotModule):
         
         # Listen for camera state changes
         self._listeners.append(
-            self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._on_state_changed)
+            async_get_state_router(self._hass).async_subscribe(
+                "camera_context",
+                self._on_state_changed,
+                domains=("binary_sensor", "person", "image_processing"),
+            )
         )
         
         # Listen for camera-specific events
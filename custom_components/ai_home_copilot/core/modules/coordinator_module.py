@@ -2,7 +2,8 @@
 
 Replaces the monolithic legacy.py with focused responsibilities:
   - Creates and initializes CopilotDataUpdateCoordinator
-  - Registers webhook for real-time Core pushes
+  - Registers webhook and the SSE push stream for real-time Core pushes
+  - Registers the brain graph panel feed view
   - Fetches Core API capabilities
   - No platform forwarding (handled by legacy.py still for entity setup)
 
@@ -22,6 +23,8 @@ from ...entity import VERSION as INTEGRATION_VERSION
 from ...connection_config import resolve_core_connection
 from ...compat import async_update_core_version_mismatch_issue
 from ...webhook import async_register_webhook, async_unregister_webhook
+from ...brain_graph_panel import async_get_brain_graph_feed
+from ...core_push import async_setup_core_push
 from ..module import ModuleContext
 
 _LOGGER = logging.getLogger(__name__)
@@ -74,12 +77,22 @@ class CoordinatorModule:
         except Exception:  # noqa: BLE001
             _LOGGER.exception("Failed to register webhook")
 
+        # Real-time Core push stream; polling covers whatever it misses.
+        core_push = async_setup_core_push(hass, entry, coordinator)
+
+        # The published brain graph panel polls this feed, also after a restart.
+        try:
+            async_get_brain_graph_feed(hass, coordinator)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Failed to register brain graph feed")
+
         # Store coordinator data
         hass.data.setdefault(DOMAIN, {})
         hass.data[DOMAIN].setdefault(entry.entry_id, {})
         entry_store = hass.data[DOMAIN][entry.entry_id]
         entry_store["coordinator"] = coordinator
         entry_store["webhook_id"] = webhook_id
+        entry_store["core_push"] = core_push
 
         # Fetch Core capabilities (best-effort)
         try:
@@ -130,5 +143,14 @@ class CoordinatorModule:
             webhook_id = data.get("webhook_id")
             if webhook_id:
                 await async_unregister_webhook(hass, webhook_id)
+            core_push = data.pop("core_push", None)
+            if core_push is not None:
+                await core_push.async_stop()
+            prompt_cache = data.pop("prompt_cache", None)
+            if prompt_cache is not None:
+                prompt_cache.async_close()
+            response_cache = data.pop("response_cache", None)
+            if response_cache is not None:
+                response_cache.async_close()
 
         return True
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import logging
 from typing import Any
 import asyncio
 import time
+import uuid
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import Event, HomeAssistant
@@ -24,6 +25,15 @@ from ...const import (
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED,
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE,
     CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS,
+    CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+    CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+    CONF_EVENTS_FORWARDER_MIN_BATCH,
+    CONF_EVENTS_FORWARDER_TARGET_RTT_MS,
+    CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS,
+    CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT,
+    CONF_EVENTS_FORWARDER_PRIORITY_RULES,
+    CONF_EVENTS_FORWARDER_PRIORITY_MAX_BATCH,
+    CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
     CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES,
     CONF_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS,
     CONF_EVENTS_FORWARDER_ADDITIONAL_ENTITIES,
@@ -35,6 +45,15 @@ from ...const import (
     DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED,
     DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE,
     DEFAULT_EVENTS_FORWARDER_PERSISTENT_QUEUE_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+    DEFAULT_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+    DEFAULT_EVENTS_FORWARDER_MIN_BATCH,
+    DEFAULT_EVENTS_FORWARDER_TARGET_RTT_MS,
+    DEFAULT_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS,
+    DEFAULT_EVENTS_FORWARDER_MAX_IN_FLIGHT,
+    DEFAULT_EVENTS_FORWARDER_PRIORITY_RULES,
+    DEFAULT_EVENTS_FORWARDER_PRIORITY_MAX_BATCH,
+    DEFAULT_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
     DEFAULT_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES,
     DEFAULT_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS,
     DEFAULT_EVENTS_FORWARDER_ADDITIONAL_ENTITIES,
@@ -46,9 +65,20 @@ from ...const import (
 # DEPRECATED: v1 - prefer v2
 # from ...habitus_zones_store import SIGNAL_HABITUS_ZONES_V2_UPDATED, async_get_zones
 from ...habitus_zones_store_v2 import SIGNAL_HABITUS_ZONES_V2_UPDATED, async_get_zones_v2
-from ...core_v1 import async_fetch_core_capabilities
+from ...api import CopilotApiError
+from ...core_v1 import _parse_http_status, async_fetch_core_capabilities
 from ...media_context import _parse_csv
+from ..batch_controller import AimdBatchController
+from ..batch_pipeline import LANE_BULK, LANE_HIGH, LANES, BatchPipeline
+from ..event_codec import (
+    LEGACY_ENCODING,
+    EventEncoding,
+    encode_events_body,
+    negotiate_event_encoding,
+)
+from ..event_log import SegmentedEventLog
 from ..module import ModuleContext
+from ..performance import ExpiringKeyIndex
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -136,12 +166,21 @@ def _allowed_state_attrs(entity_id: str, state_obj: Any) -> dict[str, Any]:
     return {k: attrs.get(k) for k in allow if k in attrs}
 
 
+# Hard cap for the idempotency index (keys live for idempotency_ttl seconds).
+_SEEN_MAX_KEYS = 20000
+
+
 def _store_key(entry_id: str) -> str:
     # Stored in .storage (local HA config directory).
     # Keep it stable + namespaced.
     return f"{DOMAIN}.events_forwarder.{entry_id}"
 
 
+def _event_log_dir(hass: HomeAssistant, entry_id: str) -> str:
+    # Segmented queue log lives next to the metadata Store in .storage.
+    return hass.config.path(".storage", f"{_store_key(entry_id)}.log")
+
+
 def _rate_limit_refill(st: _ForwarderState) -> None:
     """Refill rate limit tokens based on elapsed time."""
     if not st.rate_limit_enabled:
@@ -190,6 +229,7 @@ class _ForwarderState:
     unsub_state: Callable[[], None] | None = None
     unsub_zones: Callable[[], None] | None = None
     unsub_timer: Callable[[], None] | None = None
+    unsub_priority_timer: Callable[[], None] | None = None
     unsub_call_service: Callable[[], None] | None = None
 
     # persistence timers
@@ -198,18 +238,26 @@ class _ForwarderState:
     entity_ids: list[str] | None = None
     entity_to_zone_ids: dict[str, list[str]] | None = None
 
-    # bounded in-memory queue (drop-oldest policy enforced by our enqueue helpers)
-    queue: list[dict[str, Any]] | None = None
-
     # best-effort idempotency (in-memory, optionally persisted)
-    seen_until: dict[str, float] | None = None
+    seen: ExpiringKeyIndex | None = None
 
-    # persistent queue
+    # persistent queue: envelopes go to an append-only segmented log,
+    # small metadata (idempotency keys, counters) stays in the HA Store.
     store: Store | None = None
+    event_log: SegmentedEventLog | None = None
     persistent_enabled: bool = False
     persistent_dirty: bool = False
     persistent_flush_interval: int = 5
     persistent_max_size: int = 500
+    # one save (log append + Store write) at a time
+    persist_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    # wire format for /api/v1/events (negotiated via Core capabilities)
+    encoding: EventEncoding = LEGACY_ENCODING
+    wire_bytes_total: int = 0
+
+    # adaptive batch size / flush delay (None = static config values)
+    batch_ctl: AimdBatchController | None = None
 
     # stats / observability
     dropped_total: int = 0
@@ -220,10 +268,13 @@ class _ForwarderState:
     first_error_ts: float | None = None
     last_error_ts: float | None = None
 
-    # concurrency guard (avoid overlapping flush tasks)
-    # Set at runtime to an asyncio.Lock(); dataclass default must be a bool
-    # because asyncio.Lock() cannot be created before an event loop exists.
-    flush_lock: Any = None
+    # bounded in-memory queue split into priority lanes (drop-oldest policy
+    # enforced by our enqueue helpers) + pipelined uploads of up to
+    # pipeline.max_in_flight concurrent batches
+    pipeline: BatchPipeline = field(default_factory=BatchPipeline)
+    send_tasks: set[asyncio.Task] = field(default_factory=set)
+    stream_id: str = ""
+    retry_not_before: float = 0.0  # monotonic; backoff gate after errors
 
     # Rate limiting: token bucket algorithm
     rate_limit_tokens: float = 10.0
@@ -238,6 +289,18 @@ class _ForwarderState:
     backoff_base_delay: float = 1.0  # seconds
 
 
+def _metadata_payload(st: _ForwarderState) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "seen_until": st.seen.to_dict() if st.seen is not None else {},
+        "dropped_total": int(st.dropped_total or 0),
+        "updated_at": _now_iso(),
+    }
+    if st.event_log is None:
+        # Queued, in-flight and parked batches, in enqueue order.
+        payload["queue"] = st.pipeline.unacked_items()
+    return payload
+
+
 def _entry_data(hass: HomeAssistant, entry_id: str) -> dict[str, Any]:
     dom = hass.data.setdefault(DOMAIN, {})
     ent = dom.setdefault(entry_id, {})
@@ -336,7 +399,7 @@ class EventsForwarderModule:
             )
             return
 
-        st = _ForwarderState(queue=[], seen_until={}, flush_lock=asyncio.Lock())
+        st = _ForwarderState(stream_id=uuid.uuid4().hex)
         data["events_forwarder_state"] = st
 
         flush_interval = int(
@@ -364,6 +427,7 @@ class EventsForwarderModule:
             )
         )
         idempotency_ttl = max(0, min(idempotency_ttl, 86400))
+        st.seen = ExpiringKeyIndex(ttl_seconds=idempotency_ttl, max_size=_SEEN_MAX_KEYS)
 
         # Persistent queue options (store unsent events across HA restarts)
         persistent_enabled = bool(
@@ -388,12 +452,67 @@ class EventsForwarderModule:
         )
         persistent_flush_interval = max(1, min(persistent_flush_interval, 60))
 
+        compressed_upload = bool(
+            cfg.get(
+                CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+                DEFAULT_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+            )
+        )
+        if compressed_upload:
+            st.encoding = negotiate_event_encoding(cap.data)
+
+        adaptive_batching = bool(
+            cfg.get(
+                CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+                DEFAULT_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+            )
+        )
+        if adaptive_batching:
+            min_batch = int(cfg.get(CONF_EVENTS_FORWARDER_MIN_BATCH, DEFAULT_EVENTS_FORWARDER_MIN_BATCH))
+            target_rtt_ms = int(
+                cfg.get(CONF_EVENTS_FORWARDER_TARGET_RTT_MS, DEFAULT_EVENTS_FORWARDER_TARGET_RTT_MS)
+            )
+            min_delay_ms = int(
+                cfg.get(CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS, DEFAULT_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS)
+            )
+            st.batch_ctl = AimdBatchController(
+                min_batch=max(1, min(min_batch, max_batch)),
+                max_batch=max_batch,
+                min_delay=max(0, min_delay_ms) / 1000.0,
+                max_delay=flush_interval,
+                target_rtt_ms=max(50, min(target_rtt_ms, 10000)),
+            )
+
+        max_in_flight = int(
+            cfg.get(CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT, DEFAULT_EVENTS_FORWARDER_MAX_IN_FLIGHT)
+        )
+        st.pipeline = BatchPipeline(max_in_flight=max(1, min(max_in_flight, 16)))
+
+        priority_rules = {
+            r.lower()
+            for r in _parse_csv(
+                cfg.get(CONF_EVENTS_FORWARDER_PRIORITY_RULES, DEFAULT_EVENTS_FORWARDER_PRIORITY_RULES)
+            )
+        }
+        priority_max_batch = int(
+            cfg.get(CONF_EVENTS_FORWARDER_PRIORITY_MAX_BATCH, DEFAULT_EVENTS_FORWARDER_PRIORITY_MAX_BATCH)
+        )
+        priority_max_batch = max(1, min(priority_max_batch, 500))
+        priority_flush_ms = int(
+            cfg.get(
+                CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
+                DEFAULT_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
+            )
+        )
+        priority_flush_delay = max(0, min(priority_flush_ms, 10000)) / 1000.0
+
         st.persistent_enabled = persistent_enabled
         st.persistent_max_size = persistent_max_size
         st.persistent_flush_interval = persistent_flush_interval
 
         if persistent_enabled:
             st.store = Store(hass, version=1, key=_store_key(entry.entry_id))
+            st.event_log = SegmentedEventLog(_event_log_dir(hass, entry.entry_id))
 
         # Operator visibility / observability (read by sensors + diagnostics)
         data["events_forwarder_persistent_enabled"] = persistent_enabled
@@ -409,6 +528,37 @@ class EventsForwarderModule:
         data["events_forwarder_last_error_ts"] = None
         data["events_forwarder_rate_limit_tokens"] = st.rate_limit_max_tokens
         data["events_forwarder_backoff_level"] = 0
+        data["events_forwarder_wire"] = {
+            "encoding": st.encoding.batch,
+            "content_encoding": st.encoding.content_encoding,
+            "bytes_total": 0,
+        }
+        data["events_forwarder_adaptive"] = st.batch_ctl.as_dict() if st.batch_ctl else None
+        data["events_forwarder_pipeline"] = st.pipeline.stats()
+
+        def _batch_limit() -> int:
+            return st.batch_ctl.batch_size if st.batch_ctl else max_batch
+
+        def _flush_delay() -> float:
+            return st.batch_ctl.flush_delay if st.batch_ctl else flush_interval
+
+        def _lane_limit(lane: str) -> int:
+            return priority_max_batch if lane == LANE_HIGH else _batch_limit()
+
+        def _lane_for(item: dict[str, Any], device_class: Any = None) -> str:
+            """Priority lane if the event type, domain or device_class matches a rule."""
+            if not priority_rules:
+                return LANE_BULK
+            attrs = item.get("attributes") if isinstance(item.get("attributes"), dict) else {}
+            for key in (item.get("type"), attrs.get("domain"), device_class):
+                if isinstance(key, str) and key.lower() in priority_rules:
+                    return LANE_HIGH
+            return LANE_BULK
+
+        def _state_device_class(entity_id: Any) -> Any:
+            state_obj = hass.states.get(entity_id) if isinstance(entity_id, str) else None
+            attrs = getattr(state_obj, "attributes", None)
+            return attrs.get("device_class") if isinstance(attrs, dict) else None
 
         def _schedule_task(coro_fn) -> None:
             """Schedule a coroutine function on the HA event loop.
@@ -431,61 +581,92 @@ class EventsForwarderModule:
             try:
                 loaded = await st.store.async_load()
             except Exception as err:  # noqa: BLE001
+                # Keep going: the segment log must still be replayed (or
+                # skipped) so new appends never reuse on-disk sequence numbers.
                 _LOGGER.warning("Events forwarder: failed to load persistent queue: %s", err)
-                return
+                loaded = {}
 
             if not isinstance(loaded, dict):
-                return
+                loaded = {}
 
-            queue = loaded.get("queue")
-            if isinstance(queue, list):
-                st.queue = [q for q in queue if isinstance(q, dict)]
-            if st.queue is None:
-                st.queue = []
-
-            seen_until = loaded.get("seen_until")
-            if isinstance(seen_until, dict):
-                # only keep numeric expiries
-                st.seen_until = {
-                    str(k): float(v)
-                    for k, v in seen_until.items()
-                    if isinstance(k, str) and k and isinstance(v, (int, float))
-                }
+            replayed: list[dict[str, Any]] = []
+            if st.event_log is not None:
+                try:
+                    replayed = await hass.async_add_executor_job(st.event_log.replay)
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.warning("Events forwarder: failed to replay queue log: %s", err)
+                    try:
+                        await hass.async_add_executor_job(st.event_log.skip_unreplayed)
+                    except Exception as err2:  # noqa: BLE001
+                        _LOGGER.debug("Events forwarder: failed to resume queue log: %s", err2)
+
+            # One-time migration: older versions kept the whole queue in the Store.
+            legacy_queue = loaded.get("queue")
+            if isinstance(legacy_queue, list) and st.event_log is not None:
+                legacy = [q for q in legacy_queue if isinstance(q, dict)]
+                if legacy and not replayed:
+                    try:
+                        await hass.async_add_executor_job(st.event_log.reset, legacy)
+                        replayed = legacy
+                    except Exception as err:  # noqa: BLE001
+                        _LOGGER.warning("Events forwarder: failed to migrate legacy queue: %s", err)
+                st.persistent_dirty = True
+
+            for item in replayed:
+                st.pipeline.push(item, _lane_for(item, _state_device_class(item.get("entity_id"))))
+
+            # only keeps numeric, unexpired entries
+            if st.seen is not None:
+                st.seen.load(loaded.get("seen_until"))
 
             drops = loaded.get("dropped_total")
             if isinstance(drops, int):
                 st.dropped_total = max(0, drops)
 
             # Enforce bounds on load as well.
-            if st.persistent_max_size > 0 and len(st.queue) > st.persistent_max_size:
-                overflow = len(st.queue) - st.persistent_max_size
-                del st.queue[:overflow]
-                st.dropped_total += overflow
+            if _enforce_bounds():
                 st.persistent_dirty = True
 
-            data["events_forwarder_queue_len"] = len(st.queue)
-            data["events_forwarder_persistent_queue_len"] = len(st.queue)
+            _publish_queue_len()
             data["events_forwarder_dropped_total"] = st.dropped_total
 
             # If we have pending items, schedule a send soon.
-            if st.queue:
+            if st.pipeline.pending():
                 st.unsub_timer = async_call_later(hass, 1, _flush_timer)
 
-            if st.persistent_dirty:
+            if st.persistent_dirty or (st.event_log is not None and st.event_log.dirty):
                 _schedule_task(_persist_save)
 
+        def _log_ack(count: int) -> None:
+            # The pipeline only reports contiguous runs of delivered or dropped
+            # items (log order), so a count is enough to advance the watermark.
+            if st.event_log is not None:
+                st.event_log.ack(count)
+
         async def _persist_save() -> None:
             if not st.persistent_enabled or st.store is None:
                 return
+
+            # The timer handle is cleared before a save runs, so the next one
+            # can start while this one is still in the executor; the log
+            # writer is not safe to run twice at once.
+            async with st.persist_lock:
+                await _persist_save_locked()
+
+        async def _persist_save_locked() -> None:
+            if st.event_log is not None and st.event_log.dirty:
+                records, acked_seq = st.event_log.take_pending()
+                try:
+                    await hass.async_add_executor_job(st.event_log.write, records, acked_seq)
+                    data["events_forwarder_queue_log"] = st.event_log.stats()
+                except Exception as err:  # noqa: BLE001
+                    st.event_log.restage(records)
+                    _LOGGER.warning("Events forwarder: failed to append queue log: %s", err)
+
             if not st.persistent_dirty:
                 return
 
-            payload = {
-                "queue": st.queue or [],
-                "seen_until": st.seen_until or {},
-                "dropped_total": int(st.dropped_total or 0),
-                "updated_at": _now_iso(),
-            }
+            payload = _metadata_payload(st)
             try:
                 await st.store.async_save(payload)
                 st.persistent_dirty = False
@@ -499,10 +680,11 @@ class EventsForwarderModule:
             st.unsub_persist_timer = None
             _schedule_task(_persist_save)
 
-        def _persist_mark_dirty() -> None:
+        def _persist_mark_dirty(metadata: bool = True) -> None:
             if not st.persistent_enabled:
                 return
-            st.persistent_dirty = True
+            if metadata:
+                st.persistent_dirty = True
             if st.unsub_persist_timer is None:
                 st.unsub_persist_timer = async_call_later(
                     hass, st.persistent_flush_interval, _persist_timer
@@ -512,50 +694,48 @@ class EventsForwarderModule:
             if not id_key or idempotency_ttl <= 0:
                 return True
 
-            if st.seen_until is None:
-                st.seen_until = {}
-
-            now = time.time()
-            # opportunistic cleanup
-            if len(st.seen_until) > 5000:
-                st.seen_until = {k: v for k, v in st.seen_until.items() if v > now}
-            else:
-                for k, v in list(st.seen_until.items()):
-                    if v <= now:
-                        st.seen_until.pop(k, None)
+            if st.seen is None:
+                st.seen = ExpiringKeyIndex(ttl_seconds=idempotency_ttl, max_size=_SEEN_MAX_KEYS)
 
-            if st.seen_until.get(id_key, 0) > now:
+            if not st.seen.add(id_key):
                 return False
 
-            st.seen_until[id_key] = now + idempotency_ttl
             _persist_mark_dirty()
             return True
 
-        def _enqueue(item: dict[str, Any]) -> None:
-            if st.queue is None:
-                st.queue = []
-            st.queue.append(item)
+        def _enqueue(item: dict[str, Any], device_class: Any = None) -> None:
+            lane = _lane_for(item, device_class)
+            st.pipeline.push(item, lane)
+            if st.event_log is not None:
+                st.event_log.append(item)
 
             # Enforce bounded queue (drop-oldest). If max_size==0, treat as "no limit".
             # We apply this even when persistence is disabled to avoid unbounded RAM growth.
-            if st.persistent_max_size > 0:
-                overflow = len(st.queue) - st.persistent_max_size
-                if overflow > 0:
-                    del st.queue[:overflow]
-                    st.dropped_total += overflow
-
-            data["events_forwarder_queue_len"] = len(st.queue)
-            data["events_forwarder_persistent_queue_len"] = len(st.queue)
+            overflow = _enforce_bounds()
+
+            _publish_queue_len()
             data["events_forwarder_dropped_total"] = st.dropped_total
 
-            _persist_mark_dirty()
+            # Only the drop counter lives in the metadata Store; the envelope
+            # itself is appended to the queue log on the next persist tick.
+            _persist_mark_dirty(metadata=overflow > 0 or st.event_log is None)
+
+            if lane == LANE_HIGH:
+                # Own flush trigger: short delay, small batches.
+                if st.pipeline.has_full_batch(LANE_HIGH, priority_max_batch) or priority_flush_delay <= 0:
+                    _schedule_task(_flush_priority)
+                elif st.unsub_priority_timer is None:
+                    st.unsub_priority_timer = async_call_later(
+                        hass, priority_flush_delay, _priority_timer
+                    )
+                return
 
             # Schedule flush if this was the first in an empty queue.
             if st.unsub_timer is None:
-                st.unsub_timer = async_call_later(hass, flush_interval, _flush_timer)
+                st.unsub_timer = async_call_later(hass, _flush_delay(), _flush_timer)
 
             # Flush immediately on size.
-            if len(st.queue or []) >= max_batch:
+            if st.pipeline.queued(LANE_BULK) >= _batch_limit():
                 _schedule_task(_flush_now)
 
         async def _refresh_subscriptions() -> None:
@@ -614,7 +794,8 @@ class EventsForwarderModule:
                         },
                     }
 
-                    _enqueue(item)
+                    attrs = getattr(new, "attributes", None)
+                    _enqueue(item, attrs.get("device_class") if isinstance(attrs, dict) else None)
 
                     # Debug stats for operator UX
                     data["events_forwarder_seen"] = {
@@ -695,160 +876,253 @@ class EventsForwarderModule:
             except Exception as e:  # noqa: BLE001
                 _LOGGER.debug("Events forwarder call_service handler failed: %s", e)
 
-        async def _flush_now() -> None:
-            # Use asyncio.Lock to avoid overlapping flush tasks.
-            if st.flush_lock is None:
-                st.flush_lock = asyncio.Lock()
-            if st.flush_lock.locked():
-                return  # another flush is in progress, skip
-            async with st.flush_lock:
-                try:
-                    # Cancel pending timer if any
-                    if callable(st.unsub_timer):
-                        st.unsub_timer()
-                    st.unsub_timer = None
+        async def _post_batch(seq: int, items: list[dict[str, Any]]) -> None:
+            # batch_seq is scoped to stream_id (new per setup) so Core can
+            # reorder concurrent batches and drop retried duplicates.
+            payload = {"items": items, "batch_seq": seq, "stream_id": st.stream_id}
+            if st.encoding.is_legacy:
+                await api.async_post("/api/v1/events", payload)
+                return
 
-                    # Check rate limit before proceeding
-                    if not _rate_limit_consume(st, cost=1.0):
-                        delay = 1.0 / st.rate_limit_refill_rate
-                        st.unsub_timer = async_call_later(hass, delay, _flush_timer)
-                        data["events_forwarder_last"] = {
-                            "sent": 0,
-                            "time": _now_iso(),
-                            "status": "rate_limited",
-                        }
-                        return
+            body, headers = encode_events_body(payload, "items", st.encoding)
+            try:
+                await api.async_post_bytes("/api/v1/events", body, headers)
+            except CopilotApiError as err:
+                # Core advertised the format but rejected it: fall back for good.
+                if _parse_http_status(err) not in (400, 415):
+                    raise
+                _LOGGER.warning(
+                    "Events forwarder: Core rejected %s upload (%s); falling back to JSON",
+                    st.encoding.batch,
+                    err,
+                )
+                st.encoding = LEGACY_ENCODING
+                await api.async_post("/api/v1/events", payload)
+            else:
+                st.wire_bytes_total += len(body)
 
-                    # Apply exponential backoff if needed
-                    backoff_delay = _get_backoff_delay(st)
-                    if backoff_delay > 0:
-                        _LOGGER.debug("Events forwarder: backing off %.1fs (level %d)", backoff_delay, st.backoff_level)
-                        await asyncio.sleep(backoff_delay)
+            data["events_forwarder_wire"] = {
+                "encoding": st.encoding.batch,
+                "content_encoding": st.encoding.content_encoding,
+                "bytes_total": st.wire_bytes_total,
+            }
 
-                    if st.queue is None:
-                        st.queue = []
+        def _publish_queue_len() -> None:
+            pending = st.pipeline.pending()
+            data["events_forwarder_queue_len"] = pending
+            data["events_forwarder_persistent_queue_len"] = pending
+            data["events_forwarder_pipeline"] = st.pipeline.stats()
 
-                    if not st.queue:
-                        data["events_forwarder_queue_len"] = 0
-                        data["events_forwarder_persistent_queue_len"] = 0
-                        _reset_backoff(st)
-                        return
+        def _enforce_bounds() -> int:
+            """Drop-oldest down to persistent_max_size; returns items dropped.
 
-                    # Take up to max_batch items, keep remainder.
-                    items = list(st.queue[:max_batch])
-                    remain = list(st.queue[max_batch:])
-                    st.queue = remain
+            The bulk lane is dropped before the priority lane; parked retry
+            batches are older than their lane's queue, so they go first.
+            """
+            if st.persistent_max_size <= 0:
+                return 0
+
+            overflow = st.pipeline.pending() - st.persistent_max_size
+            if overflow <= 0:
+                return 0
+
+            dropped, acked = st.pipeline.drop_oldest(overflow)
+            _log_ack(acked)
+            if dropped:
+                st.dropped_total += dropped
+                data["events_forwarder_dropped_total"] = st.dropped_total
+            return dropped
+
+        def _record_error(err: Exception) -> None:
+            st.error_total += 1
+            st.error_streak += 1
+            now_ts = time.time()
+            st.last_error_ts = now_ts
+            if st.first_error_ts is None:
+                st.first_error_ts = now_ts
+
+            # Concurrent batches failing together count as one backoff step.
+            if time.monotonic() >= st.retry_not_before:
+                st.backoff_level = min(st.backoff_level + 1, st.backoff_max_level)
+                st.retry_not_before = time.monotonic() + _get_backoff_delay(st)
+
+            data["events_forwarder_last"] = {
+                "sent": 0,
+                "time": _now_iso(),
+                "status": "error",
+                "error": str(err),
+            }
+            data["events_forwarder_error_total"] = st.error_total
+            data["events_forwarder_error_streak"] = st.error_streak
+            data["events_forwarder_last_error_at"] = data["events_forwarder_last"]["time"]
+            data["events_forwarder_last_error_ts"] = st.last_error_ts
+            data["events_forwarder_backoff_level"] = st.backoff_level
 
-                    data["events_forwarder_queue_len"] = len(st.queue)
-                    data["events_forwarder_persistent_queue_len"] = len(st.queue)
-                    _persist_mark_dirty()
+        async def _send_batch(seq: int, lane: str, items: list[dict[str, Any]]) -> None:
+            try:
+                started = time.monotonic()
+                await _post_batch(seq, items)
+                rtt = time.monotonic() - started
+
+            except asyncio.CancelledError:
+                st.pipeline.fail(seq)
+                data["events_forwarder_last"] = {
+                    "sent": 0,
+                    "time": _now_iso(),
+                    "status": "cancelled",
+                }
+                _publish_queue_len()
+                return
 
-                    data["events_forwarder_last"] = {
-                        "sent": 0,
-                        "time": _now_iso(),
-                        "status": "sending",
-                    }
+            except Exception as err:  # noqa: BLE001
+                # Park the batch for retry (same batch_seq, ahead of its lane).
+                st.pipeline.fail(seq)
+                _record_error(err)
+                if st.batch_ctl is not None:
+                    st.batch_ctl.on_error(st.error_streak)
+                    data["events_forwarder_adaptive"] = st.batch_ctl.as_dict()
+
+                _LOGGER.warning(
+                    "Events forwarder failed to POST /api/v1/events (batch %d): %s (backoff level %d)",
+                    seq,
+                    err,
+                    st.backoff_level,
+                )
 
-                    payload = {"items": items}
-                    try:
-                        await api.async_post("/api/v1/events", payload)
+                _enforce_bounds()
+                _publish_queue_len()
 
-                        st.sent_total += len(items)
-                        st.error_streak = 0
-                        st.last_success_ts = time.time()
-                        st.first_error_ts = None
-                        _reset_backoff(st)
+                # Schedule retry with backoff
+                if st.unsub_timer is None:
+                    retry_delay = max(0.0, st.retry_not_before - time.monotonic())
+                    st.unsub_timer = async_call_later(hass, retry_delay, _flush_timer)
 
-                        data["events_forwarder_last"] = {
-                            "sent": len(items),
-                            "time": _now_iso(),
-                            "status": "sent",
-                        }
-                        data["events_forwarder_sent_total"] = st.sent_total
-                        data["events_forwarder_error_streak"] = st.error_streak
-                        data["events_forwarder_last_success_at"] = data["events_forwarder_last"]["time"]
-                        data["events_forwarder_last_success_ts"] = st.last_success_ts
-                        data["events_forwarder_rate_limit_tokens"] = st.rate_limit_tokens
+                _persist_mark_dirty()
+                return
 
-                        _persist_mark_dirty()
+            st.sent_total += len(items)
+            st.error_streak = 0
+            st.last_success_ts = time.time()
+            st.first_error_ts = None
+            st.retry_not_before = 0.0
+            _reset_backoff(st)
 
-                    except asyncio.CancelledError:
-                        data["events_forwarder_last"] = {
-                            "sent": 0,
-                            "time": _now_iso(),
-                            "status": "cancelled",
-                        }
-                        st.queue = items + (st.queue or [])
-                        data["events_forwarder_queue_len"] = len(st.queue)
-                        data["events_forwarder_persistent_queue_len"] = len(st.queue)
-                        _persist_mark_dirty()
-                        return
+            data["events_forwarder_last"] = {
+                "sent": len(items),
+                "time": _now_iso(),
+                "status": "sent",
+                "lane": lane,
+            }
+            data["events_forwarder_sent_total"] = st.sent_total
+            data["events_forwarder_error_streak"] = st.error_streak
+            data["events_forwarder_last_success_at"] = data["events_forwarder_last"]["time"]
+            data["events_forwarder_last_success_ts"] = st.last_success_ts
+            data["events_forwarder_rate_limit_tokens"] = st.rate_limit_tokens
+            data["events_forwarder_backoff_level"] = st.backoff_level
+            if st.seen is not None:
+                data["events_forwarder_dedup"] = st.seen.get_stats()
+
+            # Completions may arrive out of order; only a contiguous prefix is acked.
+            _log_ack(st.pipeline.complete(seq))
+            _persist_mark_dirty(metadata=st.event_log is None)
+
+            # The adaptive controller tunes the bulk lane only.
+            if st.batch_ctl is not None and lane == LANE_BULK:
+                st.batch_ctl.on_success(rtt, len(items), st.pipeline.queued(LANE_BULK))
+                data["events_forwarder_adaptive"] = st.batch_ctl.as_dict()
+
+            # Refill the window right away while full batches (or retries) are
+            # waiting; a partial remainder waits for its lane's flush trigger.
+            if any(st.pipeline.has_full_batch(ln, _lane_limit(ln)) for ln in LANES):
+                await _flush_now()
+            else:
+                if st.pipeline.queued(LANE_HIGH) and st.unsub_priority_timer is None:
+                    st.unsub_priority_timer = async_call_later(
+                        hass, priority_flush_delay, _priority_timer
+                    )
+                if st.pipeline.queued(LANE_BULK) and st.unsub_timer is None:
+                    st.unsub_timer = async_call_later(hass, _flush_delay(), _flush_timer)
+            _publish_queue_len()
 
-                    except Exception as err:  # noqa: BLE001
-                        st.error_total += 1
-                        st.error_streak += 1
-                        st.backoff_level = min(st.backoff_level + 1, st.backoff_max_level)
-                        now_ts = time.time()
-                        st.last_error_ts = now_ts
-                        if st.first_error_ts is None:
-                            st.first_error_ts = now_ts
+        async def _flush_now(lanes: tuple[str, ...] = LANES) -> None:
+            """Dispatch batches until the in-flight window is full or nothing is left.
+
+            The priority lane is always served first.
+            """
+            try:
+                # Cancel pending timers if any
+                if LANE_BULK in lanes and callable(st.unsub_timer):
+                    st.unsub_timer()
+                    st.unsub_timer = None
+                if LANE_HIGH in lanes and callable(st.unsub_priority_timer):
+                    st.unsub_priority_timer()
+                    st.unsub_priority_timer = None
+
+                # After an error: wait out the backoff, then probe with one batch.
+                wait = st.retry_not_before - time.monotonic()
+                if wait > 0:
+                    if st.unsub_timer is None:
+                        st.unsub_timer = async_call_later(hass, wait, _flush_timer)
+                    return
+                probing = st.error_streak > 0
+
+                rate_limited = False
+                for lane in lanes:
+                    while st.pipeline.has_capacity(lane, probing) and st.pipeline.has_work(lane):
+                        # Check rate limit before each dispatch
+                        if not _rate_limit_consume(st, cost=1.0):
+                            rate_limited = True
+                            break
+
+                        batch = st.pipeline.next_batch(lane, _lane_limit(lane))
+                        if batch is None:
+                            break
+                        seq, items = batch
 
                         data["events_forwarder_last"] = {
                             "sent": 0,
                             "time": _now_iso(),
-                            "status": "error",
-                            "error": str(err),
+                            "status": "sending",
+                            "lane": lane,
                         }
-                        data["events_forwarder_error_total"] = st.error_total
-                        data["events_forwarder_error_streak"] = st.error_streak
-                        data["events_forwarder_last_error_at"] = data["events_forwarder_last"]["time"]
-                        data["events_forwarder_last_error_ts"] = st.last_error_ts
-                        data["events_forwarder_backoff_level"] = st.backoff_level
-
-                        _LOGGER.warning("Events forwarder failed to POST /api/v1/events: %s (backoff level %d)", err, st.backoff_level)
-
-                        # Re-queue items (front), keep order.
-                        st.queue = items + (st.queue or [])
-
-                        # Enforce bounds after re-queue.
-                        if st.persistent_max_size > 0:
-                            overflow = len(st.queue) - st.persistent_max_size
-                            if overflow > 0:
-                                del st.queue[:overflow]
-                                st.dropped_total += overflow
-                                data["events_forwarder_dropped_total"] = st.dropped_total
-
-                        data["events_forwarder_queue_len"] = len(st.queue)
-                        data["events_forwarder_persistent_queue_len"] = len(st.queue)
-
-                        # Schedule retry with backoff
-                        retry_delay = _get_backoff_delay(st)
-                        if retry_delay > 0:
-                            st.unsub_timer = async_call_later(hass, retry_delay, _flush_timer)
-
-                        _persist_mark_dirty()
-
-                except Exception as err:
-                    _LOGGER.error("Events forwarder flush failed: %s", err)
+                        task = hass.async_create_task(_send_batch(seq, lane, items))
+                        st.send_tasks.add(task)
+                        task.add_done_callback(st.send_tasks.discard)
+                    if rate_limited:
+                        break
+
+                if rate_limited:
+                    delay = 1.0 / st.rate_limit_refill_rate
+                    if callable(st.unsub_timer):
+                        st.unsub_timer()
+                    st.unsub_timer = async_call_later(hass, delay, _flush_timer)
                     data["events_forwarder_last"] = {
                         "sent": 0,
                         "time": _now_iso(),
-                        "status": "error",
-                        "error": str(err),
+                        "status": "rate_limited",
                     }
-                    st.error_total += 1
-                    st.error_streak += 1
-                    st.backoff_level = min(st.backoff_level + 1, st.backoff_max_level)
-                    now_ts = time.time()
-                    st.last_error_ts = now_ts
-                    if st.first_error_ts is None:
-                        st.first_error_ts = now_ts
-                    _persist_mark_dirty()
+
+                if not st.pipeline.has_work() and not st.pipeline.in_flight:
+                    _reset_backoff(st)
+                _publish_queue_len()
+
+            except Exception as err:
+                _LOGGER.error("Events forwarder flush failed: %s", err)
+                _record_error(err)
+                _persist_mark_dirty()
+
+        async def _flush_priority() -> None:
+            await _flush_now((LANE_HIGH,))
 
         def _flush_timer(_now) -> None:
             # callback from async_call_later (sync context)
+            st.unsub_timer = None
             _schedule_task(_flush_now)
 
+        def _priority_timer(_now) -> None:
+            st.unsub_priority_timer = None
+            _schedule_task(_flush_priority)
+
         # Load persisted queue before subscriptions.
         await _persist_load()
 
@@ -880,10 +1154,14 @@ class EventsForwarderModule:
                 st.unsub_zones()
             if callable(st.unsub_timer):
                 st.unsub_timer()
+            if callable(st.unsub_priority_timer):
+                st.unsub_priority_timer()
             if callable(st.unsub_call_service):
                 st.unsub_call_service()
             if callable(st.unsub_persist_timer):
                 st.unsub_persist_timer()
+            for task in list(st.send_tasks):
+                task.cancel()
 
             if isinstance(data, dict):
                 data.pop("events_forwarder_state", None)
@@ -898,19 +1176,19 @@ class EventsForwarderModule:
         data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
         st = data.get("events_forwarder_state") if isinstance(data, dict) else None
         if isinstance(st, _ForwarderState) and st.persistent_enabled and st.store is not None:
-            # Best-effort final persist.
-            if st.persistent_dirty:
-                try:
-                    await st.store.async_save(
-                        {
-                            "queue": st.queue or [],
-                            "seen_until": st.seen_until or {},
-                            "dropped_total": int(st.dropped_total or 0),
-                            "updated_at": _now_iso(),
-                        }
-                    )
-                except Exception as err:  # noqa: BLE001
-                    _LOGGER.warning("Events forwarder: failed to persist queue on unload: %s", err)
+            # Best-effort final persist, after any save still in flight.
+            async with st.persist_lock:
+                if st.event_log is not None and st.event_log.dirty:
+                    records, acked_seq = st.event_log.take_pending()
+                    try:
+                        await hass.async_add_executor_job(st.event_log.write, records, acked_seq)
+                    except Exception as err:  # noqa: BLE001
+                        _LOGGER.warning("Events forwarder: failed to append queue log on unload: %s", err)
+                if st.persistent_dirty:
+                    try:
+                        await st.store.async_save(_metadata_payload(st))
+                    except Exception as err:  # noqa: BLE001
+                        _LOGGER.warning("Events forwarder: failed to persist queue on unload: %s", err)
 
         unsub = data.get("unsub_events_forwarder") if isinstance(data, dict) else None
         if callable(unsub):
@@ -22,11 +22,11 @@ from datetime import datetime
 from typing import Any
 
 from homeassistant.core import HomeAssistant, Event, callback
-from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers import entity_registry
 
 from ...const import DOMAIN
 from .module import CopilotModule
+from ..state_router import async_get_state_router
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -106,10 +106,10 @@ class FrigateBridgeModule(CopilotModule):
 
         self._enabled = True
 
-        # Listen for state changes on Frigate entities
+        # Listen for state changes on Frigate entities (binary_sensor/sensor only)
         self._listeners.append(
-            self._hass.bus.async_listen(
-                EVENT_STATE_CHANGED, self._on_state_changed
+            async_get_state_router(self._hass).async_subscribe(
+                "frigate_bridge", self._on_state_changed, domains=("binary_sensor", "sensor")
             )
         )
 
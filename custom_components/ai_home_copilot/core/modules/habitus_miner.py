@@ -27,6 +27,7 @@ import voluptuous as vol
 
 from ...const import DOMAIN
 from ..module import ModuleContext
+from ..state_router import async_get_state_router
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +36,12 @@ STORAGE_KEY = "ai_home_copilot.habitus_miner"
 STORAGE_VERSION = 1
 BUFFER_SAVE_INTERVAL = timedelta(minutes=5)
 
+# Domains mined by default, both from the live buffer and from HA history.
+MINING_DOMAINS = (
+    "light", "switch", "climate", "media_player", "cover",
+    "binary_sensor", "person", "device_tracker",
+)
+
 
 # Type definitions for better type safety
 class HabitusRule(TypedDict):
@@ -392,8 +399,10 @@ class HabitusMinerModule:
             except Exception as e:
                 _LOGGER.debug("Error buffering event: %s", e)
 
-        # Register listener
-        unsub = hass.bus.async_listen("state_changed", event_listener)
+        # Register listener for the mined domains; zone lookup happens per event
+        unsub = async_get_state_router(hass).async_subscribe(
+            "habitus_miner", event_listener, domains=MINING_DOMAINS
+        )
         module_data["listeners"].append(unsub)
 
         # Set up periodic buffer cleanup
@@ -821,10 +830,7 @@ class HabitusMinerModule:
 
             end = datetime.now(timezone.utc)
             start = end - timedelta(days=days_back)
-            target_domains = domains or [
-                "light", "switch", "climate", "media_player", "cover",
-                "binary_sensor", "person", "device_tracker",
-            ]
+            target_domains = domains or list(MINING_DOMAINS)
 
             # Run in executor to avoid blocking the event loop
             history = await get_instance(hass).async_add_executor_job(
@@ -15,6 +15,8 @@ OPTIMIZATIONS:
 - Batch node/edge creation for efficiency
 - Dynamic entity discovery for state tracking
 - Incremental sync (only changed entities)
+- Per-entity coalescing change queue drained by a small worker pool
+- Local graph mirror for related/zone/mood queries, reconciled on full sync
 - Brain Graph integration with graph state API
 - Proper error handling and retry logic
 """
@@ -22,18 +24,19 @@ OPTIMIZATIONS:
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 import logging
 import time
 from typing import Any, Optional
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.const import STATE_ON, STATE_OFF
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import area_registry as ar
-from homeassistant.helpers.event import async_track_state_change
 from homeassistant.helpers.area_registry import AreaEntry
 
 from ..module import CopilotModule, ModuleContext
+from ..state_router import async_get_state_router
 from ...connection_config import merged_entry_config
 from ...api.knowledge_graph import (
     KnowledgeGraphClient,
@@ -43,6 +46,7 @@ from ...api.knowledge_graph import (
     KGNode,
     KGEdge,
 )
+from ...api.knowledge_graph_mirror import KnowledgeGraphMirror
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,6 +55,8 @@ FULL_SYNC_INTERVAL = 3600  # 1 hour
 BATCH_SIZE = 50  # Nodes/edges per batch request
 RETRY_DELAY = 5  # Seconds between retries on failure
 MAX_RETRIES = 3  # Max retries for failed operations
+CHANGE_QUEUE_MAX_ENTITIES = 2000  # Distinct entities waiting for a live sync
+CHANGE_QUEUE_WORKERS = 2  # Concurrent batch uploads draining the change queue
 
 # Entity domains to sync (exclude transient/noise)
 SYNC_DOMAINS = {
@@ -94,7 +100,23 @@ class KnowledgeGraphSyncModule(CopilotModule):
         self._enabled: bool = True
         self._full_sync_interval: int = FULL_SYNC_INTERVAL
         self._last_full_sync: float = 0
-        self._sync_lock = asyncio.Lock()
+        # Live changes: entity_id -> monotonic time first queued. Repeated
+        # changes collapse onto one entry; workers read the latest state.
+        self._pending_changes: OrderedDict[str, float] = OrderedDict()
+        self._in_flight: set[str] = set()
+        self._changes_ready = asyncio.Event()
+        self._worker_tasks: list[asyncio.Task] = []
+        self._queue_stats: dict[str, Any] = {
+            "queued": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "processed": 0,
+            "batches": 0,
+            "errors": 0,
+            "max_depth": 0,
+            "last_lag_s": 0.0,
+            "max_lag_s": 0.0,
+        }
 
     @property
     def name(self) -> str:
@@ -196,7 +218,12 @@ class KnowledgeGraphSyncModule(CopilotModule):
             session = self._hass.helpers.aiohttp_client.async_get_clientsession()
             base_url = runtime.config.get("core_addon_url", "http://localhost:8909")
             token = runtime.config.get("token")
-            self._client = KnowledgeGraphClient(session, base_url, token)
+            self._client = KnowledgeGraphClient(
+                session,
+                base_url,
+                token,
+                mirror=KnowledgeGraphMirror(stale_after_s=2 * self._full_sync_interval),
+            )
         else:
             _LOGGER.warning("Knowledge Graph sync: No API client available")
             return
@@ -207,8 +234,10 @@ class KnowledgeGraphSyncModule(CopilotModule):
 
         # Initial sync with retry logic
         await self._async_initial_sync_with_retry()
+        await self._client.async_reconcile_mirror()
 
         # Set up state change tracking
+        self._start_change_workers()
         self._setup_state_change_tracking()
         self._setup_area_registry_listeners()
 
@@ -287,51 +316,120 @@ class KnowledgeGraphSyncModule(CopilotModule):
             except asyncio.CancelledError:
                 pass
 
+        for task in self._worker_tasks:
+            task.cancel()
+        if self._worker_tasks:
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._pending_changes.clear()
+
         _LOGGER.info("Knowledge Graph sync module unloaded")
 
     def _setup_state_change_tracking(self) -> None:
-        """Set up tracking for entity state changes using wildcard."""
+        """Set up tracking for state changes of SYNC_DOMAINS entities."""
 
-        @callback
-        def _state_changed(entity_id: str, old_state, new_state) -> None:
+        def _state_changed(event: Event) -> None:
             """Handle entity state change."""
-            domain = entity_id.split(".")[0]
-            if domain not in SYNC_DOMAINS:
-                return
-
-            # Schedule async update
-            self._hass.async_create_task(
-                self._async_handle_entity_change(entity_id, old_state, new_state)
-            )
+            entity_id = event.data.get("entity_id")
+            if entity_id:
+                self._enqueue_entity_change(entity_id)
 
-        # Track all state changes - more efficient than tracking specific entities
-        self._unsub_state_change = async_track_state_change(
-            self._hass, None, _state_changed  # None = all entities
+        # Domain-indexed subscription on the shared router
+        self._unsub_state_change = async_get_state_router(self._hass).async_subscribe(
+            "knowledge_graph_sync", _state_changed, domains=SYNC_DOMAINS
         )
 
-    async def _async_handle_entity_change(
-        self,
-        entity_id: str,
-        old_state,
-        new_state,
-    ) -> None:
-        """Handle entity state change with proper error handling."""
-        async with self._sync_lock:
-            try:
-                if entity_id not in self._synced_entities:
-                    # New entity - full sync
-                    await self._async_sync_entity(entity_id)
-                else:
-                    # Existing entity - update state and capabilities
-                    await self._async_update_entity_state(entity_id, new_state)
+    def _enqueue_entity_change(self, entity_id: str) -> None:
+        """Queue an entity for a live sync, collapsing repeated changes.
 
-                # Update sync timestamp
-                self._synced_entities[entity_id] = int(time.time())
+        The queue holds at most CHANGE_QUEUE_MAX_ENTITIES entities; when full
+        the oldest entry is dropped, and the periodic incremental sync picks
+        it up again via last_changed.
+        """
+        stats = self._queue_stats
+        if entity_id in self._pending_changes:
+            stats["coalesced"] += 1
+        else:
+            if len(self._pending_changes) >= CHANGE_QUEUE_MAX_ENTITIES:
+                self._pending_changes.popitem(last=False)
+                stats["dropped"] += 1
+            self._pending_changes[entity_id] = time.monotonic()
+            stats["queued"] += 1
+            stats["max_depth"] = max(stats["max_depth"], len(self._pending_changes))
+        self._changes_ready.set()
+
+    def _start_change_workers(self) -> None:
+        """Start the worker pool draining the change queue."""
+        if self._worker_tasks:
+            return
+        self._worker_tasks = [
+            asyncio.create_task(self._async_change_worker())
+            for _ in range(CHANGE_QUEUE_WORKERS)
+        ]
+
+    def _take_change_batch(self) -> list[str]:
+        """Pop up to BATCH_SIZE queued entities that are not already in flight."""
+        batch: list[str] = []
+        deferred: list[tuple[str, float]] = []
+        now = time.monotonic()
+        while self._pending_changes and len(batch) < BATCH_SIZE:
+            entity_id, queued_at = self._pending_changes.popitem(last=False)
+            if entity_id in self._in_flight:
+                # Keep per-entity order: wait for the in-flight upsert.
+                deferred.append((entity_id, queued_at))
+                continue
+            batch.append(entity_id)
+            lag = now - queued_at
+            self._queue_stats["last_lag_s"] = round(lag, 3)
+            self._queue_stats["max_lag_s"] = round(max(self._queue_stats["max_lag_s"], lag), 3)
+        for entity_id, queued_at in deferred:
+            self._pending_changes[entity_id] = queued_at
+        return batch
+
+    async def _async_change_worker(self) -> None:
+        """Drain queued entity changes into batched Knowledge Graph upserts."""
+        while True:
+            await self._changes_ready.wait()
+            batch = self._take_change_batch()
+            if not batch:
+                # Only in-flight entities left; their worker wakes us again.
+                self._changes_ready.clear()
+                continue
+            if not self._pending_changes:
+                self._changes_ready.clear()
 
-            except KnowledgeGraphError as err:
-                _LOGGER.warning("Failed to sync entity %s: %s", entity_id, err)
+            self._in_flight.update(batch)
+            try:
+                await self._async_batch_sync_entities(batch)
+                self._queue_stats["processed"] += len(batch)
+            except asyncio.CancelledError:
+                raise
             except Exception as err:
-                _LOGGER.error("Unexpected error syncing entity %s: %s", entity_id, err)
+                self._queue_stats["errors"] += 1
+                _LOGGER.warning("Knowledge Graph live sync of %d entities failed: %s", len(batch), err)
+            finally:
+                self._in_flight.difference_update(batch)
+                self._queue_stats["batches"] += 1
+                if self._pending_changes:
+                    self._changes_ready.set()
+
+    def _mirror_stats(self) -> dict[str, Any] | None:
+        mirror = self._client.mirror if self._client else None
+        return mirror.get_stats() if mirror else None
+
+    def invalidate_mirror(self) -> None:
+        """Send read queries to Core until the next full sync reconciles."""
+        if self._client and self._client.mirror:
+            self._client.mirror.invalidate()
+
+    def get_queue_stats(self) -> dict[str, Any]:
+        """Live change queue metrics (depth, coalescing, lag)."""
+        return {
+            **self._queue_stats,
+            "depth": len(self._pending_changes),
+            "in_flight": len(self._in_flight),
+            "workers": len(self._worker_tasks),
+        }
 
     async def _async_initial_sync(self) -> None:
         """Perform initial sync of all entities."""
@@ -347,12 +445,8 @@ class KnowledgeGraphSyncModule(CopilotModule):
             if domain in SYNC_DOMAINS:
                 entities_to_sync.append(state.entity_id)
 
-        # Sync in batches
-        for i in range(0, len(entities_to_sync), BATCH_SIZE):
-            batch = entities_to_sync[i:i + BATCH_SIZE]
-            await self._async_batch_sync_entities(batch)
-            _LOGGER.debug("Synced batch %d/%d", i // BATCH_SIZE + 1,
-                         (len(entities_to_sync) + BATCH_SIZE - 1) // BATCH_SIZE)
+        # The client chunks bulk upserts, so one pass covers every entity
+        await self._async_batch_sync_entities(entities_to_sync)
 
         _LOGGER.info("Initial sync complete: %d entities, %d areas",
                     len(self._synced_entities), len(self._synced_areas))
@@ -407,7 +501,6 @@ class KnowledgeGraphSyncModule(CopilotModule):
                     type=NodeType.CAPABILITY,
                     label=cap.replace("_", " ").title(),
                 ))
-                self._known_capabilities.add(cap)
 
         # Create capability edges
         for entity_id, caps in capabilities_by_entity.items():
@@ -418,28 +511,26 @@ class KnowledgeGraphSyncModule(CopilotModule):
                     type=EdgeType.HAS_CAPABILITY,
                 ))
 
-        # Batch create nodes (if API supports it, otherwise sequential)
-        try:
-            for node in nodes_to_create:
-                try:
-                    await self.client.create_node(node)
-                    self._synced_entities[node.id] = int(time.time())
-                except KnowledgeGraphError as err:
-                    if "already exists" not in str(err).lower():
-                        _LOGGER.debug("Node create error (may be OK): %s", err)
-        except Exception as err:
-            _LOGGER.warning("Batch node sync failed, falling back: %s", err)
-
-        # Batch create edges
-        try:
-            for edge in edges_to_create:
-                try:
-                    await self.client.create_edge(edge)
-                except KnowledgeGraphError as err:
-                    if "already exists" not in str(err).lower():
-                        _LOGGER.debug("Edge create error (may be OK): %s", err)
-        except Exception as err:
-            _LOGGER.warning("Batch edge sync failed: %s", err)
+        # Bulk upsert: nodes first so edge endpoints exist
+        node_result = await self.client.upsert_nodes(nodes_to_create)
+        failed_nodes = set(node_result.failed_ids)
+        now = int(time.time())
+        for node in nodes_to_create:
+            if node.id in failed_nodes:
+                continue
+            if node.type == NodeType.CAPABILITY:
+                self._known_capabilities.add(node.id[len("cap."):])
+            else:
+                self._synced_entities[node.id] = now
+
+        edge_result = await self.client.upsert_edges(edges_to_create)
+        for result, kind in ((node_result, "node"), (edge_result, "edge")):
+            for chunk in result.chunks:
+                if not chunk.ok:
+                    _LOGGER.debug(
+                        "KG %s chunk %d: %d/%d failed (%s)",
+                        kind, chunk.index, len(chunk.failed_ids), chunk.size, chunk.error,
+                    )
 
     async def _async_periodic_sync(self) -> None:
         """Periodic incremental sync task."""
@@ -452,6 +543,7 @@ class KnowledgeGraphSyncModule(CopilotModule):
                 if now - self._last_full_sync >= self._full_sync_interval:
                     _LOGGER.info("Starting periodic full Knowledge Graph sync...")
                     await self._async_initial_sync_with_retry()
+                    await self.client.async_reconcile_mirror()
                     self._last_full_sync = now
                 else:
                     # Incremental sync - only sync entities changed since last sync
@@ -481,110 +573,34 @@ class KnowledgeGraphSyncModule(CopilotModule):
 
         if entities_to_sync:
             _LOGGER.info("Incremental sync: %d changed entities", len(entities_to_sync))
-            for i in range(0, len(entities_to_sync), BATCH_SIZE):
-                batch = entities_to_sync[i:i + BATCH_SIZE]
-                await self._async_batch_sync_entities(batch)
+            await self._async_batch_sync_entities(entities_to_sync)
 
     async def _async_sync_areas(self) -> None:
         """Sync all areas to Knowledge Graph."""
         if not self._area_registry:
             return
 
-        for area_id, area in self._area_registry.areas.items():
-            try:
-                node = KGNode(
-                    id=f"area.{area_id}",
-                    type=NodeType.AREA,
-                    label=area.name,
-                    properties={
-                        "area_id": area_id,
-                        "icon": area.icon,
-                    }
-                )
-                await self.client.create_node(node)
-                self._synced_areas[area_id] = int(time.time())
-                _LOGGER.debug("Synced area: %s", area.name)
-            except KnowledgeGraphError as err:
-                if "already exists" not in str(err).lower():
-                    _LOGGER.warning("Failed to sync area %s: %s", area_id, err)
-
-    async def _async_sync_entity(self, entity_id: str) -> bool:
-        """Sync a single entity to Knowledge Graph."""
-        if not self._entity_registry:
-            return False
-
-        state = self._hass.states.get(entity_id)
-        if not state:
-            return False
-
-        domain = entity_id.split(".")[0]
-
-        try:
-            # Get entity from registry
-            entity_entry = self._entity_registry.async_get(entity_id)
-
-            # Create entity node
-            node = KGNode(
-                id=entity_id,
-                type=NodeType.ENTITY,
-                label=entity_entry.name if entity_entry and entity_entry.name else state.name,
+        nodes = [
+            KGNode(
+                id=f"area.{area_id}",
+                type=NodeType.AREA,
+                label=area.name,
                 properties={
-                    "domain": domain,
-                    "state": state.state,
-                    "device_class": state.attributes.get("device_class"),
-                    "unit_of_measurement": state.attributes.get("unit_of_measurement"),
+                    "area_id": area_id,
+                    "icon": area.icon,
                 }
             )
-            await self.client.create_node(node)
-            self._synced_entities[entity_id] = int(time.time())
-
-            # Create area relationship
-            area_id = entity_entry.area_id if entity_entry else None
-            if area_id:
-                await self.client.add_relationship(
-                    entity_id,
-                    f"area.{area_id}",
-                    EdgeType.BELONGS_TO,
-                )
-
-            # Sync capabilities
-            await self._async_sync_entity_capabilities(entity_id, state)
-
-            _LOGGER.debug("Synced entity: %s", entity_id)
-            return True
-
-        except KnowledgeGraphError as err:
-            if "already exists" not in str(err).lower():
-                _LOGGER.warning("Failed to sync entity %s: %s", entity_id, err)
-            return False
-
-    async def _async_update_entity_state(self, entity_id: str, new_state) -> None:
-        """Update entity state in Knowledge Graph."""
-        if new_state is None:
-            return
-
-        # Get existing node and update properties
-        try:
-            existing = await self.client.get_node(entity_id)
-            if existing:
-                # Update node with new state
-                updated = KGNode(
-                    id=entity_id,
-                    type=existing.type,
-                    label=existing.label,
-                    properties={
-                        **existing.properties,
-                        "state": new_state.state,
-                        "last_changed": new_state.last_changed.isoformat() if new_state.last_changed else None,
-                    }
-                )
-                await self.client.create_node(updated)  # Upsert
-
-            # Update capabilities if they might have changed
-            await self._async_sync_entity_capabilities(entity_id, new_state)
-
-        except KnowledgeGraphError as err:
-            _LOGGER.debug("Failed to update entity state %s: %s", entity_id, err)
+            for area_id, area in self._area_registry.areas.items()
+        ]
+        result = await self.client.upsert_nodes(nodes)
+        failed = set(result.failed_ids)
+        now = int(time.time())
+        for node in nodes:
+            area_id = node.properties["area_id"]
+            if node.id in failed:
+                _LOGGER.warning("Failed to sync area %s", area_id)
+            else:
+                self._synced_areas[area_id] = now
 
     def _extract_capabilities(self, entity_id: str, state) -> set[str]:
         """Extract capabilities from entity state."""
@@ -607,32 +623,6 @@ class KnowledgeGraphSyncModule(CopilotModule):
 
         return capabilities
 
-    async def _async_sync_entity_capabilities(self, entity_id: str, state) -> None:
-        """Sync entity capabilities as nodes and edges."""
-        capabilities = self._extract_capabilities(entity_id, state)
-
-        # Create capability nodes and edges
-        for cap in capabilities:
-            try:
-                # Create capability node (idempotent)
-                if cap not in self._known_capabilities:
-                    cap_node = KGNode(
-                        id=f"cap.{cap}",
-                        type=NodeType.CAPABILITY,
-                        label=cap.replace("_", " ").title(),
-                    )
-                    await self.client.create_node(cap_node)
-                    self._known_capabilities.add(cap)
-
-                # Create edge
-                await self.client.add_relationship(
-                    entity_id,
-                    f"cap.{cap}",
-                    EdgeType.HAS_CAPABILITY,
-                )
-            except KnowledgeGraphError:
-                pass  # Ignore errors for capabilities
-
     async def async_sync_zone(self, zone_id: str, zone_name: str, entities: list[str]) -> None:
         """Sync a Habitus zone to the Knowledge Graph."""
         try:
@@ -768,6 +758,8 @@ class KnowledgeGraphSyncModule(CopilotModule):
                     "synced_areas": len(self._synced_areas),
                     "known_capabilities": len(self._known_capabilities),
                     "last_full_sync": self._last_full_sync,
+                    "change_queue": self.get_queue_stats(),
+                    "mirror": self._mirror_stats(),
                 }
             }
         except KnowledgeGraphError as err:
@@ -778,6 +770,8 @@ class KnowledgeGraphSyncModule(CopilotModule):
                     "synced_areas": len(self._synced_areas),
                     "known_capabilities": len(self._known_capabilities),
                     "last_full_sync": self._last_full_sync,
+                    "change_queue": self.get_queue_stats(),
+                    "mirror": self._mirror_stats(),
                 }
             }
 
@@ -14,6 +14,8 @@ from ...media_setup import async_setup_media_context, async_unload_media_context
 from ...media_context_v2_setup import async_setup_media_context_v2, async_unload_media_context_v2
 from ...automation_engine import async_setup_automation_engine, async_unload_automation_engine
 from ...webhook import async_register_webhook, async_unregister_webhook
+from ...brain_graph_panel import async_get_brain_graph_feed
+from ...core_push import async_setup_core_push
 from ...coordinator import CopilotDataUpdateCoordinator
 from ...core_v1 import async_fetch_core_capabilities
 from ..module import ModuleContext
@@ -22,6 +24,13 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["binary_sensor", "sensor", "button", "text", "number", "select"]
 
+try:
+    from homeassistant.components.conversation import ConversationEntity  # noqa: F401
+except ImportError:  # Home Assistant without conversation entities: see conversation.py
+    pass
+else:
+    PLATFORMS.append("conversation")
+
 
 class LegacyModule:
     """Preserves the existing single-module integration behavior."""
@@ -68,6 +77,15 @@ class LegacyModule:
         except Exception:  # noqa: BLE001
             _LOGGER.exception("Legacy setup: failed to register webhook")
 
+        # Real-time Core push stream; polling covers whatever it misses.
+        core_push = async_setup_core_push(hass, entry, coordinator)
+
+        # The published brain graph panel polls this feed, also after a restart.
+        try:
+            async_get_brain_graph_feed(hass, coordinator)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Legacy setup: failed to register brain graph feed")
+
         # Optional dev tool: push sanitized HA log snippets to Copilot-Core.
         unsub_devlog_push = None
         try:
@@ -87,6 +105,7 @@ class LegacyModule:
         hass.data[DOMAIN][entry.entry_id] = {
             "coordinator": coordinator,
             "webhook_id": webhook_id,
+            "core_push": core_push,
             "unsub_devlog_push": unsub_devlog_push,
             "unsub_ha_errors": unsub_ha_errors,
         }
@@ -141,6 +160,18 @@ class LegacyModule:
 
             data = hass.data[DOMAIN].get(entry.entry_id)
 
+            core_push = data.get("core_push") if isinstance(data, dict) else None
+            if core_push is not None:
+                await core_push.async_stop()
+
+            prompt_cache = data.get("prompt_cache") if isinstance(data, dict) else None
+            if prompt_cache is not None:
+                prompt_cache.async_close()
+
+            response_cache = data.get("response_cache") if isinstance(data, dict) else None
+            if response_cache is not None:
+                response_cache.async_close()
+
             unsub = data.get("unsub_seed_adapter") if isinstance(data, dict) else None
             if callable(unsub):
                 unsub()
@@ -15,10 +15,10 @@ from datetime import datetime
 from typing import Any
 
 from homeassistant.core import HomeAssistant, Event, callback
-from homeassistant.const import EVENT_STATE_CHANGED
 
 from ...const import DOMAIN
 from .module import CopilotModule, ModuleContext
+from ..state_router import async_get_state_router
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -143,9 +143,11 @@ class PersonTrackingModule(CopilotModule):
         #    backing a person entity (standalone trackers).
         self._discover_standalone_trackers()
 
-        # 3. Register a single EVENT_STATE_CHANGED listener for both domains.
+        # 3. Subscribe to person.* / device_tracker.* changes via the shared router.
         self._listeners.append(
-            self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._on_state_changed)
+            async_get_state_router(self._hass).async_subscribe(
+                "person_tracking", self._on_state_changed, domains=_TRACKED_DOMAINS
+            )
         )
 
         # 4. Parse optional household config from hass.data (set by the
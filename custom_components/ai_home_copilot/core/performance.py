@@ -152,6 +152,111 @@ class DomainFilter:
         return result
 
 
+class ExpiringKeyIndex:
+    """Bounded set of keys that expire after a fixed TTL (idempotency / dedup).
+
+    All keys share one TTL, so insertion order equals expiry order: expired keys
+    are always at the front of the OrderedDict and are popped in amortized O(1)
+    per operation instead of sweeping the whole map. Membership is a dict lookup
+    that also checks the expiry, since keys restored by ``load`` (possibly
+    written under another TTL) can sit behind later-expiring ones.
+    ``max_size`` is a hard cap; when reached the oldest key is evicted.
+
+    Not locked: meant to be used from the HA event loop only.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 10000):
+        self._ttl = float(ttl_seconds)
+        self._max_size = max(1, int(max_size))
+        self._keys: OrderedDict[str, float] = OrderedDict()  # key -> expires_at
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        expires_at = self._keys.get(key)
+        return expires_at is not None and expires_at > time.time()
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop keys whose TTL has passed. Returns the number removed."""
+        if now is None:
+            now = time.time()
+        removed = 0
+        keys = self._keys
+        while keys:
+            key, expires_at = next(iter(keys.items()))
+            if expires_at > now:
+                break
+            del keys[key]
+            removed += 1
+        self.expired += removed
+        return removed
+
+    def add(self, key: str, now: Optional[float] = None) -> bool:
+        """Record ``key``; return True if it was new, False if seen within TTL."""
+        if now is None:
+            now = time.time()
+        self.expire(now)
+
+        expires_at = self._keys.get(key)
+        if expires_at is not None and expires_at > now:
+            self.hits += 1
+            return False
+
+        self.misses += 1
+        self._keys[key] = now + self._ttl
+        self._keys.move_to_end(key)
+        while len(self._keys) > self._max_size:
+            self._keys.popitem(last=False)
+            self.evicted += 1
+        return True
+
+    def discard(self, key: str) -> None:
+        self._keys.pop(key, None)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+    def to_dict(self) -> Dict[str, float]:
+        """Export live keys (key -> expires_at, wall clock) for persistence."""
+        self.expire()
+        return dict(self._keys)
+
+    def load(self, data: Any) -> None:
+        """Restore keys exported by ``to_dict`` (invalid/expired entries skipped)."""
+        if not isinstance(data, dict):
+            return
+        now = time.time()
+        entries = sorted(
+            (float(v), k)
+            for k, v in data.items()
+            if isinstance(k, str) and k and isinstance(v, (int, float)) and v > now
+        )
+        for expires_at, key in entries[-self._max_size:]:
+            self._keys[key] = expires_at
+            self._keys.move_to_end(key)
+        while len(self._keys) > self._max_size:
+            self._keys.popitem(last=False)
+            self.evicted += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._keys),
+            "max_size": self._max_size,
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
 # Global cache instances (singleton per integration)
 _mood_cache: Optional[TTLCache] = None
 _entity_cache: Optional[EntityStateCache] = None
@@ -0,0 +1,288 @@
+"""Integration-wide ``state_changed`` fan-out router.
+
+Many components used to register their own global ``state_changed`` listener
+and then filter by entity_id or domain in Python, so every state change in the
+house ran N filters. The router subscribes to the bus once and dispatches
+through precomputed indexes::
+
+    router = async_get_state_router(hass)
+    unsub = router.async_subscribe(
+        "person_tracking", self._on_state_changed, domains=("person", "device_tracker")
+    )
+
+Subscriptions are keyed by entity_id, domain and/or device_class (of the new,
+else old state); a subscription without keys receives every event. Handlers
+get the original ``Event`` and run on the event loop; coroutine functions are
+scheduled as tasks. Per-subscriber call counts and time spent are kept for
+diagnostics.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+_GLOBAL_KEY = "_state_router"
+
+
+class StateSubscription:
+    """Handle returned by ``StateChangeRouter.async_subscribe``.
+
+    Calling it unsubscribes (same contract as ``hass.bus.async_listen``).
+    """
+
+    __slots__ = (
+        "_router", "name", "handler", "is_coroutine",
+        "entity_ids", "domains", "device_classes",
+        "calls", "errors", "total_time", "max_time", "active",
+    )
+
+    def __init__(
+        self,
+        router: StateChangeRouter,
+        name: str,
+        handler: Callable[[Event], Any],
+        entity_ids: frozenset[str],
+        domains: frozenset[str],
+        device_classes: frozenset[str],
+    ) -> None:
+        self._router = router
+        self.name = name
+        self.handler = handler
+        self.is_coroutine = asyncio.iscoroutinefunction(handler)
+        self.entity_ids = entity_ids
+        self.domains = domains
+        self.device_classes = device_classes
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.active = True
+
+    @property
+    def is_wildcard(self) -> bool:
+        return not (self.entity_ids or self.domains or self.device_classes)
+
+    def update(self, entity_ids: Iterable[str]) -> None:
+        """Replace the entity_id keys (for subscribers with a changing set)."""
+        self._router._reindex(self, entity_ids=frozenset(entity_ids))
+
+    def __call__(self) -> None:
+        self._router._remove(self)
+
+    def record(self, elapsed: float) -> None:
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_time * 1000.0, 2),
+            "avg_ms": round(self.total_time * 1000.0 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_time * 1000.0, 3),
+            "keys": {
+                "entity_ids": len(self.entity_ids),
+                "domains": sorted(self.domains),
+                "device_classes": sorted(self.device_classes),
+            },
+        }
+
+
+class StateChangeRouter:
+    """Single ``state_changed`` listener with entity/domain/device_class indexes."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._by_entity: dict[str, list[StateSubscription]] = {}
+        self._by_domain: dict[str, list[StateSubscription]] = {}
+        self._by_device_class: dict[str, list[StateSubscription]] = {}
+        self._wildcard: list[StateSubscription] = []
+        self._subs: list[StateSubscription] = []
+        self._unsub_bus: Callable[[], None] | None = None
+
+        self.events_total = 0
+        self.dispatched_total = 0
+        self.dispatch_time = 0.0
+
+    # ------------------------------------------------------------------
+    # Subscription management
+    # ------------------------------------------------------------------
+
+    def async_subscribe(
+        self,
+        name: str,
+        handler: Callable[[Event], Any],
+        *,
+        entity_ids: Iterable[str] | None = None,
+        domains: Iterable[str] | None = None,
+        device_classes: Iterable[str] | None = None,
+    ) -> StateSubscription:
+        """Register ``handler`` for matching state changes; returns the unsub handle."""
+        sub = StateSubscription(
+            self,
+            name,
+            handler,
+            frozenset(entity_ids or ()),
+            frozenset(domains or ()),
+            frozenset(device_classes or ()),
+        )
+        self._subs.append(sub)
+        self._index(sub)
+        self._ensure_listening()
+        return sub
+
+    def _index(self, sub: StateSubscription) -> None:
+        if sub.is_wildcard:
+            self._wildcard.append(sub)
+            return
+        for key in sub.entity_ids:
+            self._by_entity.setdefault(key, []).append(sub)
+        for key in sub.domains:
+            self._by_domain.setdefault(key, []).append(sub)
+        for key in sub.device_classes:
+            self._by_device_class.setdefault(key, []).append(sub)
+
+    def _unindex(self, sub: StateSubscription) -> None:
+        if sub in self._wildcard:
+            self._wildcard.remove(sub)
+        for index, keys in (
+            (self._by_entity, sub.entity_ids),
+            (self._by_domain, sub.domains),
+            (self._by_device_class, sub.device_classes),
+        ):
+            for key in keys:
+                bucket = index.get(key)
+                if bucket and sub in bucket:
+                    bucket.remove(sub)
+                    if not bucket:
+                        del index[key]
+
+    def _reindex(self, sub: StateSubscription, entity_ids: frozenset[str]) -> None:
+        if not sub.active:
+            return
+        self._unindex(sub)
+        sub.entity_ids = entity_ids
+        self._index(sub)
+
+    def _remove(self, sub: StateSubscription) -> None:
+        if not sub.active:
+            return
+        sub.active = False
+        self._unindex(sub)
+        self._subs.remove(sub)
+        if not self._subs and self._unsub_bus is not None:
+            self._unsub_bus()
+            self._unsub_bus = None
+
+    def _ensure_listening(self) -> None:
+        if self._unsub_bus is not None:
+            return
+
+        @callback
+        def _on_state_changed(event: Event) -> None:
+            self.dispatch(event)
+
+        self._unsub_bus = self.hass.bus.async_listen(EVENT_STATE_CHANGED, _on_state_changed)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _matches(self, event: Event) -> list[StateSubscription]:
+        data = event.data
+        entity_id = data.get("entity_id") or ""
+        matched: list[StateSubscription] = list(self._wildcard)
+
+        by_entity = self._by_entity.get(entity_id)
+        if by_entity:
+            matched.extend(by_entity)
+
+        by_domain = self._by_domain.get(entity_id.partition(".")[0])
+        if by_domain:
+            matched.extend(by_domain)
+
+        if self._by_device_class:
+            state = data.get("new_state") or data.get("old_state")
+            attrs = getattr(state, "attributes", None)
+            device_class = attrs.get("device_class") if attrs else None
+            by_class = self._by_device_class.get(device_class) if device_class else None
+            if by_class:
+                matched.extend(by_class)
+
+        if len(matched) > 1:
+            # A subscription keyed on several matching indexes runs once.
+            matched = list(dict.fromkeys(matched))
+        return matched
+
+    def dispatch(self, event: Event) -> None:
+        """Fan ``event`` out to matching subscribers (event loop)."""
+        started = time.perf_counter()
+        self.events_total += 1
+        for sub in self._matches(event):
+            sub.calls += 1
+            self.dispatched_total += 1
+            if sub.is_coroutine:
+                self.hass.async_create_task(self._run_coroutine(sub, event))
+                continue
+            t0 = time.perf_counter()
+            try:
+                sub.handler(event)
+            except Exception:  # noqa: BLE001
+                sub.errors += 1
+                _LOGGER.exception("State router: subscriber %s failed", sub.name)
+            sub.record(time.perf_counter() - t0)
+        self.dispatch_time += time.perf_counter() - started
+
+    async def _run_coroutine(self, sub: StateSubscription, event: Event) -> None:
+        t0 = time.perf_counter()
+        try:
+            await sub.handler(event)
+        except Exception:  # noqa: BLE001
+            sub.errors += 1
+            _LOGGER.exception("State router: subscriber %s failed", sub.name)
+        finally:
+            sub.record(time.perf_counter() - t0)
+
+    def get_stats(self) -> dict[str, Any]:
+        subscribers: dict[str, Any] = {}
+        for sub in self._subs:
+            key = sub.name
+            n = 2
+            while key in subscribers:
+                key = f"{sub.name}#{n}"
+                n += 1
+            subscribers[key] = sub.stats()
+        return {
+            "listening": self._unsub_bus is not None,
+            "events_total": self.events_total,
+            "dispatched_total": self.dispatched_total,
+            "dispatch_ms_total": round(self.dispatch_time * 1000.0, 2),
+            "index_sizes": {
+                "entity_ids": len(self._by_entity),
+                "domains": len(self._by_domain),
+                "device_classes": len(self._by_device_class),
+                "wildcard": len(self._wildcard),
+            },
+            "subscribers": subscribers,
+        }
+
+
+def async_get_state_router(hass: HomeAssistant) -> StateChangeRouter:
+    """Return the integration-wide router (created on first use)."""
+    global_data = hass.data.setdefault(DOMAIN, {}).setdefault("_global", {})
+    router = global_data.get(_GLOBAL_KEY)
+    if router is None:
+        router = StateChangeRouter(hass)
+        global_data[_GLOBAL_KEY] = router
+    return router
@@ -0,0 +1,174 @@
+"""Persistent push channel from PilotSuite Core (Server-Sent Events).
+
+One long-lived ``GET /api/v1/events/stream`` per config entry. Every SSE
+event carries the webhook envelope (``event:`` is the type, ``data:`` the
+JSON payload) and is applied to the coordinator as soon as it arrives, so
+sensors follow Core within about a second.
+
+While the stream is up, the endpoints it covers are not polled; idle
+traffic is Core's keepalive comments. SSE event ids are kept as resume
+tokens and sent back as ``Last-Event-ID`` on reconnect. Core answers a
+resume it cannot honour (or a first connect) with ``event: resync``, which
+triggers one full coordinator refresh. When the stream drops, the covered
+endpoints go back to polling until it reconnects; a Core without the
+endpoint (HTTP 404/405) is retried only every ``PUSH_UNSUPPORTED_RETRY_S``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .api import CopilotApiError, extract_http_status
+from .webhook import apply_core_event
+
+_LOGGER = logging.getLogger(__name__)
+
+PUSH_STREAM_PATH = "/api/v1/events/stream"
+# Core sends a keepalive comment every 15 s; three missed ones mean the
+# connection is dead even if TCP has not noticed yet.
+PUSH_IDLE_TIMEOUT_S = 45.0
+PUSH_RECONNECT_MIN_S = 1.0
+PUSH_RECONNECT_MAX_S = 60.0
+PUSH_UNSUPPORTED_RETRY_S = 1800.0
+# Coordinator endpoints Core pushes changes for.
+PUSH_COVERED_ENDPOINTS = ("status", "mood", "neurons")
+PUSH_EVENT_RESYNC = "resync"
+
+
+class CorePushStream:
+    """Keeps the Core SSE stream connected and feeds it into the coordinator."""
+
+    def __init__(self, hass: HomeAssistant, coordinator) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._task: asyncio.Task | None = None
+        self._resume_token: str | None = None
+        self._connected = False
+        self._last_event_at: float | None = None
+        self._stats: dict[str, int] = {
+            "connects": 0,
+            "disconnects": 0,
+            "events": 0,
+            "keepalives": 0,
+            "resyncs": 0,
+            "errors": 0,
+        }
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def async_start(self, entry) -> None:
+        if self._task is None or self._task.done():
+            self._task = entry.async_create_background_task(
+                self._hass, self._run(), f"pilotsuite_core_push_{entry.entry_id}"
+            )
+
+    async def async_stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._set_connected(False)
+
+    async def _run(self) -> None:
+        backoff = PUSH_RECONNECT_MIN_S
+        while True:
+            connects = self._stats["connects"]
+            unsupported = False
+            try:
+                await self._consume()
+            except asyncio.CancelledError:
+                raise
+            except CopilotApiError as err:
+                self._stats["errors"] += 1
+                unsupported = extract_http_status(err) in (404, 405)
+                _LOGGER.debug("Core push stream unavailable: %s", err)
+            except Exception:  # noqa: BLE001
+                self._stats["errors"] += 1
+                _LOGGER.exception("Core push stream failed")
+            finally:
+                self._set_connected(False)
+            if self._stats["connects"] != connects:
+                backoff = PUSH_RECONNECT_MIN_S  # the stream was up; reconnect quickly
+            await asyncio.sleep(PUSH_UNSUPPORTED_RETRY_S if unsupported else backoff)
+            backoff = min(backoff * 2, PUSH_RECONNECT_MAX_S)
+
+    async def _consume(self) -> None:
+        stream = self._coordinator.api.async_stream_events(
+            PUSH_STREAM_PATH,
+            last_event_id=self._resume_token,
+            idle_timeout_s=PUSH_IDLE_TIMEOUT_S,
+        )
+        async for event_id, event, data in stream:
+            if not self._connected:
+                self._stats["connects"] += 1
+                self._set_connected(True)
+            self._last_event_at = time.monotonic()
+            if event == "keepalive":
+                self._stats["keepalives"] += 1
+                continue
+            if event_id:
+                self._resume_token = event_id
+            if event == PUSH_EVENT_RESYNC:
+                self._stats["resyncs"] += 1
+                await self._async_resync()
+                continue
+            self._apply(event, data)
+
+    def _apply(self, event: str, data: str) -> None:
+        try:
+            payload = json.loads(data) if data else {}
+        except json.JSONDecodeError:
+            _LOGGER.debug("Skipping malformed Core push event %s: %s", event, data[:200])
+            return
+        if not isinstance(payload, dict):
+            return
+        self._stats["events"] += 1
+        apply_core_event(self._hass, self._coordinator, event, payload)
+
+    async def _async_resync(self) -> None:
+        """Refetch the covered endpoints once; push keeps them fresh after."""
+        self._coordinator.set_push_endpoints(())
+        await self._coordinator.async_refresh()
+        if self._connected:
+            self._coordinator.set_push_endpoints(PUSH_COVERED_ENDPOINTS)
+
+    def _set_connected(self, connected: bool) -> None:
+        if connected == self._connected:
+            return
+        self._connected = connected
+        if connected:
+            self._coordinator.set_push_endpoints(PUSH_COVERED_ENDPOINTS)
+        else:
+            self._stats["disconnects"] += 1
+            self._coordinator.set_push_endpoints(())
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "connected": self._connected,
+            "resumable": self._resume_token is not None,
+            "idle_s": (
+                round(time.monotonic() - self._last_event_at, 1)
+                if self._last_event_at is not None else None
+            ),
+        }
+
+
+def async_setup_core_push(hass: HomeAssistant, entry, coordinator) -> CorePushStream:
+    """Start the push stream for ``coordinator``; stop it with ``async_stop``."""
+    stream = CorePushStream(hass, coordinator)
+    stream.async_start(entry)
+    return stream
+
+
+__all__ = ["CorePushStream", "async_setup_core_push", "PUSH_COVERED_ENDPOINTS", "PUSH_STREAM_PATH"]
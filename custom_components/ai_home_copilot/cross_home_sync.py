@@ -19,10 +19,11 @@ from typing import Any, Dict, List, Optional, Set
 import aiohttp
 from homeassistant.core import HomeAssistant, Event, callback
 from homeassistant.helpers import entity_registry
-from homeassistant.const import EVENT_STATE_CHANGED, EVENT_CALL_SERVICE
+from homeassistant.const import EVENT_CALL_SERVICE
 
 from .const import DOMAIN
 from .core.error_helpers import log_error_with_context
+from .core.state_router import StateSubscription, async_get_state_router
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -86,6 +87,9 @@ class CrossHomeClient:
         
         # Conflict queue
         self._conflict_queue: List[Dict[str, Any]] = []
+
+        # state_changed subscription, keyed on the shared entity ids
+        self._state_sub: StateSubscription | None = None
         
     async def async_initialize(self) -> None:
         """Initialize the client and start background tasks."""
@@ -96,14 +100,18 @@ class CrossHomeClient:
         # Load shared entities from storage
         await self._load_shared_entities()
         
-        # Subscribe to HA events for syncing
-        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._on_state_changed)
-        
         self._is_initialized = True
+
+        # Subscribe to HA events for syncing (only shared entities are routed here)
+        self._refresh_state_subscription()
         _LOGGER.info("Cross-Home Client initialized for %s", self.home_id)
         
     async def async_shutdown(self) -> None:
         """Shutdown the client."""
+        if self._state_sub is not None:
+            self._state_sub()
+            self._state_sub = None
+
         if self._session:
             await self._session.close()
             self._session = None
@@ -160,6 +168,24 @@ class CrossHomeClient:
             resp.raise_for_status()
             return await resp.json()
             
+    def _refresh_state_subscription(self) -> None:
+        """Keep the state router subscription on exactly the shared entities.
+
+        Nothing shared means no subscription: an empty entity set would be a
+        wildcard and route every state_changed event here.
+        """
+        entity_ids = set(self.shared_entities)
+        if self._state_sub is None:
+            if entity_ids and self._is_initialized:
+                self._state_sub = async_get_state_router(self.hass).async_subscribe(
+                    "cross_home_sync", self._on_state_changed, entity_ids=entity_ids
+                )
+        elif entity_ids:
+            self._state_sub.update(entity_ids)
+        else:
+            self._state_sub()
+            self._state_sub = None
+
     @callback
     def _on_state_changed(self, event: Event) -> None:
         """Handle state changes for synced entities."""
@@ -254,6 +280,7 @@ class CrossHomeClient:
                     last_sync=0,
                     sync_status="pending",
                 )
+            self._refresh_state_subscription()
                 
             _LOGGER.info("Shared %s with %s", entity_id, target_home_id)
             return True
@@ -289,6 +316,7 @@ class CrossHomeClient:
                 self.shared_entities[entity_id].shared_with.discard(target_home_id)
                 if not self.shared_entities[entity_id].shared_with:
                     del self.shared_entities[entity_id]
+                    self._refresh_state_subscription()
                     
             _LOGGER.info("Unshared %s from %s", entity_id, target_home_id)
             return True
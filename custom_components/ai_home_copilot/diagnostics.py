@@ -201,8 +201,41 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
             "last_success_at": data.get("events_forwarder_last_success_at"),
             "last_error_at": data.get("events_forwarder_last_error_at"),
             "health": data.get("events_forwarder_health"),
+            "queue_log": data.get("events_forwarder_queue_log"),
+            "dedup": data.get("events_forwarder_dedup"),
+            "wire": data.get("events_forwarder_wire"),
+            "adaptive": data.get("events_forwarder_adaptive"),
+            "pipeline": data.get("events_forwarder_pipeline"),
         }
 
+    # Integration-wide state_changed router (counts and timings only).
+    state_router = None
+    router = hass.data.get(DOMAIN, {}).get("_global", {}).get("_state_router")
+    if router is not None and hasattr(router, "get_stats"):
+        state_router = router.get_stats()
+
+    # Per-endpoint polling schedule and conditional-GET counters.
+    core_polling = None
+    if coordinator is not None and hasattr(coordinator, "get_poll_stats"):
+        core_polling = coordinator.get_poll_stats()
+    core_latency = None
+    api = getattr(coordinator, "api", None) if coordinator is not None else None
+    if api is not None and hasattr(api, "get_latency_stats"):
+        core_latency = api.get_latency_stats()
+    core_hedging = api.get_hedge_stats() if api is not None and hasattr(api, "get_hedge_stats") else None
+    core_push = data.get("core_push") if isinstance(data, dict) else None
+    core_push_stats = core_push.get_stats() if core_push is not None else None
+
+    # Shared Core connection pool (per-caller reuse and wait times).
+    http_pool = hass.data.get(DOMAIN, {}).get("_global", {}).get("_core_http_pool")
+    http_pool_stats = http_pool.get_stats() if http_pool is not None else None
+
+    # Conversation system prompt section cache (hits, builds, build times).
+    prompt_cache = data.get("prompt_cache") if isinstance(data, dict) else None
+    prompt_cache_stats = prompt_cache.get_stats() if prompt_cache is not None else None
+    response_cache = data.get("response_cache") if isinstance(data, dict) else None
+    response_cache_stats = response_cache.get_stats() if response_cache is not None else None
+
     return {
         "contract": CONTRACT,
         "contract_version": CONTRACT_VERSION,
@@ -232,8 +265,16 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
         "core": {
             "status": core_status,
             "devlogs": core_devlogs,
+            "polling": core_polling,
+            "latency": core_latency,
+            "hedging": core_hedging,
+            "push": core_push_stats,
+            "http_pool": http_pool_stats,
         },
         "media_context": media_state,
         "events_forwarder": events_forwarder,
+        "state_router": state_router,
+        "prompt_cache": prompt_cache_stats,
+        "response_cache": response_cache_stats,
         "dev_surface": dev_surface,
     }
@@ -16,9 +16,9 @@ from urllib.parse import urlsplit, urlunsplit
 import aiohttp
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN
+from .core.http_pool import CoreSessionView, async_get_core_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -78,7 +78,7 @@ class EnergyContextCoordinator(DataUpdateCoordinator[EnergySnapshot]):
         self._host = host
         self._port = port
         self._token = token
-        self._session: aiohttp.ClientSession | None = None
+        self._session: CoreSessionView | None = None
 
     def _get_base_url(self) -> str:
         """Build base URL for Core Add-on API."""
@@ -102,10 +102,10 @@ class EnergyContextCoordinator(DataUpdateCoordinator[EnergySnapshot]):
             headers["Authorization"] = f"Bearer {self._token}"
         return headers
 
-    async def _get_session(self) -> aiohttp.ClientSession:
+    async def _get_session(self) -> CoreSessionView:
         """Get or create HTTP session."""
         if self._session is None:
-            self._session = async_get_clientsession(self.hass)
+            self._session = async_get_core_session(self.hass, "energy_context")
         return self._session
 
     async def _async_update_data(self) -> EnergySnapshot:
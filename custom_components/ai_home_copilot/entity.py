@@ -82,10 +82,22 @@ class CopilotBaseEntity(CoordinatorEntity["CopilotDataUpdateCoordinator"]):
         return headers
 
     async def _fetch(self, path: str, *, timeout_s: float = 10.0) -> dict[str, Any] | None:
-        """Fetch JSON from Core API with configured auth and resilient URL handling."""
+        """Fetch JSON from Core API with configured auth and resilient URL handling.
+
+        Goes through the coordinator client's shared GET layer when present,
+        so entities polling the same path share one request per cycle.
+        """
         import aiohttp
 
         normalized = path if path.startswith("/") else f"/{path}"
+        shared_get = getattr(getattr(self.coordinator, "api", None), "async_get_shared", None)
+        if shared_get is not None:
+            try:
+                return await shared_get(normalized, timeout_s=timeout_s)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Core fetch failed for %s: %s", normalized, err)
+            return None
+
         url = f"{self._core_base_url()}{normalized}"
         headers = self._core_headers()
         session = async_get_clientsession(self.hass)
@@ -24,7 +24,13 @@ from homeassistant.helpers.storage import Store
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_CALL_SERVICE
 
 from .const import DOMAIN
-from .core.performance import get_entity_cache, DomainFilter, TTLCache
+from .core.event_codec import (
+    LEGACY_ENCODING,
+    encode_events_body,
+    negotiate_event_encoding,
+)
+from .core.http_pool import CoreSessionView, async_get_core_session
+from .core.performance import get_entity_cache, DomainFilter, TTLCache, ExpiringKeyIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,12 +70,22 @@ BLOCKED_CALL_SERVICE_DOMAINS = {
     "notify", "rest_command", "shell_command", "tts"
 }
 
+# Hard cap for the idempotency index
+SEEN_EVENTS_MAX_SIZE = 10000
+
 # Default debounce intervals by domain (seconds)
 DEFAULT_DEBOUNCE_INTERVALS = {
     "sensor": 1.0,
     "binary_sensor": 0.5,
 }
 
+# Debounce modes:
+# - leading: forward the first change, drop everything else inside the window
+# - coalesce: forward the first change, hold the latest change inside the window
+#   and forward it when the window closes (Core always sees the terminal state)
+DEBOUNCE_MODE_LEADING = "leading"
+DEBOUNCE_MODE_COALESCE = "coalesce"
+
 
 class N3EventForwarder:
     """N3 specification-compliant event forwarder."""
@@ -78,13 +94,16 @@ class N3EventForwarder:
         self.hass = hass
         self.config = config
         self._store = Store(hass, 1, f"{DOMAIN}_n3_forwarder")
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[CoreSessionView] = None
         
         # Event queue and processing
         self._pending_events: List[Dict[str, Any]] = []
         self._flush_task: Optional[asyncio.Task] = None
         self._debounce_cache: Dict[str, float] = {}  # entity_id -> last_sent_time
-        self._seen_events: Dict[str, float] = {}  # context_id -> expires_at
+        self._coalesce_pending: Dict[str, Dict[str, Any]] = {}  # entity_id -> latest held envelope
+        self._coalesce_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._coalesced_total = 0  # intermediate states collapsed into a later one
+        self._coalesce_tasks: Set[asyncio.Task] = set()  # enqueues started by window timers
         self._queue_lock = asyncio.Lock()  # Lock for thread-safe queue operations
         
         # Zone mapping
@@ -108,6 +127,11 @@ class N3EventForwarder:
         self._batch_size = config.get("batch_size", 50)
         self._flush_interval = config.get("flush_interval", 0.5)
         self._max_queue_size = config.get("max_queue_size", 1000)
+
+        # Wire format: opt-in columnar/compressed uploads, negotiated with Core
+        self._compressed_upload = bool(config.get("compressed_upload", False))
+        self._encoding = LEGACY_ENCODING
+        self._wire_bytes_total = 0
         
         # Heartbeat configuration
         self._heartbeat_interval = config.get("heartbeat_interval", 60)  # seconds
@@ -129,9 +153,13 @@ class N3EventForwarder:
         debounce_config = config.get("debounce", {})
         self._debounce_intervals = DEFAULT_DEBOUNCE_INTERVALS.copy()
         self._debounce_intervals.update(debounce_config)
+        self._debounce_mode = config.get("debounce_mode", DEBOUNCE_MODE_LEADING)
         
         # Idempotency TTL (seconds)
         self._idempotency_ttl = config.get("idempotency_ttl", 120)
+        self._seen_events = ExpiringKeyIndex(
+            ttl_seconds=self._idempotency_ttl, max_size=SEEN_EVENTS_MAX_SIZE
+        )
 
     async def async_start(self):
         """Start the N3 event forwarder."""
@@ -144,8 +172,12 @@ class N3EventForwarder:
         await self._build_zone_mapping()
         
         # Create HTTP session
-        timeout = aiohttp.ClientTimeout(total=10)
-        self._session = aiohttp.ClientSession(timeout=timeout)
+        self._session = async_get_core_session(
+            self.hass, "n3_forwarder", timeout=aiohttp.ClientTimeout(total=10)
+        )
+
+        if self._compressed_upload:
+            await self._negotiate_encoding()
         
         # Start event listeners
         self._start_event_listeners()
@@ -188,6 +220,9 @@ class N3EventForwarder:
             except asyncio.CancelledError:
                 pass
         
+        # Release envelopes held by the coalescing debounce
+        await self._flush_coalesced()
+        
         # Flush any pending events
         if self._pending_events:
             await self._flush_events()
@@ -241,8 +276,9 @@ class N3EventForwarder:
         if old_state_value == new_state_value:
             return
         
-        # Apply debounce
-        if not self._should_forward_entity(entity_id, domain):
+        # Apply debounce (coalesce mode decides after the envelope is built)
+        coalesce = self._debounce_mode == DEBOUNCE_MODE_COALESCE
+        if not coalesce and not self._should_forward_entity(entity_id, domain):
             return
         
         # Check idempotency
@@ -262,6 +298,8 @@ class N3EventForwarder:
                 entity_id=entity_id,
                 kind="state_changed",
             )
+            if coalesce and self._coalesce_envelope(entity_id, domain, envelope):
+                return
             await self._enqueue_event(envelope)
 
     async def _handle_call_service_event(self, event: Event):
@@ -532,25 +570,67 @@ class N3EventForwarder:
         self._debounce_cache[entity_id] = now
         return True
 
+    def _coalesce_envelope(self, entity_id: str, domain: str, envelope: Dict[str, Any]) -> bool:
+        """Trailing-edge debounce. Returns True if the envelope was held back.
+
+        At most one envelope per entity is held; a newer one replaces it but keeps
+        the held ``old`` block, so Core sees one transition from the last
+        forwarded state to the terminal state of the burst.
+        """
+        debounce_interval = self._debounce_intervals.get(domain, 0)
+        if debounce_interval <= 0:
+            return False
+
+        held = self._coalesce_pending.get(entity_id)
+        if held is not None:
+            envelope["old"] = held.get("old", envelope.get("old"))
+            self._coalesce_pending[entity_id] = envelope
+            self._coalesced_total += 1
+            return True
+
+        now = time.time()
+        elapsed = now - self._debounce_cache.get(entity_id, 0)
+        if elapsed >= debounce_interval:
+            self._debounce_cache[entity_id] = now
+            return False
+
+        self._coalesce_pending[entity_id] = envelope
+        loop = asyncio.get_running_loop()
+        self._coalesce_timers[entity_id] = loop.call_later(
+            debounce_interval - elapsed, self._coalesce_window_closed, entity_id
+        )
+        return True
+
+    def _coalesce_window_closed(self, entity_id: str) -> None:
+        """Timer callback (event loop): forward the held envelope."""
+        self._coalesce_timers.pop(entity_id, None)
+        envelope = self._coalesce_pending.pop(entity_id, None)
+        if envelope is None:
+            return
+        self._debounce_cache[entity_id] = time.time()
+        task = self.hass.async_create_task(self._enqueue_event(envelope))
+        self._coalesce_tasks.add(task)
+        task.add_done_callback(self._coalesce_tasks.discard)
+
+    async def _flush_coalesced(self) -> None:
+        """Cancel coalescing timers and enqueue every held envelope."""
+        for handle in self._coalesce_timers.values():
+            handle.cancel()
+        self._coalesce_timers.clear()
+        if self._coalesce_tasks:
+            # Enqueues already started by a closed window finish first.
+            await asyncio.gather(*self._coalesce_tasks, return_exceptions=True)
+        held = list(self._coalesce_pending.values())
+        self._coalesce_pending.clear()
+        for envelope in held:
+            await self._enqueue_event(envelope)
+
     def _is_event_new(self, event_key: str) -> bool:
         """Check if event is new for idempotency (N3 specification)."""
         if self._idempotency_ttl <= 0:
             return True
         
-        now = time.time()
-        
-        # Clean expired entries periodically
-        if len(self._seen_events) > 1000:
-            self._seen_events = {k: v for k, v in self._seen_events.items() if v > now}
-        
-        # Check if already seen
-        expires_at = self._seen_events.get(event_key, 0)
-        if expires_at > now:
-            return False
-        
-        # Mark as seen
-        self._seen_events[event_key] = now + self._idempotency_ttl
-        return True
+        return self._seen_events.add(event_key)
 
     async def _build_zone_mapping(self):
         """Build entity_id -> zone_id mapping from HA area registry."""
@@ -613,10 +693,13 @@ class N3EventForwarder:
                 dropped = len(self._pending_events) - self._max_queue_size
                 self._pending_events = self._pending_events[-self._max_queue_size:]
                 _LOGGER.warning("Dropped %d old events due to queue size limit", dropped)
-            
-            # Trigger immediate flush if batch is full
-            if len(self._pending_events) >= self._batch_size:
-                await self._flush_events()
+
+            batch_full = len(self._pending_events) >= self._batch_size
+
+        # Trigger immediate flush if batch is full (outside the lock:
+        # _flush_events takes it again and asyncio.Lock is not reentrant)
+        if batch_full:
+            await self._flush_events()
 
     async def _flush_loop(self):
         """Background task to flush events periodically."""
@@ -703,6 +786,21 @@ class N3EventForwarder:
         except Exception as e:
             _LOGGER.exception("Exception sending heartbeat to Core: %s", e)
 
+    async def _negotiate_encoding(self):
+        """Pick the upload wire format from Core's capabilities endpoint."""
+        url = f"{self._core_url}/api/v1/capabilities"
+        headers = {"Authorization": f"Bearer {self._api_token}"}
+        try:
+            async with self._session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    return
+                capabilities = await response.json()
+        except Exception as e:
+            _LOGGER.debug("Could not fetch Core capabilities, using JSON uploads: %s", e)
+            return
+        self._encoding = negotiate_event_encoding(capabilities)
+        _LOGGER.debug("N3 forwarder upload encoding: %s", self._encoding)
+
     async def _flush_events(self):
         """Send pending events to CoPilot Core."""
         async with self._queue_lock:
@@ -722,10 +820,28 @@ class N3EventForwarder:
             
             # Send as batch per Core API
             payload = {"events": events_to_send}
+            encoding = self._encoding
+            if encoding.is_legacy:
+                request_kwargs = {"json": payload}
+            else:
+                body, body_headers = encode_events_body(payload, "events", encoding)
+                headers.update(body_headers)
+                request_kwargs = {"data": body}
             
-            async with self._session.post(url, headers=headers, json=payload) as response:
+            async with self._session.post(url, headers=headers, **request_kwargs) as response:
                 if response.status == 200:
                     _LOGGER.debug("Sent %d events to Core successfully", len(events_to_send))
+                    if not encoding.is_legacy:
+                        self._wire_bytes_total += len(request_kwargs["data"])
+                elif not encoding.is_legacy and response.status in (400, 415):
+                    # Core advertised the format but rejected it: fall back for good.
+                    _LOGGER.warning(
+                        "Core rejected %s upload (%s); falling back to JSON",
+                        encoding.batch, response.status,
+                    )
+                    self._encoding = LEGACY_ENCODING
+                    async with self._queue_lock:
+                        self._pending_events = events_to_send + self._pending_events
                 else:
                     error_text = await response.text()
                     _LOGGER.error(
@@ -752,7 +868,7 @@ class N3EventForwarder:
                 if "debounce_cache" in data:
                     self._debounce_cache = data["debounce_cache"]
                 if "seen_events" in data:
-                    self._seen_events = data["seen_events"]
+                    self._seen_events.load(data["seen_events"])
                 
                 _LOGGER.info("Loaded persistent state: %d pending events", len(self._pending_events))
         except Exception as e:
@@ -767,15 +883,11 @@ class N3EventForwarder:
                 k: v for k, v in self._debounce_cache.items() 
                 if now - v < 3600  # Keep last hour
             }
-            self._seen_events = {
-                k: v for k, v in self._seen_events.items() 
-                if v > now  # Keep non-expired
-            }
             
             data = {
                 "pending_events": self._pending_events,
                 "debounce_cache": self._debounce_cache,
-                "seen_events": self._seen_events,
+                "seen_events": self._seen_events.to_dict(),
                 "saved_at": datetime.now(timezone.utc).isoformat(),
             }
             await self._store.async_save(data)
@@ -790,6 +902,13 @@ class N3EventForwarder:
             "zone_mappings": len(self._entity_to_zone),
             "debounce_cache_size": len(self._debounce_cache),
             "seen_events_cache_size": len(self._seen_events),
+            "dedup": self._seen_events.get_stats(),
+            "debounce_mode": self._debounce_mode,
+            "coalesce_pending": len(self._coalesce_pending),
+            "coalesced_total": self._coalesced_total,
+            "upload_encoding": self._encoding.batch,
+            "upload_content_encoding": self._encoding.content_encoding,
+            "upload_bytes_total": self._wire_bytes_total,
             "core_url": self._core_url,
             "batch_size": self._batch_size,
             "flush_interval": self._flush_interval,
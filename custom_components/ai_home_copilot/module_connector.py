@@ -21,6 +21,7 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .core.state_router import async_get_state_router
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -211,7 +212,7 @@ class ModuleConnector:
                 return
             
             # Check for motion binary sensors
-            if "motion" in entity_id.lower() and "binary_sensor" in entity_id:
+            if "motion" in entity_id.lower():
                 is_motion = new_state.state == "on"
                 camera_id = entity_id.replace("binary_sensor.", "camera.")
                 
@@ -223,7 +224,9 @@ class ModuleConnector:
                     "timestamp": datetime.now().isoformat(),
                 })
         
-        self._hass.bus.async_listen("state_changed", on_state_change)
+        async_get_state_router(self._hass).async_subscribe(
+            "module_connector.camera_motion", on_state_change, domains=("binary_sensor",)
+        )
         
         _LOGGER.debug("Camera → Activity link established")
     
@@ -355,16 +358,12 @@ class ModuleConnector:
         
         # Also check for calendar state changes
         async def on_calendar_state_change(event: Event) -> None:
-            entity_id = event.data.get("entity_id", "")
-            new_state = event.data.get("new_state")
-            
-            if not entity_id.startswith("calendar."):
-                return
-            
             # Trigger calendar reload
             await self._refresh_calendar_context()
         
-        self._hass.bus.async_listen("state_changed", on_calendar_state_change)
+        async_get_state_router(self._hass).async_subscribe(
+            "module_connector.calendar", on_calendar_state_change, domains=("calendar",)
+        )
         
         _LOGGER.debug("Calendar → calendar.load link established")
     
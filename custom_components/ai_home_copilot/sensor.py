@@ -34,7 +34,11 @@ from .habitus_zones_entities_v2 import (
 from .habitus_zones_store_v2 import async_get_zones_v2
 from .habitus_zone_aggregates import build_zone_average_sensors
 from .core_v1_entities import CoreApiV1StatusSensor
-from .systemhealth_entities import SystemHealthEntityCountSensor, SystemHealthSqliteDbSizeSensor
+from .systemhealth_entities import (
+    CoreApiLatencySensor,
+    SystemHealthEntityCountSensor,
+    SystemHealthSqliteDbSizeSensor,
+)
 from .mesh_monitoring import (
     ZWaveNetworkHealthSensor,
     ZWaveDevicesOnlineSensor,
@@ -225,6 +229,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         # System Health
         SystemHealthEntityCountSensor(coordinator),
         SystemHealthSqliteDbSizeSensor(coordinator),
+        CoreApiLatencySensor(coordinator),
         CopilotInventoryLastRunSensor(coordinator),
         RagPipelineStatusSensor(coordinator),
     ]
@@ -9,7 +9,6 @@ import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from ..entity import CopilotBaseEntity
 
@@ -27,21 +26,8 @@ class AutomationTemplateSensor(CopilotBaseEntity, SensorEntity):
         super().__init__(coordinator)
         self._data: dict[str, Any] = {}
 
-    async def _fetch(self) -> dict | None:
-        import aiohttp
-        try:
-            url = f"{self._core_base_url()}/api/v1/hub/templates/summary"
-            headers = self._core_headers()
-            session = async_get_clientsession(self.hass)
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-        except Exception:
-            logger.debug("Failed to fetch automation templates data")
-        return None
-
     async def async_update(self) -> None:
-        data = await self._fetch()
+        data = await self._fetch("/api/v1/hub/templates/summary")
         if data and data.get("ok"):
             self._data = data
 
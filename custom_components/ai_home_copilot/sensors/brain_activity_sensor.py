@@ -12,8 +12,6 @@ from typing import Any
 from homeassistant.components.sensor import SensorEntity
 
 from ..entity import CopilotBaseEntity
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-import aiohttp
 
 logger = logging.getLogger(__name__)
 
@@ -41,20 +39,8 @@ class BrainActivitySensor(CopilotBaseEntity, SensorEntity):
         super().__init__(coordinator)
         self._data: dict[str, Any] = {}
 
-    async def _fetch(self) -> dict | None:
-        try:
-            url = f"{self._core_base_url()}/api/v1/hub/brain/activity"
-            headers = self._core_headers()
-            session = async_get_clientsession(self.hass)
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-        except Exception:
-            logger.debug("Failed to fetch brain activity data")
-        return None
-
     async def async_update(self) -> None:
-        data = await self._fetch()
+        data = await self._fetch("/api/v1/hub/brain/activity")
         if data and data.get("ok"):
             self._data = data
 
@@ -9,7 +9,6 @@ import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from ..entity import CopilotBaseEntity
 
@@ -53,20 +52,9 @@ class HubDashboardSensor(CopilotBaseEntity, SensorEntity):
         }
 
     async def async_update(self) -> None:
-        session = async_get_clientsession(self.hass)
-        base = f"{self._core_base_url()}/api/v1/hub"
-        headers = self._core_headers()
-
-        try:
-            async with session.get(
-                f"{base}/dashboard", headers=headers, timeout=10
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if data.get("ok"):
-                        self._overview = data
-        except Exception as exc:
-            _LOGGER.debug("Failed to fetch hub dashboard data: %s", exc)
+        data = await self._fetch("/api/v1/hub/dashboard")
+        if data and data.get("ok"):
+            self._overview = data
 
 
 class HubPluginsSensor(CopilotBaseEntity, SensorEntity):
@@ -96,20 +84,9 @@ class HubPluginsSensor(CopilotBaseEntity, SensorEntity):
         }
 
     async def async_update(self) -> None:
-        session = async_get_clientsession(self.hass)
-        base = f"{self._core_base_url()}/api/v1/hub"
-        headers = self._core_headers()
-
-        try:
-            async with session.get(
-                f"{base}/plugins", headers=headers, timeout=10
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if data.get("ok"):
-                        self._plugins = data
-        except Exception as exc:
-            _LOGGER.debug("Failed to fetch hub plugins data: %s", exc)
+        data = await self._fetch("/api/v1/hub/plugins")
+        if data and data.get("ok"):
+            self._plugins = data
 
 
 class HubMultiHomeSensor(CopilotBaseEntity, SensorEntity):
@@ -147,17 +124,6 @@ class HubMultiHomeSensor(CopilotBaseEntity, SensorEntity):
         }
 
     async def async_update(self) -> None:
-        session = async_get_clientsession(self.hass)
-        base = f"{self._core_base_url()}/api/v1/hub"
-        headers = self._core_headers()
-
-        try:
-            async with session.get(
-                f"{base}/homes", headers=headers, timeout=10
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    if data.get("ok"):
-                        self._homes = data
-        except Exception as exc:
-            _LOGGER.debug("Failed to fetch hub homes data: %s", exc)
+        data = await self._fetch("/api/v1/hub/homes")
+        if data and data.get("ok"):
+            self._homes = data
@@ -287,7 +287,11 @@ def _register_forwarder_n3_services(hass: HomeAssistant) -> None:
     """Register N3 Event Forwarder services."""
 
     if not hass.services.has_service(DOMAIN, "forwarder_n3_start"):
-        from .forwarder_n3 import N3EventForwarder
+        from .forwarder_n3 import (
+            DEBOUNCE_MODE_COALESCE,
+            DEBOUNCE_MODE_LEADING,
+            N3EventForwarder,
+        )
 
         async def _handle_forwarder_start(call: ServiceCall) -> None:
             entry_id = call.data.get("entry_id")
@@ -307,6 +311,8 @@ def _register_forwarder_n3_services(hass: HomeAssistant) -> None:
                         "batch_size": 50,
                         "flush_interval": 0.5,
                         "forward_call_service": True,
+                        "debounce_mode": call.data.get("debounce_mode", DEBOUNCE_MODE_LEADING),
+                        "compressed_upload": call.data.get("compressed_upload", False),
                     }
                     forwarder = N3EventForwarder(hass, config)
                     await forwarder.async_start()
@@ -317,7 +323,15 @@ def _register_forwarder_n3_services(hass: HomeAssistant) -> None:
             DOMAIN,
             "forwarder_n3_start",
             _handle_forwarder_start,
-            schema=vol.Schema({vol.Required("entry_id"): str}),
+            schema=vol.Schema(
+                {
+                    vol.Required("entry_id"): str,
+                    vol.Optional("debounce_mode"): vol.In(
+                        [DEBOUNCE_MODE_LEADING, DEBOUNCE_MODE_COALESCE]
+                    ),
+                    vol.Optional("compressed_upload"): bool,
+                }
+            ),
         )
 
     if not hass.services.has_service(DOMAIN, "forwarder_n3_stop"):
@@ -1256,6 +1270,7 @@ def _register_core_module_services(hass: HomeAssistant) -> None:
                         f"{DOMAIN}_core_module_configured",
                         {"module_id": module_id, "state": state, "ok": result.get("ok", False)},
                     )
+                    coordinator.mark_endpoints_due("core_modules")
                     await coordinator.async_refresh()
                 except Exception as err:  # noqa: BLE001
                     _LOGGER.error("Failed to configure Core module %s: %s", module_id, err)
@@ -1278,6 +1293,7 @@ def _register_core_module_services(hass: HomeAssistant) -> None:
                 entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
                 coordinator = entry_data.get("coordinator")
                 if coordinator:
+                    coordinator.mark_endpoints_due("core_modules")
                     await coordinator.async_refresh()
                     break
 
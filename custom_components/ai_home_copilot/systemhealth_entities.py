@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.const import UnitOfInformation
+from homeassistant.const import UnitOfInformation, UnitOfTime
 from homeassistant.helpers.entity import EntityCategory
 
 from .entity import CopilotBaseEntity
@@ -40,3 +41,57 @@ class SystemHealthSqliteDbSizeSensor(CopilotBaseEntity, SensorEntity):
             return int(os.stat(path).st_size)
         except OSError:
             return None
+
+
+class CoreApiLatencySensor(CopilotBaseEntity, SensorEntity):
+    """p99 latency of Core API calls; slowest endpoints and error budget as attributes."""
+
+    _attr_has_entity_name = False
+    _attr_name = "PilotSuite core API latency (p99)"
+    _attr_unique_id = "ai_home_copilot_core_api_latency_p99"
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = "measurement"
+
+    # Endpoints listed in the attributes, slowest p99 first.
+    MAX_ENDPOINTS = 10
+
+    def _latency(self) -> dict[str, Any]:
+        api = getattr(self.coordinator, "api", None)
+        if api is None or not hasattr(api, "get_latency_stats"):
+            return {}
+        return api.get_latency_stats()
+
+    @property
+    def native_value(self) -> float | None:
+        return self._latency().get("overall", {}).get("p99_ms")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        stats = self._latency()
+        overall = stats.get("overall", {})
+        endpoints = sorted(
+            stats.get("endpoints", {}).items(),
+            key=lambda kv: kv[1].get("p99_ms") or 0.0,
+            reverse=True,
+        )[: self.MAX_ENDPOINTS]
+        return {
+            "calls": overall.get("count", 0),
+            "p50_ms": overall.get("p50_ms"),
+            "p90_ms": overall.get("p90_ms"),
+            "errors": overall.get("errors", 0),
+            "failovers": overall.get("failovers", 0),
+            "error_rate": overall.get("error_rate"),
+            "error_budget_remaining": overall.get("budget_remaining"),
+            "slo": stats.get("slo"),
+            "slowest": {
+                name: {
+                    "count": ep.get("count"),
+                    "p50_ms": ep.get("p50_ms"),
+                    "p99_ms": ep.get("p99_ms"),
+                    "error_rate": ep.get("error_rate"),
+                }
+                for name, ep in endpoints
+            },
+        }
@@ -22,6 +22,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import DOMAIN
+from .core.http_pool import CoreSessionView, async_get_core_session
 from .multi_user_preferences import MultiUserPreferenceModule
 
 if TYPE_CHECKING:
@@ -106,7 +107,7 @@ class VectorStoreClient:
         self.config_entry = config_entry
         self.config = config or VectorStoreConfig()
         
-        self._session: aiohttp.ClientSession | None = None
+        self._session: CoreSessionView | None = None
         self._unsub_trackers: list[Any] = []
         self._sync_task: asyncio.Task | None = None
         
@@ -119,7 +120,9 @@ class VectorStoreClient:
         _LOGGER.info("Setting up Vector Store Client")
         
         # Create HTTP session
-        self._session = aiohttp.ClientSession(
+        self._session = async_get_core_session(
+            self.hass,
+            "vector_client",
             base_url=self.config.api_url,
             headers=self._get_headers(),
             timeout=aiohttp.ClientTimeout(total=30),
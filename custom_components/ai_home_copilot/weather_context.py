@@ -15,10 +15,10 @@ from urllib.parse import urlsplit
 
 import aiohttp
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
+from .core.http_pool import CoreSessionView, async_get_core_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,7 +76,7 @@ class WeatherContextCoordinator(DataUpdateCoordinator[WeatherSnapshot]):
         self._host = host
         self._port = port
         self._token = token
-        self._session: aiohttp.ClientSession | None = None
+        self._session: CoreSessionView | None = None
         self._last_issue: str | None = None
 
     def _log_issue_once(self, issue: str, message: str, *args: object) -> None:
@@ -128,10 +128,10 @@ class WeatherContextCoordinator(DataUpdateCoordinator[WeatherSnapshot]):
             headers["Authorization"] = f"Bearer {self._token}"
         return headers
 
-    async def _get_session(self) -> aiohttp.ClientSession:
+    async def _get_session(self) -> CoreSessionView:
         """Get or create HTTP session."""
         if self._session is None:
-            self._session = async_get_clientsession(self.hass)
+            self._session = async_get_core_session(self.hass, "weather_context")
         return self._session
 
     async def _async_update_data(self) -> WeatherSnapshot:
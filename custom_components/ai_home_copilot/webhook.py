@@ -19,6 +19,20 @@ EVENT_TYPE_MOOD = "mood_changed"
 EVENT_TYPE_SUGGESTION = "suggestion_new"
 EVENT_TYPE_NEURON = "neuron_update"
 EVENT_TYPE_PROACTIVE = "proactive_suggestion"
+EVENT_TYPE_STATE_DELTA = "state_delta"
+
+# Coordinator data keys a state_delta push may replace.
+STATE_DELTA_KEYS = frozenset({
+    "capabilities",
+    "core_modules",
+    "brain_summary",
+    "habitus_rules",
+    "rag_status",
+    "override_modes",
+    "music_cloud",
+    "light_module",
+    "zone_automation",
+})
 
 
 def _make_webhook_url(hass: HomeAssistant, webhook_id: str) -> str:
@@ -43,6 +57,74 @@ def _merge_coordinator_data(coordinator, updates: dict) -> dict:
     return merged
 
 
+def _push_coordinator_data(coordinator, updates: dict) -> None:
+    """Merge pushed data into the coordinator without touching its poll tick.
+
+    ``async_set_updated_data`` would also reschedule the refresh timer, so a
+    Core pushing more often than once per tick would starve every endpoint
+    the push does not cover.
+    """
+    coordinator.data = _merge_coordinator_data(coordinator, updates)
+    coordinator.async_update_listeners()
+
+
+def apply_core_event(hass: HomeAssistant, coordinator, event_type: str, data: dict) -> None:
+    """Apply one pushed Core event (webhook or push stream) to the coordinator."""
+    if event_type == EVENT_TYPE_MOOD:
+        # Add-on pushes mood change: merge into coordinator data
+        updates = {
+            "mood": data,
+            "dominant_mood": data.get("mood", "unknown"),
+            "mood_confidence": data.get("confidence", 0.0),
+        }
+        _push_coordinator_data(coordinator, updates)
+        _LOGGER.debug("Core push: mood – %s", data.get("mood"))
+
+    elif event_type == EVENT_TYPE_NEURON:
+        # Add-on pushes neuron state update
+        updates = {"neurons": data.get("neurons", {})}
+        _push_coordinator_data(coordinator, updates)
+        _LOGGER.debug("Core push: neuron update")
+
+    elif event_type == EVENT_TYPE_STATE_DELTA:
+        # Partial coordinator data, e.g. {"brain_summary": {...}}
+        updates = {k: v for k, v in data.items() if k in STATE_DELTA_KEYS}
+        if updates:
+            _push_coordinator_data(coordinator, updates)
+        _LOGGER.debug("Core push: state delta %s", sorted(updates))
+
+    elif event_type == EVENT_TYPE_SUGGESTION:
+        # Add-on pushes new suggestion – fire HA event for suggestion panel
+        hass.bus.async_fire(
+            f"{DOMAIN}_suggestion_received",
+            {"suggestion": data},
+        )
+        _LOGGER.debug("Core push: suggestion")
+
+    elif event_type == EVENT_TYPE_PROACTIVE:
+        # Add-on pushes proactive mood-triggered suggestion
+        hass.bus.async_fire(
+            f"{DOMAIN}_proactive_suggestion",
+            {"suggestion": data, "source": "mood_trigger"},
+        )
+        _LOGGER.debug("Core push: proactive suggestion – %s",
+                      data.get("subtype", "unknown"))
+
+    else:
+        # Legacy status push (online/version)
+        online = data.get("online")
+        version = data.get("version")
+
+        updates = {}
+        if online is not None:
+            updates["ok"] = bool(online)
+        if isinstance(version, str):
+            updates["version"] = version
+
+        if updates:
+            _push_coordinator_data(coordinator, updates)
+
+
 async def async_register_webhook(hass: HomeAssistant, entry, coordinator) -> str:
     webhook_id = await async_ensure_webhook(hass, entry)
 
@@ -65,56 +147,7 @@ async def async_register_webhook(hass: HomeAssistant, entry, coordinator) -> str
         # Typed envelope: {"type": "mood_changed", "data": {...}}
         event_type = payload.get("type", EVENT_TYPE_STATUS)
         data = payload.get("data") if payload.get("data") else payload
-
-        if event_type == EVENT_TYPE_MOOD:
-            # Add-on pushes mood change: merge into coordinator data
-            updates = {
-                "mood": data,
-                "dominant_mood": data.get("mood", "unknown"),
-                "mood_confidence": data.get("confidence", 0.0),
-            }
-            merged = _merge_coordinator_data(coordinator, updates)
-            coordinator.async_set_updated_data(merged)
-            _LOGGER.debug("Webhook: mood push received – %s", data.get("mood"))
-
-        elif event_type == EVENT_TYPE_NEURON:
-            # Add-on pushes neuron state update
-            updates = {"neurons": data.get("neurons", {})}
-            merged = _merge_coordinator_data(coordinator, updates)
-            coordinator.async_set_updated_data(merged)
-            _LOGGER.debug("Webhook: neuron update received")
-
-        elif event_type == EVENT_TYPE_SUGGESTION:
-            # Add-on pushes new suggestion – fire HA event for suggestion panel
-            hass.bus.async_fire(
-                f"{DOMAIN}_suggestion_received",
-                {"suggestion": data},
-            )
-            _LOGGER.debug("Webhook: suggestion push received")
-
-        elif event_type == EVENT_TYPE_PROACTIVE:
-            # Add-on pushes proactive mood-triggered suggestion
-            hass.bus.async_fire(
-                f"{DOMAIN}_proactive_suggestion",
-                {"suggestion": data, "source": "mood_trigger"},
-            )
-            _LOGGER.debug("Webhook: proactive suggestion received – %s",
-                          data.get("subtype", "unknown"))
-
-        else:
-            # Legacy status push (online/version)
-            online = data.get("online")
-            version = data.get("version")
-
-            updates = {}
-            if online is not None:
-                updates["ok"] = bool(online)
-            if isinstance(version, str):
-                updates["version"] = version
-
-            if updates:
-                merged = _merge_coordinator_data(coordinator, updates)
-                coordinator.async_set_updated_data(merged)
+        apply_core_event(hass, coordinator, event_type, data)
 
         return Response(
             status=200,
@@ -0,0 +1,458 @@
+"""End-to-end throughput benchmark for the HA -> Core event forwarders.
+
+Opt-in, skipped in the normal test run::
+
+    PILOTSUITE_BENCHMARK=1 python -m pytest tests/benchmarks -q
+
+Each scenario fires a synthetic ``state_changed`` storm at a fixed rate on a
+stand-in ``hass`` bus, runs it through ``EventsForwarderModule`` or
+``N3EventForwarder`` and into a local aiohttp Core stub serving
+``/api/v1/events``, then reports delivered events/s, enqueue-to-ack p50/p99
+(fire on the bus -> batch accepted by the stub), peak RSS and request body
+bytes on the wire. Every generated event must arrive.
+
+Environment knobs:
+
+- ``PILOTSUITE_BENCHMARK_RATES``: events/s, comma separated (default ``100,1000,10000``)
+- ``PILOTSUITE_BENCHMARK_SECONDS``: storm duration per scenario (default ``2``)
+- ``PILOTSUITE_BENCHMARK_COMPRESSED=1``: stub advertises columnar + gzip uploads
+- ``PILOTSUITE_BENCHMARK_REPORT``: write the results as JSON to this path
+- ``PILOTSUITE_BENCHMARK_BASELINE``: a previous report; fail if events/s drops
+  more than 20% or p99 grows more than 50% for a matching scenario
+
+Needs a real ``aiohttp`` (tests/conftest.py replaces a missing one with a mock).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+import uuid
+
+import pytest
+
+from homeassistant.const import EVENT_STATE_CHANGED
+
+from custom_components.ai_home_copilot import forwarder_n3
+from custom_components.ai_home_copilot.const import (
+    CONF_EVENTS_FORWARDER_ADDITIONAL_ENTITIES,
+    CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD,
+    CONF_EVENTS_FORWARDER_ENABLED,
+    CONF_EVENTS_FORWARDER_FLUSH_INTERVAL_SECONDS,
+    CONF_EVENTS_FORWARDER_FORWARD_CALL_SERVICE,
+    CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES,
+    CONF_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS,
+    CONF_EVENTS_FORWARDER_MAX_BATCH,
+    CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED,
+    CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE,
+    DOMAIN,
+)
+from custom_components.ai_home_copilot.core.event_codec import (
+    CONTENT_ENCODING_GZIP,
+    ENCODING_COLUMNAR,
+    decode_events_body,
+)
+from custom_components.ai_home_copilot.core.http_pool import async_get_core_session_pool
+from custom_components.ai_home_copilot.core.module import ModuleContext
+from custom_components.ai_home_copilot.core.modules import events_forwarder
+
+_REAL_AIOHTTP = not isinstance(sys.modules.get("aiohttp"), MagicMock)
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(
+        os.environ.get("PILOTSUITE_BENCHMARK") != "1",
+        reason="benchmark is opt-in (set PILOTSUITE_BENCHMARK=1)",
+    ),
+    pytest.mark.skipif(not _REAL_AIOHTTP, reason="benchmark needs a real aiohttp install"),
+]
+
+RATES = [
+    int(r) for r in os.environ.get("PILOTSUITE_BENCHMARK_RATES", "100,1000,10000").split(",") if r.strip()
+]
+STORM_SECONDS = float(os.environ.get("PILOTSUITE_BENCHMARK_SECONDS", "2"))
+COMPRESSED = os.environ.get("PILOTSUITE_BENCHMARK_COMPRESSED") == "1"
+DRAIN_TIMEOUT_SECONDS = 60.0
+
+MAX_THROUGHPUT_DROP = 0.20
+MAX_P99_RISE = 0.50
+P99_NOISE_FLOOR_MS = 5.0
+
+# 90 lights (bulk lane) and 10 persons (priority lane); neither domain is
+# debounced by the N3 forwarder, so every event must be delivered.
+ENTITIES = [f"light.bench_{i:03d}" for i in range(90)] + [f"person.bench_{i:02d}" for i in range(10)]
+
+
+# ---------------------------------------------------------------------------
+# Stand-ins
+# ---------------------------------------------------------------------------
+
+
+class _BenchBus:
+    """Minimal event bus: sync listeners run inline, coroutine listeners as tasks."""
+
+    def __init__(self) -> None:
+        self._listeners: dict[str, list] = {}
+
+    def async_listen(self, event_type: str, listener):
+        bucket = self._listeners.setdefault(event_type, [])
+        bucket.append(listener)
+
+        def _remove() -> None:
+            if listener in bucket:
+                bucket.remove(listener)
+
+        return _remove
+
+    def async_listen_once(self, event_type: str, listener):
+        return self.async_listen(event_type, listener)
+
+    def async_fire(self, event_type: str, data: dict[str, Any], context: Any) -> None:
+        event = SimpleNamespace(event_type=event_type, data=data, context=context)
+        for listener in list(self._listeners.get(event_type, ())):
+            result = listener(event)
+            if asyncio.iscoroutine(result):
+                asyncio.get_running_loop().create_task(result)
+
+
+def _bench_hass(loop: asyncio.AbstractEventLoop, tmp_path) -> SimpleNamespace:
+    return SimpleNamespace(
+        loop=loop,
+        data={},
+        bus=_BenchBus(),
+        states=SimpleNamespace(get=lambda entity_id: None),
+        config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))),
+        async_create_task=lambda coro, *args, **kwargs: loop.create_task(coro),
+    )
+
+
+def _track_state_change_event(hass, entity_ids, action):
+    wanted = None if entity_ids is None else set(entity_ids)
+
+    def _listener(event):
+        if wanted is None or event.data.get("entity_id") in wanted:
+            return action(event)
+        return None
+
+    return hass.bus.async_listen(EVENT_STATE_CHANGED, _listener)
+
+
+def _call_later(hass, delay, action):
+    handle = hass.loop.call_later(float(delay), action, None)
+    return handle.cancel
+
+
+class _MemoryStore:
+    def __init__(self, *args, **kwargs) -> None:
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data) -> None:
+        self.data = data
+
+
+class CoreStub:
+    """Local ``/api/v1/events`` endpoint recording per-event acceptance time."""
+
+    def __init__(self, list_key: str, compressed: bool) -> None:
+        self.list_key = list_key
+        self.compressed = compressed
+        self.acked_at: dict[int, float] = {}
+        self.wire_bytes = 0
+        self.requests = 0
+        self.url = ""
+        self._runner = None
+
+    async def start(self) -> None:
+        from aiohttp import web
+
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_get("/api/v1/capabilities", self._capabilities)
+        app.router.add_post("/api/v1/events", self._events)
+        # Keep request bodies as sent so wire bytes are the compressed size.
+        self._runner = web.AppRunner(app, access_log=None, auto_decompress=False)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _capabilities(self, request):
+        from aiohttp import web
+
+        caps: dict[str, Any] = {"ok": True, "version": "benchmark"}
+        if self.compressed:
+            caps["events"] = {
+                "encodings": [ENCODING_COLUMNAR],
+                "content_encodings": [CONTENT_ENCODING_GZIP],
+            }
+        return web.json_response(caps)
+
+    async def _events(self, request):
+        from aiohttp import web
+
+        body = await request.read()
+        self.requests += 1
+        self.wire_bytes += len(body)
+        payload = decode_events_body(body, dict(request.headers), self.list_key)
+        now = time.monotonic()
+        items = payload.get(self.list_key) or []
+        for item in items:
+            seq = _event_seq(item)
+            if seq is not None:
+                self.acked_at.setdefault(seq, now)
+        return web.json_response({"ok": True, "accepted": len(items)})
+
+
+def _event_seq(item: dict[str, Any]) -> int | None:
+    """Recover the storm sequence number carried in the new state value."""
+    new = item.get("new")  # N3 envelope
+    value = new.get("state") if isinstance(new, dict) else None
+    if value is None:
+        attrs = item.get("attributes")  # events forwarder envelope
+        value = attrs.get("new_state") if isinstance(attrs, dict) else None
+    if isinstance(value, str) and value.startswith("b"):
+        try:
+            return int(value[1:])
+        except ValueError:
+            return None
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def _sample_rss(peak: list[int]) -> None:
+    while True:
+        peak[0] = max(peak[0], _rss_bytes())
+        await asyncio.sleep(0.02)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+async def _storm(hass, rate: int, seconds: float, fired_at: dict[int, float]) -> int:
+    """Fire ``rate * seconds`` state changes in 10 ms ticks; returns the count."""
+    total = max(1, int(rate * seconds))
+    per_tick = max(1, round(rate * 0.01))
+    states: dict[str, Any] = {}
+    start = time.monotonic()
+    seq = 0
+    while seq < total:
+        for _ in range(min(per_tick, total - seq)):
+            entity_id = ENTITIES[seq % len(ENTITIES)]
+            attrs = {"brightness": seq % 255} if entity_id.startswith("light.") else {"source_type": "gps"}
+            new = SimpleNamespace(
+                entity_id=entity_id,
+                state=f"b{seq}",
+                attributes=attrs,
+                last_changed=None,
+                last_updated=None,
+                context=None,
+            )
+            data = {"entity_id": entity_id, "old_state": states.get(entity_id), "new_state": new}
+            states[entity_id] = new
+            fired_at[seq] = time.monotonic()
+            hass.bus.async_fire(
+                EVENT_STATE_CHANGED,
+                data,
+                SimpleNamespace(id=uuid.uuid4().hex, parent_id=None, user_id=None),
+            )
+            seq += 1
+        await asyncio.sleep(max(0.0, start + seq / rate - time.monotonic()))
+    return total
+
+
+async def _drain(stub: CoreStub, expected: int) -> None:
+    deadline = time.monotonic() + DRAIN_TIMEOUT_SECONDS
+    while len(stub.acked_at) < expected and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+
+
+def _summarize(
+    forwarder: str, rate: int, generated: int, fired_at: dict[int, float], stub: CoreStub, peak_rss: int
+) -> dict[str, Any]:
+    latencies = sorted(
+        max(0.0, acked - fired_at[seq]) for seq, acked in stub.acked_at.items() if seq in fired_at
+    )
+    delivered = len(stub.acked_at)
+    elapsed = (max(stub.acked_at.values()) - min(fired_at.values())) if delivered else 0.0
+    return {
+        "forwarder": forwarder,
+        "rate": rate,
+        "compressed": COMPRESSED,
+        "generated": generated,
+        "delivered": delivered,
+        "events_per_s": round(delivered / elapsed, 1) if elapsed > 0 else 0.0,
+        "p50_ms": round(_percentile(latencies, 50) * 1000.0, 1) if latencies else None,
+        "p99_ms": round(_percentile(latencies, 99) * 1000.0, 1) if latencies else None,
+        "peak_rss_mb": round(peak_rss / (1024 * 1024), 1),
+        "wire_bytes": stub.wire_bytes,
+        "bytes_per_event": round(stub.wire_bytes / delivered, 1) if delivered else None,
+        "requests": stub.requests,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+
+async def _run_events_forwarder(hass, stub: CoreStub, rate: int, fired_at: dict[int, float]) -> int:
+    from aiohttp import ClientSession
+
+    from custom_components.ai_home_copilot.coordinator import CopilotApiClient
+
+    entry = SimpleNamespace(
+        entry_id="benchmark",
+        domain=DOMAIN,
+        # Bench profile: batches large enough (and a queue bound high enough)
+        # that a 10k events/s storm drains without drops.
+        data={
+            CONF_EVENTS_FORWARDER_ENABLED: True,
+            CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES: False,
+            CONF_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS: False,
+            CONF_EVENTS_FORWARDER_ADDITIONAL_ENTITIES: ENTITIES,
+            CONF_EVENTS_FORWARDER_FORWARD_CALL_SERVICE: False,
+            CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED: False,
+            CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_MAX_SIZE: 50000,
+            CONF_EVENTS_FORWARDER_MAX_BATCH: 500,
+            CONF_EVENTS_FORWARDER_FLUSH_INTERVAL_SECONDS: 1,
+            CONF_EVENTS_FORWARDER_COMPRESSED_UPLOAD: COMPRESSED,
+        },
+        options={},
+    )
+    async with ClientSession() as session:
+        api = CopilotApiClient(session, base_urls=[stub.url], token="benchmark")
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": SimpleNamespace(api=api)}
+        await events_forwarder.EventsForwarderModule().async_setup_entry(ModuleContext(hass=hass, entry=entry))
+        data = hass.data[DOMAIN][entry.entry_id]
+        st = data.get("events_forwarder_state")
+        assert st is not None, "events forwarder did not start"
+        try:
+            generated = await _storm(hass, rate, STORM_SECONDS, fired_at)
+            await _drain(stub, generated)
+        finally:
+            data["unsub_events_forwarder"]()
+            if st.send_tasks:
+                await asyncio.gather(*st.send_tasks, return_exceptions=True)
+    return generated
+
+
+async def _run_n3_forwarder(hass, stub: CoreStub, rate: int, fired_at: dict[int, float]) -> int:
+    forwarder = forwarder_n3.N3EventForwarder(
+        hass,
+        {
+            "core_url": stub.url,
+            "api_token": "benchmark",
+            "max_queue_size": 50000,
+            "heartbeat_enabled": False,
+            "forward_call_service": False,
+            "compressed_upload": COMPRESSED,
+        },
+    )
+    await forwarder.async_start()
+    try:
+        generated = await _storm(hass, rate, STORM_SECONDS, fired_at)
+        await _drain(stub, generated)
+    finally:
+        await forwarder.async_stop()
+    return generated
+
+
+_SCENARIOS = {
+    "events_forwarder": (_run_events_forwarder, "items"),
+    "n3_forwarder": (_run_n3_forwarder, "events"),
+}
+
+
+@pytest.fixture(scope="module")
+def bench_results(request):
+    results: list[dict[str, Any]] = []
+    yield results
+
+    columns = ("forwarder", "rate", "delivered", "events_per_s", "p50_ms", "p99_ms", "peak_rss_mb", "bytes_per_event")
+    lines = ["", " ".join(f"{c:>16}" for c in columns)]
+    lines += [" ".join(f"{str(r[c]):>16}" for c in columns) for r in results]
+    capman = request.config.pluginmanager.getplugin("capturemanager")
+    with capman.global_and_fixture_disabled():
+        print("\n".join(lines))
+
+    report_path = os.environ.get("PILOTSUITE_BENCHMARK_REPORT")
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as fh:
+            json.dump({"storm_seconds": STORM_SECONDS, "results": results}, fh, indent=2)
+
+
+def _baseline_for(result: dict[str, Any]) -> dict[str, Any] | None:
+    path = os.environ.get("PILOTSUITE_BENCHMARK_BASELINE")
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    for row in baseline.get("results", []):
+        if all(row.get(k) == result[k] for k in ("forwarder", "rate", "compressed")):
+            return row
+    return None
+
+
+@pytest.mark.parametrize("rate", RATES)
+@pytest.mark.parametrize("forwarder", sorted(_SCENARIOS))
+async def test_forwarder_throughput(forwarder, rate, monkeypatch, tmp_path, bench_results):
+    monkeypatch.setattr(events_forwarder, "async_call_later", _call_later)
+    monkeypatch.setattr(events_forwarder, "async_track_state_change_event", _track_state_change_event)
+    monkeypatch.setattr(events_forwarder, "async_dispatcher_connect", lambda *args: (lambda: None))
+    monkeypatch.setattr(forwarder_n3, "async_track_state_change_event", _track_state_change_event)
+    monkeypatch.setattr(forwarder_n3, "Store", _MemoryStore)
+
+    run, list_key = _SCENARIOS[forwarder]
+    stub = CoreStub(list_key, COMPRESSED)
+    await stub.start()
+    hass = _bench_hass(asyncio.get_running_loop(), tmp_path)
+    fired_at: dict[int, float] = {}
+    peak = [_rss_bytes()]
+    sampler = asyncio.get_running_loop().create_task(_sample_rss(peak))
+    try:
+        generated = await run(hass, stub, rate, fired_at)
+    finally:
+        sampler.cancel()
+        await async_get_core_session_pool(hass).async_close()
+        await stub.stop()
+
+    result = _summarize(forwarder, rate, generated, fired_at, stub, peak[0])
+    bench_results.append(result)
+
+    assert result["delivered"] == generated, result
+
+    base = _baseline_for(result)
+    if base:
+        assert result["events_per_s"] >= base["events_per_s"] * (1 - MAX_THROUGHPUT_DROP), (result, base)
+        if base.get("p99_ms") is not None and result["p99_ms"] is not None:
+            allowed = max(base["p99_ms"] * (1 + MAX_P99_RISE), base["p99_ms"] + P99_NOISE_FLOOR_MS)
+            assert result["p99_ms"] <= allowed, (result, base)
@@ -7,6 +7,9 @@ Test Categories:
 Unit tests should import specific modules directly and mock dependencies.
 Integration tests are skipped if HA is not installed.
 """
+import importlib.util
+import os
+import ssl
 import sys
 import pytest
 from pathlib import Path
@@ -204,6 +207,8 @@ mock_ha_exceptions.HomeAssistantError = Exception
 mock_ha_data_entry_flow = MagicMock()
 mock_ha_data_entry_flow.UnknownFlow = Exception
 mock_ha_util = MagicMock()
+mock_ha_util.ssl = MagicMock()
+mock_ha_util.ssl.get_default_context = ssl.create_default_context
 
 # Set up const values
 mock_ha_const.EVENT_STATE_CHANGED = "state_changed"
@@ -217,6 +222,7 @@ mock_ha_const.STATE_OFF = "off"
 # Set up helpers submodules
 mock_ha_helpers.aiohttp_client = MagicMock()
 mock_ha_helpers.aiohttp_client.async_get_clientsession = MagicMock(return_value=MagicMock())
+mock_ha_helpers.aiohttp_client.SERVER_SOFTWARE = "HomeAssistant/test aiohttp/test Python/test"
 mock_ha_helpers.storage = MagicMock()
 
 
@@ -306,9 +312,15 @@ mock_ha_components.persistent_notification = MagicMock()
 
 # External HA dependencies — voluptuous is installed as a real package
 # (needed for schema validation tests), so we don't mock it.
-# aiohttp is mocked since it's only used for HTTP calls in tests.
-if 'aiohttp' not in sys.modules:
+# aiohttp is mocked since it's only used for HTTP calls in tests. The opt-in
+# benchmarks (PILOTSUITE_BENCHMARK=1) drive a real client and server instead.
+_REAL_AIOHTTP = (
+    os.environ.get("PILOTSUITE_BENCHMARK") == "1"
+    and importlib.util.find_spec("aiohttp") is not None
+)
+if 'aiohttp' not in sys.modules and not _REAL_AIOHTTP:
     sys.modules['aiohttp'] = MagicMock()
+    sys.modules['aiohttp.web'] = sys.modules['aiohttp'].web
 
 # Core modules
 sys.modules['homeassistant'] = mock_ha
@@ -319,6 +331,7 @@ sys.modules['homeassistant.exceptions'] = mock_ha_exceptions
 sys.modules['homeassistant.data_entry_flow'] = mock_ha_data_entry_flow
 sys.modules['homeassistant.util'] = mock_ha_util
 sys.modules['homeassistant.util.dt'] = mock_ha_util
+sys.modules['homeassistant.util.ssl'] = mock_ha_util.ssl
 
 # Helpers
 sys.modules['homeassistant.helpers'] = mock_ha_helpers
@@ -428,6 +441,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "ha_required: Requires Home Assistant installation"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: Opt-in performance benchmarks (PILOTSUITE_BENCHMARK=1)"
+    )
 
 
 def pytest_collection_modifyitems(session, config, items):
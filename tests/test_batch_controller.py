@@ -0,0 +1,59 @@
+"""Tests for the AIMD events forwarder batch controller."""
+
+from custom_components.ai_home_copilot.core.batch_controller import AimdBatchController
+
+
+def _ctl(**overrides) -> AimdBatchController:
+    kwargs = dict(min_batch=10, max_batch=100, min_delay=0.25, max_delay=5.0, target_rtt_ms=500)
+    kwargs.update(overrides)
+    return AimdBatchController(**kwargs)
+
+
+def test_starts_at_configured_ceiling():
+    ctl = _ctl()
+    assert ctl.batch_size == 100
+    assert ctl.flush_delay == 5.0
+    assert ctl.as_dict()["last_decision"] == "init"
+
+
+def test_error_halves_then_floors_batch():
+    ctl = _ctl()
+    ctl.on_error(error_streak=1)
+    assert ctl.batch_size == 50
+    ctl.on_error(error_streak=3)
+    assert ctl.batch_size == 10
+    assert ctl.as_dict()["last_decision"] == "decrease_error"
+
+
+def test_slow_rtt_decreases_fast_rtt_increases_additively():
+    ctl = _ctl()
+    ctl.on_success(rtt_seconds=2.0, sent=100, queue_depth=0)
+    assert ctl.batch_size == 70
+    assert ctl.last_decision == "decrease_slow"
+
+    ctl = _ctl()
+    ctl.on_error(error_streak=3)
+    for _ in range(3):
+        ctl.on_success(rtt_seconds=0.05, sent=ctl.batch_size, queue_depth=0)
+    # +9 per good round-trip (10% of the 10..100 range)
+    assert ctl.batch_size == 37
+    assert ctl.increases == 3
+
+
+def test_backlog_shrinks_delay_and_idle_grows_it_within_bounds():
+    ctl = _ctl()
+    for _ in range(10):
+        ctl.on_success(rtt_seconds=0.05, sent=100, queue_depth=500)
+    assert ctl.flush_delay == 0.25
+
+    for _ in range(50):
+        ctl.on_success(rtt_seconds=0.05, sent=1, queue_depth=0)
+    assert ctl.flush_delay == 5.0
+    assert ctl.batch_size <= 100
+
+
+def test_min_batch_clamped_to_max():
+    ctl = _ctl(min_batch=500, max_batch=50)
+    assert ctl.min_batch == 50
+    ctl.on_error(error_streak=5)
+    assert ctl.batch_size == 50
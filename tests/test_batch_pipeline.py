@@ -0,0 +1,106 @@
+"""Tests for pipelined events forwarder batch bookkeeping and priority lanes."""
+
+from custom_components.ai_home_copilot.core.batch_pipeline import (
+    LANE_BULK,
+    LANE_HIGH,
+    BatchPipeline,
+)
+
+
+def _pipeline(count: int, max_in_flight: int = 3, lane: str = LANE_BULK) -> BatchPipeline:
+    pipe = BatchPipeline(max_in_flight=max_in_flight)
+    for i in range(count):
+        pipe.push({"id": f"e{i}"}, lane, now=0.0)
+    return pipe
+
+
+def test_batches_get_monotonic_sequence_numbers_within_window():
+    pipe = _pipeline(10)
+
+    taken = []
+    while pipe.has_capacity() and pipe.has_work():
+        taken.append(pipe.next_batch(LANE_BULK, 3))
+
+    assert [seq for seq, _ in taken] == [1, 2, 3]
+    assert [len(items) for _, items in taken] == [3, 3, 3]
+    assert pipe.queued() == 1
+    assert pipe.in_flight == 3
+
+
+def test_out_of_order_completion_acks_contiguous_prefix_only():
+    pipe = _pipeline(6)
+    for _ in range(3):
+        pipe.next_batch(LANE_BULK, 2)
+
+    assert pipe.complete(2) == 0
+    assert pipe.complete(3) == 0
+    assert pipe.complete(1) == 6
+    assert pipe.complete(1) == 0  # unknown / already completed
+
+
+def test_failed_batch_retried_first_with_same_sequence():
+    pipe = _pipeline(6, max_in_flight=2)
+    seq1, items1 = pipe.next_batch(LANE_BULK, 2)
+    seq2, _ = pipe.next_batch(LANE_BULK, 2)
+
+    pipe.fail(seq1)
+    assert pipe.retry_items() == 2
+    assert pipe.pending() == 4
+    assert pipe.complete(seq2) == 0  # batch 1 still outstanding
+
+    assert pipe.next_batch(LANE_BULK, 2) == (seq1, items1)
+    assert pipe.retried_total == 1
+    assert pipe.complete(seq1) == 4
+
+    seq3, _ = pipe.next_batch(LANE_BULK, 2)
+    assert seq3 == 3
+
+
+def test_drop_oldest_prefers_bulk_and_acks_in_order():
+    pipe = BatchPipeline(max_in_flight=2)
+    pipe.push({"id": "h0"}, LANE_HIGH)
+    for i in range(4):
+        pipe.push({"id": f"b{i}"}, LANE_BULK)
+
+    seq, _ = pipe.next_batch(LANE_BULK, 2)
+    pipe.fail(seq)
+
+    # Parked bulk batch (b0, b1) is dropped whole before the queue front.
+    assert pipe.drop_oldest(1) == (2, 0)  # h0 still pending -> nothing acked
+    assert pipe.dropped_batches_total == 1
+    assert pipe.drop_oldest(1) == (1, 0)
+    assert [i["id"] for i in pipe.unacked_items()] == ["h0", "b3"]
+
+    hseq, _ = pipe.next_batch(LANE_HIGH, 10)
+    assert pipe.complete(hseq) == 4
+
+
+def test_priority_lane_gets_extra_slot_and_latency_stats():
+    pipe = BatchPipeline(max_in_flight=1)
+    pipe.push({"id": "b0"}, LANE_BULK, now=0.0)
+    pipe.push({"id": "h0"}, LANE_HIGH, now=1.0)
+
+    bseq, _ = pipe.next_batch(LANE_BULK, 10)
+    assert not pipe.has_capacity(LANE_BULK)
+    assert pipe.has_capacity(LANE_HIGH)
+    assert not pipe.has_capacity(LANE_HIGH, probing=True)
+
+    hseq, _ = pipe.next_batch(LANE_HIGH, 10)
+    pipe.complete(hseq, now=1.05)
+    pipe.complete(bseq, now=3.0)
+
+    high = pipe.lane_stats(LANE_HIGH)
+    assert high["delivered_total"] == 1
+    assert high["latency_p99_ms"] == 50.0
+    assert pipe.lane_stats(LANE_BULK)["latency_p99_ms"] == 3000.0
+
+
+def test_unacked_items_in_enqueue_order_across_lanes():
+    pipe = BatchPipeline(max_in_flight=4)
+    pipe.push({"id": "b0"}, LANE_BULK)
+    pipe.push({"id": "h0"}, LANE_HIGH)
+    pipe.push({"id": "b1"}, LANE_BULK)
+
+    seq, _ = pipe.next_batch(LANE_HIGH, 10)
+    pipe.fail(seq)
+    assert [i["id"] for i in pipe.unacked_items()] == ["b0", "h0", "b1"]
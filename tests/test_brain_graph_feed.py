@@ -0,0 +1,144 @@
+"""Tests for the brain graph panel JSON feed (ETag caching, limits, shell)."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.ai_home_copilot import brain_graph_panel as panel
+from custom_components.ai_home_copilot.brain_graph_panel import (
+    BrainGraphFeed,
+    _render_interactive_html,
+    _write_text_if_changed,
+)
+
+GRAPH = {
+    "nodes": [
+        {"id": "light.kitchen", "label": "Kitchen", "kind": "light", "score": 0.8},
+        {"id": "zone.kitchen", "label": "Kitchen zone", "kind": "zone", "score": 0.4},
+    ],
+    "edges": [{"from": "light.kitchen", "to": "zone.kitchen", "type": "in_zone"}],
+}
+
+
+def _feed(*responses) -> BrainGraphFeed:
+    api = MagicMock()
+    api.async_get_conditional = AsyncMock(side_effect=list(responses))
+    return BrainGraphFeed(api)
+
+
+@pytest.fixture
+def no_refresh_window(monkeypatch):
+    monkeypatch.setattr(panel, "FEED_MIN_REFRESH_S", 0.0)
+
+
+async def test_revalidates_with_core_etag(no_refresh_window):
+    feed = _feed((GRAPH, '"core-1"'), (None, '"core-1"'))
+
+    first = await feed.async_snapshot()
+    etag = first.etag
+    second = await feed.async_snapshot()
+
+    assert second.etag == etag
+    assert [n["id"] for n in second.payload["nodes"]] == ["light.kitchen", "zone.kitchen"]
+    assert feed.api.async_get_conditional.await_args_list[1].kwargs["etag"] == '"core-1"'
+    assert feed.stats["core_not_modified"] == 1
+    assert feed.stats["rebuilds"] == 1
+
+
+async def test_unchanged_graph_keeps_etag_without_core_etags(no_refresh_window):
+    feed = _feed((GRAPH, None), (dict(GRAPH), None))
+
+    first = await feed.async_snapshot()
+    etag, generated = first.etag, first.payload["generated"]
+    second = await feed.async_snapshot()
+
+    assert second.etag == etag
+    assert second.payload["generated"] == generated
+    assert feed.stats["core_fetches"] == 2
+    assert feed.stats["rebuilds"] == 1
+
+
+async def test_cached_within_refresh_window():
+    feed = _feed((GRAPH, None))
+
+    await feed.async_snapshot()
+    await feed.async_snapshot()
+
+    assert feed.api.async_get_conditional.await_count == 1
+
+
+async def test_respond_304_and_clamps_limits():
+    feed = _feed((GRAPH, None))
+
+    status, body, headers = await feed.async_respond({"limitNodes": "999999", "limitEdges": "x"}, None)
+    assert status == 200
+    assert body["edge_count"] == 1
+    params = feed.api.async_get_conditional.await_args.kwargs["params"]
+    assert params == {"limitNodes": panel.FEED_MAX_NODES, "limitEdges": panel.DEFAULT_MAX_EDGES}
+
+    status, body, _ = await feed.async_respond({"limitNodes": "999999"}, headers["ETag"])
+    assert (status, body) == (304, None)
+    assert feed.stats["not_modified"] == 1
+
+
+async def test_respond_502_when_core_fails():
+    feed = _feed(RuntimeError("core down"))
+
+    status, body, _ = await feed.async_respond({}, None)
+
+    assert status == 502
+    assert "core down" in body["error"]
+
+
+def test_payload_respects_limits():
+    nodes = [{"id": f"n{i}", "label": f"N{i}"} for i in range(50)]
+    edges = [{"from": "n0", "to": f"n{i}"} for i in range(1, 50)]
+
+    payload = panel._build_graph_payload(nodes, edges, max_nodes=10, max_edges=5)
+
+    assert len(payload["nodes"]) == 10
+    assert len(payload["edges"]) == 5
+
+
+def test_shell_has_no_data_and_points_at_feed():
+    html = _render_interactive_html(nodes=[], edges=[], title="Shell", feed_url=panel.BRAIN_GRAPH_FEED_URL)
+
+    assert "const nodes = [];" in html
+    assert f'const feedUrl = "{panel.BRAIN_GRAPH_FEED_URL}";' in html
+    assert "function loadFeed" in html
+    # Deterministic: re-rendering gives identical bytes, so the file is not rewritten.
+    assert html == _render_interactive_html(nodes=[], edges=[], title="Shell", feed_url=panel.BRAIN_GRAPH_FEED_URL)
+
+
+def test_write_skipped_when_content_unchanged(tmp_path):
+    path = tmp_path / "www" / "panel.html"
+
+    assert _write_text_if_changed(path, "<html>a</html>") is True
+    mtime = path.stat().st_mtime_ns
+    assert _write_text_if_changed(path, "<html>a</html>") is False
+    assert path.stat().st_mtime_ns == mtime
+    assert _write_text_if_changed(path, "<html>b</html>") is True
+
+
+async def test_snapshot_cache_is_bounded_per_limit_pair():
+    feed = _feed(*[(GRAPH, None)] * (panel.FEED_MAX_SNAPSHOTS + 2))
+
+    await feed.async_snapshot(10, 10)
+    for n in range(panel.FEED_MAX_SNAPSHOTS):
+        await feed.async_snapshot(20 + n, 10)
+        await feed.async_snapshot(10, 10)
+
+    assert len(feed._snapshots) == panel.FEED_MAX_SNAPSHOTS
+    assert (10, 10) in feed._snapshots
+    assert (20, 10) not in feed._snapshots
+
+
+def test_feed_view_registered_once_and_follows_new_api():
+    hass = MagicMock()
+    hass.data = {}
+
+    first = panel.async_get_brain_graph_feed(hass, MagicMock(api="api-1"))
+    second = panel.async_get_brain_graph_feed(hass, MagicMock(api="api-2"))
+
+    assert first is second
+    assert second.api == "api-2"
+    hass.http.register_view.assert_called_once()
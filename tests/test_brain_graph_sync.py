@@ -113,6 +113,184 @@ class TestBrainGraphSync:
         assert url == "http://localhost:5000/api/v1/graph/snapshot.svg"
 
 
+class _Resp:
+    def __init__(self, status):
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _upload_session(statuses=None):
+    """Session whose post() records payloads; statuses are consumed in order (default 200)."""
+    session = MagicMock()
+    session.payloads = []
+    pending = list(statuses or [])
+
+    def _post(url, json=None):
+        session.payloads.append(json)
+        return _Resp(pending.pop(0) if pending else 200)
+
+    session.post = MagicMock(side_effect=_post)
+    return session
+
+
+def _state(value):
+    state = MagicMock()
+    state.state = value
+    state.last_changed = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return state
+
+
+class TestBatchedDiffUpload:
+    """Batched, diff-based uploads to /api/v1/graph/state."""
+
+    @pytest.fixture
+    def sync(self, brain_graph_sync, mock_hass):
+        brain_graph_sync._session = _upload_session()
+        lamp = _state("on")
+        with patch(
+            "custom_components.ai_home_copilot.brain_graph_sync.DomainFilter.get_entities_by_domain",
+            return_value={"light.living_room_lamp": lamp},
+        ):
+            yield brain_graph_sync
+
+    @pytest.mark.asyncio
+    async def test_initial_sync_is_one_request(self, sync):
+        await sync._sync_initial_graph()
+
+        assert sync._session.post.call_count == 1
+        payload = sync._session.payloads[0]
+        # area, device, entity, state
+        assert len(payload["nodes"]) == 4
+        # device->area, entity->device, entity->area, entity->state
+        assert len(payload["edges"]) == 4
+
+    @pytest.mark.asyncio
+    async def test_unchanged_resync_sends_nothing(self, sync):
+        await sync._sync_initial_graph()
+        await sync._sync_initial_graph()
+
+        assert sync._session.post.call_count == 1
+        assert sync.get_upload_stats()["skipped_unchanged"] == 8
+
+    @pytest.mark.asyncio
+    async def test_resync_sends_only_changed_node(self, sync, mock_registries):
+        await sync._sync_initial_graph()
+        area_reg, _, _ = mock_registries
+        area_reg.areas["living_room"].name = "Lounge"
+
+        await sync._sync_initial_graph()
+
+        assert sync._session.post.call_count == 2
+        payload = sync._session.payloads[1]
+        assert "edges" not in payload
+        assert [n["node_id"] for n in payload["nodes"]] == ["area:living_room"]
+        assert payload["nodes"][0]["properties"]["name"] == "Lounge"
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_is_resent(self, sync):
+        sync._session = _upload_session([503])
+
+        await sync._sync_initial_graph()
+        await sync._sync_initial_graph()
+
+        assert sync._session.post.call_count == 2
+        assert sync._session.payloads[0] == sync._session.payloads[1]
+        assert sync.get_upload_stats()["failed_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_uploads_are_chunked(self, sync):
+        with patch("custom_components.ai_home_copilot.brain_graph_sync.GRAPH_UPLOAD_MAX_ITEMS", 3):
+            await sync._sync_initial_graph()
+
+        sizes = [len(p.get("nodes", [])) + len(p.get("edges", [])) for p in sync._session.payloads]
+        assert sizes == [3, 3, 2]
+        # Nodes go out before edges so edge endpoints exist in Core.
+        assert "edges" not in sync._session.payloads[0]
+
+    @pytest.mark.asyncio
+    async def test_live_updates_coalesce_into_one_flush(self, sync):
+        sync._running = True
+        with patch("custom_components.ai_home_copilot.brain_graph_sync.async_call_later") as call_later:
+            for value in ("on", "off", "on"):
+                event = MagicMock()
+                event.data = {"entity_id": "light.living_room_lamp", "new_state": _state(value)}
+                event.time_fired = datetime.now(timezone.utc)
+                await sync._handle_state_changed(event)
+
+            assert call_later.call_count == 1
+            timer = call_later.call_args[0][2]
+            await timer(None)
+
+        assert sync._session.post.call_count == 1
+        node_ids = [n["node_id"] for n in sync._session.payloads[0]["nodes"]]
+        assert node_ids == [
+            "state:light.living_room_lamp:on",
+            "state:light.living_room_lamp:off",
+        ]
+
+
+    @pytest.mark.asyncio
+    async def test_resync_resends_everything_after_core_restart(self, sync):
+        sync._running = True
+        sync.get_graph_stats = AsyncMock(return_value={"nodes": 4, "edges": 4, "uptime_seconds": 600})
+        await sync.async_resync()
+        await sync.async_resync()
+        assert sync._session.post.call_count == 1
+
+        sync.get_graph_stats.return_value = {"nodes": 0, "edges": 0, "uptime_seconds": 5}
+        await sync.async_resync()
+
+        assert sync._session.post.call_count == 2
+        assert sync._session.payloads[1] == sync._session.payloads[0]
+        assert sync.get_upload_stats()["hash_resets"] == 1
+
+    @pytest.mark.asyncio
+    async def test_every_nth_resync_is_a_full_upload(self, sync):
+        sync._running = True
+        sync.get_graph_stats = AsyncMock(return_value=None)
+        with patch("custom_components.ai_home_copilot.brain_graph_sync.GRAPH_FULL_UPLOAD_EVERY", 3):
+            for _ in range(3):
+                await sync.async_resync()
+
+        assert sync._session.post.call_count == 2
+
+
+class TestProcessedEventDedupe:
+    """Processed-event dedupe keeps recent ids instead of resetting."""
+
+    def _event(self, entity_id, fired):
+        event = MagicMock()
+        event.data = {"entity_id": entity_id, "new_state": _state("on")}
+        event.time_fired = fired
+        return event
+
+    @pytest.mark.asyncio
+    async def test_duplicates_skipped_and_overflow_evicts_oldest(self, brain_graph_sync):
+        from custom_components.ai_home_copilot import brain_graph_sync as bgs_mod
+
+        sync = brain_graph_sync
+        sync._running = True
+        sync._processed_events = bgs_mod.ExpiringKeyIndex(ttl_seconds=60, max_size=3)
+        fired = datetime.now(timezone.utc)
+        with patch.object(sync, "_sync_entity_state", AsyncMock()) as sync_state, \
+                patch.object(sync, "_schedule_flush"):
+            for i in range(4):
+                await sync._handle_state_changed(self._event(f"light.l{i}", fired))
+            # l3 is still remembered after the overflow; l0 was evicted.
+            await sync._handle_state_changed(self._event("light.l3", fired))
+            await sync._handle_state_changed(self._event("light.l0", fired))
+
+        assert sync_state.await_count == 5
+        stats = sync.get_upload_stats()["dedupe"]
+        assert stats["hits"] == 1
+        assert stats["evicted"] == 2
+
+
 if __name__ == "__main__":
     # Simple test runner (no pytest dependency)
     print("Brain Graph Sync Tests")
@@ -0,0 +1,110 @@
+"""Tests for the conversation response cache."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.ai_home_copilot.conversation_cache import (
+    ConversationResponseCache,
+    is_follow_up,
+    is_question,
+    normalize_utterance,
+)
+from custom_components.ai_home_copilot.core.state_router import async_get_state_router
+
+
+def _state(entity_id: str, name: str) -> SimpleNamespace:
+    return SimpleNamespace(entity_id=entity_id, state="on", attributes={"friendly_name": name})
+
+
+def _hass(*states: SimpleNamespace) -> MagicMock:
+    hass = MagicMock()
+    hass.data = {}
+    by_id = {s.entity_id: s for s in states}
+    hass.states.async_all = lambda domain=None: list(states)
+    hass.states.get = by_id.get
+    return hass
+
+
+def _event(entity_id: str) -> SimpleNamespace:
+    state = SimpleNamespace(entity_id=entity_id, state="off", attributes={})
+    return SimpleNamespace(data={"entity_id": entity_id, "new_state": state, "old_state": None})
+
+
+def test_normalization_and_question_detection():
+    assert normalize_utterance("  Ist   jemand zuhause?! ") == "ist jemand zuhause"
+    assert normalize_utterance("What's the temperature?") == "whats the temperature"
+    assert is_question("ist jemand zuhause")
+    assert is_question("Temperatur im Wohnzimmer?")
+    assert not is_question("Mach das Licht im Flur an")
+
+
+def test_commands_get_no_key_and_context_is_part_of_the_key():
+    cache = ConversationResponseCache(_hass())
+
+    assert cache.key_for("Schalte das Licht an", "de", "ctx") is None
+    assert cache.key_for("Ist jemand zuhause?", "de", "ctx") == cache.key_for("ist jemand zuhause", "de", "ctx")
+    assert cache.key_for("Ist jemand zuhause?", "de", "ctx") != cache.key_for("Ist jemand zuhause?", "de", "ctx2")
+    assert cache.get_stats()["uncacheable"] == 1
+
+
+def test_polite_commands_and_imperatives_are_not_questions():
+    cache = ConversationResponseCache(_hass())
+
+    for text in (
+        "Kannst du das Licht im Flur anmachen?",
+        "Könntest du die Heizung aufdrehen?",
+        "Can you turn off the kitchen lights?",
+        "Could you lock the front door?",
+        "Schalte das Licht an?",
+        "Ist es zu warm, bitte lüften",
+        "Turn on the TV please",
+    ):
+        assert not is_question(text), text
+        assert cache.key_for(text, "de", "ctx") is None, text
+    assert cache.get_stats()["uncacheable"] == 7
+
+
+def test_follow_ups_depend_on_the_previous_turn_and_are_not_cached():
+    cache = ConversationResponseCache(_hass())
+
+    for text in ("Warum?", "Und im Bad?", "Wie lange?", "What about the garage?", "And upstairs?"):
+        assert is_follow_up(text), text
+        assert cache.key_for(text, "de", "ctx") is None, text
+    assert not is_follow_up("Wie warm ist es im Bad?")
+    assert cache.key_for("Wie warm ist es im Bad?", "de", "ctx") is not None
+
+
+def test_reply_is_dropped_when_a_mentioned_entity_changes():
+    hass = _hass(_state("person.andreas", "Andreas"), _state("sensor.wohnzimmer_temp", "Wohnzimmer Temperatur"))
+    router = async_get_state_router(hass)
+    cache = ConversationResponseCache(hass)
+    home = cache.key_for("Ist jemand zuhause?", "de", "ctx")
+    temp = cache.key_for("Wie warm ist es im Wohnzimmer?", "de", "ctx")
+
+    cache.store(home, "Ist jemand zuhause?", "Andreas ist zuhause.")
+    cache.store(temp, "Wie warm ist es im Wohnzimmer?", "sensor.wohnzimmer_temp meldet 21 °C.")
+    assert cache.get(home) == "Andreas ist zuhause."
+
+    router.dispatch(_event("light.kitchen"))
+    router.dispatch(_event("person.andreas"))
+
+    assert cache.get(home) is None
+    assert cache.get(temp) == "sensor.wohnzimmer_temp meldet 21 °C."
+    stats = cache.get_stats()
+    assert stats["invalidations"] == 1
+    assert stats["tracked_entities"] == 1
+    assert stats["hit_rate"] == round(2 / 3, 3)
+
+
+def test_cache_is_bounded_and_expires():
+    cache = ConversationResponseCache(_hass(), max_entries=2)
+    for q in ("wer ist a?", "wer ist b?", "wer ist c?"):
+        cache.store(cache.key_for(q, "de", ""), q, "x")
+    assert cache.get_stats()["entries"] == 2
+    assert cache.get(cache.key_for("wer ist a?", "de", "")) is None
+
+    cache.ttl_s = 0.0
+    key = cache.key_for("wer ist d?", "de", "")
+    cache.store(key, "wer ist d?", "x")
+    assert cache.get(key) is None
+    assert cache.get_stats()["expired"] == 1
+
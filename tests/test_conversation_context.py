@@ -294,3 +294,90 @@ class TestConversationContext:
 
         prompt = await async_build_system_prompt(hass, entry)
         assert len(prompt) <= 2000
+
+
+class TestPromptSectionCache:
+    """Tests for the per-entry prompt section cache."""
+
+    def _setup(self):
+        from custom_components.ai_home_copilot.core.state_router import async_get_state_router
+
+        person = MagicMock()
+        person.entity_id = "person.andreas"
+        person.state = "home"
+        person.attributes = {"friendly_name": "Andreas"}
+        hass = _make_hass_with_states([person])
+        hass.data = {"ai_home_copilot": {"test": {}}}
+        entry = MagicMock()
+        entry.entry_id = "test"
+        entry.options = {}
+        entry.data = {}
+        return hass, entry, person, async_get_state_router(hass)
+
+    @staticmethod
+    def _event(entity_id):
+        state = MagicMock()
+        state.entity_id = entity_id
+        state.attributes = {}
+        return MagicMock(data={"entity_id": entity_id, "new_state": state, "old_state": None})
+
+    @pytest.mark.asyncio
+    async def test_follow_up_turn_reuses_sections(self):
+        from custom_components.ai_home_copilot.conversation_context import (
+            PROMPT_SECTION_TTL_S,
+            async_build_system_prompt,
+        )
+
+        hass, entry, _, _ = self._setup()
+        first = await async_build_system_prompt(hass, entry)
+        second = await async_build_system_prompt(hass, entry)
+
+        assert first == second
+        stats = hass.data["ai_home_copilot"]["test"]["prompt_cache"].get_stats()
+        assert all(s["builds"] == 1 and s["hits"] == 1 for s in stats["sections"].values())
+        assert stats["hit_rate"] == 0.5
+        assert set(stats["sections"]) == set(PROMPT_SECTION_TTL_S)
+
+    @pytest.mark.asyncio
+    async def test_person_state_change_rebuilds_only_persons(self):
+        from custom_components.ai_home_copilot.conversation_context import async_build_system_prompt
+
+        hass, entry, person, router = self._setup()
+        assert "Andreas: zuhause" in await async_build_system_prompt(hass, entry)
+
+        person.state = "not_home"
+        router.dispatch(self._event("person.andreas"))
+        router.dispatch(self._event("light.kitchen"))
+        prompt = await async_build_system_prompt(hass, entry)
+
+        assert "Andreas: not_home" in prompt
+        sections = hass.data["ai_home_copilot"]["test"]["prompt_cache"].get_stats()["sections"]
+        assert sections["persons"]["builds"] == 2
+        assert sections["persons"]["invalidations"] == 1
+        assert sections["weather"]["builds"] == 1
+        assert sections["identity"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_section_is_rebuilt(self):
+        from custom_components.ai_home_copilot import conversation_context as ctx
+
+        hass, entry, _, _ = self._setup()
+        await ctx.async_build_system_prompt(hass, entry)
+        with patch.dict(ctx.PROMPT_SECTION_TTL_S, {"suggestions": 0.0}):
+            await ctx.async_build_system_prompt(hass, entry)
+
+        sections = hass.data["ai_home_copilot"]["test"]["prompt_cache"].get_stats()["sections"]
+        assert sections["suggestions"]["builds"] == 2
+        assert sections["analysis"]["builds"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_releases_router_subscriptions(self):
+        from custom_components.ai_home_copilot.conversation_context import async_build_system_prompt
+
+        hass, entry, _, router = self._setup()
+        await async_build_system_prompt(hass, entry)
+        assert any(name.startswith("prompt_cache") for name in router.get_stats()["subscribers"])
+
+        hass.data["ai_home_copilot"]["test"]["prompt_cache"].async_close()
+
+        assert not any(name.startswith("prompt_cache") for name in router.get_stats()["subscribers"])
@@ -0,0 +1,338 @@
+"""Tests for streamed chat completions (coordinator client + conversation agent)."""
+from __future__ import annotations
+
+from contextlib import nullcontext
+from dataclasses import dataclass
+import importlib
+import json
+import sys
+import types
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.ai_home_copilot import coordinator as coordinator_mod
+from custom_components.ai_home_copilot.coordinator import CopilotApiClient, CopilotApiError
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeContent:
+    def __init__(self, lines: list[bytes]) -> None:
+        self._lines = lines
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for line in self._lines:
+            yield line
+
+
+class _FakeResponse:
+    def __init__(self, *, status: int = 200, content_type: str = "text/event-stream",
+                 lines: list[bytes] | None = None, body: str = "") -> None:
+        self.status = status
+        self.headers = {"Content-Type": content_type}
+        self.content = _FakeContent(lines or [])
+        self._body = body
+
+    async def text(self) -> str:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+def _client(response: _FakeResponse) -> tuple[CopilotApiClient, MagicMock]:
+    session = MagicMock()
+    session.post = MagicMock(return_value=response)
+    return CopilotApiClient(session, base_urls=["http://core:8909"], token="t"), session
+
+
+def _sse(*chunks: Any) -> list[bytes]:
+    lines = []
+    for chunk in chunks:
+        data = chunk if isinstance(chunk, str) else json.dumps(chunk)
+        lines += [f"data: {data}\n".encode(), b"\n"]
+    return lines
+
+
+async def _collect(client: CopilotApiClient) -> list[str]:
+    return [t async for t in client.async_chat_completions_stream([{"role": "user", "content": "hi"}], "c1")]
+
+
+@pytest.fixture(autouse=True)
+def _real_client_error(monkeypatch):
+    # aiohttp is a MagicMock in tests; except clauses need a real class.
+    monkeypatch.setattr(coordinator_mod.aiohttp, "ClientError", type("ClientError", (Exception,), {}))
+
+
+# ---------------------------------------------------------------------------
+# Coordinator client
+# ---------------------------------------------------------------------------
+
+
+async def test_stream_yields_sse_deltas_until_done():
+    client, session = _client(_FakeResponse(lines=[b": keep-alive\n"] + _sse(
+        {"choices": [{"delta": {"role": "assistant"}}]},
+        {"choices": [{"delta": {"content": "Hal"}}]},
+        {"choices": [{"delta": {"content": "lo"}}]},
+        "[DONE]",
+        {"choices": [{"delta": {"content": "ignored"}}]},
+    )))
+
+    assert await _collect(client) == ["Hal", "lo"]
+    payload = session.post.call_args.kwargs["json"]
+    assert payload["stream"] is True
+    assert payload["conversation_id"] == "c1"
+
+
+async def test_stream_accepts_ndjson_lines():
+    client, _ = _client(_FakeResponse(content_type="application/x-ndjson", lines=[
+        b'{"message": {"content": "Guten "}, "done": false}\n',
+        b'{"message": {"content": "Tag"}, "done": true}\n',
+    ]))
+
+    assert await _collect(client) == ["Guten ", "Tag"]
+
+
+async def test_stream_falls_back_to_single_json_body():
+    body = json.dumps({"choices": [{"message": {"content": "Komplett"}}]})
+    client, _ = _client(_FakeResponse(content_type="application/json", body=body))
+
+    assert await _collect(client) == ["Komplett"]
+
+
+async def test_stream_http_error_raises_api_error():
+    client, _ = _client(_FakeResponse(status=404, body="not found"))
+
+    with pytest.raises(CopilotApiError, match="HTTP 404"):
+        await _collect(client)
+
+
+# ---------------------------------------------------------------------------
+# Conversation agent
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Input:
+    text: str
+    conversation_id: str | None = None
+    language: str | None = "de"
+    agent_id: str = "conversation.pilotsuite"
+
+
+@dataclass
+class _Result:
+    response: Any
+    conversation_id: str
+
+
+@pytest.fixture
+def conversation(monkeypatch):
+    """Import conversation.py against a minimal HA conversation component."""
+    conv = types.ModuleType("homeassistant.components.conversation")
+    conv.AbstractConversationAgent = type("AbstractConversationAgent", (), {})
+    conv.ConversationEntity = type(
+        "ConversationEntity",
+        (),
+        {"_attr_supports_streaming": False, "async_added_to_hass": AsyncMock()},
+    )
+    conv.ConversationInput = _Input
+    conv.ConversationResult = _Result
+
+    from custom_components.ai_home_copilot import conversation_context
+
+    monkeypatch.setattr(conversation_context, "async_build_system_prompt", AsyncMock(return_value=""))
+    with patch.dict(sys.modules, {"homeassistant.components.conversation": conv}):
+        sys.modules.pop("custom_components.ai_home_copilot.conversation", None)
+        module = importlib.import_module("custom_components.ai_home_copilot.conversation")
+        module.conv_stub = conv
+        yield module
+    sys.modules.pop("custom_components.ai_home_copilot.conversation", None)
+
+
+def _agent(module, api) -> Any:
+    from custom_components.ai_home_copilot.const import DOMAIN
+
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.entry_id = "e1"
+    hass.data = {DOMAIN: {"e1": {"coordinator": MagicMock(api=api)}}}
+    entry.data = {}
+    entry.options = {}
+    return module.StyxConversationEntity(hass, entry)
+
+
+def _api(*deltas: str, error: Exception | None = None) -> MagicMock:
+    api = MagicMock()
+
+    async def _stream(messages, conversation_id=None):
+        for text in deltas:
+            yield text
+        if error is not None:
+            raise error
+
+    api.async_chat_completions_stream = _stream
+    api.async_chat_completions = AsyncMock(return_value={"content": "blocking reply"})
+    return api
+
+
+def _speech(result) -> str:
+    return result.response.async_set_speech.call_args[0][0]
+
+
+async def test_agent_assembles_streamed_reply(conversation):
+    api = _api("Das Licht ", "ist an.")
+    result = await _agent(conversation, api).async_process(_Input(text="Licht?"))
+
+    assert _speech(result) == "Das Licht ist an."
+    api.async_chat_completions.assert_not_called()
+
+
+class _ChatLog:
+    conversation_id = "01HZZZZZZZZZZZZZZZZZZZZZZZ"
+
+    def __init__(self) -> None:
+        self.deltas: list[dict[str, Any]] = []
+
+    async def async_add_delta_content_stream(self, agent_id, stream):
+        async for delta in stream:
+            self.deltas.append(delta)
+            yield delta
+
+
+def test_agent_is_a_streaming_conversation_entity(conversation):
+    agent = _agent(conversation, _api())
+
+    assert isinstance(agent, conversation.conv_stub.ConversationEntity)
+    assert agent._attr_supports_streaming is True
+    assert agent._attr_unique_id == "e1_conversation"
+
+
+async def test_agent_moves_pipelines_off_the_legacy_entry_id(conversation, monkeypatch):
+    pipelines = [
+        types.SimpleNamespace(id="p1", conversation_engine="e1"),
+        types.SimpleNamespace(id="p2", conversation_engine="conversation.home_assistant"),
+    ]
+
+    async def _update(hass, pipeline, *, conversation_engine):
+        pipeline.conversation_engine = conversation_engine
+
+    assist = types.SimpleNamespace(
+        async_get_pipelines=lambda hass: pipelines, async_update_pipeline=_update
+    )
+    monkeypatch.setattr(sys.modules["homeassistant.components"], "assist_pipeline", assist)
+    agent = _agent(conversation, _api())
+    agent.entity_id = "conversation.pilotsuite"
+
+    await agent.async_added_to_hass()
+
+    assert [p.conversation_engine for p in pipelines] == [
+        "conversation.pilotsuite",
+        "conversation.home_assistant",
+    ]
+
+
+async def test_agent_streams_into_chat_log_handed_over_by_ha(conversation):
+    chat_log = _ChatLog()
+    result = await _agent(conversation, _api("Hal", "lo"))._async_handle_message(
+        _Input(text="Hi"), chat_log
+    )
+
+    assert chat_log.deltas == [{"role": "assistant", "content": "Hal"}, {"content": "lo"}]
+    assert _speech(result) == "Hallo"
+    assert result.conversation_id == _ChatLog.conversation_id
+
+
+async def test_agent_writes_blocking_fallback_as_the_only_assistant_turn(conversation):
+    chat_log = _ChatLog()
+    api = _api(error=CopilotApiError("HTTP 404 for http://core/v1/chat/completions: nope"))
+    result = await _agent(conversation, api)._async_handle_message(_Input(text="Hi"), chat_log)
+
+    assert chat_log.deltas == [{"role": "assistant", "content": "blocking reply"}]
+    assert _speech(result) == "blocking reply"
+
+
+async def test_agent_feeds_ha_chat_log_when_available(conversation, monkeypatch):
+    chat_log = _ChatLog()
+    conversation.conv_stub.async_get_chat_log = lambda hass, session, user_input: nullcontext(chat_log)
+    helpers = sys.modules["homeassistant.helpers"]
+    monkeypatch.setattr(
+        helpers,
+        "chat_session",
+        types.SimpleNamespace(async_get_chat_session=lambda hass, cid: nullcontext(object())),
+        raising=False,
+    )
+
+    result = await _agent(conversation, _api("Hal", "lo")).async_process(_Input(text="Hi"))
+
+    assert chat_log.deltas == [{"role": "assistant", "content": "Hal"}, {"content": "lo"}]
+    assert _speech(result) == "Hallo"
+
+
+async def test_agent_falls_back_when_core_does_not_stream(conversation):
+    api = _api(error=CopilotApiError("HTTP 404 for http://core/v1/chat/completions: nope"))
+    result = await _agent(conversation, api).async_process(_Input(text="Hi"))
+
+    assert _speech(result) == "blocking reply"
+    api.async_chat_completions.assert_awaited_once()
+
+
+async def test_agent_keeps_partial_reply_when_stream_breaks(conversation):
+    api = _api("Teil", error=CopilotApiError("Timeout calling http://core/v1/chat/completions"))
+    result = await _agent(conversation, api).async_process(_Input(text="Hi"))
+
+    assert _speech(result) == "Teil"
+    api.async_chat_completions.assert_not_called()
+
+
+async def test_agent_answers_repeated_question_from_cache(conversation):
+    api = _api("Niemand ist zuhause.")
+    agent = _agent(conversation, api)
+    calls = []
+    stream = api.async_chat_completions_stream
+
+    async def _counting(messages, conversation_id=None):
+        calls.append(messages[-1]["content"])
+        async for text in stream(messages, conversation_id):
+            yield text
+
+    api.async_chat_completions_stream = _counting
+
+    first = await agent.async_process(_Input(text="Ist jemand zuhause?"))
+    second = await agent.async_process(_Input(text="ist jemand zuhause"))
+    await agent.async_process(_Input(text="Mach das Licht an"))
+    await agent.async_process(_Input(text="Mach das Licht an"))
+
+    assert _speech(first) == _speech(second) == "Niemand ist zuhause."
+    assert calls == ["Ist jemand zuhause?", "Mach das Licht an", "Mach das Licht an"]
+
+
+async def test_agent_does_not_cache_reply_cut_off_mid_stream(conversation):
+    api = _api("Niemand ", error=CopilotApiError("Timeout calling http://core/v1/chat/completions"))
+    agent = _agent(conversation, api)
+    calls = []
+    stream = api.async_chat_completions_stream
+
+    async def _counting(messages, conversation_id=None):
+        calls.append(messages[-1]["content"])
+        async for text in stream(messages, conversation_id):
+            yield text
+
+    api.async_chat_completions_stream = _counting
+
+    first = await agent.async_process(_Input(text="Ist jemand zuhause?"))
+    await agent.async_process(_Input(text="Ist jemand zuhause?"))
+
+    assert _speech(first) == "Niemand "
+    assert calls == ["Ist jemand zuhause?", "Ist jemand zuhause?"]
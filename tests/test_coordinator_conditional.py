@@ -0,0 +1,284 @@
+"""Tests for conditional (ETag) and shared GETs in the coordinator API client."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.ai_home_copilot import coordinator as coordinator_mod
+from custom_components.ai_home_copilot.api import CopilotApiError
+from custom_components.ai_home_copilot.coordinator import (
+    CopilotApiClient,
+    CopilotDataUpdateCoordinator,
+)
+from custom_components.ai_home_copilot.entity import CopilotBaseEntity
+
+
+class _Resp:
+    def __init__(
+        self, status: int, body: str = "", etag: str | None = None, last_modified: str | None = None
+    ) -> None:
+        self.status = status
+        self.headers = {"Content-Type": "application/json"}
+        if etag:
+            self.headers["ETag"] = etag
+        if last_modified:
+            self.headers["Last-Modified"] = last_modified
+        self._body = body
+
+    async def text(self) -> str:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+@pytest.fixture(autouse=True)
+def _real_client_error(monkeypatch):
+    # aiohttp is a MagicMock in tests; except clauses need a real class.
+    monkeypatch.setattr(coordinator_mod.aiohttp, "ClientError", type("ClientError", (Exception,), {}))
+
+
+def _client(*responses: _Resp) -> tuple[CopilotApiClient, MagicMock]:
+    session = MagicMock()
+    session.request = MagicMock(side_effect=list(responses))
+    return CopilotApiClient(session, base_urls=["http://core:8909"], token="t"), session
+
+
+async def test_conditional_get_returns_body_and_etag():
+    client, session = _client(_Resp(200, '{"nodes": []}', etag='"v1"'))
+
+    data, etag = await client.async_get_conditional("/api/v1/graph/state", params={"limitNodes": 5})
+
+    assert data == {"nodes": []}
+    assert etag == '"v1"'
+    assert "If-None-Match" not in session.request.call_args.kwargs["headers"]
+
+
+async def test_conditional_get_not_modified():
+    client, session = _client(_Resp(304))
+
+    data, etag = await client.async_get_conditional("/api/v1/graph/state", etag='"v1"')
+
+    assert (data, etag) == (None, '"v1"')
+    assert session.request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+async def test_revalidated_get_reuses_body_on_304():
+    client, session = _client(
+        _Resp(200, '{"rules": 3}', etag='"r1"', last_modified="Wed, 14 Oct 2026 10:00:00 GMT"),
+        _Resp(304),
+    )
+
+    first = await client.async_get_revalidated("/api/v1/habitus/rules/summary")
+    second = await client.async_get_revalidated("/api/v1/habitus/rules/summary")
+
+    assert first == second == {"rules": 3}
+    headers = session.request.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"r1"'
+    assert headers["If-Modified-Since"] == "Wed, 14 Oct 2026 10:00:00 GMT"
+    assert client.get_revalidation_stats() == {"requests": 2, "not_modified": 1, "cached_paths": 1}
+
+
+# ---------------------------------------------------------------------------
+# Per-endpoint refresh schedule
+# ---------------------------------------------------------------------------
+
+
+class _CoreStub:
+    """Answers every GET with a per-path body and honours If-None-Match."""
+
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+        self.not_modified = 0
+        self.failing: set[str] = set()
+
+    def request(self, method, url, **kwargs):
+        path = url.split("8909", 1)[1]
+        self.paths.append(path)
+        if path in self.failing:
+            return _Resp(500, '{"error": "down"}')
+        etag = f'"{path}"'
+        if kwargs["headers"].get("If-None-Match") == etag:
+            self.not_modified += 1
+            return _Resp(304)
+        body = '{"ok": true, "version": "1.2.3", "mood": "relax", "confidence": 0.8}'
+        return _Resp(200, body, etag=etag)
+
+
+def _coordinator() -> tuple[object, _CoreStub]:
+    # DataUpdateCoordinator is a MagicMock in tests; run the real methods
+    # on a plain object instead.
+    harness = type("_Coordinator", (), {
+        k: v for k, v in vars(CopilotDataUpdateCoordinator).items() if not k.startswith("__")
+    })()
+    stub = _CoreStub()
+    session = MagicMock()
+    session.request = MagicMock(side_effect=stub.request)
+    harness.api = CopilotApiClient(session, base_urls=["http://core:8909"], token="t")
+    harness.hass = MagicMock(data={})
+    harness.data = None
+    harness._endpoint_due = {}
+    harness._poll_stats = {"ticks": 0, "fetched": 0, "skipped": 0, "failed": 0}
+    harness._push_endpoints = frozenset()
+    return harness, stub
+
+
+async def test_first_refresh_fetches_every_endpoint():
+    coordinator, stub = _coordinator()
+
+    data = await coordinator._async_refresh_due_endpoints()
+
+    assert data["version"] == "1.2.3"
+    assert data["dominant_mood"] == "relax"
+    assert {"capabilities", "brain_summary", "habitus_rules", "music_cloud", "zone_automation"} <= set(data)
+    assert "/api/v1/habitus/rules/summary" in stub.paths
+    assert coordinator.get_poll_stats()["fetched"] == len(coordinator_mod.ENDPOINT_REFRESH_S)
+
+
+async def test_only_due_endpoints_are_refetched():
+    coordinator, stub = _coordinator()
+    clock = [1000.0]
+    with patch.object(coordinator_mod.time, "monotonic", lambda: clock[0]):
+        coordinator.data = await coordinator._async_refresh_due_endpoints()
+        full = len(stub.paths)
+
+        stub.paths.clear()
+        clock[0] += coordinator_mod.COORDINATOR_TICK_S
+        coordinator.data = {**coordinator.data, "dominant_mood": "pushed"}
+        data = await coordinator._async_refresh_due_endpoints()
+        # Only the availability check runs every tick.
+        assert stub.paths == ["/health", "/version"]
+        assert data["dominant_mood"] == "pushed"  # webhook value survives
+        stub.paths.clear()
+
+        clock[0] += coordinator_mod.COORDINATOR_TICK_S
+        data = await coordinator._async_refresh_due_endpoints()
+
+    # Mood and neurons are due after 240 s; they and /version are unchanged.
+    assert sorted(stub.paths) == ["/api/v1/neurons", "/api/v1/neurons/mood", "/health", "/version"]
+    assert stub.not_modified == 4
+    assert data["dominant_mood"] == "relax"
+    assert full == 18  # health + version + 16 endpoint GETs
+
+
+async def test_failed_endpoint_keeps_last_value_and_retries_next_tick():
+    coordinator, stub = _coordinator()
+    clock = [1000.0]
+    with patch.object(coordinator_mod.time, "monotonic", lambda: clock[0]):
+        coordinator.data = await coordinator._async_refresh_due_endpoints()
+        before = coordinator.data["brain_summary"]
+
+        coordinator.mark_endpoints_due("brain_summary")
+        stub.failing.add("/api/v1/dashboard/brain-summary")
+        coordinator.data = await coordinator._async_refresh_due_endpoints()
+        assert coordinator.data["brain_summary"] == before
+        assert coordinator.get_poll_stats()["failed"] == 1
+
+        stub.failing.clear()
+        stub.paths.clear()
+        clock[0] += coordinator_mod.COORDINATOR_TICK_S
+        await coordinator._async_refresh_due_endpoints()
+
+    assert "/api/v1/dashboard/brain-summary" in stub.paths
+
+
+async def test_endpoint_failing_on_first_refresh_gets_fallback():
+    coordinator, stub = _coordinator()
+    stub.failing.add("/api/v1/neurons/mood")
+
+    data = await coordinator._async_refresh_due_endpoints()
+
+    assert data["mood"] == {"mood": "unknown", "confidence": 0.0}
+    assert data["dominant_mood"] == "unknown"
+
+
+async def test_mark_endpoints_due_forces_refetch():
+    coordinator, stub = _coordinator()
+    coordinator.data = await coordinator._async_refresh_due_endpoints()
+    stub.paths.clear()
+
+    coordinator.mark_endpoints_due("core_modules")
+    await coordinator._async_refresh_due_endpoints()
+
+    assert stub.paths == ["/api/v1/modules/"]
+
+
+async def test_push_covered_endpoints_are_not_polled():
+    coordinator, stub = _coordinator()
+    coordinator.data = await coordinator._async_refresh_due_endpoints()
+    coordinator.set_push_endpoints(("status", "mood", "neurons"))
+    coordinator.mark_endpoints_due()
+    stub.paths.clear()
+
+    await coordinator._async_refresh_due_endpoints()
+    assert not {"/health", "/api/v1/neurons/mood", "/api/v1/neurons"} & set(stub.paths)
+
+    coordinator.set_push_endpoints(())  # stream lost: back to polling at once
+    stub.paths.clear()
+    await coordinator._async_refresh_due_endpoints()
+    assert sorted(stub.paths) == ["/api/v1/neurons", "/api/v1/neurons/mood", "/health", "/version"]
+
+
+# ---------------------------------------------------------------------------
+# Single-flight shared GETs
+# ---------------------------------------------------------------------------
+
+
+class _SlowResp(_Resp):
+    def __init__(self, gate: asyncio.Event, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._gate = gate
+
+    async def text(self) -> str:
+        await self._gate.wait()
+        return await super().text()
+
+
+async def test_concurrent_shared_gets_make_one_request():
+    gate = asyncio.Event()
+    client, session = _client(_SlowResp(gate, 200, '{"ok": true, "persons_home": 2}'))
+
+    callers = [asyncio.create_task(client.async_get_shared("/api/v1/hub/presence")) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*callers)
+
+    assert session.request.call_count == 1
+    assert all(r == {"ok": True, "persons_home": 2} for r in results)
+    assert client.get_shared_stats()["coalesced"] == 4
+
+
+async def test_shared_get_cache_expires_after_ttl():
+    client, session = _client(_Resp(200, '{"v": 1}'), _Resp(200, '{"v": 2}'), _Resp(200, '{"v": 3}'))
+
+    assert await client.async_get_shared("api/v1/hub/light") == {"v": 1}
+    assert await client.async_get_shared("/api/v1/hub/light") == {"v": 1}
+    assert await client.async_get_shared("/api/v1/hub/media", ttl_s=0.0) == {"v": 2}
+    assert await client.async_get_shared("/api/v1/hub/media", ttl_s=0.0) == {"v": 3}
+
+    assert session.request.call_count == 3
+    assert client.get_shared_stats()["hits"] == 1
+
+
+async def test_shared_get_errors_are_not_cached():
+    client, session = _client(_Resp(503, "busy"), _Resp(200, '{"ok": true}'))
+
+    with pytest.raises(CopilotApiError, match="HTTP 503"):
+        await client.async_get_shared("/api/v1/hub/energy")
+    assert await client.async_get_shared("/api/v1/hub/energy") == {"ok": True}
+    assert client.get_shared_stats()["errors"] == 1
+
+
+async def test_entity_fetch_uses_shared_layer():
+    client, session = _client(_Resp(200, '{"ok": true}'))
+    entity = object.__new__(CopilotBaseEntity)
+    entity.coordinator = SimpleNamespace(api=client, _config={})
+
+    assert await entity._fetch("api/v1/hub/scenes") == {"ok": True}
+    assert await entity._fetch("/api/v1/hub/scenes") == {"ok": True}
+    assert session.request.call_count == 1
+    assert session.request.call_args.args[1] == "http://core:8909/api/v1/hub/scenes"
@@ -0,0 +1,150 @@
+"""Tests for hedged GETs across primary and failover Core hosts."""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.ai_home_copilot import coordinator as coordinator_mod
+from custom_components.ai_home_copilot.coordinator import CopilotApiClient
+
+PRIMARY = "http://a:8909"
+SECONDARY = "http://b:8909"
+TERTIARY = "http://c:8909"
+
+
+class _Resp:
+    def __init__(self, status: int, body: str, delay: float) -> None:
+        self.status = status
+        self.headers = {"Content-Type": "application/json"}
+        self._body = body
+        self._delay = delay
+
+    async def text(self) -> str:
+        return self._body
+
+    async def __aenter__(self):
+        await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+def _client(
+    hosts: dict[str, tuple[int, float]], base_urls: tuple[str, ...] = (PRIMARY, SECONDARY)
+) -> tuple[CopilotApiClient, list[str]]:
+    """``hosts``: base URL -> (status, delay_s)."""
+    calls: list[str] = []
+
+    def _request(method, url, **kwargs):
+        base = url.split("/api/")[0]
+        calls.append(base)
+        status, delay = hosts[base]
+        return _Resp(status, f'{{"host": "{base}"}}', delay)
+
+    session = MagicMock()
+    session.request = MagicMock(side_effect=_request)
+    return CopilotApiClient(session, base_urls=list(base_urls), token="t"), calls
+
+
+@pytest.fixture(autouse=True)
+def _fast_hedges(monkeypatch):
+    # aiohttp is a MagicMock in tests; except clauses need a real class.
+    monkeypatch.setattr(coordinator_mod.aiohttp, "ClientError", type("ClientError", (Exception,), {}))
+    monkeypatch.setattr(coordinator_mod, "HEDGE_DEFAULT_DELAY_S", 0.01)
+
+
+async def test_slow_primary_is_hedged_and_first_answer_wins():
+    client, calls = _client({PRIMARY: (200, 1.0), SECONDARY: (200, 0.0)})
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    data = await client.async_get("/api/v1/status")
+
+    assert data == {"host": SECONDARY}
+    assert loop.time() - started < 0.5
+    assert calls == [PRIMARY, SECONDARY]
+    stats = client.get_hedge_stats()
+    assert stats["hedged"] == 1
+    assert stats["secondary_wins"] == 1
+    # Slow is not broken: the primary stays active.
+    assert stats["active"] == PRIMARY
+    assert client.get_latency_stats()["endpoints"]["GET /api/v1/status"]["failovers"] == 1
+
+
+async def test_fast_primary_is_not_hedged():
+    client, calls = _client({PRIMARY: (200, 0.0), SECONDARY: (200, 0.0)})
+
+    assert await client.async_get("/api/v1/status") == {"host": PRIMARY}
+    assert calls == [PRIMARY]
+    assert client.get_hedge_stats()["hedged"] == 0
+
+
+async def test_failing_primary_fails_over_without_spending_a_hedge():
+    client, calls = _client({PRIMARY: (503, 0.0), SECONDARY: (200, 0.0)})
+    client._hedge_tokens = 0.0
+
+    assert await client.async_get("/api/v1/status") == {"host": SECONDARY}
+    stats = client.get_hedge_stats()
+    assert stats["hedged"] == 0
+    assert stats["active"] == SECONDARY
+    assert stats["hosts"][PRIMARY]["score"] < 1.0
+
+
+async def test_hedge_rate_is_capped():
+    client, calls = _client({PRIMARY: (200, 0.03), SECONDARY: (200, 0.0)})
+
+    with patch.object(coordinator_mod, "HEDGE_BURST", 2.0):
+        client._hedge_tokens = 2.0
+        for _ in range(5):
+            await client.async_get("/api/v1/status")
+
+    stats = client.get_hedge_stats()
+    assert stats["hedged"] == 2
+    assert stats["throttled"] == 3
+    assert calls.count(SECONDARY) == 2
+
+
+def test_hedge_delay_follows_primary_p95_and_unhealthy_primary_is_demoted():
+    client, _ = _client({})
+    assert client._hedge_delay(PRIMARY) == 0.01  # too few samples
+
+    health = client._host_health(PRIMARY)
+    for _ in range(coordinator_mod.HEDGE_MIN_SAMPLES):
+        health.record(0.2, True)
+    assert 0.2 <= client._hedge_delay(PRIMARY) <= 0.2 * 1.125
+
+    for _ in range(5):
+        health.record(0.0, False)
+    assert client._hedge_hosts() == [SECONDARY, PRIMARY]
+
+
+async def test_failures_walk_the_remaining_hosts_in_order():
+    hosts = {PRIMARY: (503, 0.0), SECONDARY: (503, 0.0), TERTIARY: (200, 0.0)}
+    client, calls = _client(hosts, base_urls=(PRIMARY, SECONDARY, TERTIARY))
+
+    assert await client.async_get("/api/v1/status") == {"host": TERTIARY}
+    assert calls == [PRIMARY, SECONDARY, TERTIARY]
+    stats = client.get_hedge_stats()
+    assert stats["hedged"] == 0
+    assert stats["active"] == TERTIARY
+    assert client.get_latency_stats()["endpoints"]["GET /api/v1/status"]["failovers"] == 2
+
+
+async def test_hedged_race_lost_by_both_hosts_falls_through_to_the_next():
+    hosts = {PRIMARY: (503, 0.05), SECONDARY: (503, 0.0), TERTIARY: (200, 0.0)}
+    client, calls = _client(hosts, base_urls=(PRIMARY, SECONDARY, TERTIARY))
+
+    assert await client.async_get("/api/v1/status") == {"host": TERTIARY}
+    # The third host is only asked once both racing hosts failed.
+    assert calls == [PRIMARY, SECONDARY, TERTIARY]
+    assert client.get_hedge_stats()["hedged"] == 1
+
+
+async def test_request_errors_do_not_walk_the_hosts():
+    hosts = {PRIMARY: (400, 0.0), SECONDARY: (200, 0.0), TERTIARY: (200, 0.0)}
+    client, calls = _client(hosts, base_urls=(PRIMARY, SECONDARY, TERTIARY))
+
+    with pytest.raises(coordinator_mod.CopilotApiError, match="HTTP 400"):
+        await client.async_get("/api/v1/status")
+    assert calls == [PRIMARY]
@@ -0,0 +1,116 @@
+"""Tests for per-endpoint latency histograms in the Core API client."""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.ai_home_copilot import coordinator as coordinator_mod
+from custom_components.ai_home_copilot.api import CopilotApiError
+from custom_components.ai_home_copilot.core import latency as latency_mod
+from custom_components.ai_home_copilot.core.latency import (
+    EndpointLatencyTracker,
+    LatencyHistogram,
+    path_template,
+)
+from custom_components.ai_home_copilot.coordinator import CopilotApiClient
+from custom_components.ai_home_copilot.systemhealth_entities import CoreApiLatencySensor
+
+
+class _Resp:
+    def __init__(self, status: int, body: str = "{}") -> None:
+        self.status = status
+        self.headers = {"Content-Type": "application/json"}
+        self._body = body
+
+    async def text(self) -> str:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+@pytest.fixture(autouse=True)
+def _real_client_error(monkeypatch):
+    # aiohttp is a MagicMock in tests; except clauses need a real class.
+    monkeypatch.setattr(coordinator_mod.aiohttp, "ClientError", type("ClientError", (Exception,), {}))
+
+
+def test_histogram_percentiles_within_bucket_error():
+    hist = LatencyHistogram()
+    for ms in range(1, 101):
+        hist.record(ms * 1000)
+
+    summary = hist.summary()
+    assert summary["count"] == 100
+    assert summary["max_ms"] == 100.0
+    assert 50.0 <= summary["p50_ms"] <= 50.0 * 1.125
+    assert 99.0 <= summary["p99_ms"] <= 100.0
+    assert len(hist.counts) == latency_mod._BUCKETS
+
+    hist.record(10 ** 9)  # beyond the last bucket: clamped, not grown
+    assert len(hist.counts) == latency_mod._BUCKETS
+    assert hist.counts[-1] == 1
+
+
+def test_paths_are_templated_and_endpoint_count_is_bounded():
+    assert path_template("/api/v1/graph/nodes/light.kitchen") == "/api/v1/graph/nodes/{id}"
+    assert path_template("/api/v1/vector/vectors/42") == "/api/v1/vector/vectors/{id}"
+    assert path_template("/api/v1/hub/snapshot") == "/api/v1/hub/snapshot"
+
+    tracker = EndpointLatencyTracker()
+    with patch.object(latency_mod, "LATENCY_MAX_ENDPOINTS", 2):
+        for name in ("a", "b", "c", "d"):
+            tracker.record("GET", f"/api/v1/{name}", 0.01, "2xx")
+
+    endpoints = tracker.get_stats()["endpoints"]
+    assert set(endpoints) == {"GET /api/v1/a", "GET /api/v1/b", "* {other}"}
+    assert endpoints["* {other}"]["count"] == 2
+
+
+async def test_request_json_records_outcomes_failovers_and_budget():
+    session = MagicMock()
+    session.request = MagicMock(side_effect=[
+        _Resp(200),
+        _Resp(503, "down"),
+        _Resp(200),
+        asyncio.TimeoutError(),
+        asyncio.TimeoutError(),
+        _Resp(404, "nope"),
+        _Resp(404, "nope"),
+    ])
+    client = CopilotApiClient(session, base_urls=["http://a:8909", "http://b:8909"], token="t")
+
+    await client.async_get("/api/v1/status")
+    await client.async_get("/api/v1/status")  # 503 on a, fails over to b
+    with pytest.raises(CopilotApiError):
+        await client.async_get("/api/v1/status")
+    with pytest.raises(CopilotApiError):
+        await client.async_get("/api/v1/graph/nodes/light.kitchen")
+
+    stats = client.get_latency_stats()
+    status = stats["endpoints"]["GET /api/v1/status"]
+    assert status["count"] == 3
+    assert status["outcomes"] == {"2xx": 2, "timeout": 1}
+    assert status["failovers"] == 2
+    assert status["error_rate"] == round(1 / 3, 4)
+    assert status["budget_remaining"] < 0
+    assert stats["endpoints"]["GET /api/v1/graph/nodes/{id}"]["outcomes"] == {"4xx": 1}
+    assert stats["overall"]["count"] == 4
+    assert stats["overall"]["errors"] == 1
+
+
+def test_latency_sensor_reports_p99_and_slowest_endpoints():
+    client = CopilotApiClient(MagicMock(), base_urls=["http://core:8909"], token="t")
+    client._latency.record("GET", "/api/v1/status", 0.005, "2xx")
+    client._latency.record("POST", "/api/v1/hub/snapshot", 0.250, "2xx")
+    sensor = CoreApiLatencySensor.__new__(CoreApiLatencySensor)
+    sensor.coordinator = MagicMock(api=client)
+
+    assert 250.0 <= sensor.native_value <= 250.0 * 1.125
+    attrs = sensor.extra_state_attributes
+    assert list(attrs["slowest"]) == ["POST /api/v1/hub/snapshot", "GET /api/v1/status"]
+    assert attrs["calls"] == 2
+    assert attrs["error_budget_remaining"] == 1.0
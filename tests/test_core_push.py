@@ -0,0 +1,167 @@
+"""Tests for the Core SSE push stream."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.ai_home_copilot import coordinator as coordinator_mod
+from custom_components.ai_home_copilot import core_push as push_mod
+from custom_components.ai_home_copilot.api import CopilotApiError
+from custom_components.ai_home_copilot.coordinator import CopilotApiClient
+from custom_components.ai_home_copilot.core_push import CorePushStream, PUSH_COVERED_ENDPOINTS
+
+
+class _FakeContent:
+    def __init__(self, lines: list[bytes]) -> None:
+        self._lines = lines
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for line in self._lines:
+            yield line
+
+
+class _FakeResponse:
+    def __init__(self, lines: list[bytes], status: int = 200) -> None:
+        self.status = status
+        self.headers = {"Content-Type": "text/event-stream"}
+        self.content = _FakeContent(lines)
+
+    async def text(self) -> str:
+        return "nope"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+@pytest.fixture(autouse=True)
+def _real_client_error(monkeypatch):
+    # aiohttp is a MagicMock in tests; except clauses need a real class.
+    monkeypatch.setattr(coordinator_mod.aiohttp, "ClientError", type("ClientError", (Exception,), {}))
+
+
+def _events(*events: tuple[str | None, str, str]):
+    async def _stream(path, *, last_event_id=None, idle_timeout_s=45.0):
+        for event in events:
+            yield event
+
+    return _stream
+
+
+class _Coordinator:
+    def __init__(self, events=()) -> None:
+        self.data = {"dominant_mood": "unknown", "version": "1.0"}
+        self.push_endpoints: list[tuple[str, ...]] = []
+        self.api = MagicMock()
+        self.api.async_stream_events = MagicMock(side_effect=_events(*events))
+        self.async_refresh = AsyncMock()
+        self.listener_updates = 0
+
+    def async_set_updated_data(self, data) -> None:
+        raise AssertionError("pushes must not reschedule the poll tick")
+
+    def async_update_listeners(self) -> None:
+        self.listener_updates += 1
+
+    def set_push_endpoints(self, keys) -> None:
+        self.push_endpoints.append(tuple(keys))
+
+
+async def test_client_parses_sse_events_and_keepalives():
+    session = MagicMock()
+    session.get = MagicMock(return_value=_FakeResponse([
+        b": ping\n",
+        b"id: 41\n", b"event: mood_changed\n", b'data: {"mood": "relax",\n', b'data: "confidence": 0.9}\n', b"\n",
+        b"event: resync\n", b"data:\n", b"\n",
+    ]))
+    client = CopilotApiClient(session, base_urls=["http://core:8909"], token="t")
+
+    events = [e async for e in client.async_stream_events("/api/v1/events/stream", last_event_id="40")]
+
+    assert events == [
+        (None, "keepalive", ""),
+        ("41", "mood_changed", '{"mood": "relax",\n"confidence": 0.9}'),
+        ("41", "resync", ""),
+    ]
+    assert session.get.call_args.kwargs["headers"]["Last-Event-ID"] == "40"
+
+
+async def test_stream_applies_events_and_covers_endpoints_while_up():
+    coordinator = _Coordinator([
+        (None, "keepalive", ""),
+        ("7", "mood_changed", '{"mood": "focus", "confidence": 0.7}'),
+        ("8", "state_delta", '{"brain_summary": {"nodes": 3}, "unknown": 1}'),
+        ("9", "mood_changed", "not json"),
+    ])
+    stream = CorePushStream(MagicMock(), coordinator)
+
+    await stream._consume()
+    assert coordinator.data["dominant_mood"] == "focus"
+    assert coordinator.data["brain_summary"] == {"nodes": 3}
+    assert "unknown" not in coordinator.data
+    assert coordinator.listener_updates == 2
+    assert coordinator.push_endpoints == [PUSH_COVERED_ENDPOINTS]
+    assert stream._resume_token == "9"
+
+    await stream.async_stop()
+    assert coordinator.push_endpoints[-1] == ()
+    stats = stream.get_stats()
+    assert (stats["events"], stats["keepalives"], stats["connects"], stats["disconnects"]) == (2, 1, 1, 1)
+
+
+async def test_resync_event_refreshes_coordinator():
+    coordinator = _Coordinator([("1", "resync", "")])
+    stream = CorePushStream(MagicMock(), coordinator)
+
+    await stream._consume()
+
+    coordinator.async_refresh.assert_awaited_once()
+    assert coordinator.push_endpoints == [PUSH_COVERED_ENDPOINTS, (), PUSH_COVERED_ENDPOINTS]
+
+
+async def test_reconnect_resumes_and_backs_off_when_unsupported():
+    coordinator = _Coordinator()
+    calls = []
+
+    def _open(path, *, last_event_id=None, idle_timeout_s=45.0):
+        calls.append(last_event_id)
+        if len(calls) == 1:
+            return _events(("5", "neuron_update", '{"neurons": {"a": 1}}'))(path)
+        raise CopilotApiError("HTTP 404 for http://core:8909/api/v1/events/stream: nope")
+
+    coordinator.api.async_stream_events = MagicMock(side_effect=_open)
+    sleeps = []
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) == 2:
+            raise asyncio.CancelledError
+
+    stream = CorePushStream(MagicMock(), coordinator)
+    with patch.object(push_mod.asyncio, "sleep", _sleep), pytest.raises(asyncio.CancelledError):
+        await stream._run()
+
+    assert calls == [None, "5"]
+    assert sleeps == [push_mod.PUSH_RECONNECT_MIN_S, push_mod.PUSH_UNSUPPORTED_RETRY_S]
+    assert coordinator.data["neurons"] == {"a": 1}
+    assert not stream.connected
+
+
+async def test_async_setup_runs_stream_as_entry_background_task():
+    coordinator = _Coordinator()
+    entry = MagicMock(entry_id="abc")
+    hass = MagicMock()
+
+    stream = push_mod.async_setup_core_push(hass, entry, coordinator)
+
+    entry.async_create_background_task.assert_called_once()
+    args = entry.async_create_background_task.call_args.args
+    assert args[0] is hass
+    assert args[2] == "pilotsuite_core_push_abc"
+    args[1].close()
+    assert stream._task is entry.async_create_background_task.return_value
@@ -0,0 +1,47 @@
+"""Tests for the Cross-Home client's state_changed subscription."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.ai_home_copilot.core.state_router import async_get_state_router
+from custom_components.ai_home_copilot.cross_home_sync import CrossHomeClient
+
+
+def _client(shared: list[str]) -> tuple[CrossHomeClient, MagicMock]:
+    hass = MagicMock()
+    hass.data = {}
+    client = CrossHomeClient(hass, "home-a", "Home A")
+    client._api_get = AsyncMock(
+        return_value={"entities": [{"entity_id": eid, "shared_with": ["home-b"]} for eid in shared]}
+    )
+    client._api_post = AsyncMock(return_value={})
+    return client, hass
+
+
+def _index_sizes(hass) -> dict[str, int]:
+    return async_get_state_router(hass).get_stats()["index_sizes"]
+
+
+async def test_nothing_shared_means_no_wildcard_subscription():
+    client, hass = _client([])
+    await client.async_initialize()
+
+    assert client._state_sub is None
+    assert _index_sizes(hass)["wildcard"] == 0
+
+
+async def test_subscription_follows_shared_set_and_ends_when_empty():
+    client, hass = _client(["light.kitchen"])
+    await client.async_initialize()
+    assert _index_sizes(hass)["entity_ids"] == 1
+
+    await client.async_share_entity("sensor.temp", "home-b")
+    assert _index_sizes(hass)["entity_ids"] == 2
+
+    await client.async_unshare_entity("light.kitchen", "home-b")
+    await client.async_unshare_entity("sensor.temp", "home-b")
+    assert client._state_sub is None
+    assert _index_sizes(hass) == {"entity_ids": 0, "domains": 0, "device_classes": 0, "wildcard": 0}
+
+    await client.async_share_entity("light.kitchen", "home-b")
+    assert _index_sizes(hass)["entity_ids"] == 1
+    assert _index_sizes(hass)["wildcard"] == 0
@@ -0,0 +1,110 @@
+"""Tests for the columnar/compressed events upload codec."""
+
+import json
+
+from custom_components.ai_home_copilot.core.event_codec import (
+    CONTENT_TYPE_COLUMNAR,
+    ENCODING_COLUMNAR,
+    LEGACY_ENCODING,
+    EventEncoding,
+    decode_columnar_batch,
+    decode_events_body,
+    encode_columnar_batch,
+    encode_events_body,
+    negotiate_event_encoding,
+)
+
+
+def _envelopes(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"state_changed:ctx{i}",
+            "ts": f"2026-01-01T00:00:{i:02d}+00:00",
+            "type": "state_changed",
+            "source": "home_assistant",
+            "entity_id": f"light.l{i % 3}",
+            "attributes": {
+                "domain": "light",
+                "zone_ids": ["kitchen"] if i % 2 else [],
+                "old_state": {"state": "off"},
+                "new_state": {"state": "on", "attributes": {"brightness": i * 10}},
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def test_columnar_roundtrip():
+    items = _envelopes(6)
+    assert decode_columnar_batch(encode_columnar_batch(items)) == items
+
+
+def test_columnar_interns_repeated_strings():
+    batch = encode_columnar_batch(_envelopes(6))
+
+    assert batch["encoding"] == ENCODING_COLUMNAR
+    assert batch["count"] == 6
+    source_idx = batch["strings"].index("home_assistant")
+    assert batch["columns"]["source"] == {"s": [source_idx] * 6}
+    # Unique timestamps and numbers are sent raw.
+    assert "r" in batch["columns"]["ts"]
+    assert "r" in batch["columns"]["attributes.new_state.attributes.brightness"]
+    assert batch["strings"].count("home_assistant") == 1
+
+
+def test_columnar_preserves_missing_keys_and_empty_dicts():
+    items = [
+        {"id": "a", "attributes": {"service": "turn_on", "data": {}}},
+        {"id": "b"},
+        {"id": "c", "attributes": {"service": "turn_on", "data": {}}},
+    ]
+    batch = encode_columnar_batch(items)
+
+    assert batch["columns"]["attributes.service"]["m"] == [1]
+    assert decode_columnar_batch(batch) == items
+
+
+def test_columnar_escapes_dotted_keys():
+    items = [
+        {"id": "a", "attributes": {"new_state": {"attributes": {"hvac.mode": "heat", "a\\b": 1, "x": {"y": 2}}}}},
+        {"id": "b", "attributes": {"new_state": {"attributes": {"hvac.mode": "heat"}}}},
+    ]
+    batch = encode_columnar_batch(items)
+
+    assert "attributes.new_state.attributes.hvac\\.mode" in batch["columns"]
+    assert decode_columnar_batch(batch) == items
+
+
+def test_gzip_body_roundtrip():
+    payload = {"items": _envelopes(20)}
+    encoding = EventEncoding(batch=ENCODING_COLUMNAR, content_encoding="gzip")
+
+    body, headers = encode_events_body(payload, "items", encoding)
+
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Content-Type"] == CONTENT_TYPE_COLUMNAR
+    assert len(body) < len(json.dumps(payload).encode("utf-8"))
+    assert decode_events_body(body, headers, "items") == payload
+
+
+def test_legacy_body_is_plain_json():
+    payload = {"events": _envelopes(2)}
+
+    body, headers = encode_events_body(payload, "events", LEGACY_ENCODING)
+
+    assert "Content-Encoding" not in headers
+    assert json.loads(body) == payload
+
+
+def test_negotiate_event_encoding():
+    assert negotiate_event_encoding(None) == LEGACY_ENCODING
+    assert negotiate_event_encoding({"ok": True}) == LEGACY_ENCODING
+
+    nested = negotiate_event_encoding(
+        {"events": {"encodings": ["columnar-v1"], "content_encodings": ["gzip"]}}
+    )
+    assert nested == EventEncoding(batch=ENCODING_COLUMNAR, content_encoding="gzip")
+
+    flat = negotiate_event_encoding({"event_content_encodings": ["gzip"]})
+    assert flat == EventEncoding(batch="json", content_encoding="gzip")
+    assert not flat.is_legacy
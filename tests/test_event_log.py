@@ -0,0 +1,158 @@
+"""Tests for the segmented append-only events forwarder queue log."""
+
+import json
+import os
+
+from custom_components.ai_home_copilot.core.event_log import SegmentedEventLog
+
+
+def _items(start: int, count: int) -> list[dict]:
+    return [{"id": f"state_changed:{i}", "entity_id": f"light.l{i}"} for i in range(start, start + count)]
+
+
+def _flush(log: SegmentedEventLog) -> None:
+    log.write(*log.take_pending())
+
+
+def _segments(path) -> list[str]:
+    return sorted(n for n in os.listdir(path) if n.startswith("seg-"))
+
+
+def test_append_and_replay_roundtrip(tmp_path):
+    log = SegmentedEventLog(str(tmp_path), segment_max_records=4)
+    for item in _items(0, 10):
+        log.append(item)
+    _flush(log)
+
+    assert _segments(tmp_path) == ["seg-00000001.jsonl", "seg-00000002.jsonl", "seg-00000003.jsonl"]
+
+    replayed = SegmentedEventLog(str(tmp_path), segment_max_records=4).replay()
+    assert replayed == _items(0, 10)
+
+
+def test_write_only_appends_new_records(tmp_path):
+    log = SegmentedEventLog(str(tmp_path), segment_max_records=100)
+    for item in _items(0, 5):
+        log.append(item)
+    _flush(log)
+    for item in _items(5, 2):
+        log.append(item)
+    records, _ = log.take_pending()
+    assert [seq for seq, _ in records] == [6, 7]
+    log.write(records, 0)
+
+    assert log.stats()["appended_total"] == 7
+    assert SegmentedEventLog(str(tmp_path)).replay() == _items(0, 7)
+
+
+def test_ack_truncates_sealed_segments(tmp_path):
+    log = SegmentedEventLog(str(tmp_path), segment_max_records=4)
+    for item in _items(0, 10):
+        log.append(item)
+    _flush(log)
+
+    log.ack(5)
+    _flush(log)
+
+    # Segment 1 (seq 1-4) is fully acked and sealed -> removed.
+    assert _segments(tmp_path) == ["seg-00000002.jsonl", "seg-00000003.jsonl"]
+    assert log.stats()["truncated_segments_total"] == 1
+    assert SegmentedEventLog(str(tmp_path), segment_max_records=4).replay() == _items(5, 5)
+
+
+def test_replay_skips_torn_tail_line(tmp_path):
+    log = SegmentedEventLog(str(tmp_path))
+    for item in _items(0, 3):
+        log.append(item)
+    _flush(log)
+
+    with open(tmp_path / "seg-00000001.jsonl", "a", encoding="utf-8") as fh:
+        fh.write('{"s": 4, "e": {"id": "tor')
+
+    fresh = SegmentedEventLog(str(tmp_path))
+    assert fresh.replay() == _items(0, 3)
+    assert fresh.stats()["corrupt_records_total"] == 1
+
+    # New appends continue after the last intact sequence number.
+    assert fresh.append({"id": "next"}) == 4
+
+
+def test_append_after_torn_tail_starts_on_fresh_line(tmp_path):
+    log = SegmentedEventLog(str(tmp_path))
+    for item in _items(0, 3):
+        log.append(item)
+    _flush(log)
+
+    with open(tmp_path / "seg-00000001.jsonl", "ab") as fh:
+        fh.write('{"s":4,"e":{"id":"t\u00f6'.encode("utf-8")[:-1])
+
+    fresh = SegmentedEventLog(str(tmp_path))
+    assert fresh.replay() == _items(0, 3)
+    fresh.append({"id": "new1"})
+    fresh.append({"id": "new2"})
+    _flush(fresh)
+
+    again = SegmentedEventLog(str(tmp_path))
+    assert again.replay() == _items(0, 3) + [{"id": "new1"}, {"id": "new2"}]
+    assert again.stats()["corrupt_records_total"] == 0
+
+
+def test_skip_unreplayed_does_not_reuse_sequence_numbers(tmp_path):
+    log = SegmentedEventLog(str(tmp_path))
+    for item in _items(0, 3):
+        log.append(item)
+    _flush(log)
+
+    # replay() failed: start numbering after what is on disk.
+    fresh = SegmentedEventLog(str(tmp_path))
+    fresh.skip_unreplayed()
+    assert fresh.append({"id": "new"}) == 4
+    fresh.ack(0)
+    _flush(fresh)
+
+    assert _segments(tmp_path)[-1] == "seg-00000002.jsonl"
+    assert SegmentedEventLog(str(tmp_path)).replay() == [{"id": "new"}]
+
+
+def test_replay_without_checkpoint_uses_all_segments(tmp_path):
+    log = SegmentedEventLog(str(tmp_path))
+    for item in _items(0, 3):
+        log.append(item)
+    _flush(log)
+    os.remove(tmp_path / "checkpoint.json")
+
+    assert SegmentedEventLog(str(tmp_path)).replay() == _items(0, 3)
+
+
+def test_replay_ignores_duplicate_sequence_after_retry(tmp_path):
+    log = SegmentedEventLog(str(tmp_path))
+    log.append({"id": "a"})
+    records, acked = log.take_pending()
+    log.write(records, acked)
+    # Simulate a retried append of the same records (e.g. fsync error after write).
+    log.write(records, acked)
+
+    assert SegmentedEventLog(str(tmp_path)).replay() == [{"id": "a"}]
+
+
+def test_reset_migrates_legacy_queue(tmp_path):
+    log = SegmentedEventLog(str(tmp_path))
+    log.replay()
+    log.reset(_items(0, 3))
+
+    assert not log.dirty
+    with open(tmp_path / "checkpoint.json", encoding="utf-8") as fh:
+        checkpoint = json.load(fh)
+    assert checkpoint["last_seq"] == 3
+    assert SegmentedEventLog(str(tmp_path)).replay() == _items(0, 3)
+
+
+def test_restage_keeps_order_after_failed_write(tmp_path):
+    log = SegmentedEventLog(str(tmp_path))
+    log.append({"id": "a"})
+    records, _ = log.take_pending()
+    log.append({"id": "b"})
+    log.restage(records)
+
+    records, _ = log.take_pending()
+    assert [item["id"] for _, item in records] == ["a", "b"]
@@ -0,0 +1,405 @@
+"""EventsForwarderModule driven end to end against a stubbed Core API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+import uuid
+
+import pytest
+
+from custom_components.ai_home_copilot.const import (
+    CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING,
+    CONF_EVENTS_FORWARDER_ADDITIONAL_ENTITIES,
+    CONF_EVENTS_FORWARDER_ENABLED,
+    CONF_EVENTS_FORWARDER_FLUSH_INTERVAL_SECONDS,
+    CONF_EVENTS_FORWARDER_FORWARD_CALL_SERVICE,
+    CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES,
+    CONF_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS,
+    CONF_EVENTS_FORWARDER_MAX_BATCH,
+    CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT,
+    CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS,
+    CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED,
+    CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS,
+    CONF_EVENTS_FORWARDER_PRIORITY_RULES,
+    DOMAIN,
+)
+from custom_components.ai_home_copilot.api import CopilotApiError
+from custom_components.ai_home_copilot.core.event_log import SegmentedEventLog
+from custom_components.ai_home_copilot.core.module import ModuleContext
+from custom_components.ai_home_copilot.core.modules import events_forwarder
+
+ENTITIES = [f"light.l{i}" for i in range(20)] + ["person.anna"]
+
+
+class StubApi:
+    """Records POSTs; each call waits for the test to resolve it."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self._gates: list[asyncio.Future] = []
+
+    async def async_get(self, path: str) -> dict[str, Any]:
+        return {"ok": True}
+
+    async def async_post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        gate = asyncio.get_running_loop().create_future()
+        self.calls.append(payload)
+        self._gates.append(gate)
+        await gate
+        return {"ok": True}
+
+    def resolve(self, index: int, error: Exception | None = None) -> None:
+        gate = self._gates[index]
+        if error is None:
+            gate.set_result(None)
+        else:
+            gate.set_exception(error)
+
+    def seqs(self) -> list[int]:
+        return [call["batch_seq"] for call in self.calls]
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.listeners: list = []
+
+    def async_listen(self, event_type, listener):
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+
+def _hass(tmp_path) -> SimpleNamespace:
+    loop = asyncio.get_running_loop()
+    return SimpleNamespace(
+        loop=loop,
+        data={},
+        bus=_Bus(),
+        states=SimpleNamespace(get=lambda entity_id: None),
+        config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))),
+        async_create_task=lambda coro, *args, **kwargs: loop.create_task(coro),
+        async_add_executor_job=lambda fn, *args: loop.run_in_executor(None, fn, *args),
+    )
+
+
+def _track_state_change_event(hass, entity_ids, action):
+    return hass.bus.async_listen("state_changed", action)
+
+
+def _call_later(hass, delay, action):
+    return hass.loop.call_later(float(delay), action, None).cancel
+
+
+async def _no_capabilities(hass, entry, *, api):
+    return SimpleNamespace(supported=True, data={})
+
+
+class _MemoryStore:
+    def __init__(self, *args, **kwargs) -> None:
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data) -> None:
+        self.data = data
+
+
+class _BrokenStore(_MemoryStore):
+    async def async_load(self):
+        raise ValueError("corrupt store file")
+
+
+@pytest.fixture
+def patched(monkeypatch):
+    monkeypatch.setattr(events_forwarder, "async_call_later", _call_later)
+    monkeypatch.setattr(events_forwarder, "async_track_state_change_event", _track_state_change_event)
+    monkeypatch.setattr(events_forwarder, "async_dispatcher_connect", lambda *args: (lambda: None))
+    monkeypatch.setattr(events_forwarder, "async_fetch_core_capabilities", _no_capabilities)
+    monkeypatch.setattr(events_forwarder, "Store", _MemoryStore)
+
+
+async def _start(tmp_path, **options: Any):
+    hass = _hass(tmp_path)
+    api = StubApi()
+    entry = SimpleNamespace(
+        entry_id="test",
+        domain=DOMAIN,
+        data={
+            CONF_EVENTS_FORWARDER_ENABLED: True,
+            CONF_EVENTS_FORWARDER_INCLUDE_HABITUS_ZONES: False,
+            CONF_EVENTS_FORWARDER_INCLUDE_MEDIA_PLAYERS: False,
+            CONF_EVENTS_FORWARDER_ADDITIONAL_ENTITIES: ENTITIES,
+            CONF_EVENTS_FORWARDER_FORWARD_CALL_SERVICE: False,
+            CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED: False,
+            CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING: False,
+            CONF_EVENTS_FORWARDER_FLUSH_INTERVAL_SECONDS: 60,
+        },
+        options=options,
+    )
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": SimpleNamespace(api=api)}
+    await events_forwarder.EventsForwarderModule().async_setup_entry(ModuleContext(hass=hass, entry=entry))
+    data = hass.data[DOMAIN][entry.entry_id]
+    return hass, api, data, data["events_forwarder_state"]
+
+
+def _fire(hass, entity_id: str, state: str) -> None:
+    event = SimpleNamespace(
+        data={
+            "entity_id": entity_id,
+            "old_state": SimpleNamespace(state="old", attributes={}),
+            "new_state": SimpleNamespace(state=state, attributes={}),
+        },
+        context=SimpleNamespace(id=uuid.uuid4().hex),
+    )
+    for listener in list(hass.bus.listeners):
+        listener(event)
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def _wait_for_calls(api: StubApi, count: int) -> None:
+    for _ in range(200):
+        if len(api.calls) >= count:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"expected {count} POSTs, got {api.seqs()}")
+
+
+def _states(call: dict[str, Any]) -> list[str]:
+    return [item["attributes"]["new_state"] for item in call["items"]]
+
+
+_PIPELINED = {
+    CONF_EVENTS_FORWARDER_MAX_BATCH: 2,
+    CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT: 3,
+    CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED: True,
+}
+
+
+async def test_min_flush_delay_comes_from_options(tmp_path, patched):
+    hass, api, data, st = await _start(
+        tmp_path,
+        **{CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING: True, CONF_EVENTS_FORWARDER_MIN_FLUSH_DELAY_MS: 1500},
+    )
+    try:
+        assert st.batch_ctl is not None
+        assert st.batch_ctl.min_delay == 1.5
+        assert data["events_forwarder_adaptive"]["bounds"]["min_delay_s"] == 1.5
+    finally:
+        data["unsub_events_forwarder"]()
+
+
+async def test_min_flush_delay_defaults_to_quarter_second(tmp_path, patched):
+    hass, api, data, st = await _start(tmp_path, **{CONF_EVENTS_FORWARDER_ADAPTIVE_BATCHING: True})
+    try:
+        assert st.batch_ctl.min_delay == 0.25
+    finally:
+        data["unsub_events_forwarder"]()
+
+
+async def test_out_of_order_completions_ack_contiguous_prefix(tmp_path, patched):
+    hass, api, data, st = await _start(tmp_path, **_PIPELINED)
+    try:
+        for i in range(6):
+            _fire(hass, f"light.l{i}", f"s{i}")
+        await _wait_for_calls(api, 3)
+        assert api.seqs() == [1, 2, 3]
+        assert st.pipeline.in_flight == 3
+
+        api.resolve(2)
+        await _settle()
+        assert st.sent_total == 2
+        assert st.event_log.stats()["acked_seq"] == 0
+
+        api.resolve(0)
+        await _settle()
+        assert st.event_log.stats()["acked_seq"] == 2
+
+        api.resolve(1)
+        await _settle()
+        assert st.sent_total == 6
+        assert st.event_log.stats()["acked_seq"] == 6
+        assert st.pipeline.pending() == 0
+    finally:
+        data["unsub_events_forwarder"]()
+
+
+async def test_failed_middle_batch_is_retried_with_its_sequence(tmp_path, patched):
+    hass, api, data, st = await _start(tmp_path, **_PIPELINED)
+    st.backoff_base_delay = 0.005
+    try:
+        for i in range(6):
+            _fire(hass, f"light.l{i}", f"s{i}")
+        await _wait_for_calls(api, 3)
+
+        api.resolve(0)
+        api.resolve(1, CopilotApiError("HTTP 503 for /api/v1/events: unavailable"))
+        api.resolve(2)
+        await _settle()
+        assert st.error_total == 1
+        # Batch 3 is delivered but not acked past the failed batch 2.
+        assert st.event_log.stats()["acked_seq"] == 2
+
+        await _wait_for_calls(api, 4)
+        assert api.seqs()[3] == 2
+        assert _states(api.calls[3]) == ["s2", "s3"]
+
+        api.resolve(3)
+        await _settle()
+        assert st.sent_total == 6
+        assert st.error_streak == 0
+        assert st.event_log.stats()["acked_seq"] == 6
+    finally:
+        data["unsub_events_forwarder"]()
+
+
+async def test_rate_limited_batch_backs_off_and_retries(tmp_path, patched):
+    hass, api, data, st = await _start(tmp_path, **_PIPELINED)
+    st.backoff_base_delay = 0.01
+    try:
+        _fire(hass, "light.l0", "a")
+        _fire(hass, "light.l1", "b")
+        await _wait_for_calls(api, 1)
+
+        api.resolve(0, CopilotApiError("HTTP 429 for /api/v1/events: too many requests"))
+        await _settle()
+        assert st.backoff_level == 1
+        assert st.retry_not_before > 0
+        # Events arriving during the backoff wait behind the parked batch.
+        _fire(hass, "light.l2", "c")
+        _fire(hass, "light.l3", "d")
+        await _settle()
+        assert len(api.calls) == 1
+
+        await _wait_for_calls(api, 2)
+        assert api.seqs()[1] == 1
+        assert _states(api.calls[1]) == ["a", "b"]
+        # Probing: one batch at a time until the retry succeeds.
+        await _settle()
+        assert len(api.calls) == 2
+
+        api.resolve(1)
+        await _wait_for_calls(api, 3)
+        assert _states(api.calls[2]) == ["c", "d"]
+        assert st.backoff_level == 0
+        api.resolve(2)
+        await _settle()
+        assert st.sent_total == 4
+    finally:
+        data["unsub_events_forwarder"]()
+
+
+async def test_priority_event_preempts_queued_bulk(tmp_path, patched):
+    hass, api, data, st = await _start(
+        tmp_path,
+        **{
+            CONF_EVENTS_FORWARDER_MAX_BATCH: 2,
+            CONF_EVENTS_FORWARDER_MAX_IN_FLIGHT: 1,
+            CONF_EVENTS_FORWARDER_PRIORITY_RULES: "person",
+            CONF_EVENTS_FORWARDER_PRIORITY_FLUSH_INTERVAL_MS: 0,
+        },
+    )
+    try:
+        for i in range(4):
+            _fire(hass, f"light.l{i}", f"s{i}")
+        await _wait_for_calls(api, 1)
+        # Window is full: the second bulk batch waits.
+        await _settle()
+        assert len(api.calls) == 1
+
+        _fire(hass, "person.anna", "home")
+        await _wait_for_calls(api, 2)
+        assert api.calls[1]["items"][0]["entity_id"] == "person.anna"
+        assert st.pipeline.in_flight == 2
+
+        api.resolve(1)
+        await _settle()
+        assert st.pipeline.lane_stats("high")["delivered_total"] == 1
+        api.resolve(0)
+        await _wait_for_calls(api, 3)
+        assert _states(api.calls[2]) == ["s2", "s3"]
+        api.resolve(2)
+        await _settle()
+        assert st.sent_total == 5
+    finally:
+        data["unsub_events_forwarder"]()
+
+
+async def test_store_load_failure_still_replays_segment_log(tmp_path, patched, monkeypatch):
+    monkeypatch.setattr(events_forwarder, "Store", _BrokenStore)
+    log_dir = events_forwarder._event_log_dir(_hass(tmp_path), "test")
+    previous = SegmentedEventLog(log_dir)
+    for i in range(3):
+        previous.append({"id": f"state_changed:old{i}", "entity_id": f"light.l{i}"})
+    previous.write(*previous.take_pending())
+
+    hass, api, data, st = await _start(tmp_path, **_PIPELINED)
+    try:
+        assert st.event_log.stats()["last_seq"] == 3
+        await _wait_for_calls(api, 1)
+        assert [item["id"] for item in api.calls[0]["items"]] == ["state_changed:old0", "state_changed:old1"]
+
+        _fire(hass, "light.l5", "new")
+        await _settle()
+        # New appends continue after the replayed records instead of restarting at 1.
+        assert st.event_log.stats()["last_seq"] == 4
+    finally:
+        data["unsub_events_forwarder"]()
+
+
+async def test_overlapping_persist_saves_write_the_log_one_at_a_time(tmp_path, patched, monkeypatch):
+    persist_timers = []
+
+    def _call_later_capturing_persist(hass, delay, action):
+        if getattr(action, "__name__", "") == "_persist_timer":
+            persist_timers.append(action)
+            return lambda: None
+        return _call_later(hass, delay, action)
+
+    monkeypatch.setattr(events_forwarder, "async_call_later", _call_later_capturing_persist)
+    hass, api, data, st = await _start(
+        tmp_path, **{CONF_EVENTS_FORWARDER_PERSISTENT_QUEUE_ENABLED: True}
+    )
+    write = st.event_log.write
+    active = 0
+    peak = 0
+    writes = []
+
+    def _slow_write(records, acked_seq):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            time.sleep(0.05)
+            write(records, acked_seq)
+            writes.append([seq for seq, _ in records])
+        finally:
+            active -= 1
+
+    st.event_log.write = _slow_write
+    try:
+        _fire(hass, "light.l0", "a")
+        persist_timers.pop()(None)
+        await asyncio.sleep(0.01)
+        # The first save is still in the executor when the next one starts.
+        _fire(hass, "light.l1", "b")
+        persist_timers.pop()(None)
+        for _ in range(50):
+            if len(writes) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert writes == [[1], [2]]
+        assert peak == 1
+        assert [item["entity_id"] for item in SegmentedEventLog(events_forwarder._event_log_dir(hass, "test")).replay()] == [
+            "light.l0",
+            "light.l1",
+        ]
+    finally:
+        data["unsub_events_forwarder"]()
@@ -0,0 +1,66 @@
+"""Tests for the shared forwarder idempotency index (ExpiringKeyIndex)."""
+
+import time
+
+from custom_components.ai_home_copilot.core.performance import ExpiringKeyIndex
+
+
+def test_add_reports_new_and_duplicate_keys():
+    index = ExpiringKeyIndex(ttl_seconds=60)
+    assert index.add("state_changed:a", now=100.0) is True
+    assert index.add("state_changed:a", now=101.0) is False
+    assert index.add("state_changed:b", now=101.0) is True
+
+    stats = index.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_keys_expire_in_insertion_order():
+    index = ExpiringKeyIndex(ttl_seconds=10)
+    index.add("a", now=0.0)
+    index.add("b", now=5.0)
+
+    assert index.expire(now=12.0) == 1
+    assert len(index) == 1
+    # "a" expired, so it is new again; "b" is still live.
+    assert index.add("a", now=12.0) is True
+    assert index.add("b", now=12.0) is False
+    assert index.get_stats()["expired"] == 1
+
+
+def test_hard_cap_evicts_oldest():
+    index = ExpiringKeyIndex(ttl_seconds=3600, max_size=3)
+    for i in range(5):
+        index.add(f"k{i}", now=float(i))
+
+    assert len(index) == 3
+    assert index.get_stats()["evicted"] == 2
+    assert index.add("k0", now=5.0) is True
+    assert index.add("k4", now=5.0) is False
+
+
+def test_persistence_roundtrip_skips_expired_and_invalid():
+    now = time.time()
+    index = ExpiringKeyIndex(ttl_seconds=60)
+    index.load({"live": now + 30, "old": now - 1, "": now + 30, "bad": "x"})
+
+    assert "live" in index
+    assert "old" not in index
+    assert len(index) == 1
+
+    restored = ExpiringKeyIndex(ttl_seconds=60)
+    restored.load(index.to_dict())
+    assert restored.add("live") is False
+
+
+def test_expired_key_restored_behind_a_live_one_is_new_again():
+    now = time.time()
+    index = ExpiringKeyIndex(ttl_seconds=600)
+    index.add("state_changed:live", now=now)
+    # Persisted under a shorter TTL: expires long before the live key.
+    index.load({"state_changed:old": now + 5})
+
+    assert index.add("state_changed:old", now=now + 10) is True
+    assert index.add("state_changed:old", now=now + 11) is False
+    assert index.expire(now + 611) == 2
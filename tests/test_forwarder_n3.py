@@ -68,6 +68,8 @@ def mock_hass():
     
     device_registry = Mock()
     hass.helpers.device_registry.async_get.return_value = device_registry
+
+    hass.async_create_task.side_effect = lambda coro, *args, **kwargs: asyncio.get_running_loop().create_task(coro)
     
     return hass
 
@@ -332,6 +334,81 @@ class TestN3EventForwarder:
         assert forwarder._pending_events[1]["test"] == "event_3"
         assert forwarder._pending_events[2]["test"] == "event_4"
 
+    @pytest.mark.asyncio
+    async def test_enqueue_full_batch_flushes_without_deadlock(self, mock_hass_obj, forwarder_config_obj):
+        """A full batch triggers a flush; the queue lock must not be held across it."""
+        forwarder_config_obj["batch_size"] = 2
+        forwarder = N3EventForwarder(mock_hass_obj, forwarder_config_obj)
+        forwarder._flush_events = AsyncMock()
+
+        await forwarder._enqueue_event({"test": "event_0"})
+        await asyncio.wait_for(forwarder._enqueue_event({"test": "event_1"}), timeout=1.0)
+
+        forwarder._flush_events.assert_awaited_once()
+        assert not forwarder._queue_lock.locked()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_debounce_emits_terminal_state(self, mock_hass_obj, forwarder_config_obj):
+        """Coalesce mode forwards the first and the last state of a burst."""
+        forwarder_config_obj["debounce_mode"] = "coalesce"
+        forwarder_config_obj["debounce"] = {"sensor": 0.05}
+        forwarder = N3EventForwarder(mock_hass_obj, forwarder_config_obj)
+        forwarder._session = Mock()
+
+        def envelope(old, new):
+            return {"entity_id": "sensor.power", "old": {"state": old}, "new": {"state": new}}
+
+        # Leading edge goes straight through.
+        assert forwarder._coalesce_envelope("sensor.power", "sensor", envelope("0", "1")) is False
+        # Burst inside the window is held and collapsed.
+        for i in range(1, 5):
+            assert forwarder._coalesce_envelope("sensor.power", "sensor", envelope(str(i), str(i + 1))) is True
+
+        stats = await forwarder.async_get_stats()
+        assert stats["coalesce_pending"] == 1
+        assert stats["coalesced_total"] == 3
+
+        await asyncio.sleep(0.1)
+
+        assert len(forwarder._pending_events) == 1
+        emitted = forwarder._pending_events[0]
+        assert emitted["old"]["state"] == "1"
+        assert emitted["new"]["state"] == "5"
+        assert forwarder._coalesce_pending == {}
+
+    @pytest.mark.asyncio
+    async def test_flush_coalesced_releases_held_envelopes(self, mock_hass_obj, forwarder_config_obj):
+        """Stopping must not lose envelopes held by the coalescing debounce."""
+        forwarder_config_obj["debounce_mode"] = "coalesce"
+        forwarder_config_obj["debounce"] = {"sensor": 60}
+        forwarder = N3EventForwarder(mock_hass_obj, forwarder_config_obj)
+        forwarder._session = Mock()
+
+        forwarder._coalesce_envelope("sensor.a", "sensor", {"entity_id": "sensor.a", "new": {"state": "1"}})
+        forwarder._coalesce_envelope("sensor.a", "sensor", {"entity_id": "sensor.a", "new": {"state": "2"}})
+        await forwarder._flush_coalesced()
+
+        assert [e["new"]["state"] for e in forwarder._pending_events] == ["2"]
+        assert forwarder._coalesce_timers == {}
+
+    @pytest.mark.asyncio
+    async def test_flush_coalesced_waits_for_window_enqueues(self, mock_hass_obj, forwarder_config_obj):
+        """Enqueues started by a closed window are tracked and finish before stop flushes."""
+        forwarder_config_obj["debounce_mode"] = "coalesce"
+        forwarder_config_obj["debounce"] = {"sensor": 60}
+        forwarder = N3EventForwarder(mock_hass_obj, forwarder_config_obj)
+        forwarder._session = Mock()
+
+        forwarder._coalesce_envelope("sensor.a", "sensor", {"entity_id": "sensor.a", "new": {"state": "1"}})
+        forwarder._coalesce_envelope("sensor.a", "sensor", {"entity_id": "sensor.a", "new": {"state": "2"}})
+        async with forwarder._queue_lock:
+            forwarder._coalesce_window_closed("sensor.a")
+            assert len(forwarder._coalesce_tasks) == 1
+        await forwarder._flush_coalesced()
+
+        assert [e["new"]["state"] for e in forwarder._pending_events] == ["2"]
+        assert forwarder._coalesce_tasks == set()
+
 
 if __name__ == "__main__":
     # Simple test runner
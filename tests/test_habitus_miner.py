@@ -119,6 +119,21 @@ class TestHabitusMinerModule:
         assert result is True
         assert mock_listener.called
 
+    @pytest.mark.asyncio
+    async def test_state_listener_subscribes_to_mined_domains(self, module, mock_ctx):
+        """The live buffer only receives state changes of the mined domains."""
+        from ai_home_copilot.core.modules.habitus_miner import MINING_DOMAINS
+        from ai_home_copilot.core.state_router import async_get_state_router
+
+        mock_ctx.hass.services.has_service = MagicMock(return_value=False)
+        await module.async_setup_entry(mock_ctx)
+
+        router = async_get_state_router(mock_ctx.hass)
+        subs = [sub for sub in router._subs if sub.name == "habitus_miner"]
+        assert len(subs) == 1
+        assert not subs[0].is_wildcard
+        assert subs[0].domains == frozenset(MINING_DOMAINS)
+
     @pytest.mark.asyncio
     async def test_zone_affinity_initialization(self, module, mock_ctx):
         """Test zone affinity is initialized from zones store v2."""
@@ -0,0 +1,108 @@
+"""Tests for the shared Core HTTP connection pool."""
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.ai_home_copilot.core.http_pool import (
+    CoreSessionPool,
+    async_get_core_session,
+    async_get_core_session_pool,
+)
+
+
+def _hass() -> MagicMock:
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+def _pool_with_session() -> tuple[CoreSessionPool, MagicMock]:
+    pool = CoreSessionPool()
+    session = MagicMock(closed=False)
+    pool._session = session
+    return pool, session
+
+
+def test_pool_is_shared_and_closed_with_home_assistant():
+    hass = _hass()
+    pool = async_get_core_session_pool(hass)
+
+    assert async_get_core_session_pool(hass) is pool
+    assert async_get_core_session(hass, "a")._pool is async_get_core_session(hass, "b")._pool is pool
+    hass.bus.async_listen_once.assert_called_once()
+
+
+def test_view_applies_defaults_and_tags_caller():
+    pool, session = _pool_with_session()
+    hass = _hass()
+    hass.data = {"ai_home_copilot": {"_global": {"_core_http_pool": pool}}}
+    timeout = object()
+    view = async_get_core_session(
+        hass, "vector_client", base_url="http://core:8909/", headers={"Authorization": "Bearer t"}, timeout=timeout
+    )
+
+    view.post("/api/v1/vector/stats", json={}, headers={"X-Extra": "1"})
+    view.get("http://other/x", timeout=None)
+
+    method, url = session.request.call_args_list[0].args
+    kwargs = session.request.call_args_list[0].kwargs
+    assert (method, url) == ("POST", "http://core:8909/api/v1/vector/stats")
+    assert kwargs["headers"] == {"Authorization": "Bearer t", "X-Extra": "1"}
+    assert kwargs["timeout"] is timeout
+    assert kwargs["trace_request_ctx"] == {"caller": "vector_client"}
+    assert session.request.call_args_list[1].args == ("GET", "http://other/x")
+    assert session.request.call_args_list[1].kwargs["timeout"] is None
+    assert view.closed is False
+
+
+async def test_trace_callbacks_feed_per_caller_metrics():
+    pool = CoreSessionPool()
+
+    async def _request(caller, *, reuse: bool, queued: bool = False) -> None:
+        ctx = SimpleNamespace(trace_request_ctx={"caller": caller})
+        await pool._on_request_start(None, ctx, None)
+        if queued:
+            await pool._on_queued_start(None, ctx, None)
+            await pool._on_queued_end(None, ctx, None)
+        if reuse:
+            await pool._on_reuse(None, ctx, None)
+        else:
+            await pool._on_dns_hit(None, ctx, None)
+            await pool._on_create_start(None, ctx, None)
+            await pool._on_create_end(None, ctx, None)
+
+    await _request("coordinator", reuse=False)
+    for _ in range(3):
+        await _request("coordinator", reuse=True)
+    await _request("n3_forwarder", reuse=False, queued=True)
+    await pool._on_request_exception(None, SimpleNamespace(trace_request_ctx=None), None)
+
+    callers = pool.get_stats()["callers"]
+    assert callers["coordinator"]["requests"] == 4
+    assert callers["coordinator"]["reuse_rate"] == 0.75
+    assert callers["coordinator"]["dns_hits"] == 1
+    assert callers["n3_forwarder"]["queued"] == 1
+    assert callers["n3_forwarder"]["reuse_rate"] == 0.0
+    assert callers["other"]["errors"] == 1
+
+
+def test_session_uses_home_assistant_ssl_context_and_user_agent(monkeypatch):
+    from custom_components.ai_home_copilot.core import http_pool
+
+    ssl_context = object()
+    monkeypatch.setitem(sys.modules, "homeassistant.util.ssl", SimpleNamespace(get_default_context=lambda: ssl_context))
+    monkeypatch.setattr(
+        sys.modules["homeassistant.helpers.aiohttp_client"], "SERVER_SOFTWARE", "HomeAssistant/test", raising=False
+    )
+    connector_cls = MagicMock()
+    session_cls = MagicMock(return_value=MagicMock(closed=False))
+    monkeypatch.setattr(http_pool.aiohttp, "TCPConnector", connector_cls)
+    monkeypatch.setattr(http_pool.aiohttp, "ClientSession", session_cls)
+
+    session = CoreSessionPool().session
+
+    assert session is session_cls.return_value
+    assert connector_cls.call_args.kwargs["ssl"] is ssl_context
+    assert connector_cls.call_args.kwargs["limit"] == http_pool.CORE_POOL_LIMIT
+    assert session_cls.call_args.kwargs["connector"] is connector_cls.return_value
+    assert session_cls.call_args.kwargs["headers"] == {"User-Agent": "HomeAssistant/test"}
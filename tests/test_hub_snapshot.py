@@ -0,0 +1,128 @@
+"""Tests for multiplexed hub snapshot fetches, against a stand-in Core."""
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.ai_home_copilot import coordinator as coordinator_mod
+from custom_components.ai_home_copilot.api import CopilotApiError
+from custom_components.ai_home_copilot.coordinator import HUB_SNAPSHOT_PATH, CopilotApiClient
+from custom_components.ai_home_copilot.entity import CopilotBaseEntity
+
+
+class _Resp:
+    def __init__(self, status: int, payload: dict | None = None) -> None:
+        self.status = status
+        self.headers = {"Content-Type": "application/json"}
+        self._body = json.dumps(payload) if payload is not None else "not found"
+
+    async def text(self) -> str:
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+class _HubCore:
+    """Stand-in Core: per-path GETs plus POST /api/v1/hub/snapshot."""
+
+    def __init__(self, resources: dict[str, dict], *, snapshot: bool = True,
+                 snapshot_only: set[str] | None = None) -> None:
+        self.resources = resources
+        self.snapshot = snapshot
+        # Paths the snapshot endpoint does not know (answered per entry with 404).
+        self.unknown_to_snapshot = snapshot_only or set()
+        self.calls: list[tuple[str, str]] = []
+
+    def request(self, method, url, *, json=None, **kwargs):
+        path = url.split("8909", 1)[1]
+        self.calls.append((method, path))
+        if path == HUB_SNAPSHOT_PATH:
+            if not self.snapshot:
+                return _Resp(404)
+            return _Resp(200, {"ok": True, "resources": {
+                p: self._entry(p) for p in json["paths"] if p not in self.unknown_to_snapshot
+            }})
+        if path in self.resources:
+            return _Resp(200, self.resources[path])
+        return _Resp(404)
+
+    def _entry(self, path: str) -> dict:
+        if path in self.resources:
+            return {"status": 200, "data": self.resources[path]}
+        return {"status": 500, "error": "boom"}
+
+
+@pytest.fixture(autouse=True)
+def _real_client_error(monkeypatch):
+    # aiohttp is a MagicMock in tests; except clauses need a real class.
+    monkeypatch.setattr(coordinator_mod.aiohttp, "ClientError", type("ClientError", (Exception,), {}))
+
+
+def _client(core: _HubCore) -> CopilotApiClient:
+    session = MagicMock()
+    session.request = MagicMock(side_effect=core.request)
+    return CopilotApiClient(session, base_urls=["http://core:8909"], token="t")
+
+
+def _sensor(client: CopilotApiClient) -> CopilotBaseEntity:
+    entity = object.__new__(CopilotBaseEntity)
+    entity.coordinator = SimpleNamespace(api=client, _config={})
+    return entity
+
+
+HUB = {f"/api/v1/hub/{name}": {"ok": True, "name": name}
+       for name in ("presence", "energy", "media", "scenes", "modes", "brain")}
+
+
+async def test_platform_refresh_is_one_round_trip():
+    core = _HubCore(HUB)
+    client = _client(core)
+
+    results = await asyncio.gather(*(_sensor(client)._fetch(path) for path in HUB))
+
+    assert [r["name"] for r in results] == [p.rsplit("/", 1)[1] for p in HUB]
+    assert core.calls == [("POST", HUB_SNAPSHOT_PATH)]
+    # The sensors' next reads within the TTL are served from memory.
+    assert await _sensor(client)._fetch("/api/v1/hub/media") == HUB["/api/v1/hub/media"]
+    assert len(core.calls) == 1
+    stats = client.get_shared_stats()
+    assert (stats["snapshots"], stats["snapshot_paths"], stats["direct"]) == (1, 6, 0)
+
+
+async def test_unsupported_snapshot_falls_back_to_per_path_gets():
+    core = _HubCore(HUB, snapshot=False)
+    client = _client(core)
+
+    results = await asyncio.gather(*(client.async_get_shared(p, ttl_s=0.0) for p in HUB))
+    assert results == list(HUB.values())
+    assert core.calls.count(("POST", HUB_SNAPSHOT_PATH)) == 1
+    assert client.get_shared_stats()["snapshot_supported"] is False
+
+    core.calls.clear()
+    await asyncio.gather(*(client.async_get_shared(p) for p in HUB))
+    assert core.calls == [("GET", p) for p in HUB]
+
+
+async def test_per_resource_fallback_and_errors():
+    resources = {**HUB, "/api/v1/regional/gas": {"ok": True, "m3": 4}}
+    core = _HubCore(resources, snapshot_only={"/api/v1/regional/gas"})
+    client = _client(core)
+
+    gas, presence, broken = await asyncio.gather(
+        client.async_get_shared("/api/v1/regional/gas"),
+        client.async_get_shared("/api/v1/hub/presence"),
+        client.async_get_shared("/api/v1/hub/missing"),
+        return_exceptions=True,
+    )
+
+    assert gas == {"ok": True, "m3": 4}
+    assert presence == HUB["/api/v1/hub/presence"]
+    assert isinstance(broken, CopilotApiError) and "HTTP 500" in str(broken)
+    assert core.calls == [("POST", HUB_SNAPSHOT_PATH), ("GET", "/api/v1/regional/gas")]
+    assert client.get_shared_stats()["snapshot_skipped_paths"] == 1
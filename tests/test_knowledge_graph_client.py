@@ -0,0 +1,133 @@
+"""Tests for KnowledgeGraphClient bulk upserts."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.ai_home_copilot.api import knowledge_graph as kg_api
+from custom_components.ai_home_copilot.api.knowledge_graph import (
+    EdgeType,
+    KGEdge,
+    KGNode,
+    KnowledgeGraphClient,
+    KnowledgeGraphError,
+    NodeType,
+)
+
+
+def _client() -> KnowledgeGraphClient:
+    return KnowledgeGraphClient(MagicMock(), "http://core:8909", "t")
+
+
+def _nodes(count: int) -> list[KGNode]:
+    return [KGNode(id=f"sensor.s{i}", type=NodeType.ENTITY, label=f"s{i}") for i in range(count)]
+
+
+async def test_upsert_nodes_chunks_into_bulk_requests():
+    client = _client()
+    client._post = AsyncMock(side_effect=[
+        {"ok": True},
+        {"ok": True, "errors": [{"id": "sensor.s250", "error": "bad"}]},
+        {"ok": True},
+    ])
+
+    result = await client.upsert_nodes(_nodes(450), chunk_size=200)
+
+    assert [c.size for c in result.chunks] == [200, 200, 50]
+    assert client._post.await_count == 3
+    path, payload = client._post.await_args_list[0].args
+    assert path == "/api/v1/kg/nodes/bulk"
+    assert len(payload["nodes"]) == 200
+    assert result.failed_ids == ["sensor.s250"]
+    assert result.succeeded == 449
+    assert result.bulk_endpoint is True
+
+
+async def test_failed_chunk_does_not_stop_the_rest():
+    client = _client()
+    client._post = AsyncMock(side_effect=[
+        KnowledgeGraphError("HTTP 500 for http://core:8909/api/v1/kg/nodes/bulk: oops", status=500),
+        {"ok": True},
+    ])
+
+    result = await client.upsert_nodes(_nodes(4), chunk_size=2)
+
+    assert result.chunks[0].failed_ids == ["sensor.s0", "sensor.s1"]
+    assert "HTTP 500" in result.chunks[0].error
+    assert result.chunks[1].ok
+    assert not result.ok
+
+
+async def test_falls_back_to_bounded_single_requests_without_bulk_endpoint(monkeypatch):
+    monkeypatch.setattr(kg_api, "FALLBACK_CONCURRENCY", 3)
+    client = _client()
+    client._post = AsyncMock(
+        side_effect=KnowledgeGraphError("HTTP 404 for http://core:8909/api/v1/kg/edges/bulk: nope", status=404)
+    )
+    active = peak = 0
+
+    async def _create_edge(edge):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        if edge.target == "cap.bad":
+            raise KnowledgeGraphError("HTTP 400 for x: invalid", status=400)
+        if edge.target == "cap.dup":
+            raise KnowledgeGraphError("Edge already exists")
+        return edge
+
+    client.create_edge = _create_edge
+    edges = [KGEdge(source=f"light.l{i}", target="cap.dimmable", type=EdgeType.HAS_CAPABILITY) for i in range(10)]
+    edges += [
+        KGEdge(source="light.x", target="cap.bad", type=EdgeType.HAS_CAPABILITY),
+        KGEdge(source="light.y", target="cap.dup", type=EdgeType.HAS_CAPABILITY),
+    ]
+
+    first = await client.upsert_edges(edges, chunk_size=6)
+    second = await client.upsert_edges(edges[:2])
+
+    # Only the first chunk probed the bulk route.
+    assert client._post.await_count == 1
+    assert first.bulk_endpoint is False
+    assert first.failed_ids == [edges[10].id]
+    assert second.ok
+    assert peak == 3
+
+
+class _Resp:
+    status = 404
+    headers: dict = {}
+
+    async def text(self) -> str:
+        return "not found"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+async def test_http_errors_carry_the_status_used_for_bulk_fallback(monkeypatch):
+    # aiohttp is a MagicMock in tests; except clauses need a real class.
+    monkeypatch.setattr(kg_api.aiohttp, "ClientError", type("ClientError", (Exception,), {}))
+    session = MagicMock()
+    session.post = MagicMock(return_value=_Resp())
+    client = KnowledgeGraphClient(session, "http://core:8909", "t")
+
+    try:
+        await client._post("/api/v1/kg/nodes/bulk", {"nodes": []})
+    except KnowledgeGraphError as err:
+        assert err.status == 404
+    else:
+        raise AssertionError("expected KnowledgeGraphError")
+
+    # Only the status decides, not the wording of the message.
+    node = _nodes(1)[0]
+    client._post = AsyncMock(side_effect=[
+        KnowledgeGraphError("no bulk route", status=404),
+        {"ok": True, "node": node.to_dict()},
+    ])
+    result = await client.upsert_nodes([node])
+    assert result.bulk_endpoint is False
+    assert result.ok
@@ -0,0 +1,202 @@
+"""Tests for the local Knowledge Graph mirror."""
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.ai_home_copilot.api.knowledge_graph import (
+    EdgeType,
+    KGEdge,
+    KGNode,
+    KnowledgeGraphClient,
+    KnowledgeGraphError,
+    NodeType,
+)
+from custom_components.ai_home_copilot.api.knowledge_graph_mirror import KnowledgeGraphMirror
+
+
+def _entity(entity_id: str) -> KGNode:
+    return KGNode(id=entity_id, type=NodeType.ENTITY, label=entity_id.split(".")[1].title())
+
+
+def _graph() -> tuple[list[KGNode], list[KGEdge]]:
+    nodes = [
+        _entity("light.desk"),
+        _entity("light.ceiling"),
+        _entity("sensor.temp"),
+        KGNode(id="area.office", type=NodeType.AREA, label="Office"),
+        KGNode(id="zone.work", type=NodeType.ZONE, label="Work"),
+        KGNode(id="mood.focus", type=NodeType.MOOD, label="Focus"),
+    ]
+    edges = [
+        KGEdge(source="light.desk", target="area.office", type=EdgeType.BELONGS_TO),
+        KGEdge(source="light.ceiling", target="area.office", type=EdgeType.BELONGS_TO),
+        KGEdge(source="light.desk", target="zone.work", type=EdgeType.BELONGS_TO),
+        KGEdge(source="sensor.temp", target="zone.work", type=EdgeType.BELONGS_TO),
+        KGEdge(source="light.desk", target="mood.focus", type=EdgeType.RELATES_TO_MOOD, confidence=0.9),
+        KGEdge(source="light.ceiling", target="mood.focus", type=EdgeType.RELATES_TO_MOOD, confidence=0.4),
+        KGEdge(source="sensor.temp", target="light.desk", type=EdgeType.CORRELATES_WITH, confidence=0.1),
+    ]
+    return nodes, edges
+
+
+def _mirror() -> KnowledgeGraphMirror:
+    mirror = KnowledgeGraphMirror()
+    mirror.replace(*_graph())
+    return mirror
+
+
+def test_find_related_uses_shared_neighbours_and_confidence():
+    result = _mirror().find_related("light.desk", max_results=10, min_confidence=0.3)
+
+    # light.ceiling shares both the area and the mood; sensor.temp only the
+    # zone, because its direct low-confidence correlation is filtered out.
+    assert [n.id for n in result.nodes] == [
+        "area.office", "light.ceiling", "mood.focus", "zone.work", "sensor.temp",
+    ]
+    assert result.sources == ["mirror"]
+
+
+def test_find_by_zone_and_mood():
+    mirror = _mirror()
+
+    zone = mirror.find_by_zone("work")
+    assert [n.id for n in zone.nodes] == ["light.desk", "sensor.temp"]
+
+    mood = mirror.find_by_mood("focus")
+    assert [n.id for n in mood.nodes] == ["light.desk", "light.ceiling"]
+    assert [e.confidence for e in mood.edges] == [0.9, 0.4]
+
+    assert [n.id for n in mirror.find_by_label("office")] == ["area.office"]
+
+
+def test_not_used_until_reconciled_and_after_invalidate():
+    mirror = KnowledgeGraphMirror()
+    mirror.apply_nodes([_entity("light.desk")])
+    assert mirror.find_related("light.desk") is None
+
+    mirror.replace(*_graph())
+    assert mirror.find_by_zone("work") is not None
+    mirror.invalidate()
+    assert mirror.find_by_zone("work") is None
+
+    stats = mirror.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+
+
+def test_truncated_or_stale_snapshot_is_not_used():
+    mirror = KnowledgeGraphMirror()
+    mirror.replace(*_graph(), complete=False)
+    assert mirror.find_by_zone("work") is None
+
+    mirror = KnowledgeGraphMirror(stale_after_s=-1)
+    mirror.replace(*_graph())
+    assert mirror.find_by_zone("work") is None
+
+
+async def test_client_answers_from_mirror_and_writes_through():
+    mirror = KnowledgeGraphMirror()
+    client = KnowledgeGraphClient(MagicMock(), "http://core:8909", "t", mirror=mirror)
+    nodes, edges = _graph()
+    client.list_nodes = AsyncMock(
+        side_effect=lambda node_type, limit, offset: [n for n in nodes if n.type == node_type][offset:]
+    )
+    client.list_edges = AsyncMock(
+        side_effect=lambda edge_type, limit, offset: [e for e in edges if e.type == edge_type][offset:]
+    )
+    client._post = AsyncMock(return_value={"ok": True})
+
+    assert await client.async_reconcile_mirror() is True
+    await client.upsert_edges([KGEdge(source="light.ceiling", target="zone.work", type=EdgeType.BELONGS_TO)])
+    client._post.reset_mock()
+
+    zone = await client.find_by_zone("work")
+
+    assert [n.id for n in zone.nodes] == ["light.ceiling", "light.desk", "sensor.temp"]
+    client._post.assert_not_called()
+    assert mirror.get_stats()["writes_since_reconcile"] == 1
+
+
+async def test_failed_reconcile_keeps_queries_remote():
+    mirror = KnowledgeGraphMirror()
+    client = KnowledgeGraphClient(MagicMock(), "http://core:8909", "t", mirror=mirror)
+    client.list_nodes = AsyncMock(side_effect=KnowledgeGraphError("HTTP 500 for x: down"))
+    client._post = AsyncMock(return_value={"ok": True, "result": {}})
+
+    assert await client.async_reconcile_mirror() is False
+    await client.find_related("light.desk")
+
+    client._post.assert_awaited_once()
+    assert mirror.get_stats()["reconcile_errors"] == 1
+
+
+def _many_entities(count: int) -> list[KGNode]:
+    return [_entity(f"light.l{i}") for i in range(count)]
+
+
+async def test_reconcile_pages_past_the_list_limit():
+    mirror = KnowledgeGraphMirror()
+    client = KnowledgeGraphClient(MagicMock(), "http://core:8909", "t", mirror=mirror)
+    entities = _many_entities(1200)
+
+    async def _nodes(node_type, limit, offset):
+        return entities[offset:offset + limit] if node_type == NodeType.ENTITY else []
+
+    client.list_nodes = AsyncMock(side_effect=_nodes)
+    client.list_edges = AsyncMock(return_value=[])
+
+    assert await client.async_reconcile_mirror() is True
+
+    offsets = [c.kwargs["offset"] for c in client.list_nodes.call_args_list if c.args[0] == NodeType.ENTITY]
+    assert offsets == [0, 500, 1000]
+    assert mirror.get_stats()["complete"] is True
+    assert mirror.get_stats()["nodes"] == 1200
+
+
+async def test_reconcile_marks_mirror_incomplete_when_core_ignores_offset():
+    mirror = KnowledgeGraphMirror()
+    client = KnowledgeGraphClient(MagicMock(), "http://core:8909", "t", mirror=mirror)
+    entities = _many_entities(500)
+
+    async def _nodes(node_type, limit, offset):
+        return entities if node_type == NodeType.ENTITY else []
+
+    client.list_nodes = AsyncMock(side_effect=_nodes)
+    client.list_edges = AsyncMock(return_value=[])
+
+    assert await client.async_reconcile_mirror() is True
+
+    assert mirror.get_stats()["complete"] is False
+    assert mirror.find_related("light.l0", 10, 0.0) is None
+
+
+async def test_habitus_import_invalidates_mirror():
+    mirror = _mirror()
+    client = KnowledgeGraphClient(MagicMock(), "http://core:8909", "t", mirror=mirror)
+    client._post = AsyncMock(return_value={"ok": True, "result": {}})
+
+    await client.import_patterns_from_habitus("zone.work")
+    await client.find_by_mood("focus")
+
+    assert client._post.await_count == 2
+    assert mirror.get_stats()["invalidations"] == 1
+
+
+async def test_single_request_fallback_mirrors_items_core_already_has():
+    mirror = _mirror()
+    client = KnowledgeGraphClient(MagicMock(), "http://core:8909", "t", mirror=mirror)
+    client._bulk_supported["edges"] = False
+
+    async def _post(path, payload):
+        if payload["source"] == "sensor.temp":
+            raise KnowledgeGraphError("Edge already exists")
+        return {"ok": True, "edge": payload}
+
+    client._post = AsyncMock(side_effect=_post)
+    result = await client.upsert_edges([
+        KGEdge(source="light.ceiling", target="zone.work", type=EdgeType.BELONGS_TO),
+        KGEdge(source="sensor.temp", target="mood.focus", type=EdgeType.RELATES_TO_MOOD, confidence=0.8),
+    ])
+
+    assert result.failed_ids == []
+    mood = mirror.find_by_mood("focus")
+    assert "sensor.temp" in [n.id for n in mood.nodes]
@@ -0,0 +1,101 @@
+"""Tests for the Knowledge Graph sync live change queue."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.ai_home_copilot.api.knowledge_graph import KGBulkResult
+from custom_components.ai_home_copilot.core.modules import knowledge_graph_sync as kg_mod
+from custom_components.ai_home_copilot.core.modules.knowledge_graph_sync import (
+    KnowledgeGraphSyncModule,
+)
+
+
+def _module() -> KnowledgeGraphSyncModule:
+    module = KnowledgeGraphSyncModule()
+    hass = MagicMock()
+    hass.states.get = lambda entity_id: SimpleNamespace(
+        entity_id=entity_id, name=entity_id, state="on", attributes={}, last_changed=None,
+    )
+    module._hass = hass
+    module._entity_registry = MagicMock()
+    module._entity_registry.async_get.return_value = None
+    module._client = MagicMock()
+    module._client.upsert_nodes = AsyncMock(return_value=KGBulkResult())
+    module._client.upsert_edges = AsyncMock(return_value=KGBulkResult())
+    return module
+
+
+async def _drained(module: KnowledgeGraphSyncModule) -> None:
+    for _ in range(100):
+        if not module._pending_changes and not module._in_flight:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError(module.get_queue_stats())
+
+
+def test_repeated_changes_collapse_to_one_entry():
+    module = _module()
+    for _ in range(100):
+        module._enqueue_entity_change("sensor.power")
+
+    stats = module.get_queue_stats()
+    assert stats["depth"] == 1
+    assert stats["queued"] == 1
+    assert stats["coalesced"] == 99
+
+
+def test_queue_is_bounded_and_drops_oldest():
+    module = _module()
+    with patch.object(kg_mod, "CHANGE_QUEUE_MAX_ENTITIES", 3):
+        for i in range(5):
+            module._enqueue_entity_change(f"sensor.s{i}")
+
+    assert list(module._pending_changes) == ["sensor.s2", "sensor.s3", "sensor.s4"]
+    assert module.get_queue_stats()["dropped"] == 2
+
+
+def test_in_flight_entities_are_deferred():
+    module = _module()
+    module._enqueue_entity_change("light.a")
+    module._enqueue_entity_change("light.b")
+    module._in_flight.add("light.a")
+
+    assert module._take_change_batch() == ["light.b"]
+    assert list(module._pending_changes) == ["light.a"]
+
+
+async def test_workers_drain_queue_in_batches():
+    module = _module()
+    module._start_change_workers()
+    try:
+        for _ in range(3):
+            for i in range(120):
+                module._enqueue_entity_change(f"sensor.s{i}")
+        await _drained(module)
+    finally:
+        await module.async_unload()
+
+    stats = module.get_queue_stats()
+    assert stats["processed"] == 120
+    assert stats["batches"] == 3  # BATCH_SIZE 50
+    assert stats["coalesced"] == 240
+    upserted = [n.id for call in module._client.upsert_nodes.await_args_list for n in call.args[0]]
+    assert sorted(upserted) == sorted(f"sensor.s{i}" for i in range(120))
+    assert stats["workers"] == 0
+
+
+async def test_failed_batch_is_counted_and_worker_survives():
+    module = _module()
+    module._start_change_workers()
+    try:
+        with patch.object(module, "_async_batch_sync_entities", AsyncMock(side_effect=[RuntimeError("boom"), None])):
+            module._enqueue_entity_change("light.a")
+            await _drained(module)
+            module._enqueue_entity_change("light.b")
+            await _drained(module)
+    finally:
+        await module.async_unload()
+
+    stats = module.get_queue_stats()
+    assert stats["errors"] == 1
+    assert stats["processed"] == 1
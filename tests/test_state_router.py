@@ -0,0 +1,128 @@
+"""Tests for the integration-wide state_changed router."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.ai_home_copilot.core.state_router import (
+    StateChangeRouter,
+    async_get_state_router,
+)
+
+
+def _hass() -> MagicMock:
+    hass = MagicMock()
+    hass.data = {}
+    hass.bus.async_listen.return_value = MagicMock()
+    return hass
+
+
+def _event(entity_id: str, device_class: str | None = None) -> SimpleNamespace:
+    attrs = {"device_class": device_class} if device_class else {}
+    state = SimpleNamespace(entity_id=entity_id, state="on", attributes=attrs)
+    return SimpleNamespace(data={"entity_id": entity_id, "new_state": state, "old_state": None})
+
+
+def test_routes_by_entity_domain_device_class_and_wildcard():
+    router = StateChangeRouter(_hass())
+    seen: dict[str, list[str]] = {"ent": [], "dom": [], "cls": [], "all": []}
+    router.async_subscribe("ent", lambda e: seen["ent"].append(e.data["entity_id"]), entity_ids=["light.kitchen"])
+    router.async_subscribe("dom", lambda e: seen["dom"].append(e.data["entity_id"]), domains=["person"])
+    router.async_subscribe("cls", lambda e: seen["cls"].append(e.data["entity_id"]), device_classes=["motion"])
+    router.async_subscribe("all", lambda e: seen["all"].append(e.data["entity_id"]))
+
+    router.dispatch(_event("light.kitchen"))
+    router.dispatch(_event("person.alice"))
+    router.dispatch(_event("binary_sensor.hall", device_class="motion"))
+    router.dispatch(_event("sensor.unrelated"))
+
+    assert seen["ent"] == ["light.kitchen"]
+    assert seen["dom"] == ["person.alice"]
+    assert seen["cls"] == ["binary_sensor.hall"]
+    assert len(seen["all"]) == 4
+    assert router.events_total == 4
+    assert router.dispatched_total == 7
+
+
+def test_subscription_matching_several_keys_runs_once():
+    router = StateChangeRouter(_hass())
+    calls = []
+    router.async_subscribe(
+        "multi",
+        calls.append,
+        entity_ids=["binary_sensor.hall"],
+        domains=["binary_sensor"],
+        device_classes=["motion"],
+    )
+
+    router.dispatch(_event("binary_sensor.hall", device_class="motion"))
+
+    assert len(calls) == 1
+
+
+def test_single_bus_listener_removed_with_last_subscriber():
+    hass = _hass()
+    router = StateChangeRouter(hass)
+    unsub_a = router.async_subscribe("a", lambda e: None, domains=["light"])
+    unsub_b = router.async_subscribe("b", lambda e: None)
+
+    assert hass.bus.async_listen.call_count == 1
+
+    unsub_a()
+    unsub_a()  # idempotent
+    assert router.get_stats()["listening"] is True
+    unsub_b()
+    hass.bus.async_listen.return_value.assert_called_once()
+    assert router.get_stats()["listening"] is False
+    assert router.get_stats()["index_sizes"] == {
+        "entity_ids": 0, "domains": 0, "device_classes": 0, "wildcard": 0,
+    }
+
+
+def test_update_replaces_entity_keys():
+    router = StateChangeRouter(_hass())
+    calls = []
+    sub = router.async_subscribe("shared", lambda e: calls.append(e.data["entity_id"]), entity_ids=["light.a"])
+
+    sub.update(["light.b"])
+    router.dispatch(_event("light.a"))
+    router.dispatch(_event("light.b"))
+
+    assert calls == ["light.b"]
+
+
+def test_failing_handler_counted_and_does_not_block_others():
+    router = StateChangeRouter(_hass())
+    calls = []
+
+    def _boom(event):
+        raise RuntimeError("boom")
+
+    router.async_subscribe("bad", _boom, domains=["light"])
+    router.async_subscribe("good", calls.append, domains=["light"])
+
+    router.dispatch(_event("light.a"))
+
+    stats = router.get_stats()["subscribers"]
+    assert stats["bad"]["errors"] == 1
+    assert stats["bad"]["calls"] == 1
+    assert stats["good"]["calls"] == 1
+    assert len(calls) == 1
+
+
+def test_coroutine_handlers_scheduled_as_tasks():
+    hass = _hass()
+    router = StateChangeRouter(hass)
+
+    async def _handler(event):
+        return None
+
+    router.async_subscribe("async", _handler, domains=["light"])
+    router.dispatch(_event("light.a"))
+
+    assert hass.async_create_task.call_count == 1
+    hass.async_create_task.call_args[0][0].close()
+
+
+def test_router_is_shared_per_hass():
+    hass = _hass()
+    assert async_get_state_router(hass) is async_get_state_router(hass)